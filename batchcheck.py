@@ -10,8 +10,8 @@ import time
 parser = argparse.ArgumentParser()
 parser.add_argument("--database", required=True, help="Where the database is")
 parser.add_argument("--openai-api-key", default=os.path.expanduser("~/.openai.key"))
-parser.add_argument("--only-batch", type=int, help="The batch ID to look at")
-parser.add_argument("--monitor", action="store_true", help="Monitor in a loop until the status is 'completed'. Only makes sense with --only-batch")
+parser.add_argument("--only-batch", type=int, nargs='+', help="The batch IDs to look at")
+parser.add_argument("--monitor", action="store_true", help="Monitor in a loop until every batch has finished. Only makes sense with --only-batch")
 args = parser.parse_args()
 
 api_key = open(args.openai_api_key).read().strip()
@@ -24,21 +24,29 @@ update_cursor.execute("create table if not exists batchprogress (batch_id int re
 
 query = "select batches.id, openai_batch_id, count(word_id) from batches join batchwords on (batch_id = batches.id) where when_sent is not null and when_retrieved is null "
 if args.only_batch:
-    query += f"and batches.id = {int(args.only_batch)} "
+    query += "and batches.id in (" + ", ".join(str(int(b)) for b in args.only_batch) + ") "
 query += "group by batches.id, openai_batch_id"
 
 if args.monitor:
     import tqdm
     progress = None
 
+# Once a batch gets to one of these, it isn't going to change
+finished_statuses = ['completed', 'failed', 'expired', 'cancelled']
+
 while True:
     cursor.execute(query)
     work_to_be_done = False
+    still_running = 0
+    requests_done = 0
+    requests_total = 0
 
     for local_batch_id, openai_batch_id, number_of_words in cursor:
         openai_result = client.batches.retrieve(openai_batch_id)
         if openai_result.status == 'completed':
             work_to_be_done = True
+        if openai_result.status not in finished_statuses:
+            still_running += 1
         if openai_result.status in ['in_progress','completed']:
             update_cursor.execute("insert into batchprogress (batch_id, number_completed, number_failed) values (?,?,?)",
                                   [local_batch_id,
@@ -46,16 +54,12 @@ while True:
                                    openai_result.request_counts.failed])
             conn.commit()
         if args.monitor:
-            if progress is None:
-                # To be smarter, I should keep track of the number of words that were already done
-                # at the start
-                progress = tqdm.tqdm(total=number_of_words)
-            progress.set_description(openai_result.status)
-            if openai_result.status in ['in_progress', 'completed']:
-                progress.update(openai_result.request_counts.completed - progress.n)
-            if openai_result.status == 'completed':
-                break
-            time.sleep(15)
+            # Requests rather than words: with --per-sentence there are fewer requests than words
+            if openai_result.request_counts and openai_result.request_counts.total:
+                requests_total += openai_result.request_counts.total
+                requests_done += openai_result.request_counts.completed + openai_result.request_counts.failed
+            else:
+                requests_total += number_of_words
             continue
         print(f"""## {openai_result.metadata.get('description')}
       Num words: {number_of_words}
@@ -77,8 +81,14 @@ while True:
         #print(openai_result)
     if not args.monitor:
         break
-    if work_to_be_done:
+    if progress is None:
+        progress = tqdm.tqdm(total=requests_total)
+    progress.total = max(progress.total, requests_total)
+    progress.set_description(f"{still_running} batches still running")
+    progress.update(requests_done - progress.n)
+    if still_running == 0:
         break
+    time.sleep(15)
 if work_to_be_done:
     sys.exit(0)
 else:
@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+
+# Looks after OpenAI batches from start to finish, instead of running
+# generate_multisynset_batch.py, batchcheck.py --monitor and batchfetch.py in turn.
+#
+# Every batch that has been sent and not retrieved gets checked on its own
+# schedule (all at the same time, with the async client): often when it has just
+# changed status, then about half the time it looks like it has left to run, or
+# less and less often if it isn't moving. Progress goes in batchprogress, like
+# batchcheck.py does. As soon as a batch completes it is fetched, the same way as
+# batchfetch.py. Whenever there are fewer than --in-flight batches running,
+# generate_multisynset_batch.py (with --generate-args) is run to send some more,
+# until it runs out of work or --max-batches have been sent.
+#
+# Progress and fetching are done one thing at a time, on one thread, which has the
+# daemon's only database connection. The generator is a separate process with its
+# own connection, so while it is holding the database a fetch can find it locked;
+# that fetch is just tried again every --max-interval until it works. A batch that
+# can't be checked or fetched for any other reason MAX_FAILURES times in a row is
+# left for batchcheck.py and batchfetch.py.
+
+import argparse
+import asyncio
+import collections
+import concurrent.futures
+import os
+import shlex
+import sqlite3
+import sys
+import tempfile
+import time
+
+import openai
+
+import batchfetch
+import generate_multisynset_batch
+
+GENERATOR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "generate_multisynset_batch.py")
+
+# Once a batch gets to one of these, it isn't going to change
+finished_statuses = ['completed', 'failed', 'expired', 'cancelled']
+
+# Give up on a batch (or on sending more) after this many failures in a row
+MAX_FAILURES = 5
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="Keep OpenAI batches running, and fetch them as they complete")
+    parser.add_argument("--database", required=True, help="Where the database is")
+    parser.add_argument("--openai-api-key", default=os.path.expanduser("~/.openai.key"))
+    parser.add_argument("--in-flight", type=int, default=2, help="How many batches to keep running at once")
+    parser.add_argument("--max-batches", type=int, help="Stop sending new batches after this many")
+    parser.add_argument("--no-submit", dest="submit", action="store_false",
+                        help="Don't send any new batches, just watch and fetch the ones already sent")
+    parser.add_argument("--generate-args", default="",
+                        help="Extra arguments for generate_multisynset_batch.py, e.g. \"--congruent 3 --modulo 1000 --limit 40000\"")
+    parser.add_argument("--batch-dir", default=".batchfiles", help="Where generate_multisynset_batch.py should write the batch files")
+    parser.add_argument("--min-interval", type=float, default=15, help="Seconds to wait between checks on a batch, at least")
+    parser.add_argument("--max-interval", type=float, default=600, help="Seconds to wait between checks on a batch, at most")
+    parser.add_argument("--download-dir", help="Keep the downloaded output files in this directory (otherwise they go in a temporary one)")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Number of answers to apply to the database at a time")
+    parser.add_argument("--report-costs", action="store_true", help="Report the cost of the batches fetched, at the end")
+    args = parser.parse_args()
+    if args.in_flight < 1:
+        sys.exit("--in-flight must be at least 1")
+    if args.min_interval <= 0 or args.max_interval < args.min_interval:
+        sys.exit("--min-interval must be more than 0, and no more than --max-interval")
+    return args
+
+def log(message):
+    print(f"{time.strftime('%F %T')} {message}", flush=True)
+
+def open_database(database):
+    conn = batchfetch.open_database(database)
+    conn.execute("create table if not exists batchprogress (batch_id int references batches(id), when_checked datetime default current_timestamp, number_completed int, number_failed int)")
+    conn.commit()
+    return conn
+
+def outstanding_batches(conn):
+    cursor = conn.cursor()
+    cursor.execute("select id, openai_batch_id from batches where when_sent is not null and when_retrieved is null order by id")
+    return cursor.fetchall()
+
+def record_progress(conn, local_batch_id, request_counts):
+    # Only for openaispeed.py's graphs, so if the database is busy it can be skipped
+    try:
+        conn.execute("insert into batchprogress (batch_id, number_completed, number_failed) values (?,?,?)",
+                     [local_batch_id, request_counts.completed, request_counts.failed])
+        conn.commit()
+    except sqlite3.OperationalError as e:
+        conn.rollback()
+        log(f"Batch {local_batch_id}: couldn't record progress: {e}")
+
+def database_locked(e):
+    # "database is locked" (someone else is writing), or "database table is locked"
+    return isinstance(e, sqlite3.OperationalError) and "locked" in str(e)
+
+def fetch_batch(conn, client, local_batch_id, openai_result, download_dir, chunk_size):
+    # Anything half applied mustn't be committed by whatever uses the connection next
+    try:
+        return batchfetch.fetch_batch(conn, client, local_batch_id, openai_result, download_dir, chunk_size)
+    except BaseException:
+        conn.rollback()
+        raise
+
+async def submit_work(args, wanted, round_number):
+    # Runs the generator, and returns its exit status once it has written and sent its batches
+    os.makedirs(args.batch_dir, exist_ok=True)
+    command = [sys.executable, GENERATOR,
+               "--database", args.database,
+               "--openai-api-key", args.openai_api_key,
+               "--output-file", os.path.join(args.batch_dir, f"batch-{time.strftime('%F-%T')}-{round_number}.jsonl")]
+    command += shlex.split(args.generate_args)
+    command += ["--max-batches", str(wanted)]
+    log(f"Sending up to {wanted} more batches")
+    process = await asyncio.create_subprocess_exec(*command)
+    return await process.wait()
+
+def next_interval(interval, status_changed, before, after, min_interval, max_interval):
+    """How long to wait before checking a batch again.
+
+    before and after are (time, requests done, requests total) from the last two checks
+    (before is None the first time)."""
+    if status_changed or before is None:
+        return min_interval
+    (then, done_then, _) = before
+    (now, done_now, total) = after
+    if done_now <= done_then or now <= then:
+        # Nothing happening (validating, finalizing, or just stuck): back off
+        return min(interval * 2, max_interval)
+    rate = (done_now - done_then) / (now - then)
+    remaining = (total - done_now) / rate
+    return max(min_interval, min(max_interval, remaining / 2))
+
+class Daemon:
+    def __init__(self, args, download_dir):
+        self.args = args
+        self.download_dir = download_dir
+        api_key = open(args.openai_api_key).read().strip()
+        self.client = openai.OpenAI(api_key=api_key)
+        self.async_client = openai.AsyncOpenAI(api_key=api_key)
+        self.database_thread = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+        self.conn = None
+        self.watchers = {}
+        self.totals = collections.Counter()
+        self.fetched_batch_ids = []
+        self.batches_sent = 0
+        self.rounds = 0
+
+    def in_database_thread(self, function, *args):
+        return asyncio.get_running_loop().run_in_executor(self.database_thread, function, *args)
+
+    async def watch_batch(self, local_batch_id, openai_batch_id):
+        args = self.args
+        interval = args.min_interval
+        status = None
+        before = None
+        failures = 0
+        while True:
+            if failures >= MAX_FAILURES:
+                log(f"Batch {local_batch_id}: giving up after {failures} failures in a row; batchcheck.py and batchfetch.py can look at it")
+                return
+            try:
+                result = await self.async_client.batches.retrieve(openai_batch_id)
+            except openai.OpenAIError as e:
+                failures += 1
+                log(f"Batch {local_batch_id}: could not check on {openai_batch_id}: {e}")
+                interval = min(interval * 2, args.max_interval)
+                await asyncio.sleep(interval)
+                continue
+            counts = result.request_counts
+            if result.status != status:
+                log(f"Batch {local_batch_id}: {result.status}")
+            if result.status in ['in_progress', 'completed'] and counts is not None:
+                await self.in_database_thread(record_progress, self.conn, local_batch_id, counts)
+            if result.status == 'completed':
+                try:
+                    totals = await self.in_database_thread(fetch_batch, self.conn, self.client, local_batch_id, result,
+                                                           self.download_dir, args.chunk_size)
+                except (openai.OpenAIError, sqlite3.OperationalError, OSError) as e:
+                    status = result.status
+                    if database_locked(e):
+                        # The generator has the database, which is nothing wrong with the
+                        # batch, and it has been paid for: keep trying for as long as it takes
+                        log(f"Batch {local_batch_id}: the database is locked, trying again in {args.max_interval:.0f}s")
+                        interval = args.max_interval
+                    else:
+                        failures += 1
+                        log(f"Batch {local_batch_id}: could not fetch it: {e}")
+                        interval = min(interval * 2, args.max_interval)
+                    await asyncio.sleep(interval)
+                    continue
+                except Exception as e:
+                    log(f"Batch {local_batch_id}: could not fetch it, leaving it for batchfetch.py: {e!r}")
+                    return
+                log(f"Batch {local_batch_id}: fetched {totals['words']} answers (${totals['dollars']:.2f})")
+                self.totals.update(totals)
+                self.fetched_batch_ids.append(local_batch_id)
+                return
+            if result.status in finished_statuses:
+                # Left for a person to look at, as batchfetch.py would
+                if result.errors:
+                    for err in result.errors.data:
+                        log(f"Batch {local_batch_id}: {err.code} on line {err.line}: {err.message}")
+                return
+            failures = 0
+            after = (time.monotonic(), 0, 0)
+            if counts is not None:
+                after = (time.monotonic(), counts.completed + counts.failed, counts.total)
+            interval = next_interval(interval, result.status != status, before, after, args.min_interval, args.max_interval)
+            status = result.status
+            before = after
+            await asyncio.sleep(interval)
+
+    async def watch_new_batches(self):
+        # Start watching anything sent since we last looked. Returns how many that was.
+        started = 0
+        for (local_batch_id, openai_batch_id) in await self.in_database_thread(outstanding_batches, self.conn):
+            if local_batch_id in self.watchers:
+                continue
+            self.watchers[local_batch_id] = asyncio.create_task(self.watch_batch(local_batch_id, openai_batch_id))
+            started += 1
+        return started
+
+    async def run(self):
+        args = self.args
+        self.conn = await self.in_database_thread(open_database, args.database)
+        submitting = args.submit
+        failed_rounds = 0
+        await self.watch_new_batches()
+        if self.watchers:
+            log(f"Watching {len(self.watchers)} batches already sent")
+        while True:
+            running = [task for task in self.watchers.values() if not task.done()]
+            if submitting and args.max_batches is not None and self.batches_sent >= args.max_batches:
+                log(f"Sent {self.batches_sent} batches, which is --max-batches")
+                submitting = False
+            if submitting and len(running) < args.in_flight:
+                wanted = args.in_flight - len(running)
+                if args.max_batches is not None:
+                    wanted = min(wanted, args.max_batches - self.batches_sent)
+                self.rounds += 1
+                returncode = await submit_work(args, wanted, self.rounds)
+                started = await self.watch_new_batches()
+                self.batches_sent += started
+                if started > 0:
+                    failed_rounds = 0
+                elif returncode in [0, generate_multisynset_batch.NOTHING_TO_DO]:
+                    log("No more work to send")
+                    submitting = False
+                else:
+                    failed_rounds += 1
+                    log(f"generate_multisynset_batch.py failed (exit status {returncode})")
+                    if failed_rounds >= MAX_FAILURES:
+                        log(f"Not sending any more after {failed_rounds} failures in a row")
+                        submitting = False
+                    else:
+                        await asyncio.sleep(args.min_interval)
+                continue
+            if not running:
+                break
+            (done, _) = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                # watch_batch() handles its own failures, so this would be a bug
+                task.result()
+        log(f"Fetched {len(self.fetched_batch_ids)} batches, {self.totals['words']} answers")
+        if args.report_costs:
+            await self.in_database_thread(batchfetch.report_costs, self.conn, self.totals, self.fetched_batch_ids)
+        self.database_thread.shutdown()
+
+def main():
+    args = parse_args()
+    if args.download_dir:
+        os.makedirs(args.download_dir, exist_ok=True)
+        asyncio.run(Daemon(args, args.download_dir).run())
+    else:
+        with tempfile.TemporaryDirectory() as download_dir:
+            asyncio.run(Daemon(args, download_dir).run())
+
+if __name__ == "__main__":
+    main()
@@ -1,77 +1,194 @@
 #!/usr/bin/env python3
 
 import argparse
+import collections
 import os
 import sys
 import openai
 import sqlite3
-import time
+import tempfile
 import json
+import pricing
+import wordpaths
+import resolution_cache
 
-parser = argparse.ArgumentParser()
-parser.add_argument("--database", required=True, help="Where the database is")
-parser.add_argument("--openai-api-key", default=os.path.expanduser("~/.openai.key"))
-parser.add_argument("--progress-bar", action='store_true', help="Show a progress bar for updating the database on each batch")
-parser.add_argument("--report-costs", action="store_true", help="Report the cost of the runs fetched")
-args = parser.parse_args()
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--database", required=True, help="Where the database is")
+    parser.add_argument("--openai-api-key", default=os.path.expanduser("~/.openai.key"))
+    parser.add_argument("--progress-bar", action='store_true', help="Show a progress bar for updating the database on each batch")
+    parser.add_argument("--report-costs", action="store_true", help="Report the cost of the runs fetched")
+    parser.add_argument("--download-dir", help="Keep the downloaded output files in this directory (otherwise they go in a temporary one)")
+    parser.add_argument("--chunk-size", type=int, default=10000, help="Number of answers to apply to the database at a time")
+    return parser.parse_args()
 
-api_key = open(args.openai_api_key).read().strip()
-client = openai.OpenAI(api_key=api_key)
+def open_database(database):
+    conn = sqlite3.connect(database)
+    cursor = conn.cursor()
+    cursor.execute("pragma busy_timeout = 30000;")
+    cursor.execute("pragma journal_mode = WAL;")
+    resolution_cache.prepare(conn)
+    pricing.create_costs_table(conn)
+    pricing.add_estimate_columns(conn, 'batchwords')
+    # One row per answer. A word can (rarely) be answered twice, and both answers' tokens
+    # still have to reach costs, so word_id isn't the key
+    cursor.execute("""create temp table if not exists batch_results (
+        word_id INTEGER NOT NULL,
+        resolved_synset TEXT,
+        resolving_model TEXT,
+        prompt_tokens INTEGER,
+        completion_tokens INTEGER)""")
+    cursor.execute("create index if not exists temp.batch_results_by_word_id on batch_results(word_id)")
+    conn.commit()
+    return conn
 
-conn = sqlite3.connect(args.database)
-cursor = conn.cursor()
-update_cursor = conn.cursor()
+def download_file(client, file_id, path):
+    # Straight to disk, a piece at a time, rather than holding the whole file in memory
+    with client.files.with_streaming_response.content(file_id) as response:
+        response.stream_to_file(path)
+    return path
 
-cursor.execute("pragma busy_timeout = 30000;")
-cursor.execute("pragma journal_mode = WAL;")
-update_cursor.execute("pragma busy_timeout = 30000;")
-update_cursor.execute("pragma journal_mode = WAL;")
+def read_results(path, totals, progress=None):
+    """Yield (word_id, synset, model, prompt tokens, completion tokens) from a batch output file.
 
-cursor.execute("select id, openai_batch_id from batches where when_sent is not null and when_retrieved is null")
+    Reads it a line at a time. The tokens for a request go against its first word (so
+    that the costs table still adds up), and are added to totals. Requests without a
+    usable answer are left out of both."""
+    with open(path) as f:
+        for row in f:
+            if progress is not None:
+                progress.update(len(row.encode()))
+            record = json.loads(row)
+            if record['response']['status_code'] != 200:
+                continue
+            arguments = json.loads(record['response']['body']['choices'][0]['message']['tool_calls'][0]['function']['arguments'])
+            if record['custom_id'].startswith('sentence-'):
+                # generate_multisynset_batch.py --per-sentence: one answer per word, as word_<word_id>
+                answers = [(int(key[len('word_'):]), synset) for (key, synset) in arguments.items() if key.startswith('word_')]
+            elif 'synset' in arguments:
+                answers = [(int(record['custom_id']), arguments['synset'])]
+            else:
+                continue
+            if not answers:
+                # Nothing to charge the tokens to, so (like the failures above) they
+                # don't go in the totals either
+                continue
+            model = record['response']['body']['model'] + " (batch)"
+            usage = record['response']['body']['usage']
+            prompt_tokens = usage['prompt_tokens']
+            completion_tokens = usage['completion_tokens']
+            for (word_id, synset) in answers:
+                yield (word_id, synset, model, prompt_tokens, completion_tokens)
+                prompt_tokens = 0
+                completion_tokens = 0
+            totals['prompt_tokens'] += usage['prompt_tokens']
+            totals['completion_tokens'] += usage['completion_tokens']
+            totals['dollars'] += pricing.dollars(record['response']['body']['model'], usage['prompt_tokens'], usage['completion_tokens'])
 
-total_prompt_tokens = 0
-total_completion_tokens = 0
+def apply_results(conn, local_batch_id, rows):
+    """Apply one chunk of answers through the batch_results staging table. Doesn't commit."""
+    cursor = conn.cursor()
+    cursor.execute("delete from temp.batch_results")
+    cursor.executemany("""insert into temp.batch_results (word_id, resolved_synset, resolving_model, prompt_tokens, completion_tokens)
+        values (?, ?, ?, ?, ?)""", rows)
+    # If a word was answered twice, the later answer wins, as it always has
+    cursor.execute("""update words set resolved_synset = latest.resolved_synset,
+            resolving_model = latest.resolving_model, resolved_timestamp = current_timestamp
+        from (select word_id, resolved_synset, resolving_model from temp.batch_results
+              where rowid in (select max(rowid) from temp.batch_results group by word_id)) as latest
+        where words.id = latest.word_id""")
+    cursor.execute("""insert into costs (word_id, prompt_tokens, completion_tokens, estimated_prompt_tokens, estimated_completion_tokens)
+        select batch_results.word_id, batch_results.prompt_tokens, batch_results.completion_tokens,
+               batchwords.estimated_prompt_tokens, batchwords.estimated_completion_tokens
+        from temp.batch_results
+          left join batchwords on (batchwords.batch_id = ? and batchwords.word_id = batch_results.word_id
+                                   and batch_results.rowid = (select min(rowid) from temp.batch_results as first
+                                                              where first.word_id = batch_results.word_id))
+        order by batch_results.rowid""", [local_batch_id])
+    wordpaths.refresh_word_paths_in_table(conn, "temp.batch_results")
+    resolution_cache.record_in_table(conn, "temp.batch_results")
 
-update_cursor.execute("begin transaction")
-work_to_be_done = False
-for local_batch_id, openai_batch_id in cursor:
-    openai_result = client.batches.retrieve(openai_batch_id)
-    if openai_result.status != 'completed':
-        continue
+def fetch_batch(conn, client, local_batch_id, openai_result, download_dir, chunk_size=10000, progress_bar=False):
+    """Download a completed batch's output and store the answers, committing once at the end.
+
+    Returns a Counter of words, prompt_tokens, completion_tokens and dollars."""
+    totals = collections.Counter()
     if openai_result.error_file_id is not None:
-        error_file_response = client.files.content(openai_result.error_file_id)
-        sys.stderr.write(error_file_response.text)
+        error_path = download_file(client, openai_result.error_file_id, os.path.join(download_dir, f"batch-{local_batch_id}-errors.jsonl"))
+        with open(error_path) as f:
+            for line in f:
+                sys.stderr.write(line)
     if openai_result.output_file_id is None:
-        continue
-    file_response = client.files.content(openai_result.output_file_id)
-    iterator = file_response.text.splitlines()
-    if args.progress_bar:
+        return totals
+    output_path = download_file(client, openai_result.output_file_id, os.path.join(download_dir, f"batch-{local_batch_id}-output.jsonl"))
+    progress = None
+    if progress_bar:
         import tqdm
-        iterator = tqdm.tqdm(iterator)
-        if 'description' in openai_result.metadata:
-            iterator.set_description(openai_result.metadata['description'])
-    for row in iterator:
-        record = json.loads(row)
-        if record['response']['status_code'] != 200:
-            continue
-        arguments = json.loads(record['response']['body']['choices'][0]['message']['tool_calls'][0]['function']['arguments'])
-        if 'synset' not in arguments:
+        progress = tqdm.tqdm(total=os.path.getsize(output_path), unit='B', unit_scale=True)
+        if openai_result.metadata and 'description' in openai_result.metadata:
+            progress.set_description(openai_result.metadata['description'])
+    rows = []
+    for row in read_results(output_path, totals, progress):
+        rows.append(row)
+        if len(rows) >= chunk_size:
+            apply_results(conn, local_batch_id, rows)
+            totals['words'] += len(rows)
+            rows = []
+    if rows:
+        apply_results(conn, local_batch_id, rows)
+        totals['words'] += len(rows)
+    if progress is not None:
+        progress.close()
+    conn.execute("update batches set when_retrieved = current_timestamp where id = ?", [local_batch_id])
+    conn.commit()
+    return totals
+
+def report_costs(conn, totals, fetched_batch_ids):
+    print(f"Prompt tokens:     {totals['prompt_tokens']}")
+    print(f"Completion tokens: {totals['completion_tokens']}")
+    print(f"Cost (USD):        {totals['dollars']:.2f}")
+    # How good generate_multisynset_batch.py's guesses were, for the batches that have them
+    estimated_prompt_tokens = 0
+    estimated_completion_tokens = 0
+    cursor = conn.cursor()
+    for local_batch_id in fetched_batch_ids:
+        cursor.execute("select coalesce(sum(estimated_prompt_tokens), 0), coalesce(sum(estimated_completion_tokens), 0) from batchwords where batch_id = ?",
+                       [local_batch_id])
+        (prompt_tokens, completion_tokens) = cursor.fetchone()
+        estimated_prompt_tokens += prompt_tokens
+        estimated_completion_tokens += completion_tokens
+    if estimated_prompt_tokens > 0:
+        print(f"Estimated prompt tokens:     {estimated_prompt_tokens} ({totals['prompt_tokens'] / estimated_prompt_tokens:.2f}x actual/estimate)")
+        print(f"Estimated completion tokens: {estimated_completion_tokens} ({totals['completion_tokens'] / max(estimated_completion_tokens, 1):.2f}x actual/estimate)")
+
+def fetch_completed_batches(conn, client, download_dir, args):
+    cursor = conn.cursor()
+    cursor.execute("select id, openai_batch_id from batches where when_sent is not null and when_retrieved is null")
+    totals = collections.Counter()
+    fetched_batch_ids = []
+    for local_batch_id, openai_batch_id in cursor.fetchall():
+        openai_result = client.batches.retrieve(openai_batch_id)
+        if openai_result.status != 'completed':
             continue
-        model = record['response']['body']['model'] + " (batch)"
-        word_id = int(record['custom_id'])
-        usage = record['response']['body']['usage']
-        update_cursor.execute("update words set resolved_synset = ?, resolving_model=?, resolved_timestamp = current_timestamp where id = ?", [arguments['synset'], model, word_id])
-        update_cursor.execute("insert into costs (word_id, prompt_tokens, completion_tokens) values (?,?,?)",
-                              [word_id, usage['prompt_tokens'], usage['completion_tokens']])
-        total_prompt_tokens += usage['prompt_tokens']
-        total_completion_tokens += usage['completion_tokens']
-    update_cursor.execute("update batches set when_retrieved = current_timestamp where id = ?", [local_batch_id])
-conn.commit()
+        totals.update(fetch_batch(conn, client, local_batch_id, openai_result, download_dir, args.chunk_size, args.progress_bar))
+        fetched_batch_ids.append(local_batch_id)
+    return (totals, fetched_batch_ids)
+
+def main():
+    args = parse_args()
+    api_key = open(args.openai_api_key).read().strip()
+    client = openai.OpenAI(api_key=api_key)
+    conn = open_database(args.database)
+
+    if args.download_dir:
+        os.makedirs(args.download_dir, exist_ok=True)
+        (totals, fetched_batch_ids) = fetch_completed_batches(conn, client, args.download_dir, args)
+    else:
+        with tempfile.TemporaryDirectory() as download_dir:
+            (totals, fetched_batch_ids) = fetch_completed_batches(conn, client, download_dir, args)
+
+    if args.report_costs:
+        report_costs(conn, totals, fetched_batch_ids)
 
-if args.report_costs:
-    print(f"Prompt tokens:     {total_prompt_tokens}")
-    print(f"Completion tokens: {total_completion_tokens}")
-    prompt_pricing = 0.075 / 1000000
-    completion_pricing = 0.3 / 1000000
-    cost = prompt_pricing * total_prompt_tokens + completion_pricing * total_completion_tokens
-    print(f"Cost (USD):        {cost:.2f}")
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,236 @@
+#!/usr/bin/env python3
+
+# Benchmark wordnetify.py on synthetic TinyStories-shaped corpora.
+#
+# The corpora are made from the vocabulary of tests/sample.txt (with the same word
+# frequencies), so they can be generated offline at any size. The smallest tier is
+# tests/sample.txt itself. For each tier we time a complete run of wordnetify.py,
+# and then time each stage of the pipeline on its own, and write it all out as JSON
+# so that runs on different commits can be compared with --compare.
+
+import argparse
+import collections
+import json
+import os
+import platform
+import random
+import re
+import sqlite3
+import subprocess
+import sys
+import tempfile
+import time
+from typing import Dict, List, Optional
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+SAMPLE_FILE = os.path.join(HERE, 'tests', 'sample.txt')
+
+# Number of stories in each tier; None means tests/sample.txt as it is
+TIERS = collections.OrderedDict([
+    ('sample', None),
+    ('small', 1000),
+    ('medium', 10000),
+    ('large', 100000),
+])
+
+
+def sample_vocabulary(path: str) -> Dict[str, List[str]]:
+    """Words, sentence endings and sentence openers from the sample, with repeats
+    so that random.choice picks them with their real frequencies."""
+    text = open(path).read().replace('<|endoftext|>', ' ')
+    vocabulary = {'words': [], 'openers': [], 'endings': []}
+    for sentence in re.findall(r"[^.!?]+[.!?]", text):
+        words = re.findall(r"[A-Za-z']+", sentence)
+        if not words:
+            continue
+        vocabulary['openers'].append(words[0])
+        vocabulary['words'].extend(words[1:])
+        vocabulary['endings'].append(sentence[-1])
+    return vocabulary
+
+
+def generate_corpus(path: str, stories: int, sentence_length: float, sentences_per_story: float, seed: int) -> None:
+    vocabulary = sample_vocabulary(SAMPLE_FILE)
+    rng = random.Random(seed)
+    with open(path, 'w') as f:
+        for _ in range(stories):
+            sentences = []
+            for _ in range(max(1, round(rng.gauss(sentences_per_story, sentences_per_story / 3)))):
+                length = max(2, round(rng.gauss(sentence_length, sentence_length / 3)))
+                words = [rng.choice(vocabulary['openers'])]
+                for _ in range(length - 1):
+                    if rng.random() < 0.08:
+                        words[-1] += ','
+                    words.append(rng.choice(vocabulary['words']))
+                sentences.append(' '.join(words) + rng.choice(vocabulary['endings']))
+            f.write(' '.join(sentences) + '\n<|endoftext|>\n')
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=HERE, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    except (subprocess.CalledProcessError, FileNotFoundError):
+        return 'unknown'
+
+
+def time_end_to_end(corpus: str, workdir: str, extra_args: List[str]) -> float:
+    database = os.path.join(workdir, 'end-to-end.sqlite')
+    if os.path.exists(database):
+        os.remove(database)
+    command = [sys.executable, os.path.join(HERE, 'wordnetify.py'), '--database', database, '--file', corpus] + extra_args
+    start = time.perf_counter()
+    subprocess.run(command, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+    return time.perf_counter() - start
+
+
+def time_stages(corpus: str, workdir: str, tokenizer_name: str, snapshot_path: Optional[str] = None) -> Dict[str, object]:
+    """Run each stage of the pipeline over the whole corpus before starting the next."""
+    import tokenization
+    import wordnetify
+    tokenizer = tokenization.get_tokenizer(tokenizer_name)
+    wordnetify.download_nltk_data(tokenizer_name, snapshot_path)
+    timings = collections.OrderedDict()
+    counts = collections.OrderedDict()
+
+    start = time.perf_counter()
+    chunks = list(wordnetify.read_file_in_chunks(corpus))
+    timings['read'] = time.perf_counter() - start
+    counts['stories'] = len(chunks)
+
+    start = time.perf_counter()
+    sentences = [tokenizer.sentences(story) for (pos, story) in chunks]
+    timings['sentence_split'] = time.perf_counter() - start
+    counts['sentences'] = sum(len(s) for s in sentences)
+
+    start = time.perf_counter()
+    tokens = [[tokenizer.words(sentence) for sentence in story] for story in sentences]
+    timings['word_tokenize'] = time.perf_counter() - start
+    counts['tokens'] = sum(len(words) for story in tokens for words in story)
+
+    # WordNet loads itself lazily; don't count that against the first lookup
+    start = time.perf_counter()
+    wordnetify.set_wordnet(snapshot_path)
+    wordnetify.wordnet.ensure_loaded()
+    timings['wordnet_load'] = time.perf_counter() - start
+    wordnetify.set_synset_cache_size(wordnetify.DEFAULT_SYNSET_CACHE_SIZE)
+    start = time.perf_counter()
+    analyses = [[(sentence, [(word, wordnetify.lookup_synsets(word.lower())) for word in words])
+                 for (sentence, words) in zip(story_sentences, story_tokens)]
+                for (story_sentences, story_tokens) in zip(sentences, tokens)]
+    timings['synset_lookup'] = time.perf_counter() - start
+    info = wordnetify.lookup_synsets.cache_info()
+    counts['synset_lookups'] = info.hits + info.misses
+    counts['synset_cache_misses'] = info.misses
+
+    database = os.path.join(workdir, 'stages.sqlite')
+    if os.path.exists(database):
+        os.remove(database)
+    conn = sqlite3.connect(database)
+    wordnetify.create_schema(conn)
+    conn.execute("insert into filepositions (filename, position) values (?, 0)", [corpus])
+    start = time.perf_counter()
+    writer = wordnetify.BulkWriter(conn, corpus)
+    for story_number, ((pos, story), analysis) in enumerate(zip(chunks, analyses)):
+        writer.add_story(story_number, analysis, pos)
+    writer.flush()
+    timings['write'] = time.perf_counter() - start
+    conn.close()
+
+    return {'seconds': timings, 'counts': counts}
+
+
+def run_tier(tier: str, args: argparse.Namespace, workdir: str) -> Dict[str, object]:
+    stories = TIERS[tier] if args.stories is None else args.stories
+    if stories is None:
+        corpus = SAMPLE_FILE
+    else:
+        corpus = os.path.join(workdir, f'{tier}.txt')
+        generate_corpus(corpus, stories, args.sentence_length, args.sentences_per_story, args.seed)
+    result = collections.OrderedDict()
+    result['tier'] = tier
+    result['corpus_bytes'] = os.path.getsize(corpus)
+    result['wordnetify_args'] = args.wordnetify_args
+    result['tokenizer'] = args.tokenizer
+    result['wordnet_snapshot'] = args.wordnet_snapshot
+    end_to_end = min(time_end_to_end(corpus, workdir, args.wordnetify_args) for _ in range(args.repeat))
+    result['end_to_end_seconds'] = end_to_end
+    stages = time_stages(corpus, workdir, args.tokenizer, args.wordnet_snapshot)
+    result.update(stages)
+    result['stories_per_second'] = stages['counts']['stories'] / end_to_end if end_to_end > 0 else None
+    return result
+
+
+def compare(old_path: str, new_path: str) -> None:
+    old = json.load(open(old_path))
+    new = json.load(open(new_path))
+    print(f"{old['commit'][:10]} -> {new['commit'][:10]}")
+    old_tiers = {r['tier']: r for r in old['results']}
+    for result in new['results']:
+        before = old_tiers.get(result['tier'])
+        if before is None:
+            continue
+        print(f"## {result['tier']}")
+        rows = [('end to end', before['end_to_end_seconds'], result['end_to_end_seconds'])]
+        for stage, seconds in result['seconds'].items():
+            if stage in before['seconds']:
+                rows.append((stage, before['seconds'][stage], seconds))
+        for (name, was, now) in rows:
+            ratio = f"{was / now:6.2f}x" if now > 0 else "     -"
+            print(f"   {name:16} {was:10.3f}s {now:10.3f}s {ratio}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Benchmark wordnetify.py on synthetic TinyStories-like corpora.")
+    parser.add_argument("--tier", action="append", choices=list(TIERS.keys()),
+                        help="Which corpus sizes to run (can be repeated). Defaults to sample and small.")
+    parser.add_argument("--stories", type=int, help="Override the number of stories in the generated corpora")
+    parser.add_argument("--sentence-length", type=float, default=11.0, help="Mean number of words in a sentence")
+    parser.add_argument("--sentences-per-story", type=float, default=9.0, help="Mean number of sentences in a story")
+    parser.add_argument("--seed", type=int, default=1, help="Random seed for the corpus generator")
+    parser.add_argument("--tokenizer", default="nltk", choices=["nltk", "regex"],
+                        help="Tokenizer for the per-stage timings (pass --tokenizer to wordnetify.py with --wordnetify-args)")
+    parser.add_argument("--wordnet-snapshot", help="Look synsets up in this wordnet_snapshot.py file for the per-stage timings")
+    parser.add_argument("--repeat", type=int, default=1, help="Run wordnetify.py this many times and keep the fastest")
+    parser.add_argument("--wordnetify-args", nargs=argparse.REMAINDER, default=[],
+                        help="Anything after this is passed on to wordnetify.py (e.g. --workers 4)")
+    parser.add_argument("--output", help="Where to write the JSON results. Defaults to benchmark-<commit>.json")
+    parser.add_argument("--keep-files", help="Keep the generated corpora and databases in this directory")
+    parser.add_argument("--compare", nargs=2, metavar=("OLD", "NEW"), help="Compare two results files instead of running anything")
+    args = parser.parse_args()
+
+    if args.compare:
+        compare(*args.compare)
+        return
+
+    commit = git_commit()
+    report = collections.OrderedDict()
+    report['commit'] = commit
+    report['when'] = time.strftime('%Y-%m-%dT%H:%M:%S')
+    report['python'] = platform.python_version()
+    report['platform'] = platform.platform()
+    report['cpu_count'] = os.cpu_count()
+    report['results'] = []
+
+    tiers = args.tier if args.tier else ['sample', 'small']
+    if args.keep_files:
+        os.makedirs(args.keep_files, exist_ok=True)
+        workdir = args.keep_files
+        for tier in tiers:
+            report['results'].append(run_tier(tier, args, workdir))
+    else:
+        with tempfile.TemporaryDirectory() as workdir:
+            for tier in tiers:
+                report['results'].append(run_tier(tier, args, workdir))
+
+    output = args.output if args.output else f'benchmark-{commit[:10]}.json'
+    with open(output, 'w') as f:
+        json.dump(report, f, indent=2)
+    for result in report['results']:
+        stages = ', '.join(f"{stage} {seconds:.2f}s" for stage, seconds in result['seconds'].items())
+        print(f"{result['tier']}: {result['end_to_end_seconds']:.2f}s end to end ({stages})")
+    print(f"Results written to {output}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+#!/usr/bin/env python3
+
+# Pronouns, articles, conjunctions, prepositions and punctuation don't need a
+# language model: "a" is (article.other) and "," is (punctuation.other) every time.
+# This resolves them straight from the word lists in wordpaths.py, with
+# resolving_model = 'closed-class-rules', so that generate_multisynset_batch.py
+# doesn't pay to ask about them.
+#
+# Only words with one possible answer are done: not words that are in two lists
+# ("for", "but"), not the ones in wordpaths.not_always_closed_class, and not
+# prepositions that WordNet knows other senses for (apart from a few that are
+# never anything else in TinyStories).
+
+import argparse
+import collections
+import sqlite3
+
+import resolving_models
+import wordpaths
+
+RESOLVING_MODEL = resolving_models.CLOSED_CLASS_RULES
+
+def rules():
+    """{lowercase word: pseudo-synset} for every word the rules can resolve."""
+    classes = collections.defaultdict(set)
+    for (pseudo_synset, words) in wordpaths.closed_classes:
+        for word in words:
+            classes[word].add(pseudo_synset)
+    return {word: pseudo_synsets.pop() for (word, pseudo_synsets) in classes.items()
+            if len(pseudo_synsets) == 1 and word not in wordpaths.not_always_closed_class}
+
+def prepare(conn):
+    # Work out the answer (and word_paths path) for each word type the rules cover,
+    # into a temp table. Returns the ids of those word types.
+    word_rules = rules()
+    cursor = conn.cursor()
+    lookup_paths = {}
+    cursor.execute("select count(*) from sqlite_master where type = 'table' and name = 'synset_paths'")
+    if cursor.fetchone()[0] > 0:
+        cursor.execute("select synset_name, path from synset_paths where synset_name in (" + ", ".join("?" * len(word_rules)) + ")",
+                       list(word_rules))
+        lookup_paths = dict(cursor.fetchall())
+    rows = []
+    cursor.execute("select id, word, synset_count from word_types")
+    for (word_type_id, word, synset_count) in cursor.fetchall():
+        pseudo_synset = word_rules.get(word.lower())
+        if pseudo_synset is None:
+            continue
+        if (pseudo_synset == '(preposition.other)' and synset_count > 0
+                and word.lower() not in wordpaths.prepositions_despite_wordnet):
+            continue
+        path = wordpaths.word_path(word, pseudo_synset, None, lookup_paths.get(word.lower()))
+        path_key = wordpaths.encode_path_key(path) if path is not None else None
+        rows.append((word_type_id, pseudo_synset, path, path_key))
+    cursor.execute("create temp table if not exists closed_class_types (word_type_id INTEGER PRIMARY KEY, resolved_synset TEXT, path TEXT, path_key BLOB)")
+    cursor.execute("delete from temp.closed_class_types")
+    cursor.executemany("insert into temp.closed_class_types (word_type_id, resolved_synset, path, path_key) values (?, ?, ?, ?)", rows)
+    return {row[0] for row in rows}
+
+def resolve(conn, word_ids=None):
+    # Resolve these words (or every word that isn't waiting on a batch, if word_ids
+    # is None) that the rules cover and that aren't resolved yet. Call prepare()
+    # first. Returns the number of words resolved. Doesn't commit.
+    cursor = conn.cursor()
+    if word_ids is None:
+        word_filter = resolving_models.unclaimed(conn)
+    else:
+        cursor.execute("create temp table if not exists closed_class_words (word_id INTEGER PRIMARY KEY)")
+        cursor.execute("delete from temp.closed_class_words")
+        cursor.executemany("insert or ignore into temp.closed_class_words (word_id) values (?)", [(word_id,) for word_id in word_ids])
+        word_filter = " and words.id in (select word_id from temp.closed_class_words)"
+    cursor.execute(f"""update words set resolved_synset = closed_class_types.resolved_synset,
+            resolving_model = ?, resolved_timestamp = current_timestamp
+        from temp.closed_class_types
+        where words.word_type_id = closed_class_types.word_type_id and words.resolved_synset is null{word_filter}""",
+                   [RESOLVING_MODEL])
+    resolved = cursor.rowcount
+    if resolved > 0 and wordpaths.has_word_paths(conn):
+        # The path only depends on the word type, so this can be done in SQL
+        cursor.execute(f"""insert or ignore into word_paths (word_id, path, path_key)
+            select words.id, closed_class_types.path, closed_class_types.path_key
+            from temp.closed_class_types join words on (words.word_type_id = closed_class_types.word_type_id)
+            where words.resolving_model = ? and closed_class_types.path is not null{word_filter}""",
+                       [RESOLVING_MODEL])
+    return resolved
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolve pronouns, articles, conjunctions, prepositions and punctuation without a language model")
+    parser.add_argument("--database", required=True, help="Where the database is")
+    parser.add_argument("--list", action="store_true", help="Just show which words the rules cover")
+    args = parser.parse_args()
+    if args.list:
+        for (word, pseudo_synset) in sorted(rules().items(), key=lambda item: (item[1], item[0])):
+            print(f"{pseudo_synset}\t{word}")
+        return
+
+    conn = sqlite3.connect(args.database)
+    conn.execute("pragma busy_timeout = 30000;")
+    conn.execute("pragma journal_mode = WAL;")
+    word_types = prepare(conn)
+    resolved = resolve(conn)
+    conn.commit()
+    print(f"Resolved {resolved} words of {len(word_types)} closed-class word types")
+
+if __name__ == '__main__':
+    main()
@@ -81,20 +81,27 @@ def display_sentence(conn, sentence_id):
 
 WordSeq = namedtuple('WordSet', ['words', 'has_incomplete'])
     
-def get_words(conn, sentence_id):
+def get_words(conn, sentence_id, use_word_paths=False):
     cursor = conn.cursor()
-    cursor.execute("SELECT id, word, resolved_synset FROM words WHERE sentence_id = ? ORDER BY word_number", (sentence_id,))
+    if use_word_paths:
+        # make_wordnet_database.py has already worked out the paths
+        cursor.execute("""SELECT words.id, word, resolved_synset, path FROM words
+                          LEFT JOIN word_paths ON (word_id = words.id)
+                          WHERE sentence_id = ? ORDER BY word_number""", (sentence_id,))
+        words = [WordData(word_id=w_id, word=w, synset=resolved_synset, path=path) for (w_id, w, resolved_synset, path) in cursor]
+    else:
+        cursor.execute("SELECT id, word, resolved_synset FROM words WHERE sentence_id = ? ORDER BY word_number", (sentence_id,))
+        words = [get_path(conn, w_id,  w, resolved_synset) for (w_id, w, resolved_synset) in cursor.fetchall()]
     answer = []
     incomplete = False
-    for w_id, w, resolved_synset in cursor:
-        word = get_path(conn, w_id,  w, resolved_synset)
+    for word in words:
         if not word.path:
             incomplete = True
         answer.append(word)
     return WordSeq(words=answer, has_incomplete=incomplete)
 
-def display_word_by_word(conn, sentence_id, show_paths=False, show_incomplete=False, only_incomplete=False):
-    words = get_words(conn, sentence_id)
+def display_word_by_word(conn, sentence_id, show_paths=False, show_incomplete=False, only_incomplete=False, use_word_paths=False):
+    words = get_words(conn, sentence_id, use_word_paths)
     if words.has_incomplete and not show_incomplete:
         return
     if only_incomplete and not words.has_incomplete:
@@ -136,6 +143,7 @@ def main():
         args.show_incomplete = True
 
     conn = get_db_connection(args.database)
+    use_word_paths = wordpaths.has_word_paths(conn)
 
     if not args.sentence_id and not args.sentence_number:
         if args.story_id:
@@ -146,7 +154,7 @@ def main():
             sentences = get_all_sentences(conn)
         for sentence in sentences:
             if args.word_by_word:
-                display_word_by_word(conn, sentence, args.show_paths, args.show_incomplete, args.only_incomplete)
+                display_word_by_word(conn, sentence, args.show_paths, args.show_incomplete, args.only_incomplete, use_word_paths)
             else:
                 display_sentence(conn, sentence)
     else:
@@ -154,7 +162,7 @@ def main():
         if sentence is None:
             sys.exit("Error: no sentences match the arguments given")
         if args.word_by_word:
-            display_word_by_word(conn, sentence, args.show_paths, args.show_incomplete, args.only_incomplete)
+            display_word_by_word(conn, sentence, args.show_paths, args.show_incomplete, args.only_incomplete, use_word_paths)
         else:
             display_sentence(conn, sentence)
 
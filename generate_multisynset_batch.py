@@ -1,153 +1,133 @@
 #!/usr/bin/env python3
 
 import argparse
+import concurrent.futures
+import functools
 import json
 import sqlite3
 import time
 import signal
 import os
+import closed_class
 import openai
+import pricing
+import resolution_cache
 
 import sys
-parser = argparse.ArgumentParser()
-parser.add_argument("--database", required=True, help="Where the database is")
-parser.add_argument("--congruent", type=int, help="Only process rows with ids that are congruent to this number")
-parser.add_argument("--modulo", type=int, help="Only process rows with ids that are congruent to --congruent modulo this number")
-parser.add_argument("--limit", type=int, help="Stop after processing this many rows")
-parser.add_argument("--progress-bar", action="store_true", help="Show a progress bar")
-parser.add_argument("--output-file", required=True, help="Where to put the batch file")
-parser.add_argument("--dry-run", action="store_true", help="Don't send the batch to OpenAI")
-parser.add_argument("--verbose", action="store_true", help="Lots of debugging messages")
-parser.add_argument("--openai-api-key", default=os.path.expanduser("~/.openai.key"))
-parser.add_argument("--batch-id-save-file", help="What file to put the local batch ID into")
-args = parser.parse_args()
-
-conn = sqlite3.connect(args.database)
-cursor = conn.cursor()
-update_cursor = conn.cursor()
-cursor.execute("pragma busy_timeout = 30000;")
-cursor.execute("pragma journal_mode = WAL;")
-update_cursor.execute("pragma busy_timeout = 30000;")
-update_cursor.execute("pragma journal_mode = WAL;")
-
-update_cursor.execute("create table if not exists batches (id integer primary key autoincrement, openai_batch_id text, when_created datetime default current_timestamp, when_sent datetime, when_retrieved datetime)")
-update_cursor.execute("create index if not exists batches_to_retrieve on batches(openai_batch_id) where when_sent is not null and when_retrieved is null")
-cursor.execute("create table if not exists batchwords (batch_id integer references batches(id), word_id integer references words(id))")
-update_cursor.execute("create index if not exists batches_by_word_id on batchwords(word_id)")
-update_cursor.execute("create index if not exists batches_by_batch_id on batchwords(batch_id)")
-
-
-update_cursor.execute("begin transaction;")
-update_cursor.execute("insert into batches default values")
-batch_id = update_cursor.lastrowid
-
-
-if (args.congruent is not None and args.modulo is None) or (args.congruent is None and args.modulo is not None):
-    sys.exit("Must specify both --congruent and --modulo or neither")
-
-query = "select distinct story_id, words.id, sentence_id, word_number, word from words join sentences on (sentence_id = sentences.id) left join batchwords on (words.id = batchwords.word_id) left join batches on (batch_id = batches.id) where resolved_synset is null and (batch_id is null)"
-
-if args.congruent is not None and args.modulo is not None:
-    query += f" and story_id % {args.modulo} = {args.congruent}"
-    cursor.execute(f"create index if not exists sentences_by_story_{args.congruent}_mod_{args.modulo} on sentences(id) where story_id % {args.modulo} = {args.congruent}")
-else:
-    cursor.execute(f"create index if not exists unresolved_words on words(resolved_synset) where resolved_synset is null and synset_count > 1")
-
-if args.limit is not None:
-    query += f" limit {args.limit}"
-
-cursor.execute(query)
-iterator = []
-for row in cursor:
-    iterator.append(row)
-
-if args.progress_bar:
-    import tqdm
-    if args.limit:
-        iterator = tqdm.tqdm(iterator, total=args.limit)
-    else:
-        iterator = tqdm.tqdm(iterator)
-
-
-def get_sentence(sentence_id):
-    sentence_cursor = conn.cursor()
-    # if synset_cursor pragmas are redundant, then these are too
-    sentence_cursor.execute("pragma busy_timeout = 30000;")
-    sentence_cursor.execute("pragma journal_mode = WAL;")
-    sentence_cursor.execute("select sentence from sentences where id = ?", [sentence_id])
-    row = sentence_cursor.fetchone()
-    if row is None:
-        sys.exit(f"Impossible condition: missing sentence #{sentence_id}")
-    sentence = row[0]
-    sentence_cursor.close()
-    return sentence
-
-def get_synsets(word_id):
-    synset_cursor = conn.cursor()
-    # I don't know if this is necessary
-    synset_cursor.execute("pragma busy_timeout = 30000;")
-    synset_cursor.execute("pragma journal_mode = WAL;")
-    synset_cursor.execute("select synsets.id, description, examples from synsets join word_synsets on (synsets.id = synset_id) and word_id = ?", [word_id])
-    answer = []
-    for row in synset_cursor:
-        answer.append(row)
-    return answer
-
-tools = [ { "type": "function",
-            "function": {
-                "name": "specify_synset",
-                "description": "Specify which synset is being used",
-                "strict": True,
-                "parameters": {
-                    "type": "object",
-                    "additionalProperties": False,
-                    "properties": {
-                        "synset": {
-                            "type": "string",
-                            "description": "Which synset the word corresponds to, or '(other)' if none of the supplied synsets are appropriate",
-                            "enum": []
-                        }
-                    },
-                    "required": ["synset"],
-                },
-            },
-        }
-    ]
-
-output_file = open(args.output_file, 'w')
-
-did_something = False
-for (story_id, word_id, sentence_id, word_number, word) in iterator:
-    did_something = True
-    if args.progress_bar:
-      iterator.set_description(f"Story {story_id}")
-    sentence = get_sentence(sentence_id)
 
+# Exit status when there are no words left to send, so that batchdaemon.py can tell
+# that apart from something going wrong
+NOTHING_TO_DO = 3
+
+OTHER_ALTERNATIVES = ["(noun.other)", "(pronoun.other)", "(propernoun.other)", "(verb.other)", "(article.other)", "(preposition.other)", "(adjective.other)", "(adverb.other)", "(conjunction.other)", "(punctuation.other)", "(other.other)"]
+
+def parse_args():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--database", required=True, help="Where the database is")
+    parser.add_argument("--congruent", type=int, help="Only process rows with ids that are congruent to this number")
+    parser.add_argument("--modulo", type=int, help="Only process rows with ids that are congruent to --congruent modulo this number")
+    parser.add_argument("--limit", type=int, help="Stop after processing this many rows")
+    parser.add_argument("--progress-bar", action="store_true", help="Show a progress bar")
+    parser.add_argument("--output-file", required=True, help="Where to put the batch file. If the work needs more than one file, the others get -2, -3 and so on added to the name")
+    parser.add_argument("--dry-run", action="store_true", help="Don't send the batch to OpenAI")
+    parser.add_argument("--verbose", action="store_true", help="Lots of debugging messages")
+    parser.add_argument("--openai-api-key", default=os.path.expanduser("~/.openai.key"))
+    parser.add_argument("--batch-id-save-file", help="What file to put the local batch ID into")
+    parser.add_argument("--chunk-size", type=int, default=5000, help="Number of words to read from the database at a time")
+    parser.add_argument("--per-sentence", action="store_true",
+                        help="Send one request per sentence that asks about all of its unresolved words, instead of one request per word")
+    parser.add_argument("--max-words-per-request", type=int, default=20,
+                        help="With --per-sentence, split sentences with more unresolved words than this into several requests")
+    parser.add_argument("--max-enum-values", type=int, default=500,
+                        help="With --per-sentence, the most synset choices to put in one request's tool schema (OpenAI's strict mode has a limit)")
+    parser.add_argument("--max-requests-per-batch", type=int, default=40000,
+                        help="Start a new batch file after this many requests")
+    parser.add_argument("--max-batch-bytes", type=int, default=190 * 1024 * 1024,
+                        help="Start a new batch file before it gets bigger than this (OpenAI's limit is 200MB)")
+    parser.add_argument("--max-batches", type=int, help="Don't make more than this many batch files")
+    parser.add_argument("--token-budget", type=int,
+                        help="Stop adding requests before the estimated prompt and completion tokens go over this")
+    parser.add_argument("--dollar-budget", type=float,
+                        help="Stop adding requests before their estimated cost (in US dollars, at batch prices) goes over this")
+    parser.add_argument("--upload-workers", type=int, default=4, help="How many batch files to upload and create at once")
+    parser.add_argument("--no-closed-class-rules", dest="use_closed_class_rules", action="store_false",
+                        help="Send pronouns, articles, conjunctions, prepositions and punctuation to OpenAI too, instead of resolving them by rule")
+    parser.add_argument("--no-resolution-cache", dest="use_resolution_cache", action="store_false",
+                        help="Don't resolve words from the answers already given for the same word in the same sentence")
+    args = parser.parse_args()
+    if (args.congruent is not None and args.modulo is None) or (args.congruent is None and args.modulo is not None):
+        sys.exit("Must specify both --congruent and --modulo or neither")
+    return args
+
+def open_database(database):
+    conn = sqlite3.connect(database)
+    cursor = conn.cursor()
+    cursor.execute("pragma busy_timeout = 30000;")
+    cursor.execute("pragma journal_mode = WAL;")
+
+    cursor.execute("create table if not exists batches (id integer primary key autoincrement, openai_batch_id text, when_created datetime default current_timestamp, when_sent datetime, when_retrieved datetime)")
+    cursor.execute("create index if not exists batches_to_retrieve on batches(openai_batch_id) where when_sent is not null and when_retrieved is null")
+    cursor.execute("create table if not exists batchwords (batch_id integer references batches(id), word_id integer references words(id))")
+    cursor.execute("create index if not exists batches_by_word_id on batchwords(word_id)")
+    cursor.execute("create index if not exists batches_by_batch_id on batchwords(batch_id)")
+    pricing.add_estimate_columns(conn, 'batchwords')
+    return conn
+
+def unresolved_word_chunks(conn, congruent=None, modulo=None, limit=None, chunk_size=5000, whole_sentences=False):
+    """Yield lists of words that need resolving and aren't in a sent batch yet, in word id order.
+
+    Each word comes as (story_id, word_id, sentence_id, word_number, word, sentence, word_type_id).
+    Words are read a chunk at a time (keyset pagination on words.id), with their sentence
+    in the same query. The caller can safely write to batchwords between chunks. With
+    whole_sentences, a chunk doesn't stop part way through a sentence (unless the
+    sentence alone is bigger than a chunk)."""
+    cursor = conn.cursor()
+    # Lets us walk the unresolved words in id order without reading the resolved ones
+    cursor.execute("create index if not exists unresolved_word_ids on words(id) where resolved_synset is null")
+    story_filter = ""
+    if congruent is not None and modulo is not None:
+        story_filter = f" and story_id % {modulo} = {congruent}"
+        cursor.execute(f"create index if not exists sentences_by_story_{congruent}_mod_{modulo} on sentences(id) where story_id % {modulo} = {congruent}")
+    else:
+        cursor.execute(f"create index if not exists unresolved_words on words(resolved_synset) where resolved_synset is null and synset_count > 1")
+    query = f"""select story_id, words.id, sentence_id, word_number, word, sentence, word_type_id
+        from words join sentences on (sentence_id = sentences.id)
+        where words.id > ? and resolved_synset is null
+          and not exists (select 1 from batchwords join batches on (batches.id = batch_id)
+                          where batchwords.word_id = words.id and batches.when_sent is not null){story_filter}
+        order by words.id
+        limit ?"""
+    last_word_id = -1
+    remaining = limit
+    while remaining is None or remaining > 0:
+        this_chunk = chunk_size if remaining is None else min(chunk_size, remaining)
+        cursor.execute(query, [last_word_id, this_chunk])
+        words = cursor.fetchall()
+        if not words:
+            return
+        full = len(words) == this_chunk
+        if whole_sentences and full and words[0][2] != words[-1][2]:
+            # Leave the last sentence for the next chunk; word ids run in sentence order
+            last_sentence_id = words[-1][2]
+            words = [w for w in words if w[2] != last_sentence_id]
+        yield words
+        last_word_id = words[-1][1]
+        if remaining is not None:
+            remaining -= len(words)
+        if not full:
+            return
+
+def render_candidates(synsets):
     prompt = ""
-    alternatives = []
-    for (synset_id, description, examples) in get_synsets(word_id):
-        alternatives.append(synset_id)
+    for (synset_id, description, examples) in synsets:
         prompt += f" ({synset_id}) -- {description}"
         if examples is not None and examples.strip() != '':
             prompt += f"\n       Example use: {examples}"
         prompt += "\n\n"
-    if len(alternatives) == 0:
-       narrative = ""
-       preprompt = f"""Consider this sentence:
-    {sentence}
-The word `{word}` is acting as what part of speech?
+    return prompt
 
-"""
-    else:
-        narrative = "none of those synsets match, and the word is acting as "
-        preprompt = f"""Consider this sentence:
-    {sentence}
-I want to sense annotate the word `{word}` (which is word #{word_number+1}). You can ignore tense and number because we only care about the sense of the lemma. Which of the following meanings is it being used for in this sentence?
-
-"""
-    prompt = preprompt + prompt
-    
-    prompt += f""" (noun.other) -- {narrative} a noun
+def render_other_alternatives(narrative):
+    return f""" (noun.other) -- {narrative} a noun
  (pronoun.other) -- {narrative} a pronoun
  (propernoun.other) -- {narrative} a proper noun
  (verb.other) -- {narrative} a verb
@@ -159,65 +139,411 @@ I want to sense annotate the word `{word}` (which is word #{word_number+1}). You
  (punctuation.other) -- {narrative} punctuation
  (other.other) -- {narrative} something else not otherwise listed here
 """
-    # Really, I should be asking for pronoun class as well (demonstrative) and its part of speech
-    alternatives += ["(noun.other)", "(pronoun.other)", "(propernoun.other)", "(verb.other)", "(article.other)", "(preposition.other)", "(adjective.other)", "(adverb.other)", "(conjunction.other)", "(punctuation.other)", "(other.other)"]
-    tools[0]["function"]["parameters"]["properties"]["synset"]["enum"] = alternatives
 
+def make_tools(properties):
+    return [ { "type": "function",
+                "function": {
+                    "name": "specify_synset",
+                    "description": "Specify which synset is being used",
+                    "strict": True,
+                    "parameters": {
+                        "type": "object",
+                        "additionalProperties": False,
+                        "properties": properties,
+                        "required": list(properties.keys()),
+                    },
+                },
+            }
+        ]
+
+def make_body(prompt, tools):
     messages = [{'role': 'user', 'content': prompt}]
-    batch_text = {
+    return {
+        "model": pricing.DEFAULT_MODEL,
+        "messages": messages,
+        "temperature": 0,
+        "tools": tools,
+        "tool_choice": {"type": "function", "function": {"name": "specify_synset"}}
+    }
+
+class CandidateBlocks:
+    """The candidate synsets of each word type, already rendered as prompt text.
+
+    get(word_type_id) returns (synset ids, text). Every word of a type gets exactly the
+    same text, so it only needs to be read and rendered once."""
+
+    def __init__(self, conn, maxsize=20000):
+        self.conn = conn
+        self.get = functools.lru_cache(maxsize=maxsize)(self.load)
+
+    def load(self, word_type_id):
+        cursor = self.conn.cursor()
+        cursor.execute("select synsets.id, description, examples from word_type_synsets join synsets on (synsets.id = synset_id) where word_type_id = ? order by synsets.id",
+                       [word_type_id])
+        synsets = cursor.fetchall()
+        if len(synsets) == 0:
+            narrative = ""
+        else:
+            narrative = "none of those synsets match, and the word is acting as "
+        # Really, I should be asking for pronoun class as well (demonstrative) and its part of speech
+        return (tuple(synset_id for (synset_id, description, examples) in synsets),
+                render_candidates(synsets) + render_other_alternatives(narrative))
+
+# Prompts go from the most shared to the least: the fixed instructions, then the
+# candidates (the same for every word of a word type), and the sentence last, so
+# that OpenAI's prompt caching can reuse as long a prefix as possible.
+SENSE_INSTRUCTIONS = """I want to sense annotate a word in a sentence. You can ignore tense and number because we only care about the sense of the lemma. The sentence and the word are at the end. Which of the following meanings is the word being used for in the sentence?
+
+"""
+
+PART_OF_SPEECH_INSTRUCTIONS = """I want to know what part of speech a word in a sentence is acting as. The sentence and the word are at the end. Which of these is it?
+
+"""
+
+SENTENCE_INSTRUCTIONS = """I want to sense annotate some of the words in a sentence. You can ignore tense and number because we only care about the sense of the lemma. For each of the words below, which of the meanings listed is it being used for in the sentence? The sentence is at the end.
+
+"""
+
+def make_request(word_id, word, word_number, sentence, candidates):
+    (synset_ids, block) = candidates
+    if len(synset_ids) == 0:
+        prompt = PART_OF_SPEECH_INSTRUCTIONS
+    else:
+        prompt = SENSE_INSTRUCTIONS
+    prompt += block
+    prompt += f"""
+The sentence:
+    {sentence}
+The word: `{word}` (which is word #{word_number+1})
+"""
+    tools = make_tools({
+        "synset": {
+            "type": "string",
+            "description": "Which synset the word corresponds to, or '(other)' if none of the supplied synsets are appropriate",
+            "enum": list(synset_ids) + OTHER_ALTERNATIVES
+        }
+    })
+    return {
         "custom_id": str(word_id),
         "method": "POST",
         "url": "/v1/chat/completions",
-        "body": {
-            "model": "gpt-4o-mini",
-            "messages": messages,
-            "temperature": 0,
-            "tools": tools,
-            "tool_choice": {"type": "function", "function": {"name": "specify_synset"}}
-        }
-    }
-    output_file.write(json.dumps(batch_text) + "\n")
-    if args.verbose:
-        print(word_id, word, sentence)
-    update_cursor.execute("insert into batchwords (batch_id, word_id) values (?,?)", [batch_id, word_id])
-
-if not did_something:
-    sys.exit("Nothing to do.")
-
-output_file.close()
-if args.dry_run:
-    conn.rollback()
-    sys.exit(0)
-
-api_key = open(args.openai_api_key).read().strip()
-client = openai.OpenAI(api_key=api_key)
-
-batch_input_file = client.files.create(
-  file=open(args.output_file, "rb"),
-  purpose="batch"
-)
-
-batch_input_file_id = batch_input_file.id
-
-result = client.batches.create(
-    input_file_id=batch_input_file_id,
-    endpoint="/v1/chat/completions",
-    completion_window="24h",
-    metadata={
-        "description": f"{args.database} batch {batch_id} (wordnetify)",
-        "database": f"{args.database}",
-        "local_batch_id": f"{batch_id}"
+        "body": make_body(prompt, tools)
     }
-)
 
-update_cursor.execute("update batches set openai_batch_id = ?, when_sent = current_timestamp where id = ?",
-         [result.id, batch_id])
-if update_cursor.rowcount != 1:
-    sys.exit(f"Unexpectedly updated {update_cursor.rowcount} rows when we set the openai_batch id to {result.id} for batch {batch_id}")
+def make_sentence_request(sentence_id, sentence, words):
+    """One request that resolves several words of the same sentence.
 
-conn.commit()
+    words is a list of (word_id, word, word_number, candidates). The answer for each
+    word comes back in the property word_<word_id>, which is how batchfetch.py knows
+    which row to update."""
+    prompt = SENTENCE_INSTRUCTIONS
+    properties = {}
+    for (word_id, word, word_number, (synset_ids, block)) in words:
+        if len(synset_ids) == 0:
+            prompt += f"""Word #{word_number+1}, `{word}` (answer as word_{word_id}): what part of speech is it acting as?
 
-if args.batch_id_save_file:
-    with open(args.batch_id_save_file, 'w') as bisf:
-        bisf.write(f"{batch_id}")
+"""
+        else:
+            prompt += f"""Word #{word_number+1}, `{word}` (answer as word_{word_id}):
 
+"""
+        prompt += block + "\n"
+        properties[f"word_{word_id}"] = {
+            "type": "string",
+            "description": f"Which synset word #{word_number+1} (`{word}`) corresponds to",
+            "enum": list(synset_ids) + OTHER_ALTERNATIVES
+        }
+    prompt += f"""The sentence:
+    {sentence}
+"""
+    return {
+        "custom_id": f"sentence-{sentence_id}-{words[0][0]}",
+        "method": "POST",
+        "url": "/v1/chat/completions",
+        "body": make_body(prompt, make_tools(properties))
+    }
+
+def group_by_sentence(chunk, max_words, max_enum_values):
+    """Split a chunk of words into groups from the same sentence, small enough for one strict tool schema."""
+    groups = []
+    enum_values = 0
+    for (story_id, word_id, sentence_id, word_number, word, sentence, candidates) in chunk:
+        size = len(candidates[0]) + len(OTHER_ALTERNATIVES)
+        if (not groups or groups[-1][0] != sentence_id or len(groups[-1][2]) >= max_words
+                or enum_values + size > max_enum_values):
+            groups.append((sentence_id, sentence, []))
+            enum_values = 0
+        groups[-1][2].append((word_id, word, word_number, candidates))
+        enum_values += size
+    return groups
+
+def pending_request(request, word_ids):
+    (prompt_tokens, completion_tokens) = pricing.estimate_request(request['body'])
+    estimate = (prompt_tokens, completion_tokens, pricing.dollars(request['body']['model'], prompt_tokens, completion_tokens))
+    return (json.dumps(request) + "\n", word_ids, estimate)
+
+def pending_requests(conn, args, counts, progress=None):
+    """Yield (JSON line, word ids, estimate) for every request to send, in word id order.
+
+    The estimate is (prompt tokens, completion tokens, dollars).
+
+    Closed-class words (see closed_class.py), and words that the resolution cache
+    already knows the answer to, are resolved straight away instead, and counted in
+    counts['closed_class'] and counts['cache_hits']."""
+    if args.use_closed_class_rules:
+        closed_class_types = closed_class.prepare(conn)
+    if args.use_resolution_cache:
+        resolution_cache.prepare(conn)
+    candidate_blocks = CandidateBlocks(conn)
+    for chunk in unresolved_word_chunks(conn, args.congruent, args.modulo, args.limit, args.chunk_size, args.per_sentence):
+        words_read = len(chunk)
+        last_story_id = chunk[-1][0]
+        if args.use_closed_class_rules:
+            counts['closed_class'] += closed_class.resolve(conn, [word[1] for word in chunk])
+            chunk = [word for word in chunk if word[6] not in closed_class_types]
+        if args.use_resolution_cache:
+            cached = set(resolution_cache.apply(conn, [word[1] for word in chunk]))
+            counts['cache_hits'] += len(cached)
+            chunk = [word for word in chunk if word[1] not in cached]
+        chunk = [(story_id, word_id, sentence_id, word_number, word, sentence, candidate_blocks.get(word_type_id))
+                 for (story_id, word_id, sentence_id, word_number, word, sentence, word_type_id) in chunk]
+        if args.per_sentence:
+            for (sentence_id, sentence, words) in group_by_sentence(chunk, args.max_words_per_request, args.max_enum_values):
+                if args.verbose:
+                    print(sentence_id, [w[0] for w in words], sentence)
+                yield pending_request(make_sentence_request(sentence_id, sentence, words), [w[0] for w in words])
+        else:
+            for (story_id, word_id, sentence_id, word_number, word, sentence, candidates) in chunk:
+                if args.verbose:
+                    print(word_id, word, sentence)
+                yield pending_request(make_request(word_id, word, word_number, sentence, candidates), [word_id])
+        if progress is not None:
+            progress.set_description(f"Story {last_story_id}")
+            progress.update(words_read)
+
+def batch_file_name(output_file, part):
+    # The first file is called what --output-file says; any more get -2, -3, ...
+    if part == 1:
+        return output_file
+    (root, extension) = os.path.splitext(output_file)
+    return f"{root}-{part}{extension}"
+
+class BatchFile:
+    """One batch file being written, and its row in batches."""
+
+    def __init__(self, conn, filename):
+        cursor = conn.cursor()
+        cursor.execute("insert into batches default values")
+        self.batch_id = cursor.lastrowid
+        self.conn = conn
+        self.filename = filename
+        self.file = open(filename, 'w')
+        self.requests = 0
+        self.size = 0
+        self.word_ids = []
+        self.estimated_tokens = [0, 0]
+        self.estimated_dollars = 0.0
+        # (word_id, estimated prompt tokens, estimated completion tokens) for batchwords
+        self.rows = []
+
+    def has_room(self, line, args):
+        # Anything fits in an empty file, even if it's too big on its own
+        if self.requests == 0:
+            return True
+        return self.requests < args.max_requests_per_batch and self.size + len(line.encode()) <= args.max_batch_bytes
+
+    def add(self, line, word_ids, estimate):
+        (prompt_tokens, completion_tokens, dollars) = estimate
+        self.file.write(line)
+        self.requests += 1
+        self.size += len(line.encode())
+        self.word_ids.extend(word_ids)
+        self.estimated_tokens[0] += prompt_tokens
+        self.estimated_tokens[1] += completion_tokens
+        self.estimated_dollars += dollars
+        # Like the costs, the estimate for a request goes against its first word
+        self.rows.append((word_ids[0], prompt_tokens, completion_tokens))
+        self.rows.extend((word_id, 0, 0) for word_id in word_ids[1:])
+
+    def describe(self):
+        return (f"{self.requests} requests for {len(self.word_ids)} words ({self.size} bytes, "
+                f"about {self.estimated_tokens[0]} prompt + {self.estimated_tokens[1]} completion tokens, ${self.estimated_dollars:.2f})")
+
+    def close(self):
+        self.file.close()
+        self.conn.executemany("""insert into batchwords (batch_id, word_id, estimated_prompt_tokens, estimated_completion_tokens)
+            values (?,?,?,?)""", [(self.batch_id, word_id, prompt_tokens, completion_tokens)
+                                  for (word_id, prompt_tokens, completion_tokens) in self.rows])
+
+def write_batch_files(conn, args, batch_written):
+    """Write the requests into as many batch files as it takes to keep each one inside
+    OpenAI's limits, calling batch_written(batch_file) as each one is finished. Stops
+    before the estimated tokens or dollars would go over --token-budget or --dollar-budget.
+
+    Returns the number of words written, and the counts of words resolved without asking."""
+    progress = None
+    if args.progress_bar:
+        import tqdm
+        progress = tqdm.tqdm(total=args.limit)
+    counts = {'closed_class': 0, 'cache_hits': 0}
+    words_written = 0
+    batch_file = None
+    files_started = 0
+    tokens_planned = 0
+    dollars_planned = 0.0
+    for (line, word_ids, estimate) in pending_requests(conn, args, counts, progress):
+        (prompt_tokens, completion_tokens, dollars) = estimate
+        if args.token_budget is not None and tokens_planned + prompt_tokens + completion_tokens > args.token_budget:
+            break
+        if args.dollar_budget is not None and dollars_planned + dollars > args.dollar_budget:
+            break
+        tokens_planned += prompt_tokens + completion_tokens
+        dollars_planned += dollars
+        if batch_file is not None and not batch_file.has_room(line, args):
+            batch_file.close()
+            batch_written(batch_file)
+            batch_file = None
+        if batch_file is None:
+            if args.max_batches is not None and files_started >= args.max_batches:
+                break
+            files_started += 1
+            batch_file = BatchFile(conn, batch_file_name(args.output_file, files_started))
+        batch_file.add(line, word_ids, estimate)
+        words_written += len(word_ids)
+    if batch_file is not None:
+        batch_file.close()
+        batch_written(batch_file)
+    if progress is not None:
+        progress.close()
+    return (words_written, counts)
+
+def submit_batch(client, batch_file, args):
+    # Runs in a worker thread, so it doesn't touch the database
+    with open(batch_file.filename, "rb") as f:
+        batch_input_file = client.files.create(
+          file=f,
+          purpose="batch"
+        )
+
+    result = client.batches.create(
+        input_file_id=batch_input_file.id,
+        endpoint="/v1/chat/completions",
+        completion_window="24h",
+        metadata={
+            "description": f"{args.database} batch {batch_file.batch_id} (wordnetify)",
+            "database": f"{args.database}",
+            "local_batch_id": f"{batch_file.batch_id}"
+        }
+    )
+    return result.id
+
+def record_submissions(conn, submissions, wait):
+    """Store the OpenAI batch id of every finished upload (or every upload, if wait).
+
+    A batch whose upload failed is deleted, so that its words can go in a later one.
+    Returns the batches that were recorded and the ones that failed."""
+    done = [future for future in submissions if wait or future.done()]
+    sent = []
+    failed = []
+    update_cursor = conn.cursor()
+    for future in done:
+        # Only forgotten once it's committed, so if anything goes wrong here the
+        # caller can try again
+        batch_file = submissions[future]
+        try:
+            openai_batch_id = future.result()
+        except Exception as e:
+            sys.stderr.write(f"Could not submit batch {batch_file.batch_id} ({batch_file.filename}): {e}\n")
+            update_cursor.execute("delete from batchwords where batch_id = ?", [batch_file.batch_id])
+            update_cursor.execute("delete from batches where id = ?", [batch_file.batch_id])
+            conn.commit()
+            del submissions[future]
+            failed.append(batch_file)
+            continue
+        update_cursor.execute("update batches set openai_batch_id = ?, when_sent = current_timestamp where id = ?",
+                 [openai_batch_id, batch_file.batch_id])
+        if update_cursor.rowcount != 1:
+            sys.exit(f"Unexpectedly updated {update_cursor.rowcount} rows when we set the openai_batch id to {openai_batch_id} for batch {batch_file.batch_id}")
+        conn.commit()
+        del submissions[future]
+        print(f"Batch {batch_file.batch_id}: {batch_file.describe()} sent as {openai_batch_id}")
+        sent.append(batch_file)
+    return (sent, failed)
+
+def main():
+    args = parse_args()
+    conn = open_database(args.database)
+    client = None
+    if not args.dry_run:
+        api_key = open(args.openai_api_key).read().strip()
+        client = openai.OpenAI(api_key=api_key)
+    update_cursor = conn.cursor()
+    update_cursor.execute("begin transaction;")
+
+    sent = []
+    failed = []
+    written = []
+    submissions = {}
+    try:
+        with concurrent.futures.ThreadPoolExecutor(max_workers=args.upload_workers) as executor:
+
+            def batch_written(batch_file):
+                written.append(batch_file)
+                if args.dry_run:
+                    return
+                # Between files nothing else is half done, so this commits exactly this
+                # batch (and whatever the resolution cache did), claiming its words
+                conn.commit()
+                submissions[executor.submit(submit_batch, client, batch_file, args)] = batch_file
+                (now_sent, now_failed) = record_submissions(conn, submissions, wait=False)
+                sent.extend(now_sent)
+                failed.extend(now_failed)
+
+            (words_written, resolved_here) = write_batch_files(conn, args, batch_written)
+    except BaseException:
+        # The file that was being written hasn't been committed yet, so that goes
+        conn.rollback()
+        raise
+    finally:
+        # However we got here (even ^C), every batch that was committed ends up either
+        # sent or deleted. Otherwise its words would stay claimed by a batch that
+        # nothing ever looks at, or a batch we've paid for would never be fetched.
+        if not args.dry_run:
+            (now_sent, now_failed) = record_submissions(conn, submissions, wait=True)
+            sent.extend(now_sent)
+            failed.extend(now_failed)
+            for batch_file in written:
+                if batch_file in sent or batch_file in failed:
+                    continue
+                sys.stderr.write(f"Batch {batch_file.batch_id} ({batch_file.filename}) was never submitted\n")
+                conn.execute("delete from batchwords where batch_id = ?", [batch_file.batch_id])
+                conn.execute("delete from batches where id = ?", [batch_file.batch_id])
+                failed.append(batch_file)
+            conn.commit()
+
+    if resolved_here['closed_class'] > 0:
+        print(f"Resolved {resolved_here['closed_class']} closed-class words by rule")
+    if resolved_here['cache_hits'] > 0:
+        print(f"Resolved {resolved_here['cache_hits']} words from the resolution cache")
+    if len(written) > 1:
+        print(f"Estimated cost of all {len(written)} batches: ${sum(batch_file.estimated_dollars for batch_file in written):.2f}")
+    if words_written == 0:
+        if not args.dry_run:
+            conn.commit()
+        sys.stderr.write("Nothing to do.\n")
+        sys.exit(NOTHING_TO_DO)
+
+    if args.dry_run:
+        for batch_file in written:
+            print(f"{batch_file.filename}: {batch_file.describe()}")
+        conn.rollback()
+        sys.exit(0)
+
+    if args.batch_id_save_file:
+        with open(args.batch_id_save_file, 'w') as bisf:
+            bisf.write(" ".join(f"{batch_file.batch_id}" for batch_file in sent))
+    if failed:
+        sys.exit(f"{len(failed)} of {len(written)} batches could not be submitted")
+
+if __name__ == "__main__":
+    main()
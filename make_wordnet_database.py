@@ -2,124 +2,146 @@
 
 # This probably should be part of wordnetify.py
 
-import nltk
-from nltk.corpus import wordnet as wn
 import sqlite3
 import argparse
 import sys
+import wordnet_snapshot
 import wordpaths
 
-def traverse_wordnet(db_path):
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
+def load_wordnet(snapshot_path):
+    if snapshot_path is not None:
+        try:
+            return wordnet_snapshot.open_snapshot(snapshot_path)
+        except (OSError, ValueError) as e:
+            sys.exit(str(e))
+    import nltk
+    nltk.download('wordnet', quiet=True)
+    from nltk.corpus import wordnet as wn
+    return wn
+
+# Each worker process opens its own copy of wordnet, and keeps its own PathBuilder
+# so that it only works out the paths of shared ancestors once.
+worker_wordnet = None
+worker_builder = None
+
+def init_worker(snapshot_path):
+    global worker_wordnet, worker_builder
+    worker_wordnet = load_wordnet(snapshot_path)
+    worker_builder = wordpaths.PathBuilder()
+
+def path_for_synset_name(name):
+    return worker_builder.path_string(worker_wordnet.synset(name))
 
+def create_table(conn):
+    c = conn.cursor()
     c.execute('''CREATE TABLE IF NOT EXISTS synset_paths
                  (path TEXT PRIMARY KEY,
                   synset_name TEXT UNIQUE,
-                  definition TEXT)''')
-
-    for synset in wn.all_synsets():
-        path = wordpaths.get_path_string(synset)
+                  definition TEXT,
+                  path_key BLOB)''')
+    wordpaths.add_path_key_column(conn)
+
+def traverse_wordnet(conn, wn, snapshot_path=None, workers=1, progress=False):
+    """Add a row to synset_paths for every synset, and return the names of any that have no path."""
+    synsets = [(synset.name(), synset.pos(), synset.definition()) for synset in wn.all_synsets()]
+    if workers > 1:
+        import multiprocessing
+        pool = multiprocessing.Pool(workers, initializer=init_worker, initargs=(snapshot_path,))
+        # Adjectives and adverbs are just hashed, which isn't worth sending to a worker
+        noun_and_verb_paths = pool.imap(path_for_synset_name, [name for (name, pos, definition) in synsets if pos in ['n', 'v']],
+                                        chunksize=1000)
+        def get_path(name, pos):
+            if pos in ['n', 'v']:
+                return next(noun_and_verb_paths)
+            return wordpaths.get_path_string(wn.synset(name))
+    else:
+        pool = None
+        builder = wordpaths.PathBuilder()
+        def get_path(name, pos):
+            return builder.path_string(wn.synset(name))
+
+    iterator = synsets
+    if progress:
+        import tqdm
+        iterator = tqdm.tqdm(iterator)
+    rows = []
+    missing = []
+    # imap hands the paths back in the order we asked for them, so the rows (and
+    # which one wins when two paths collide) come out the same as a serial run
+    for (name, pos, definition) in iterator:
+        path = get_path(name, pos)
         if path:
-            c.execute("INSERT OR REPLACE INTO synset_paths (path, synset_name, definition) VALUES (?, ?, ?)",
-                      (path, synset.name(), synset.definition()))
+            rows.append((path, name, definition))
         else:
-            print(f"No path for {synset}")
-            input()
-
-    conn.commit()
-    conn.close()
-
-def add_misc(db_path):
-    conn = sqlite3.connect(db_path)
-    c = conn.cursor()
-    personal_pronouns = [ 'i', 'me', 'you', 'he', 'him', 'she', 'her',
-                          'it', 'we', 'us', 'they', 'them' ]
-    possessive_pronouns = [ 'my', 'mine', 'your', 'yours', 'his',
-                            'her', 'hers', 'its', 'our', 'ours', 'their', 'theirs' ]
-    reflexive_pronouns = [ 'myself', 'yourself', 'yourselves',
-                           'himself', 'herself', 'itself', 'ourselves', 'themselves',
-                           'themself' ]
-    demonstrative_pronouns = [ 'this', 'that', 'these', 'those' ]
-    interrogative_and_relative_pronouns = [ 'who', 'whom', 'whose',
-                                            'which', 'what',
-                                            # 'that'
-                                           ]
-    other_pronouns = [ 'everything', 'everyone', 'noone', 'nothing']
-    terminal_punctuation = ['.', '?', '!', '<end-of-text>', '<start-of-text>']
-    pausing_and_separating_punctuation = [',', ';', ':', '-',  '--']
-    quotation_and_parenthetical_punctuation = ['"', "'", '(', ')', '[', ']', '...', '``', "''",'']
-    linking_punctuation = ['/']
-    specialized_punctuation = ['...', '&', '*', '^', '•', "'s"]
-    # I really don't know what to do about 's -- I should identify its role and then do something
-    # cleverer about it.
-
-    conjunctions = ['and', 'or', 'but', 'nor', 'for', 'yet', 'so', 'either', 'neither', 'whether', 'both', 'how', 'if', 'then', 'because', 'when']
-    # I have no structure for prepositions.
-    prepositions = ['in', 'on', 'at', 'by', 'with', 'about', 'against', 'between', 'into', 'through', 'during',
-                    'before', 'after', 'above', 'below', 'to', 'from', 'up', 'down', 'behind',
-                    'near', 'far', 'inside', 'outside', 'onto', 'off', 'across', 'along', 'toward', 'throughout',
-                    'per', 'beyond', 'via',
-                    'under', 'over', 'for', 'of', 'among', 'around', 'beside', 'besides', 'despite',
-                    'except', 'like', 'unlike', 'since', 'until', 'till', 'within', 'without',
-                    'underneath', 'beneath', 'versus', 'amid', 'amidst', 'amongst',
-                    'as', 'but', 'concerning', 'considering', 'depending', 'excluding', 'following',
-                    'including', 'notwithstanding', 'pending', 'regarding', 'save', 'touching', 'upon',
-                    'whereas', 'vs']
-    articles = ['the', 'a', 'an']
-
-
-    for i,p in enumerate(personal_pronouns):
-        c.execute("insert or replace into synset_paths (path, synset_name) values ('1.2.1.' || ?, ?)", [i+1, p])
-    for i,p in enumerate(possessive_pronouns):
-        c.execute("insert or replace into synset_paths (path, synset_name) values  ('1.2.2.' || ?, ?)", [i+1, p])
-    for i,p in enumerate(reflexive_pronouns):
-        # I'm not quite happy with this: I think these should live under "adjectives" (2.*) some of the time.
-        c.execute("insert or replace into synset_paths (path, synset_name) values  ('1.2.3' || ?, ?)", [i+1, p])
-
-    for i,p in enumerate(demonstrative_pronouns):
-        # I'm not quite happy with this either: I think these should live under "nouns" (1.*) some of the time.
-        c.execute("insert or replace into synset_paths (path, synset_name)  values ('2.1.1.' || ?, ?)", [i+1, p])
-
-    for i,p in enumerate(interrogative_and_relative_pronouns):
-        c.execute("insert or replace into synset_paths (path, synset_name) values  ('1.2.4.' || ?, ?)", [i+1, p])
-
-    for i,p in enumerate(other_pronouns):
-        c.execute("insert or replace into synset_paths (path, synset_name) values  ('1.2.5.' || ?, ?)", [i+1, p])    
-
-    for i,p in enumerate(terminal_punctuation):
-        c.execute("insert or replace into synset_paths (path, synset_name)  values ('5.1.1.' || ?, ?)", [i+1, p])
-    for i,p in enumerate(pausing_and_separating_punctuation):
-        c.execute("insert or replace into synset_paths (path, synset_name) values  ('5.2.' || ?, ?)", [i+1, p])
-    for i,p in enumerate(quotation_and_parenthetical_punctuation):
-        c.execute("insert or replace into synset_paths (path, synset_name)  values ('5.3.' || ?, ?)", [i+1, p])
-    for i,p in enumerate(linking_punctuation):
-        c.execute("insert or replace into synset_paths (path, synset_name)  values ('5.4.' || ?, ?)", [i+1, p])
-    for i,p in enumerate(specialized_punctuation):
-        c.execute("insert or replace into synset_paths (path, synset_name)  values ('5.5.' || ?, ?)", [i+1, p])
+            missing.append(name)
+    if pool is not None:
+        pool.close()
+        pool.join()
+    conn.executemany("INSERT OR REPLACE INTO synset_paths (path, synset_name, definition) VALUES (?, ?, ?)", rows)
+    return missing
+
+def add_misc(conn):
+    # (path prefix, path suffix, name): the path is the two concatenated
+    rows = []
+    rows += [('1.2.1.', i+1, p) for i,p in enumerate(wordpaths.personal_pronouns)]
+    rows += [('1.2.2.', i+1, p) for i,p in enumerate(wordpaths.possessive_pronouns)]
+    # I'm not quite happy with this: I think these should live under "adjectives" (2.*) some of the time.
+    rows += [('1.2.3', i+1, p) for i,p in enumerate(wordpaths.reflexive_pronouns)]
+
+    # I'm not quite happy with this either: I think these should live under "nouns" (1.*) some of the time.
+    rows += [('2.1.1.', i+1, p) for i,p in enumerate(wordpaths.demonstrative_pronouns)]
+
+    rows += [('1.2.4.', i+1, p) for i,p in enumerate(wordpaths.interrogative_and_relative_pronouns)]
+
+    rows += [('1.2.5.', i+1, p) for i,p in enumerate(wordpaths.other_pronouns)]
+
+    rows += [('5.1.1.', i+1, p) for i,p in enumerate(wordpaths.terminal_punctuation)]
+    rows += [('5.2.', i+1, p) for i,p in enumerate(wordpaths.pausing_and_separating_punctuation)]
+    rows += [('5.3.', i+1, p) for i,p in enumerate(wordpaths.quotation_and_parenthetical_punctuation)]
+    rows += [('5.4.', i+1, p) for i,p in enumerate(wordpaths.linking_punctuation)]
+    rows += [('5.5.', i+1, p) for i,p in enumerate(wordpaths.specialized_punctuation)]
 
     # Adding conjunctions
-    for i, conj in enumerate(conjunctions):
-        c.execute("insert or replace into synset_paths (path, synset_name) values ('5.1.2.' || ?, ?)", [i+1, conj])
+    rows += [('5.1.2.', i+1, conj) for i, conj in enumerate(wordpaths.conjunctions)]
 
     # Adding prepositions using hash function
-    for prep in prepositions:
-        hash_val = wordpaths.hash_thing(prep)
-        c.execute("insert or replace into synset_paths (path, synset_name) values ('6.' || ?, ?)", [hash_val, prep])
+    rows += [('6.', wordpaths.hash_thing(prep), prep) for prep in wordpaths.prepositions]
 
     # Adding articles
-    for i, article in enumerate(articles):
-        c.execute("insert or replace into synset_paths (path, synset_name) values ('7.' || ?, ?)", [i+1, article])
+    rows += [('7.', i+1, article) for i, article in enumerate(wordpaths.articles)]
 
-    conn.commit()
-    conn.close()
+    conn.executemany("insert or replace into synset_paths (path, synset_name) values (? || ?, ?)", rows)
 
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="Traverse WordNet and store paths in SQLite.")
     parser.add_argument("--database", required=True, help="Path to output SQLite database")
+    parser.add_argument("--wordnet-snapshot", help="Read WordNet from a file made by wordnet_snapshot.py instead of from NLTK")
+    parser.add_argument("--workers", type=int, default=1, help="Number of processes to work out noun and verb paths with")
+    parser.add_argument("--missing-report", default="missing_paths.txt",
+                        help="Where to list the synsets that have no path, if there are any")
+    parser.add_argument("--progress", action="store_true", help="Show a progress bar")
     args = parser.parse_args()
 
-    nltk.download('wordnet', quiet=True)
-    traverse_wordnet(args.database)
-    add_misc(args.database)
+    wn = load_wordnet(args.wordnet_snapshot)
+    conn = sqlite3.connect(args.database)
+    create_table(conn)
+    # Everything goes in as one transaction
+    missing = traverse_wordnet(conn, wn, args.wordnet_snapshot, args.workers, args.progress)
+    add_misc(conn)
+    wordpaths.fill_path_keys(conn)
+    # If the corpus is in the same database, work out the path of every word in it
+    cursor = conn.cursor()
+    cursor.execute("select count(*) from sqlite_master where type = 'table' and name = 'words'")
+    if cursor.fetchone()[0] > 0:
+        wordpaths.create_word_paths_table(conn)
+        wordpaths.refresh_word_paths(conn)
+        # subtree_words() used this before there was word_paths
+        conn.execute("drop index if exists words_by_resolved_synset")
+    conn.commit()
+    conn.close()
+    if missing:
+        with open(args.missing_report, 'w') as f:
+            for name in missing:
+                f.write(f"{name}\n")
+        print(f"No path for {len(missing)} synsets: see {args.missing_report}")
     print("WordNet traversal completed.")
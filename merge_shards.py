@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+
+# Combine the databases written by `wordnetify.py --shard i/n` into one.
+#
+# Stories, sentences and words are renumbered in file order (by story number, then
+# sentence number, then word number), and synsets are added in order of first use,
+# so the result has the same contents as running wordnetify.py over the whole file
+# in one go.
+
+import argparse
+import sqlite3
+import sys
+from typing import List, Tuple
+
+import wordnetify
+import wordpaths
+
+
+def shard_extent(shard_path: str) -> List[Tuple[str, int, int]]:
+    """Return (filename, first story number, last story number) for each file in a shard."""
+    conn = sqlite3.connect(shard_path)
+    cursor = conn.cursor()
+    cursor.execute("select filename, min(story_number), max(story_number) from stories group by filename")
+    answer = cursor.fetchall()
+    conn.close()
+    return answer
+
+
+def order_shards(shard_paths: List[str]) -> List[str]:
+    """Sort the shards into file order, and check that no story appears twice."""
+    extents = []
+    for shard_path in shard_paths:
+        for (filename, first, last) in shard_extent(shard_path):
+            extents.append((filename, first, last, shard_path))
+    extents.sort()
+    for (previous, current) in zip(extents, extents[1:]):
+        if previous[0] != current[0]:
+            continue
+        if current[1] <= previous[2]:
+            sys.exit(f"{previous[3]} and {current[3]} both have stories from {current[0]} (story {current[1]})")
+        if current[1] != previous[2] + 1:
+            sys.stderr.write(f"Warning: stories {previous[2] + 1} to {current[1] - 1} of {current[0]} aren't in any shard\n")
+    answer = []
+    for extent in extents:
+        if extent[3] not in answer:
+            answer.append(extent[3])
+    # A shard might cover several files; it has to be in one piece in the ordering
+    for shard_path in answer:
+        positions = [i for (i, extent) in enumerate(extents) if extent[3] == shard_path]
+        if positions != list(range(positions[0], positions[-1] + 1)):
+            sys.exit(f"{shard_path} can't be merged in file order: it is interleaved with other shards")
+    return answer
+
+
+def merge_shard(conn: sqlite3.Connection, shard_path: str) -> None:
+    cursor = conn.cursor()
+    cursor.execute("attach database ? as shard", [shard_path])
+    cursor.execute("select type from shard.sqlite_master where name = 'word_synsets'")
+    row = cursor.fetchone()
+    if row is not None and row[0] == 'table':
+        sys.exit(f"{shard_path} was made by an older wordnetify.py: run wordnetify.py --database {shard_path} --migrate-word-types first")
+
+    cursor.execute("select count(*) from stories join shard.stories using (filename, story_number)")
+    if cursor.fetchone()[0] > 0:
+        sys.exit(f"Some of the stories in {shard_path} are already in the output database")
+
+    story_base = wordnetify.next_row_id(conn, 'stories') - 1
+    sentence_base = wordnetify.next_row_id(conn, 'sentences') - 1
+    word_base = wordnetify.next_row_id(conn, 'words') - 1
+
+    cursor.execute("drop table if exists temp.story_map")
+    cursor.execute("drop table if exists temp.sentence_map")
+    cursor.execute("drop table if exists temp.word_map")
+    cursor.execute("""create temp table story_map as
+        select id as old_id, ? + row_number() over (order by filename, story_number) as new_id
+        from shard.stories""", [story_base])
+    cursor.execute("create unique index temp.story_map_old on story_map(old_id)")
+    cursor.execute("""create temp table sentence_map as
+        select sentences.id as old_id, ? + row_number() over (order by story_map.new_id, sentence_number) as new_id
+        from shard.sentences as sentences join story_map on (story_id = story_map.old_id)""", [sentence_base])
+    cursor.execute("create unique index temp.sentence_map_old on sentence_map(old_id)")
+    cursor.execute("""create temp table word_map as
+        select words.id as old_id, ? + row_number() over (order by sentence_map.new_id, word_number) as new_id
+        from shard.words as words join sentence_map on (sentence_id = sentence_map.old_id)""", [word_base])
+    cursor.execute("create unique index temp.word_map_old on word_map(old_id)")
+    # Word types are matched up by their text; the ones we haven't seen before are
+    # numbered in order of first appearance, continuing on from the output database.
+    cursor.execute("drop table if exists temp.word_type_map")
+    cursor.execute("""create temp table word_type_map as
+        select shard_types.id as old_id,
+               main_types.id is null as is_new,
+               coalesce(main_types.id, ? + sum(main_types.id is null) over (order by shard_types.id)) as new_id
+        from shard.word_types as shard_types left join main.word_types as main_types using (word)""",
+                   [wordnetify.next_row_id(conn, 'word_types') - 1])
+    cursor.execute("create unique index temp.word_type_map_old on word_type_map(old_id)")
+
+    cursor.execute("""insert into filepositions (filename, position)
+        select filename, position from shard.filepositions where true
+        on conflict (filename) do update set position = max(position, excluded.position)""")
+    cursor.execute("""insert into stories (id, filename, story_number)
+        select new_id, filename, story_number
+        from shard.stories as stories join story_map on (id = old_id)
+        order by new_id""")
+    cursor.execute("""insert into sentences (id, story_id, sentence_number, sentence)
+        select sentence_map.new_id, story_map.new_id, sentence_number, sentence
+        from shard.sentences as sentences
+          join sentence_map on (sentences.id = sentence_map.old_id)
+          join story_map on (story_id = story_map.old_id)
+        order by sentence_map.new_id""")
+    cursor.execute("""insert into word_types (id, word, synset_count)
+        select new_id, word, synset_count
+        from shard.word_types as word_types join word_type_map on (id = old_id)
+        where is_new
+        order by new_id""")
+    cursor.execute("""insert into words (id, sentence_id, word_number, word, synset_count, resolved_synset,
+                                         resolving_model, resolved_timestamp, resolution_compute_time, word_type_id)
+        select word_map.new_id, sentence_map.new_id, word_number, word, synset_count, resolved_synset,
+               resolving_model, resolved_timestamp, resolution_compute_time, word_type_map.new_id
+        from shard.words as words
+          join word_map on (words.id = word_map.old_id)
+          join sentence_map on (sentence_id = sentence_map.old_id)
+          join word_type_map on (word_type_id = word_type_map.old_id)
+        order by word_map.new_id""")
+    cursor.execute("""insert or ignore into word_type_synsets (word_type_id, synset_id)
+        select new_id, synset_id
+        from shard.word_type_synsets as word_type_synsets join word_type_map on (word_type_id = old_id)
+        order by new_id, word_type_synsets.rowid""")
+    # The shard's synsets are in order of their first use in the shard
+    cursor.execute("""insert or ignore into synsets (id, description, examples)
+        select id, description, examples from shard.synsets order by rowid""")
+    if wordpaths.has_word_paths(conn):
+        cursor.execute("select id from words where id > ? and resolved_synset is not null", [word_base])
+        wordpaths.refresh_word_paths(conn, [word_id for (word_id,) in cursor.fetchall()])
+    conn.commit()
+    cursor.execute("detach database shard")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Merge databases made by wordnetify.py --shard into one database.")
+    parser.add_argument("--database", required=True, help="The database to merge into (normally a new file)")
+    parser.add_argument("--progress", action="store_true", help="Show a progress bar")
+    parser.add_argument("shards", nargs="+", help="The shard databases. They can be given in any order.")
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.database)
+    wordnetify.create_schema(conn)
+    iterator = order_shards(args.shards)
+    if args.progress:
+        import tqdm
+        iterator = tqdm.tqdm(iterator)
+    for shard_path in iterator:
+        merge_shard(conn, shard_path)
+    conn.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,162 @@
+#!/usr/bin/env python3
+
+# For a lot of word types, one sense wins almost every time the language model is
+# asked ("princess" is nearly always princess.n.01). This counts the answers the
+# models have given for each word type, and where one answer has at least
+# --threshold of them (from at least --min-support answers), it resolves the rest
+# of that word type's occurrences the same way, with
+# resolving_model = 'most-frequent-sense'. Words that are in a batch that hasn't
+# been fetched yet are left for the batch.
+#
+# To keep that honest, the answers for words with id % --holdout-modulo equal to
+# --holdout-residue are left out of the counts, and used to measure how often the
+# most frequent sense would have agreed with the model. That estimate is printed
+# every time; nothing is changed without --apply.
+
+import argparse
+import collections
+import sqlite3
+import sys
+
+import resolving_models
+import wordpaths
+
+RESOLVING_MODEL = resolving_models.MOST_FREQUENT_SENSE
+
+# Answers that didn't come from a language model (including ours), so they don't count
+NOT_FROM_A_MODEL = resolving_models.NOT_FROM_A_MODEL
+
+MODEL_ANSWERS = f"""select word_type_id, resolved_synset from words
+    where resolved_synset is not null and word_type_id is not null
+      and resolving_model is not null
+      and resolving_model not in ({', '.join('?' * len(NOT_FROM_A_MODEL))})"""
+
+def sense_distributions(conn, holdout_modulo, holdout_residue):
+    """{word_type_id: Counter of answers}, leaving out the held-out slice."""
+    cursor = conn.cursor()
+    cursor.execute(MODEL_ANSWERS + " and id % ? != ?", NOT_FROM_A_MODEL + [holdout_modulo, holdout_residue])
+    distributions = collections.defaultdict(collections.Counter)
+    for (word_type_id, synset) in cursor:
+        distributions[word_type_id][synset] += 1
+    return distributions
+
+def choose_senses(distributions, threshold, min_support):
+    """{word_type_id: (synset, share, support)} for the word types with a dominant sense."""
+    senses = {}
+    for (word_type_id, answers) in distributions.items():
+        support = sum(answers.values())
+        if support < min_support:
+            continue
+        # Most common first, and alphabetical among equals
+        (synset, count) = min(answers.items(), key=lambda item: (-item[1], item[0]))
+        share = count / support
+        if share >= threshold:
+            senses[word_type_id] = (synset, share, support)
+    return senses
+
+def evaluate(conn, senses, holdout_modulo, holdout_residue):
+    """How often the chosen senses agree with the model on the held-out slice.
+
+    Returns (held-out answers, how many had a chosen sense, how many of those agreed)."""
+    cursor = conn.cursor()
+    cursor.execute(MODEL_ANSWERS + " and id % ? = ?", NOT_FROM_A_MODEL + [holdout_modulo, holdout_residue])
+    held_out = 0
+    covered = 0
+    agreed = 0
+    for (word_type_id, synset) in cursor:
+        held_out += 1
+        if word_type_id not in senses:
+            continue
+        covered += 1
+        if senses[word_type_id][0] == synset:
+            agreed += 1
+    return (held_out, covered, agreed)
+
+def store_senses(conn, senses):
+    # Keep the chosen senses, with the word_paths path each one leads to
+    cursor = conn.cursor()
+    cursor.execute("""create table if not exists most_frequent_senses (
+        word_type_id INTEGER PRIMARY KEY REFERENCES word_types(id),
+        resolved_synset TEXT NOT NULL,
+        share FLOAT NOT NULL,
+        support INTEGER NOT NULL,
+        path TEXT,
+        path_key BLOB)""")
+    cursor.execute("delete from most_frequent_senses")
+    cursor.executemany("insert into most_frequent_senses (word_type_id, resolved_synset, share, support) values (?, ?, ?, ?)",
+                       [(word_type_id, synset, share, support) for (word_type_id, (synset, share, support)) in senses.items()])
+    cursor.execute("select count(*) from sqlite_master where type = 'table' and name = 'synset_paths'")
+    if cursor.fetchone()[0] == 0:
+        return
+    cursor.execute("""select word_type_id, word_types.word, resolved_synset, by_synset.path, by_word.path
+        from most_frequent_senses join word_types on (word_types.id = word_type_id)
+          left join synset_paths as by_synset on (by_synset.synset_name = resolved_synset)
+          left join synset_paths as by_word on (by_word.synset_name = lower(word_types.word))""")
+    paths = []
+    for (word_type_id, word, synset, synset_path, word_lookup_path) in cursor.fetchall():
+        path = wordpaths.word_path(word, synset, synset_path, word_lookup_path)
+        if path is not None:
+            paths.append((path, wordpaths.encode_path_key(path), word_type_id))
+    cursor.executemany("update most_frequent_senses set path = ?, path_key = ? where word_type_id = ?", paths)
+
+def count_unresolved(conn, senses):
+    # How many words apply_senses() would resolve
+    cursor = conn.cursor()
+    cursor.execute("select word_type_id, count(*) from words where resolved_synset is null" + resolving_models.unclaimed(conn) + " group by word_type_id")
+    return sum(count for (word_type_id, count) in cursor.fetchall() if word_type_id in senses)
+
+def apply_senses(conn):
+    # Resolve every unresolved word of a word type in most_frequent_senses, apart
+    # from the ones waiting on a batch. Doesn't commit.
+    cursor = conn.cursor()
+    cursor.execute("""update words set resolved_synset = most_frequent_senses.resolved_synset,
+            resolving_model = ?, resolved_timestamp = current_timestamp
+        from most_frequent_senses
+        where words.word_type_id = most_frequent_senses.word_type_id and words.resolved_synset is null""" + resolving_models.unclaimed(conn),
+                   [RESOLVING_MODEL])
+    resolved = cursor.rowcount
+    if resolved > 0 and wordpaths.has_word_paths(conn):
+        cursor.execute("""insert or ignore into word_paths (word_id, path, path_key)
+            select words.id, most_frequent_senses.path, most_frequent_senses.path_key
+            from most_frequent_senses join words on (words.word_type_id = most_frequent_senses.word_type_id)
+            where words.resolving_model = ? and most_frequent_senses.path is not null""", [RESOLVING_MODEL])
+    return resolved
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolve words to the sense the language model nearly always picks for their word type")
+    parser.add_argument("--database", required=True, help="Where the database is")
+    parser.add_argument("--threshold", type=float, default=0.95,
+                        help="How much of the answers for a word type the most frequent sense needs to have")
+    parser.add_argument("--min-support", type=int, default=20,
+                        help="How many answers a word type needs before its most frequent sense is trusted")
+    parser.add_argument("--holdout-modulo", type=int, default=10, help="Hold out the words whose id %% this is --holdout-residue")
+    parser.add_argument("--holdout-residue", type=int, default=0, help="See --holdout-modulo")
+    parser.add_argument("--apply", action="store_true", help="Actually resolve the unresolved words, instead of just reporting")
+    args = parser.parse_args()
+    if not 0 < args.threshold <= 1:
+        sys.exit("--threshold must be more than 0 and at most 1")
+    if args.holdout_modulo < 2:
+        sys.exit("--holdout-modulo must be at least 2")
+
+    conn = sqlite3.connect(args.database)
+    conn.execute("pragma busy_timeout = 30000;")
+    conn.execute("pragma journal_mode = WAL;")
+    distributions = sense_distributions(conn, args.holdout_modulo, args.holdout_residue)
+    senses = choose_senses(distributions, args.threshold, args.min_support)
+    print(f"{len(senses)} of {len(distributions)} word types have a sense with at least {args.threshold:.0%} of {args.min_support} or more answers")
+
+    (held_out, covered, agreed) = evaluate(conn, senses, args.holdout_modulo, args.holdout_residue)
+    print(f"Held out: {held_out} answers, {covered} of them for those word types ({covered / max(held_out, 1):.1%} coverage)")
+    if covered > 0:
+        print(f"Estimated accuracy: {agreed}/{covered} = {agreed / covered:.2%} agreement with the model")
+
+    if not args.apply:
+        print(f"Would resolve {count_unresolved(conn, senses)} words (use --apply)")
+        return
+    store_senses(conn, senses)
+    resolved = apply_senses(conn)
+    conn.commit()
+    print(f"Resolved {resolved} words")
+
+if __name__ == '__main__':
+    main()
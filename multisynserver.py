@@ -5,6 +5,7 @@ import json
 import sqlite3
 import time
 import os
+import wordpaths
 
 import sys
 parser = argparse.ArgumentParser()
@@ -80,7 +81,7 @@ def synsets():
     if word_id is None:
         return jsonify({'error': 'Word ID is required'}), 400
 
-    cursor.execute("select synsets.id, description, examples from synsets join word_synsets on (synsets.id = synset_id) and word_id = ?", [word_id])
+    cursor.execute("select synsets.id, description, examples from words join word_type_synsets using (word_type_id) join synsets on (synsets.id = synset_id) where words.id = ? order by synset_id", [word_id])
     answer = []
     for (synset_id, description, example) in cursor:
         answer.append({'synset_id': synset_id,
@@ -108,6 +109,7 @@ def update():
     model = data['model']
 
     cursor.execute("update words set resolved_synset = ?, resolving_model=?, resolved_timestamp = current_timestamp, resolution_compute_time=? where id = ?", [resolved_synset, model, compute_time, word_id])
+    wordpaths.refresh_word_paths(conn, [word_id])
     conn.commit()
     
     result = {'message': 'done'}
@@ -3,9 +3,9 @@
 cd /tinystories/wordnetify-tinystories
 . .venv/bin/activate
 
-python3 generate_multisynset_batch.py --database TinyStories.sqlite \
-	 --congruent 3 --modulo 1000 \
-	 --output-file .batchfiles/batch-$(date +%F-%T).jsonl --limit 40000 --progress-bar \
-	 --batch-id-save-file .batchid.txt && \
-python3 batchcheck.py --database TinyStories.sqlite  --only-batch $(< .batchid.txt) --monitor && \
+python3 batchdaemon.py --database TinyStories.sqlite \
+	 --in-flight 4 --max-batches 4 --batch-dir .batchfiles --report-costs \
+	 --generate-args "--congruent 3 --modulo 1000 --limit 10000 --progress-bar"
+
+# Anything the daemon gave up on that has completed since
 python3 batchfetch.py --database TinyStories.sqlite --progress-bar --report-costs
@@ -0,0 +1,82 @@
+# What OpenAI requests cost, and how many tokens a request is likely to use before
+# we send it.
+#
+# Prices are US dollars per million tokens, for the batch API (half the normal
+# price). Look them up again if you change models.
+#
+# Token counts are estimated with tiktoken if it's installed (and has its encoding
+# files), and otherwise with the usual four-characters-a-token rule, which is
+# close enough for English prose. generate_multisynset_batch.py stores its estimate
+# for every request in batchwords, and batchfetch.py copies it into costs beside
+# the real numbers, so the estimate can be checked with --report-costs.
+
+import json
+
+BATCH_PRICES = {
+    'gpt-4o-mini': {'prompt': 0.075, 'completion': 0.3},
+    'gpt-4o': {'prompt': 1.25, 'completion': 5.0},
+}
+
+DEFAULT_MODEL = 'gpt-4o-mini'
+
+# The chat format adds a few tokens around each message, and the tool definitions
+# are also counted as prompt tokens
+MESSAGE_OVERHEAD = 7
+REQUEST_OVERHEAD = 3
+
+def prices_for(model):
+    # The responses name a dated version of the model, e.g. gpt-4o-mini-2024-07-18,
+    # so take the longest name it starts with
+    for name in sorted(BATCH_PRICES, key=len, reverse=True):
+        if model.startswith(name):
+            return BATCH_PRICES[name]
+    raise ValueError(f"No prices for {model}: add it to pricing.BATCH_PRICES")
+
+def dollars(model, prompt_tokens, completion_tokens):
+    prices = prices_for(model)
+    return (prices['prompt'] * prompt_tokens + prices['completion'] * completion_tokens) / 1000000
+
+_encoding = None
+
+def _get_encoding():
+    global _encoding
+    if _encoding is None:
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding('o200k_base')
+        except Exception:
+            # Not installed, or couldn't download its files
+            _encoding = False
+    return _encoding
+
+def estimate_tokens(text):
+    encoding = _get_encoding()
+    if encoding:
+        return len(encoding.encode(text))
+    return (len(text) + 3) // 4
+
+def estimate_request(body):
+    """Estimate (prompt tokens, completion tokens) for the body of a chat completion request."""
+    prompt_tokens = REQUEST_OVERHEAD
+    for message in body['messages']:
+        prompt_tokens += MESSAGE_OVERHEAD + estimate_tokens(message['content'])
+    completion_tokens = REQUEST_OVERHEAD
+    for tool in body.get('tools', []):
+        prompt_tokens += estimate_tokens(json.dumps(tool['function']))
+        # The answer is a JSON object with one string from each enum; assume the
+        # longest one, so as not to under-estimate
+        for (name, schema) in tool['function']['parameters']['properties'].items():
+            longest = max(schema.get('enum', ['']), key=len)
+            completion_tokens += estimate_tokens(json.dumps({name: longest}))
+    return (prompt_tokens, completion_tokens)
+
+def create_costs_table(conn):
+    # Same as resolve_multisynsets.py has always made, plus the estimate columns
+    conn.execute("create table if not exists costs (word_id integer references words(id), prompt_tokens integer, completion_tokens integer, when_incurred datetime default current_timestamp, source text default 'groq')")
+    add_estimate_columns(conn, 'costs')
+
+def add_estimate_columns(conn, table):
+    columns = [row[0] for row in conn.execute(f"select name from pragma_table_info('{table}')")]
+    for column in ['estimated_prompt_tokens', 'estimated_completion_tokens']:
+        if column not in columns:
+            conn.execute(f"alter table {table} add column {column} integer")
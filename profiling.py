@@ -0,0 +1,133 @@
+# Cheap per-stage timers and counters for wordnetify.py --profile.
+#
+# Each process keeps a StageProfile. Worker processes send theirs back with every
+# batch of stories, and the main process merges them into its RunProfile, which
+# prints a throughput summary every so often, a breakdown at the end, and saves
+# both to the ingest_metrics table so that long runs can be looked at afterwards.
+#
+# Stage times are wall-clock seconds. With --workers, the tokenizing and lookup
+# stages are added up across all the workers, so they can come to more than the
+# elapsed time; waiting_for_workers is how long the main process sat idle.
+
+import collections
+import sqlite3
+import sys
+import time
+from typing import Callable, Iterable, Iterator, TypeVar
+
+T = TypeVar('T')
+
+# In pipeline order, for printing
+STAGES = ['read', 'sentence_split', 'word_tokenize', 'synset_lookup', 'waiting_for_workers', 'insert', 'commit']
+COUNTERS = ['stories', 'sentences', 'tokens', 'synset_lookups', 'rows_written', 'commits']
+
+
+class StageProfile:
+    def __init__(self) -> None:
+        self.seconds: collections.Counter = collections.Counter()
+        self.counts: collections.Counter = collections.Counter()
+
+    def add(self, stage: str, seconds: float) -> None:
+        self.seconds[stage] += seconds
+
+    def count(self, counter: str, n: int = 1) -> None:
+        self.counts[counter] += n
+
+    def merge(self, other: 'StageProfile') -> None:
+        self.seconds.update(other.seconds)
+        self.counts.update(other.counts)
+
+    def timed(self, stage: str, iterable: Iterable[T]) -> Iterator[T]:
+        """Pass through an iterable, charging the time spent in next() to `stage`."""
+        iterator = iter(iterable)
+        while True:
+            start = time.perf_counter()
+            try:
+                item = next(iterator)
+            except StopIteration:
+                self.add(stage, time.perf_counter() - start)
+                return
+            self.add(stage, time.perf_counter() - start)
+            yield item
+
+
+def create_metrics_table(conn: sqlite3.Connection) -> None:
+    conn.execute("""
+    CREATE TABLE if not exists ingest_metrics (
+        id INTEGER PRIMARY KEY,
+        run_started datetime,
+        filename TEXT,
+        snapshot TEXT,
+        elapsed REAL,
+        kind TEXT,
+        metric TEXT,
+        value REAL
+    )
+    """)
+    conn.commit()
+
+
+class RunProfile(StageProfile):
+    """The profile of a whole run, as seen from the main process."""
+
+    def __init__(self, conn: sqlite3.Connection, filename: str, interval: float,
+                 write: Callable[[str], None] = sys.stderr.write) -> None:
+        super().__init__()
+        self.conn = conn
+        self.filename = filename
+        self.interval = interval
+        self.write = write
+        self.started = time.perf_counter()
+        self.run_started = time.strftime('%Y-%m-%d %H:%M:%S')
+        self.next_report = self.started + interval
+        create_metrics_table(conn)
+
+    def elapsed(self) -> float:
+        return time.perf_counter() - self.started
+
+    def tick(self) -> None:
+        """Called after every story; prints and saves a snapshot when one is due."""
+        if self.interval <= 0 or time.perf_counter() < self.next_report:
+            return
+        self.next_report = time.perf_counter() + self.interval
+        elapsed = self.elapsed()
+        self.write(self.summary(elapsed) + "\n")
+        self.save('periodic', elapsed)
+
+    def summary(self, elapsed: float) -> str:
+        rates = ', '.join(f"{self.counts[counter] / elapsed:.0f} {counter}/s"
+                          for counter in ['stories', 'sentences', 'tokens', 'rows_written'])
+        stages = ', '.join(f"{stage} {self.seconds[stage]:.1f}s" for stage in STAGES if stage in self.seconds)
+        return f"[profile] {elapsed:.0f}s, {self.counts['stories']} stories: {rates} ({stages})"
+
+    def breakdown(self, elapsed: float) -> str:
+        stories = self.counts['stories']
+        total = sum(self.seconds.values())
+        lines = [f"Profile: {stories} stories in {elapsed:.2f}s",
+                 f"  {'stage':20} {'seconds':>10} {'share':>7} {'per story':>12}"]
+        for stage in STAGES:
+            if stage not in self.seconds:
+                continue
+            seconds = self.seconds[stage]
+            share = 100.0 * seconds / total if total > 0 else 0.0
+            per_story = f"{1e6 * seconds / stories:.0f}us" if stories else "-"
+            lines.append(f"  {stage:20} {seconds:10.3f} {share:6.1f}% {per_story:>12}")
+        lines.append(f"  {'counter':20} {'total':>10} {'per second':>20}")
+        for counter in COUNTERS:
+            rate = self.counts[counter] / elapsed if elapsed > 0 else 0.0
+            lines.append(f"  {counter:20} {self.counts[counter]:10} {rate:20.1f}")
+        return "\n".join(lines)
+
+    def finish(self) -> None:
+        elapsed = self.elapsed()
+        self.write(self.breakdown(elapsed) + "\n")
+        self.save('final', elapsed)
+
+    def save(self, snapshot: str, elapsed: float) -> None:
+        rows = [(self.run_started, self.filename, snapshot, elapsed, 'seconds', stage, seconds)
+                for (stage, seconds) in self.seconds.items()]
+        rows += [(self.run_started, self.filename, snapshot, elapsed, 'count', counter, n)
+                 for (counter, n) in self.counts.items()]
+        self.conn.executemany("""insert into ingest_metrics (run_started, filename, snapshot, elapsed, kind, metric, value)
+            values (?, ?, ?, ?, ?, ?, ?)""", rows)
+        self.conn.commit()
@@ -0,0 +1,191 @@
+#!/usr/bin/env python3
+
+# TinyStories repeats itself a lot ("Once upon a time, there was a little girl
+# named Lily." turns up thousands of times), so the same word in the same sentence
+# gets resolved over and over again. The resolution_cache table remembers every
+# answer we've already paid for, keyed on
+#
+#    (normalized sentence, word_number, word_type_id)
+#
+# The word type decides the candidate synsets, so that's the candidate set part of
+# the key. There's a row for each answer that has been given for a key, with the
+# number of times it was given (support). When answers disagree, the one with the
+# most support wins. hits counts how many words have been resolved from each row.
+#
+# Only answers from a language model count as support. Words resolved from the
+# cache get resolving_model = 'resolution-cache', so the cache can't vote for
+# itself. Words resolved when they were loaded (resolving_model is null) only had
+# one synset, so they never need looking up.
+#
+# batchfetch.py and resolve_multisynsets.py record() each answer as it comes in.
+# refresh (--refresh) recounts everything from scratch, which is only needed once
+# for answers given before the cache existed.
+
+import argparse
+import re
+import sqlite3
+import sys
+
+import resolving_models
+import wordpaths
+
+RESOLVING_MODEL = resolving_models.RESOLUTION_CACHE
+
+WHITESPACE = re.compile(r"\s+")
+
+def normalize_sentence(sentence):
+    if sentence is None:
+        return None
+    return WHITESPACE.sub(" ", sentence).strip().lower()
+
+def prepare(conn):
+    # Call this before anything else here. It can't be called while a query is
+    # still being read on the same connection (sqlite won't let create_function do
+    # that), which is why record() and apply() don't do it themselves.
+    conn.create_function("normalize_sentence", 1, normalize_sentence, deterministic=True)
+    conn.execute("""create table if not exists resolution_cache (
+        sentence_key TEXT NOT NULL,
+        word_number INTEGER NOT NULL,
+        word_type_id INTEGER NOT NULL,
+        resolved_synset TEXT NOT NULL,
+        support INTEGER NOT NULL,
+        hits INTEGER NOT NULL DEFAULT 0,
+        PRIMARY KEY (sentence_key, word_number, word_type_id, resolved_synset)
+    ) without rowid""")
+
+SUPPORT_QUERY = f"""select normalize_sentence(sentence), word_number, word_type_id, resolved_synset, count(*)
+    from words join sentences on (sentence_id = sentences.id)
+    where resolved_synset is not null and word_type_id is not null
+      and resolving_model is not null
+      and resolving_model not in ({', '.join(f"'{model}'" for model in resolving_models.NOT_FROM_A_MODEL)})"""
+
+UPSERT = """insert into resolution_cache (sentence_key, word_number, word_type_id, resolved_synset, support)
+    {rows}
+    on conflict (sentence_key, word_number, word_type_id, resolved_synset) do update set support = {support}"""
+
+def refresh(conn):
+    # Recount the support for every answer from the words table. This reads every
+    # resolved word, so it's for the command line, not for every run. Keeps the
+    # hit counts. Doesn't commit.
+    prepare(conn)
+    cursor = conn.cursor()
+    # Answers that aren't in words any more drop to 0, which apply() never uses
+    cursor.execute("update resolution_cache set support = 0")
+    cursor.execute(UPSERT.format(rows=SUPPORT_QUERY + " group by 1, 2, 3, 4", support="excluded.support"))
+    # ... and if they were never used either, there's no point keeping them
+    cursor.execute("delete from resolution_cache where support = 0 and hits = 0")
+    cursor.execute("select count(*), coalesce(sum(support), 0) from resolution_cache")
+    return cursor.fetchone()
+
+def record(conn, word_ids):
+    # Add the answers just given for these words (e.g. by resolve_multisynsets.py).
+    # Call it once per newly resolved word, or the support will be counted twice;
+    # refresh() puts that right. Doesn't commit.
+    cursor = conn.cursor()
+    cursor.execute("create temp table if not exists cache_record_ids (word_id INTEGER PRIMARY KEY)")
+    cursor.execute("delete from temp.cache_record_ids")
+    cursor.executemany("insert or ignore into temp.cache_record_ids (word_id) values (?)", [(word_id,) for word_id in word_ids])
+    record_in_table(conn, "temp.cache_record_ids")
+
+def record_in_table(conn, table):
+    # The same, for the words whose ids are in table's word_id column (e.g. batchfetch.py's
+    # temp.batch_results), in one statement. Doesn't commit.
+    conn.execute(UPSERT.format(rows=SUPPORT_QUERY + f" and words.id in (select word_id from {table}) group by 1, 2, 3, 4",
+                               support="support + excluded.support"))
+
+def apply(conn, word_ids, min_support=1):
+    # Resolve whichever of these words (if they're still unresolved) have a cached
+    # answer, all in one go. Returns the ids of the words that were resolved.
+    # Doesn't commit.
+    cursor = conn.cursor()
+    cursor.execute("create temp table if not exists cache_lookup (word_id INTEGER PRIMARY KEY, resolved_synset TEXT)")
+    cursor.execute("delete from temp.cache_lookup")
+    cursor.executemany("insert or ignore into temp.cache_lookup (word_id) values (?)", [(word_id,) for word_id in word_ids])
+    cursor.execute("""update temp.cache_lookup set resolved_synset = best.resolved_synset
+        from (select word_id, resolution_cache.resolved_synset,
+                     row_number() over (partition by word_id order by support desc, resolution_cache.resolved_synset) as choice
+              from temp.cache_lookup
+                join words on (words.id = word_id)
+                join sentences on (sentences.id = sentence_id)
+                join resolution_cache on (resolution_cache.sentence_key = normalize_sentence(sentence)
+                                          and resolution_cache.word_number = words.word_number
+                                          and resolution_cache.word_type_id = words.word_type_id)
+              where words.resolved_synset is null and support >= ?) as best
+        where best.word_id = cache_lookup.word_id and best.choice = 1""", [min_support])
+    cursor.execute("""update words set resolved_synset = cache_lookup.resolved_synset,
+            resolving_model = ?, resolved_timestamp = current_timestamp
+        from temp.cache_lookup
+        where words.id = cache_lookup.word_id and cache_lookup.resolved_synset is not null""", [RESOLVING_MODEL])
+    cursor.execute("""update resolution_cache set hits = hits + used.n
+        from (select normalize_sentence(sentence) as sentence_key, word_number, word_type_id, cache_lookup.resolved_synset, count(*) as n
+              from temp.cache_lookup
+                join words on (words.id = word_id)
+                join sentences on (sentences.id = sentence_id)
+              where cache_lookup.resolved_synset is not null
+              group by 1, 2, 3, 4) as used
+        where resolution_cache.sentence_key = used.sentence_key
+          and resolution_cache.word_number = used.word_number
+          and resolution_cache.word_type_id = used.word_type_id
+          and resolution_cache.resolved_synset = used.resolved_synset""")
+    cursor.execute("select word_id from temp.cache_lookup where resolved_synset is not null order by word_id")
+    resolved = [word_id for (word_id,) in cursor.fetchall()]
+    wordpaths.refresh_word_paths(conn, resolved)
+    return resolved
+
+def apply_all(conn, min_support=1, chunk_size=10000, progress=None):
+    # Go through every unresolved word, a chunk of ids at a time, apart from the
+    # ones waiting on a batch
+    cursor = conn.cursor()
+    cursor.execute("create index if not exists unresolved_word_ids on words(id) where resolved_synset is null")
+    unclaimed = resolving_models.unclaimed(conn)
+    last_word_id = -1
+    resolved = 0
+    while True:
+        cursor.execute("select id from words where resolved_synset is null and id > ?" + unclaimed + " order by id limit ?",
+                       [last_word_id, chunk_size])
+        word_ids = [word_id for (word_id,) in cursor.fetchall()]
+        if not word_ids:
+            return resolved
+        resolved += len(apply(conn, word_ids, min_support))
+        last_word_id = word_ids[-1]
+        if progress is not None:
+            progress.update(len(word_ids))
+
+def main():
+    parser = argparse.ArgumentParser(description="Resolve words from the answers already given for the same word in the same sentence")
+    parser.add_argument("--database", required=True, help="Where the database is")
+    parser.add_argument("--refresh", action="store_true", help="Recount the cache from every resolved word")
+    parser.add_argument("--apply", action="store_true", help="Resolve every unresolved word that has a cached answer")
+    parser.add_argument("--min-support", type=int, default=1, help="Only use cached answers that have been given at least this many times")
+    parser.add_argument("--stats", action="store_true", help="Say how big the cache is and how much it has been used")
+    parser.add_argument("--progress-bar", action="store_true", help="Show a progress bar for --apply")
+    args = parser.parse_args()
+    if not (args.refresh or args.apply or args.stats):
+        sys.exit("Nothing to do: use --refresh, --apply and/or --stats")
+
+    conn = sqlite3.connect(args.database)
+    conn.execute("pragma busy_timeout = 30000;")
+    conn.execute("pragma journal_mode = WAL;")
+    prepare(conn)
+    if args.refresh:
+        (answers, support) = refresh(conn)
+        conn.commit()
+        print(f"{answers} cached answers from {support} resolved words")
+    if args.apply:
+        progress = None
+        if args.progress_bar:
+            import tqdm
+            progress = tqdm.tqdm(total=conn.execute("select count(*) from words where resolved_synset is null").fetchone()[0])
+        resolved = apply_all(conn, args.min_support, progress=progress)
+        conn.commit()
+        print(f"Resolved {resolved} words from the cache")
+    if args.stats:
+        (keys, answers, support, hits) = conn.execute("""select count(distinct sentence_key || '|' || word_number || '|' || word_type_id),
+            count(*), coalesce(sum(support), 0), coalesce(sum(hits), 0) from resolution_cache""").fetchone()
+        print(f"Keys:     {keys}")
+        print(f"Answers:  {answers}")
+        print(f"Support:  {support}")
+        print(f"Hits:     {hits}")
+
+if __name__ == '__main__':
+    main()
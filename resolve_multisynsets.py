@@ -8,6 +8,9 @@ import groq
 import time
 import signal
 import os
+import pricing
+import wordpaths
+import resolution_cache
 
 import sys
 parser = argparse.ArgumentParser()
@@ -22,6 +25,8 @@ parser.add_argument("--groq-key", default=os.path.expanduser('~/.groq.key'),
      help="Where to find the groq key (if groq is being used)")
 parser.add_argument("--use-groq", action="store_true", help="Call out to groq instead of using a local ollama-based model")
 parser.add_argument("--probe-only", action="store_true", help="Return success if there is more work to do")
+parser.add_argument("--no-resolution-cache", dest="use_resolution_cache", action="store_false",
+     help="Don't resolve words from the answers already given for the same word in the same sentence")
 args = parser.parse_args()
 
 model = args.model
@@ -36,7 +41,7 @@ conn = sqlite3.connect(args.database)
 cursor = conn.cursor()
 cursor.execute("pragma busy_timeout = 30000;")
 cursor.execute("pragma journal_mode = WAL;")
-cursor.execute("create table if not exists costs (word_id integer references words(id), prompt_tokens integer, completion_tokens integer, when_incurred datetime default current_timestamp, source text default 'groq')")
+pricing.create_costs_table(conn)
 
 if (args.congruent is not None and args.modulo is None) or (args.congruent is None and args.modulo is not None):
     sys.exit("Must specify both --congruent and --modulo or neither")
@@ -67,6 +72,14 @@ iterator = []
 for row in cursor:
     iterator.append(row)
 
+if args.use_resolution_cache and not args.probe_only:
+    resolution_cache.prepare(conn)
+    cached = set(resolution_cache.apply(conn, [row[1] for row in iterator]))
+    conn.commit()
+    if cached:
+        print(f"Resolved {len(cached)} words from the resolution cache")
+        iterator = [row for row in iterator if row[1] not in cached]
+
 if args.progress_bar:
     import tqdm
     if args.limit:
@@ -93,7 +106,7 @@ def get_synsets(word_id):
     # I don't know if this is necessary
     synset_cursor.execute("pragma busy_timeout = 30000;")
     synset_cursor.execute("pragma journal_mode = WAL;")
-    synset_cursor.execute("select synsets.id, description, examples from synsets join word_synsets on (synsets.id = synset_id) and word_id = ?", [word_id])
+    synset_cursor.execute("select synsets.id, description, examples from words join word_type_synsets using (word_type_id) join synsets on (synsets.id = synset_id) where words.id = ? order by synset_id", [word_id])
     answer = []
     for row in synset_cursor:
         answer.append(row)
@@ -132,6 +145,10 @@ for (story_id, word_id, sentence_id, word_number, word) in iterator:
     if word.lower() in pronouns_and_punctuation:
        # Shouldn't happen
        continue
+    if args.use_resolution_cache and not args.probe_only and resolution_cache.apply(conn, [word_id]):
+        # Answered earlier in this run, for another copy of the same sentence
+        conn.commit()
+        continue
     starting_moment = time.time()
     sentence = get_sentence(sentence_id)
 
@@ -222,6 +239,9 @@ Answer in JSON format, with a key of "synset", e.g.
     if 'synset' in answer:
         update_cursor = conn.cursor()
         update_cursor.execute("update words set resolved_synset = ?, resolving_model=?, resolved_timestamp = current_timestamp, resolution_compute_time=? where id = ?", [answer['synset'], model, compute_time, word_id])
+        wordpaths.refresh_word_paths(conn, [word_id])
+        if args.use_resolution_cache:
+            resolution_cache.record(conn, [word_id])
         conn.commit()
         update_cursor.close()
     if need_to_stop_now:
@@ -0,0 +1,30 @@
+# The resolving_model values for words that were resolved without asking a language
+# model, all in one place so that nothing has to keep its own copy of the list.
+# Every model answer (e.g. 'gpt-4o-mini-2024-07-18 (batch)', 'phi3') is something
+# else. Words that were resolved when they were loaded have resolving_model null.
+#
+# The resolution cache and most_frequent_sense.py only learn from model answers, so
+# they leave these out. (The closed-class rules run before the cache anyway, so their
+# words never look it up.)
+
+RESOLUTION_CACHE = 'resolution-cache'
+CLOSED_CLASS_RULES = 'closed-class-rules'
+MOST_FREQUENT_SENSE = 'most-frequent-sense'
+
+NOT_FROM_A_MODEL = [RESOLUTION_CACHE, CLOSED_CLASS_RULES, MOST_FREQUENT_SENSE]
+
+# Words that are in a batch that hasn't been fetched yet: anything that resolves
+# them would be overwritten by batchfetch.py, so they're left for the batch
+NOT_IN_A_BATCH = """not exists (select 1 from batchwords join batches on (batches.id = batchwords.batch_id)
+    where batchwords.word_id = words.id and batches.when_retrieved is null)"""
+
+def has_batches(conn):
+    cursor = conn.cursor()
+    cursor.execute("select count(*) from sqlite_master where type = 'table' and name in ('batches', 'batchwords')")
+    return cursor.fetchone()[0] == 2
+
+def unclaimed(conn):
+    # The extra where clause (on words) for words that no batch is waiting to answer
+    if has_batches(conn):
+        return " and " + NOT_IN_A_BATCH
+    return ""
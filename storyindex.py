@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+
+# Byte offsets of the stories in a TinyStories file, so that wordnetify.py can
+# seek straight to any story instead of reading everything before it.
+#
+# The index is a sidecar file next to the text file (foo.txt -> foo.txt.storyindex).
+# offsets[k] is the byte position just after story k -- i.e. just after its
+# <|endoftext|> line, or the end of the file for a final story with no delimiter.
+# That's the same position that read_file_in_chunks() reports, so story k starts
+# at offsets[k-1] (or at 0 for the first story).
+
+import argparse
+import array
+import bisect
+import mmap
+import os
+import struct
+import sys
+from typing import Optional, Tuple
+
+DELIMITER = b'<|endoftext|>'
+INDEX_SUFFIX = '.storyindex'
+MAGIC = b'TSIDX001'
+HEADER = struct.Struct('<8sQ')
+
+
+def index_path_for(file_path: str) -> str:
+    return file_path + INDEX_SUFFIX
+
+
+def build_index(file_path: str) -> array.array:
+    """Scan a file for delimiter lines and return the end offset of every story."""
+    offsets = array.array('Q')
+    size = os.path.getsize(file_path)
+    if size == 0:
+        return offsets
+    with open(file_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        last_end = 0
+        position = mm.find(DELIMITER)
+        while position != -1:
+            line_start = mm.rfind(b'\n', 0, position) + 1
+            line_end = mm.find(b'\n', position)
+            line_end = size if line_end == -1 else line_end + 1
+            # Same test as read_file_in_chunks: the delimiter has to be the whole line
+            if mm[line_start:line_end].strip() == DELIMITER:
+                offsets.append(line_end)
+                last_end = line_end
+            position = mm.find(DELIMITER, line_end)
+        if last_end < size:
+            # A last story that isn't followed by a delimiter
+            offsets.append(size)
+    return offsets
+
+
+def write_index(file_path: str, offsets: array.array) -> None:
+    index_path = index_path_for(file_path)
+    data = array.array('Q', offsets)
+    if sys.byteorder == 'big':
+        data.byteswap()
+    with open(index_path + '.tmp', 'wb') as f:
+        f.write(HEADER.pack(MAGIC, os.path.getsize(file_path)))
+        data.tofile(f)
+    os.replace(index_path + '.tmp', index_path)
+
+
+def read_index(file_path: str) -> Optional[array.array]:
+    """Return the saved offsets, or None if there's no index or it is out of date."""
+    index_path = index_path_for(file_path)
+    if not os.path.exists(index_path):
+        return None
+    with open(index_path, 'rb') as f:
+        header = f.read(HEADER.size)
+        if len(header) != HEADER.size:
+            return None
+        magic, indexed_size = HEADER.unpack(header)
+        if magic != MAGIC or indexed_size != os.path.getsize(file_path):
+            return None
+        offsets = array.array('Q')
+        offsets.frombytes(f.read())
+    if sys.byteorder == 'big':
+        offsets.byteswap()
+    return offsets
+
+
+def load_index(file_path: str) -> array.array:
+    """Read the index for a file, building (and saving) it first if necessary."""
+    offsets = read_index(file_path)
+    if offsets is None:
+        offsets = build_index(file_path)
+        write_index(file_path, offsets)
+    return offsets
+
+
+def story_start(offsets: array.array, story_number: int) -> int:
+    return 0 if story_number == 0 else offsets[story_number - 1]
+
+
+def stories_before(offsets: array.array, position: int) -> int:
+    """How many stories finish at or before this byte position."""
+    return bisect.bisect_right(offsets, position)
+
+
+def parse_story_range(text: str, story_count: int) -> Tuple[int, int]:
+    """Turn 'A:B' into (A, B), python slice style. Either end can be left off."""
+    if ':' not in text:
+        raise ValueError(f"Story range {text!r} should look like A:B")
+    start_text, stop_text = text.split(':', 1)
+    start = int(start_text) if start_text != '' else 0
+    stop = int(stop_text) if stop_text != '' else story_count
+    start = min(max(start, 0), story_count)
+    stop = min(max(stop, start), story_count)
+    return (start, stop)
+
+
+def parse_shard(text: str, story_count: int) -> Tuple[int, int]:
+    """Turn 'i/n' into the range of stories for shard i (counting from 0) of n."""
+    if '/' not in text:
+        raise ValueError(f"Shard {text!r} should look like i/n")
+    shard_text, shard_count_text = text.split('/', 1)
+    shard = int(shard_text)
+    shard_count = int(shard_count_text)
+    if shard_count < 1 or not (0 <= shard < shard_count):
+        raise ValueError(f"Shard {text!r} is out of range: need 0 <= i < n")
+    return (shard * story_count // shard_count, (shard + 1) * story_count // shard_count)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Build the byte-offset story index for a TinyStories file.")
+    parser.add_argument("--file", required=True, help="The TinyStories text file to index")
+    parser.add_argument("--force", action="store_true", help="Rebuild the index even if it is up to date")
+    args = parser.parse_args()
+
+    offsets = None if args.force else read_index(args.file)
+    if offsets is None:
+        offsets = build_index(args.file)
+        write_index(args.file, offsets)
+    print(f"{len(offsets)} stories in {args.file} (index: {index_path_for(args.file)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,46 @@
+#!/usr/bin/env python3
+
+# List the synsets (or the words in the corpus) underneath a path in the
+# hypernym tree, e.g. everything under 1.1282204582.1 -- using the path_key
+# index that make_wordnet_database.py builds.
+
+import argparse
+import sqlite3
+import sys
+import wordpaths
+
+def main():
+    parser = argparse.ArgumentParser(description="Show every synset, or every word in the corpus, under a path in synset_paths.")
+    parser.add_argument("--database", required=True, help="Database made by make_wordnet_database.py")
+    group = parser.add_mutually_exclusive_group(required=True)
+    group.add_argument("--path", help="Dotted path, e.g. 1.1282204582.5")
+    group.add_argument("--synset", help="Synset name (e.g. dog.n.01); its path is looked up")
+    parser.add_argument("--words", action="store_true", help="List the words in the corpus instead of the synsets")
+    parser.add_argument("--count", action="store_true", help="Only print how many there are")
+    args = parser.parse_args()
+
+    conn = sqlite3.connect(args.database)
+    path = args.path
+    if args.synset is not None:
+        cursor = conn.cursor()
+        cursor.execute("select path from synset_paths where synset_name = ?", [args.synset])
+        row = cursor.fetchone()
+        if row is None:
+            sys.exit(f"{args.synset} isn't in synset_paths")
+        path = row[0]
+    try:
+        if args.words:
+            rows = wordpaths.subtree_words(conn, path)
+        else:
+            rows = wordpaths.subtree_synsets(conn, path)
+    except ValueError as e:
+        sys.exit(str(e))
+    if args.count:
+        print(len(rows))
+    else:
+        for row in rows:
+            print("\t".join("" if x is None else str(x) for x in row))
+    conn.close()
+
+if __name__ == "__main__":
+    main()
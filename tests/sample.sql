@@ -4,7 +4,7 @@ CREATE TABLE filepositions (
        filename text primary key,
        position integer not null
     );
-INSERT INTO filepositions VALUES('tests/sample.txt',1048);
+INSERT INTO filepositions VALUES('tests/sample.txt',1461);
 CREATE TABLE stories (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         filename TEXT NOT NULL,
@@ -14,6 +14,7 @@ CREATE TABLE stories (
     );
 INSERT INTO stories VALUES(1,'tests/sample.txt',0);
 INSERT INTO stories VALUES(2,'tests/sample.txt',1);
+INSERT INTO stories VALUES(3,'tests/sample.txt',2);
 CREATE TABLE sentences (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         story_id INTEGER NOT NULL,
@@ -36,6 +37,21 @@ INSERT INTO sentences VALUES(12,2,3,'As they were looking around, Lucy noticed a
 INSERT INTO sentences VALUES(13,2,4,'She gasped in excitement and ran towards her.');
 INSERT INTO sentences VALUES(14,2,5,'Lucy asked if she could play too but the little girl said no.');
 INSERT INTO sentences VALUES(15,2,6,'She was rather grumpy and was not in the mood to play.');
+INSERT INTO sentences VALUES(16,3,0,'One day, Tom and his mom went to the park.');
+INSERT INTO sentences VALUES(17,3,1,'Tom saw a big red ball under a tree.');
+INSERT INTO sentences VALUES(18,3,2,'"Can I play with it?"');
+INSERT INTO sentences VALUES(19,3,3,'Tom asked.');
+INSERT INTO sentences VALUES(20,3,4,'Mom smiled and said, "Yes, but be careful."');
+INSERT INTO sentences VALUES(21,3,5,'Tom ran to the ball and kicked it high.');
+INSERT INTO sentences VALUES(22,3,6,'"Look, Mom!');
+INSERT INTO sentences VALUES(23,3,7,'It''s flying!"');
+INSERT INTO sentences VALUES(24,3,8,'he said.');
+INSERT INTO sentences VALUES(25,3,9,'Then the ball landed in the pond.');
+INSERT INTO sentences VALUES(26,3,10,'Tom was sad.');
+INSERT INTO sentences VALUES(27,3,11,'"I can''t get it," he said.');
+INSERT INTO sentences VALUES(28,3,12,'A kind man said, "I will help you."');
+INSERT INTO sentences VALUES(29,3,13,'He got the ball out of the water.');
+INSERT INTO sentences VALUES(30,3,14,'Tom said, "Thank you."');
 CREATE TABLE words (
         id INTEGER PRIMARY KEY AUTOINCREMENT,
         sentence_id INTEGER NOT NULL,
@@ -46,1532 +62,1810 @@ CREATE TABLE words (
         resolving_model TEXT,
         resolved_timestamp datetime,
         resolution_compute_time FLOAT,
-        FOREIGN KEY(sentence_id) REFERENCES sentences(id)
+        word_type_id INTEGER,
+        FOREIGN KEY(sentence_id) REFERENCES sentences(id),
+        FOREIGN KEY(word_type_id) REFERENCES word_types(id)
     );
-INSERT INTO words VALUES(1,1,0,'Once',3,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(2,1,1,'upon',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(3,1,2,'a',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(4,1,3,'time',15,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(5,1,4,',',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(6,1,5,'in',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(7,1,6,'a',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(8,1,7,'small',13,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(9,1,8,'village',3,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(10,1,9,',',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(11,1,10,'there',4,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(12,1,11,'was',14,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(13,1,12,'a',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(14,1,13,'young',14,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(15,1,14,'girl',5,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(16,1,15,'named',9,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(17,1,16,'Lily',1,'lily.n.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(18,1,17,'.',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(19,2,0,'She',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(20,2,1,'loved',5,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(21,2,2,'exploring',4,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(22,2,3,'the',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(23,2,4,'forest',3,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(24,2,5,'near',9,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(25,2,6,'her',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(26,2,7,'home',17,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(27,2,8,'.',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(28,3,0,'Every',2,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(29,3,1,'morning',4,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(30,3,2,',',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(31,3,3,'Lily',1,'lily.n.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(32,3,4,'would',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(33,3,5,'pack',22,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(34,3,6,'her',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(35,3,7,'bag',14,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(36,3,8,'with',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(37,3,9,'snacks',2,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(38,3,10,'and',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(39,3,11,'a',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(40,3,12,'book',15,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(41,3,13,',',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(42,3,14,'and',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(43,3,15,'set',45,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(44,3,16,'off',9,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(45,3,17,'on',5,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(46,3,18,'her',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(47,3,19,'adventure',3,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(48,3,20,'.',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(49,4,0,'The',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(50,4,1,'forest',3,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(51,4,2,'was',14,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(52,4,3,'full',13,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(53,4,4,'of',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(54,4,5,'tall',5,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(55,4,6,'trees',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(56,4,7,',',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(57,4,8,'chirping',2,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(58,4,9,'birds',6,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(59,4,10,',',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(60,4,11,'and',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(61,4,12,'colorful',3,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(62,4,13,'flowers',4,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(63,4,14,'.',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(64,5,0,'Lily',1,'lily.n.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(65,5,1,'felt',17,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(66,5,2,'happy',4,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(67,5,3,'and',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(68,5,4,'free',22,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(69,5,5,'as',10,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(70,5,6,'she',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(71,5,7,'wandered',5,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(72,5,8,'through',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(73,5,9,'the',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(74,5,10,'woods',9,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(75,5,11,'.',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(76,6,0,'One',9,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(77,6,1,'day',10,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(78,6,2,',',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(79,6,3,'she',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(80,6,4,'found',21,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(81,6,5,'a',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(82,6,6,'mysterious',2,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(83,6,7,'old',9,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(84,6,8,'map',8,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(85,6,9,'hidden',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(86,6,10,'under',10,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(87,6,11,'a',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(88,6,12,'rock',9,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(89,6,13,'.',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(90,7,0,'Excited',12,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(91,7,1,',',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(92,7,2,'she',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(93,7,3,'decided',5,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(94,7,4,'to',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(95,7,5,'follow',24,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(96,7,6,'the',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(97,7,7,'map',8,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(98,7,8,'to',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(99,7,9,'discover',8,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(100,7,10,'its',1,'information_technology.n.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(101,7,11,'secrets',3,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(102,7,12,'.',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(103,8,0,'As',10,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(104,8,1,'the',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(105,8,2,'sun',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(106,8,3,'set',45,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(107,8,4,',',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(108,8,5,'Lily',1,'lily.n.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(109,8,6,'returned',16,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(110,8,7,'home',17,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(111,8,8,',',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(112,8,9,'eager',2,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(113,8,10,'to',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(114,8,11,'continue',10,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(115,8,12,'her',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(116,8,13,'journey',3,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(117,8,14,'the',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(118,8,15,'next',4,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(119,8,16,'day',10,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(120,8,17,'.',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(121,9,0,'Once',3,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(122,9,1,'upon',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(123,9,2,'a',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(124,9,3,'time',15,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(125,9,4,'there',4,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(126,9,5,'was',14,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(127,9,6,'a',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(128,9,7,'little',10,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(129,9,8,'girl',5,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(130,9,9,'named',9,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(131,9,10,'Lucy',1,'lucy.n.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(132,9,11,'.',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(133,10,0,'She',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(134,10,1,'loved',5,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(135,10,2,'to',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(136,10,3,'go',35,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(137,10,4,'to',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(138,10,5,'the',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(139,10,6,'store',6,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(140,10,7,'to',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(141,10,8,'buy',6,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(142,10,9,'sweets',5,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(143,10,10,'with',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(144,10,11,'her',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(145,10,12,'mom',1,'ma.n.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(146,10,13,'and',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(147,10,14,'dad',1,'dad.n.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(148,10,15,'.',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(149,11,0,'On',5,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(150,11,1,'this',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(151,11,2,'special',10,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(152,11,3,'day',10,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(153,11,4,',',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(154,11,5,'Lucy',1,'lucy.n.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(155,11,6,'entered',9,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(156,11,7,'the',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(157,11,8,'store',6,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(158,11,9,'with',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(159,11,10,'her',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(160,11,11,'mom',1,'ma.n.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(161,11,12,'and',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(162,11,13,'dad',1,'dad.n.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(163,11,14,',',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(164,11,15,'feeling',19,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(165,11,16,'so',11,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(166,11,17,'excited',12,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(167,11,18,'.',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(168,12,0,'As',10,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(169,12,1,'they',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(170,12,2,'were',13,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(171,12,3,'looking',13,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(172,12,4,'around',10,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(173,12,5,',',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(174,12,6,'Lucy',1,'lucy.n.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(175,12,7,'noticed',5,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(176,12,8,'a',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(177,12,9,'little',10,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(178,12,10,'girl',5,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(179,12,11,'playing',38,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(180,12,12,'with',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(181,12,13,'a',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(182,12,14,'toy',8,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(183,12,15,'in',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(184,12,16,'the',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(185,12,17,'corner',14,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(186,12,18,'of',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(187,12,19,'the',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(188,12,20,'store',6,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(189,12,21,'.',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(190,13,0,'She',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(191,13,1,'gasped',1,'pant.v.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(192,13,2,'in',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(193,13,3,'excitement',4,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(194,13,4,'and',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(195,13,5,'ran',41,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(196,13,6,'towards',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(197,13,7,'her',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(198,13,8,'.',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(199,14,0,'Lucy',1,'lucy.n.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(200,14,1,'asked',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(201,14,2,'if',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(202,14,3,'she',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(203,14,4,'could',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(204,14,5,'play',52,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(205,14,6,'too',2,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(206,14,7,'but',1,'merely.r.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(207,14,8,'the',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(208,14,9,'little',10,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(209,14,10,'girl',5,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(210,14,11,'said',12,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(211,14,12,'no',6,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(212,14,13,'.',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(213,15,0,'She',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(214,15,1,'was',14,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(215,15,2,'rather',4,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(216,15,3,'grumpy',1,'crabbed.s.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(217,15,4,'and',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(218,15,5,'was',14,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(219,15,6,'not',1,'not.r.01',NULL,NULL,NULL);
-INSERT INTO words VALUES(220,15,7,'in',7,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(221,15,8,'the',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(222,15,9,'mood',3,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(223,15,10,'to',0,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(224,15,11,'play',52,NULL,NULL,NULL,NULL);
-INSERT INTO words VALUES(225,15,12,'.',0,NULL,NULL,NULL,NULL);
-CREATE TABLE word_synsets (
-        word_id INTEGER NOT NULL,
+INSERT INTO words VALUES(1,1,0,'Once',3,NULL,NULL,NULL,NULL,1);
+INSERT INTO words VALUES(2,1,1,'upon',0,NULL,NULL,NULL,NULL,2);
+INSERT INTO words VALUES(3,1,2,'a',7,NULL,NULL,NULL,NULL,3);
+INSERT INTO words VALUES(4,1,3,'time',15,NULL,NULL,NULL,NULL,4);
+INSERT INTO words VALUES(5,1,4,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(6,1,5,'in',7,NULL,NULL,NULL,NULL,6);
+INSERT INTO words VALUES(7,1,6,'a',7,NULL,NULL,NULL,NULL,3);
+INSERT INTO words VALUES(8,1,7,'small',13,NULL,NULL,NULL,NULL,7);
+INSERT INTO words VALUES(9,1,8,'village',3,NULL,NULL,NULL,NULL,8);
+INSERT INTO words VALUES(10,1,9,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(11,1,10,'there',4,NULL,NULL,NULL,NULL,9);
+INSERT INTO words VALUES(12,1,11,'was',14,NULL,NULL,NULL,NULL,10);
+INSERT INTO words VALUES(13,1,12,'a',7,NULL,NULL,NULL,NULL,3);
+INSERT INTO words VALUES(14,1,13,'young',14,NULL,NULL,NULL,NULL,11);
+INSERT INTO words VALUES(15,1,14,'girl',5,NULL,NULL,NULL,NULL,12);
+INSERT INTO words VALUES(16,1,15,'named',9,NULL,NULL,NULL,NULL,13);
+INSERT INTO words VALUES(17,1,16,'Lily',1,'lily.n.01',NULL,NULL,NULL,14);
+INSERT INTO words VALUES(18,1,17,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(19,2,0,'She',0,NULL,NULL,NULL,NULL,16);
+INSERT INTO words VALUES(20,2,1,'loved',5,NULL,NULL,NULL,NULL,17);
+INSERT INTO words VALUES(21,2,2,'exploring',4,NULL,NULL,NULL,NULL,18);
+INSERT INTO words VALUES(22,2,3,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(23,2,4,'forest',3,NULL,NULL,NULL,NULL,20);
+INSERT INTO words VALUES(24,2,5,'near',9,NULL,NULL,NULL,NULL,21);
+INSERT INTO words VALUES(25,2,6,'her',0,NULL,NULL,NULL,NULL,22);
+INSERT INTO words VALUES(26,2,7,'home',17,NULL,NULL,NULL,NULL,23);
+INSERT INTO words VALUES(27,2,8,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(28,3,0,'Every',2,NULL,NULL,NULL,NULL,24);
+INSERT INTO words VALUES(29,3,1,'morning',4,NULL,NULL,NULL,NULL,25);
+INSERT INTO words VALUES(30,3,2,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(31,3,3,'Lily',1,'lily.n.01',NULL,NULL,NULL,14);
+INSERT INTO words VALUES(32,3,4,'would',0,NULL,NULL,NULL,NULL,26);
+INSERT INTO words VALUES(33,3,5,'pack',22,NULL,NULL,NULL,NULL,27);
+INSERT INTO words VALUES(34,3,6,'her',0,NULL,NULL,NULL,NULL,22);
+INSERT INTO words VALUES(35,3,7,'bag',14,NULL,NULL,NULL,NULL,28);
+INSERT INTO words VALUES(36,3,8,'with',0,NULL,NULL,NULL,NULL,29);
+INSERT INTO words VALUES(37,3,9,'snacks',2,NULL,NULL,NULL,NULL,30);
+INSERT INTO words VALUES(38,3,10,'and',0,NULL,NULL,NULL,NULL,31);
+INSERT INTO words VALUES(39,3,11,'a',7,NULL,NULL,NULL,NULL,3);
+INSERT INTO words VALUES(40,3,12,'book',15,NULL,NULL,NULL,NULL,32);
+INSERT INTO words VALUES(41,3,13,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(42,3,14,'and',0,NULL,NULL,NULL,NULL,31);
+INSERT INTO words VALUES(43,3,15,'set',45,NULL,NULL,NULL,NULL,33);
+INSERT INTO words VALUES(44,3,16,'off',9,NULL,NULL,NULL,NULL,34);
+INSERT INTO words VALUES(45,3,17,'on',5,NULL,NULL,NULL,NULL,35);
+INSERT INTO words VALUES(46,3,18,'her',0,NULL,NULL,NULL,NULL,22);
+INSERT INTO words VALUES(47,3,19,'adventure',3,NULL,NULL,NULL,NULL,36);
+INSERT INTO words VALUES(48,3,20,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(49,4,0,'The',0,NULL,NULL,NULL,NULL,37);
+INSERT INTO words VALUES(50,4,1,'forest',3,NULL,NULL,NULL,NULL,20);
+INSERT INTO words VALUES(51,4,2,'was',14,NULL,NULL,NULL,NULL,10);
+INSERT INTO words VALUES(52,4,3,'full',13,NULL,NULL,NULL,NULL,38);
+INSERT INTO words VALUES(53,4,4,'of',0,NULL,NULL,NULL,NULL,39);
+INSERT INTO words VALUES(54,4,5,'tall',5,NULL,NULL,NULL,NULL,40);
+INSERT INTO words VALUES(55,4,6,'trees',7,NULL,NULL,NULL,NULL,41);
+INSERT INTO words VALUES(56,4,7,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(57,4,8,'chirping',2,NULL,NULL,NULL,NULL,42);
+INSERT INTO words VALUES(58,4,9,'birds',6,NULL,NULL,NULL,NULL,43);
+INSERT INTO words VALUES(59,4,10,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(60,4,11,'and',0,NULL,NULL,NULL,NULL,31);
+INSERT INTO words VALUES(61,4,12,'colorful',3,NULL,NULL,NULL,NULL,44);
+INSERT INTO words VALUES(62,4,13,'flowers',4,NULL,NULL,NULL,NULL,45);
+INSERT INTO words VALUES(63,4,14,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(64,5,0,'Lily',1,'lily.n.01',NULL,NULL,NULL,14);
+INSERT INTO words VALUES(65,5,1,'felt',17,NULL,NULL,NULL,NULL,46);
+INSERT INTO words VALUES(66,5,2,'happy',4,NULL,NULL,NULL,NULL,47);
+INSERT INTO words VALUES(67,5,3,'and',0,NULL,NULL,NULL,NULL,31);
+INSERT INTO words VALUES(68,5,4,'free',22,NULL,NULL,NULL,NULL,48);
+INSERT INTO words VALUES(69,5,5,'as',10,NULL,NULL,NULL,NULL,49);
+INSERT INTO words VALUES(70,5,6,'she',0,NULL,NULL,NULL,NULL,50);
+INSERT INTO words VALUES(71,5,7,'wandered',5,NULL,NULL,NULL,NULL,51);
+INSERT INTO words VALUES(72,5,8,'through',7,NULL,NULL,NULL,NULL,52);
+INSERT INTO words VALUES(73,5,9,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(74,5,10,'woods',9,NULL,NULL,NULL,NULL,53);
+INSERT INTO words VALUES(75,5,11,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(76,6,0,'One',9,NULL,NULL,NULL,NULL,54);
+INSERT INTO words VALUES(77,6,1,'day',10,NULL,NULL,NULL,NULL,55);
+INSERT INTO words VALUES(78,6,2,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(79,6,3,'she',0,NULL,NULL,NULL,NULL,50);
+INSERT INTO words VALUES(80,6,4,'found',21,NULL,NULL,NULL,NULL,56);
+INSERT INTO words VALUES(81,6,5,'a',7,NULL,NULL,NULL,NULL,3);
+INSERT INTO words VALUES(82,6,6,'mysterious',2,NULL,NULL,NULL,NULL,57);
+INSERT INTO words VALUES(83,6,7,'old',9,NULL,NULL,NULL,NULL,58);
+INSERT INTO words VALUES(84,6,8,'map',8,NULL,NULL,NULL,NULL,59);
+INSERT INTO words VALUES(85,6,9,'hidden',7,NULL,NULL,NULL,NULL,60);
+INSERT INTO words VALUES(86,6,10,'under',10,NULL,NULL,NULL,NULL,61);
+INSERT INTO words VALUES(87,6,11,'a',7,NULL,NULL,NULL,NULL,3);
+INSERT INTO words VALUES(88,6,12,'rock',9,NULL,NULL,NULL,NULL,62);
+INSERT INTO words VALUES(89,6,13,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(90,7,0,'Excited',12,NULL,NULL,NULL,NULL,63);
+INSERT INTO words VALUES(91,7,1,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(92,7,2,'she',0,NULL,NULL,NULL,NULL,50);
+INSERT INTO words VALUES(93,7,3,'decided',5,NULL,NULL,NULL,NULL,64);
+INSERT INTO words VALUES(94,7,4,'to',0,NULL,NULL,NULL,NULL,65);
+INSERT INTO words VALUES(95,7,5,'follow',24,NULL,NULL,NULL,NULL,66);
+INSERT INTO words VALUES(96,7,6,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(97,7,7,'map',8,NULL,NULL,NULL,NULL,59);
+INSERT INTO words VALUES(98,7,8,'to',0,NULL,NULL,NULL,NULL,65);
+INSERT INTO words VALUES(99,7,9,'discover',8,NULL,NULL,NULL,NULL,67);
+INSERT INTO words VALUES(100,7,10,'its',1,'information_technology.n.01',NULL,NULL,NULL,68);
+INSERT INTO words VALUES(101,7,11,'secrets',3,NULL,NULL,NULL,NULL,69);
+INSERT INTO words VALUES(102,7,12,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(103,8,0,'As',10,NULL,NULL,NULL,NULL,70);
+INSERT INTO words VALUES(104,8,1,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(105,8,2,'sun',7,NULL,NULL,NULL,NULL,71);
+INSERT INTO words VALUES(106,8,3,'set',45,NULL,NULL,NULL,NULL,33);
+INSERT INTO words VALUES(107,8,4,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(108,8,5,'Lily',1,'lily.n.01',NULL,NULL,NULL,14);
+INSERT INTO words VALUES(109,8,6,'returned',16,NULL,NULL,NULL,NULL,72);
+INSERT INTO words VALUES(110,8,7,'home',17,NULL,NULL,NULL,NULL,23);
+INSERT INTO words VALUES(111,8,8,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(112,8,9,'eager',2,NULL,NULL,NULL,NULL,73);
+INSERT INTO words VALUES(113,8,10,'to',0,NULL,NULL,NULL,NULL,65);
+INSERT INTO words VALUES(114,8,11,'continue',10,NULL,NULL,NULL,NULL,74);
+INSERT INTO words VALUES(115,8,12,'her',0,NULL,NULL,NULL,NULL,22);
+INSERT INTO words VALUES(116,8,13,'journey',3,NULL,NULL,NULL,NULL,75);
+INSERT INTO words VALUES(117,8,14,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(118,8,15,'next',4,NULL,NULL,NULL,NULL,76);
+INSERT INTO words VALUES(119,8,16,'day',10,NULL,NULL,NULL,NULL,55);
+INSERT INTO words VALUES(120,8,17,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(121,9,0,'Once',3,NULL,NULL,NULL,NULL,1);
+INSERT INTO words VALUES(122,9,1,'upon',0,NULL,NULL,NULL,NULL,2);
+INSERT INTO words VALUES(123,9,2,'a',7,NULL,NULL,NULL,NULL,3);
+INSERT INTO words VALUES(124,9,3,'time',15,NULL,NULL,NULL,NULL,4);
+INSERT INTO words VALUES(125,9,4,'there',4,NULL,NULL,NULL,NULL,9);
+INSERT INTO words VALUES(126,9,5,'was',14,NULL,NULL,NULL,NULL,10);
+INSERT INTO words VALUES(127,9,6,'a',7,NULL,NULL,NULL,NULL,3);
+INSERT INTO words VALUES(128,9,7,'little',10,NULL,NULL,NULL,NULL,77);
+INSERT INTO words VALUES(129,9,8,'girl',5,NULL,NULL,NULL,NULL,12);
+INSERT INTO words VALUES(130,9,9,'named',9,NULL,NULL,NULL,NULL,13);
+INSERT INTO words VALUES(131,9,10,'Lucy',1,'lucy.n.01',NULL,NULL,NULL,78);
+INSERT INTO words VALUES(132,9,11,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(133,10,0,'She',0,NULL,NULL,NULL,NULL,16);
+INSERT INTO words VALUES(134,10,1,'loved',5,NULL,NULL,NULL,NULL,17);
+INSERT INTO words VALUES(135,10,2,'to',0,NULL,NULL,NULL,NULL,65);
+INSERT INTO words VALUES(136,10,3,'go',35,NULL,NULL,NULL,NULL,79);
+INSERT INTO words VALUES(137,10,4,'to',0,NULL,NULL,NULL,NULL,65);
+INSERT INTO words VALUES(138,10,5,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(139,10,6,'store',6,NULL,NULL,NULL,NULL,80);
+INSERT INTO words VALUES(140,10,7,'to',0,NULL,NULL,NULL,NULL,65);
+INSERT INTO words VALUES(141,10,8,'buy',6,NULL,NULL,NULL,NULL,81);
+INSERT INTO words VALUES(142,10,9,'sweets',5,NULL,NULL,NULL,NULL,82);
+INSERT INTO words VALUES(143,10,10,'with',0,NULL,NULL,NULL,NULL,29);
+INSERT INTO words VALUES(144,10,11,'her',0,NULL,NULL,NULL,NULL,22);
+INSERT INTO words VALUES(145,10,12,'mom',1,'ma.n.01',NULL,NULL,NULL,83);
+INSERT INTO words VALUES(146,10,13,'and',0,NULL,NULL,NULL,NULL,31);
+INSERT INTO words VALUES(147,10,14,'dad',1,'dad.n.01',NULL,NULL,NULL,84);
+INSERT INTO words VALUES(148,10,15,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(149,11,0,'On',5,NULL,NULL,NULL,NULL,85);
+INSERT INTO words VALUES(150,11,1,'this',0,NULL,NULL,NULL,NULL,86);
+INSERT INTO words VALUES(151,11,2,'special',10,NULL,NULL,NULL,NULL,87);
+INSERT INTO words VALUES(152,11,3,'day',10,NULL,NULL,NULL,NULL,55);
+INSERT INTO words VALUES(153,11,4,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(154,11,5,'Lucy',1,'lucy.n.01',NULL,NULL,NULL,78);
+INSERT INTO words VALUES(155,11,6,'entered',9,NULL,NULL,NULL,NULL,88);
+INSERT INTO words VALUES(156,11,7,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(157,11,8,'store',6,NULL,NULL,NULL,NULL,80);
+INSERT INTO words VALUES(158,11,9,'with',0,NULL,NULL,NULL,NULL,29);
+INSERT INTO words VALUES(159,11,10,'her',0,NULL,NULL,NULL,NULL,22);
+INSERT INTO words VALUES(160,11,11,'mom',1,'ma.n.01',NULL,NULL,NULL,83);
+INSERT INTO words VALUES(161,11,12,'and',0,NULL,NULL,NULL,NULL,31);
+INSERT INTO words VALUES(162,11,13,'dad',1,'dad.n.01',NULL,NULL,NULL,84);
+INSERT INTO words VALUES(163,11,14,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(164,11,15,'feeling',19,NULL,NULL,NULL,NULL,89);
+INSERT INTO words VALUES(165,11,16,'so',11,NULL,NULL,NULL,NULL,90);
+INSERT INTO words VALUES(166,11,17,'excited',12,NULL,NULL,NULL,NULL,91);
+INSERT INTO words VALUES(167,11,18,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(168,12,0,'As',10,NULL,NULL,NULL,NULL,70);
+INSERT INTO words VALUES(169,12,1,'they',0,NULL,NULL,NULL,NULL,92);
+INSERT INTO words VALUES(170,12,2,'were',13,NULL,NULL,NULL,NULL,93);
+INSERT INTO words VALUES(171,12,3,'looking',13,NULL,NULL,NULL,NULL,94);
+INSERT INTO words VALUES(172,12,4,'around',10,NULL,NULL,NULL,NULL,95);
+INSERT INTO words VALUES(173,12,5,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(174,12,6,'Lucy',1,'lucy.n.01',NULL,NULL,NULL,78);
+INSERT INTO words VALUES(175,12,7,'noticed',5,NULL,NULL,NULL,NULL,96);
+INSERT INTO words VALUES(176,12,8,'a',7,NULL,NULL,NULL,NULL,3);
+INSERT INTO words VALUES(177,12,9,'little',10,NULL,NULL,NULL,NULL,77);
+INSERT INTO words VALUES(178,12,10,'girl',5,NULL,NULL,NULL,NULL,12);
+INSERT INTO words VALUES(179,12,11,'playing',38,NULL,NULL,NULL,NULL,97);
+INSERT INTO words VALUES(180,12,12,'with',0,NULL,NULL,NULL,NULL,29);
+INSERT INTO words VALUES(181,12,13,'a',7,NULL,NULL,NULL,NULL,3);
+INSERT INTO words VALUES(182,12,14,'toy',8,NULL,NULL,NULL,NULL,98);
+INSERT INTO words VALUES(183,12,15,'in',7,NULL,NULL,NULL,NULL,6);
+INSERT INTO words VALUES(184,12,16,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(185,12,17,'corner',14,NULL,NULL,NULL,NULL,99);
+INSERT INTO words VALUES(186,12,18,'of',0,NULL,NULL,NULL,NULL,39);
+INSERT INTO words VALUES(187,12,19,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(188,12,20,'store',6,NULL,NULL,NULL,NULL,80);
+INSERT INTO words VALUES(189,12,21,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(190,13,0,'She',0,NULL,NULL,NULL,NULL,16);
+INSERT INTO words VALUES(191,13,1,'gasped',1,'pant.v.01',NULL,NULL,NULL,100);
+INSERT INTO words VALUES(192,13,2,'in',7,NULL,NULL,NULL,NULL,6);
+INSERT INTO words VALUES(193,13,3,'excitement',4,NULL,NULL,NULL,NULL,101);
+INSERT INTO words VALUES(194,13,4,'and',0,NULL,NULL,NULL,NULL,31);
+INSERT INTO words VALUES(195,13,5,'ran',41,NULL,NULL,NULL,NULL,102);
+INSERT INTO words VALUES(196,13,6,'towards',0,NULL,NULL,NULL,NULL,103);
+INSERT INTO words VALUES(197,13,7,'her',0,NULL,NULL,NULL,NULL,22);
+INSERT INTO words VALUES(198,13,8,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(199,14,0,'Lucy',1,'lucy.n.01',NULL,NULL,NULL,78);
+INSERT INTO words VALUES(200,14,1,'asked',7,NULL,NULL,NULL,NULL,104);
+INSERT INTO words VALUES(201,14,2,'if',0,NULL,NULL,NULL,NULL,105);
+INSERT INTO words VALUES(202,14,3,'she',0,NULL,NULL,NULL,NULL,50);
+INSERT INTO words VALUES(203,14,4,'could',0,NULL,NULL,NULL,NULL,106);
+INSERT INTO words VALUES(204,14,5,'play',52,NULL,NULL,NULL,NULL,107);
+INSERT INTO words VALUES(205,14,6,'too',2,NULL,NULL,NULL,NULL,108);
+INSERT INTO words VALUES(206,14,7,'but',1,'merely.r.01',NULL,NULL,NULL,109);
+INSERT INTO words VALUES(207,14,8,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(208,14,9,'little',10,NULL,NULL,NULL,NULL,77);
+INSERT INTO words VALUES(209,14,10,'girl',5,NULL,NULL,NULL,NULL,12);
+INSERT INTO words VALUES(210,14,11,'said',12,NULL,NULL,NULL,NULL,110);
+INSERT INTO words VALUES(211,14,12,'no',6,NULL,NULL,NULL,NULL,111);
+INSERT INTO words VALUES(212,14,13,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(213,15,0,'She',0,NULL,NULL,NULL,NULL,16);
+INSERT INTO words VALUES(214,15,1,'was',14,NULL,NULL,NULL,NULL,10);
+INSERT INTO words VALUES(215,15,2,'rather',4,NULL,NULL,NULL,NULL,112);
+INSERT INTO words VALUES(216,15,3,'grumpy',1,'crabbed.s.01',NULL,NULL,NULL,113);
+INSERT INTO words VALUES(217,15,4,'and',0,NULL,NULL,NULL,NULL,31);
+INSERT INTO words VALUES(218,15,5,'was',14,NULL,NULL,NULL,NULL,10);
+INSERT INTO words VALUES(219,15,6,'not',1,'not.r.01',NULL,NULL,NULL,114);
+INSERT INTO words VALUES(220,15,7,'in',7,NULL,NULL,NULL,NULL,6);
+INSERT INTO words VALUES(221,15,8,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(222,15,9,'mood',3,NULL,NULL,NULL,NULL,115);
+INSERT INTO words VALUES(223,15,10,'to',0,NULL,NULL,NULL,NULL,65);
+INSERT INTO words VALUES(224,15,11,'play',52,NULL,NULL,NULL,NULL,107);
+INSERT INTO words VALUES(225,15,12,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(226,16,0,'One',9,NULL,NULL,NULL,NULL,54);
+INSERT INTO words VALUES(227,16,1,'day',10,NULL,NULL,NULL,NULL,55);
+INSERT INTO words VALUES(228,16,2,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(229,16,3,'Tom',3,NULL,NULL,NULL,NULL,116);
+INSERT INTO words VALUES(230,16,4,'and',0,NULL,NULL,NULL,NULL,31);
+INSERT INTO words VALUES(231,16,5,'his',0,NULL,NULL,NULL,NULL,117);
+INSERT INTO words VALUES(232,16,6,'mom',1,'ma.n.01',NULL,NULL,NULL,83);
+INSERT INTO words VALUES(233,16,7,'went',30,NULL,NULL,NULL,NULL,118);
+INSERT INTO words VALUES(234,16,8,'to',0,NULL,NULL,NULL,NULL,65);
+INSERT INTO words VALUES(235,16,9,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(236,16,10,'park',8,NULL,NULL,NULL,NULL,119);
+INSERT INTO words VALUES(237,16,11,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(238,17,0,'Tom',3,NULL,NULL,NULL,NULL,116);
+INSERT INTO words VALUES(239,17,1,'saw',28,NULL,NULL,NULL,NULL,120);
+INSERT INTO words VALUES(240,17,2,'a',7,NULL,NULL,NULL,NULL,3);
+INSERT INTO words VALUES(241,17,3,'big',17,NULL,NULL,NULL,NULL,121);
+INSERT INTO words VALUES(242,17,4,'red',7,NULL,NULL,NULL,NULL,122);
+INSERT INTO words VALUES(243,17,5,'ball',13,NULL,NULL,NULL,NULL,123);
+INSERT INTO words VALUES(244,17,6,'under',10,NULL,NULL,NULL,NULL,61);
+INSERT INTO words VALUES(245,17,7,'a',7,NULL,NULL,NULL,NULL,3);
+INSERT INTO words VALUES(246,17,8,'tree',7,NULL,NULL,NULL,NULL,124);
+INSERT INTO words VALUES(247,17,9,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(248,18,0,'``',0,NULL,NULL,NULL,NULL,125);
+INSERT INTO words VALUES(249,18,1,'Can',8,NULL,NULL,NULL,NULL,126);
+INSERT INTO words VALUES(250,18,2,'I',4,NULL,NULL,NULL,NULL,127);
+INSERT INTO words VALUES(251,18,3,'play',52,NULL,NULL,NULL,NULL,107);
+INSERT INTO words VALUES(252,18,4,'with',0,NULL,NULL,NULL,NULL,29);
+INSERT INTO words VALUES(253,18,5,'it',1,'information_technology.n.01',NULL,NULL,NULL,128);
+INSERT INTO words VALUES(254,18,6,'?',0,NULL,NULL,NULL,NULL,129);
+INSERT INTO words VALUES(255,18,7,'''''',0,NULL,NULL,NULL,NULL,130);
+INSERT INTO words VALUES(256,19,0,'Tom',3,NULL,NULL,NULL,NULL,116);
+INSERT INTO words VALUES(257,19,1,'asked',7,NULL,NULL,NULL,NULL,104);
+INSERT INTO words VALUES(258,19,2,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(259,20,0,'Mom',1,'ma.n.01',NULL,NULL,NULL,131);
+INSERT INTO words VALUES(260,20,1,'smiled',2,NULL,NULL,NULL,NULL,132);
+INSERT INTO words VALUES(261,20,2,'and',0,NULL,NULL,NULL,NULL,31);
+INSERT INTO words VALUES(262,20,3,'said',12,NULL,NULL,NULL,NULL,110);
+INSERT INTO words VALUES(263,20,4,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(264,20,5,'``',0,NULL,NULL,NULL,NULL,125);
+INSERT INTO words VALUES(265,20,6,'Yes',1,'yes.n.01',NULL,NULL,NULL,133);
+INSERT INTO words VALUES(266,20,7,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(267,20,8,'but',1,'merely.r.01',NULL,NULL,NULL,109);
+INSERT INTO words VALUES(268,20,9,'be',14,NULL,NULL,NULL,NULL,134);
+INSERT INTO words VALUES(269,20,10,'careful',5,NULL,NULL,NULL,NULL,135);
+INSERT INTO words VALUES(270,20,11,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(271,20,12,'''''',0,NULL,NULL,NULL,NULL,130);
+INSERT INTO words VALUES(272,21,0,'Tom',3,NULL,NULL,NULL,NULL,116);
+INSERT INTO words VALUES(273,21,1,'ran',41,NULL,NULL,NULL,NULL,102);
+INSERT INTO words VALUES(274,21,2,'to',0,NULL,NULL,NULL,NULL,65);
+INSERT INTO words VALUES(275,21,3,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(276,21,4,'ball',13,NULL,NULL,NULL,NULL,123);
+INSERT INTO words VALUES(277,21,5,'and',0,NULL,NULL,NULL,NULL,31);
+INSERT INTO words VALUES(278,21,6,'kicked',8,NULL,NULL,NULL,NULL,136);
+INSERT INTO words VALUES(279,21,7,'it',1,'information_technology.n.01',NULL,NULL,NULL,128);
+INSERT INTO words VALUES(280,21,8,'high',18,NULL,NULL,NULL,NULL,137);
+INSERT INTO words VALUES(281,21,9,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(282,22,0,'``',0,NULL,NULL,NULL,NULL,125);
+INSERT INTO words VALUES(283,22,1,'Look',14,NULL,NULL,NULL,NULL,138);
+INSERT INTO words VALUES(284,22,2,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(285,22,3,'Mom',1,'ma.n.01',NULL,NULL,NULL,131);
+INSERT INTO words VALUES(286,22,4,'!',0,NULL,NULL,NULL,NULL,139);
+INSERT INTO words VALUES(287,23,0,'It',1,'information_technology.n.01',NULL,NULL,NULL,140);
+INSERT INTO words VALUES(288,23,1,'''s',0,NULL,NULL,NULL,NULL,141);
+INSERT INTO words VALUES(289,23,2,'flying',17,NULL,NULL,NULL,NULL,142);
+INSERT INTO words VALUES(290,23,3,'!',0,NULL,NULL,NULL,NULL,139);
+INSERT INTO words VALUES(291,23,4,'''''',0,NULL,NULL,NULL,NULL,130);
+INSERT INTO words VALUES(292,24,0,'he',2,NULL,NULL,NULL,NULL,143);
+INSERT INTO words VALUES(293,24,1,'said',12,NULL,NULL,NULL,NULL,110);
+INSERT INTO words VALUES(294,24,2,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(295,25,0,'Then',5,NULL,NULL,NULL,NULL,144);
+INSERT INTO words VALUES(296,25,1,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(297,25,2,'ball',13,NULL,NULL,NULL,NULL,123);
+INSERT INTO words VALUES(298,25,3,'landed',8,NULL,NULL,NULL,NULL,145);
+INSERT INTO words VALUES(299,25,4,'in',7,NULL,NULL,NULL,NULL,6);
+INSERT INTO words VALUES(300,25,5,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(301,25,6,'pond',1,'pond.n.01',NULL,NULL,NULL,146);
+INSERT INTO words VALUES(302,25,7,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(303,26,0,'Tom',3,NULL,NULL,NULL,NULL,116);
+INSERT INTO words VALUES(304,26,1,'was',14,NULL,NULL,NULL,NULL,10);
+INSERT INTO words VALUES(305,26,2,'sad',3,NULL,NULL,NULL,NULL,147);
+INSERT INTO words VALUES(306,26,3,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(307,27,0,'``',0,NULL,NULL,NULL,NULL,125);
+INSERT INTO words VALUES(308,27,1,'I',4,NULL,NULL,NULL,NULL,127);
+INSERT INTO words VALUES(309,27,2,'ca',2,NULL,NULL,NULL,NULL,148);
+INSERT INTO words VALUES(310,27,3,'n''t',0,NULL,NULL,NULL,NULL,149);
+INSERT INTO words VALUES(311,27,4,'get',37,NULL,NULL,NULL,NULL,150);
+INSERT INTO words VALUES(312,27,5,'it',1,'information_technology.n.01',NULL,NULL,NULL,128);
+INSERT INTO words VALUES(313,27,6,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(314,27,7,'''''',0,NULL,NULL,NULL,NULL,130);
+INSERT INTO words VALUES(315,27,8,'he',2,NULL,NULL,NULL,NULL,143);
+INSERT INTO words VALUES(316,27,9,'said',12,NULL,NULL,NULL,NULL,110);
+INSERT INTO words VALUES(317,27,10,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(318,28,0,'A',7,NULL,NULL,NULL,NULL,151);
+INSERT INTO words VALUES(319,28,1,'kind',4,NULL,NULL,NULL,NULL,152);
+INSERT INTO words VALUES(320,28,2,'man',13,NULL,NULL,NULL,NULL,153);
+INSERT INTO words VALUES(321,28,3,'said',12,NULL,NULL,NULL,NULL,110);
+INSERT INTO words VALUES(322,28,4,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(323,28,5,'``',0,NULL,NULL,NULL,NULL,125);
+INSERT INTO words VALUES(324,28,6,'I',4,NULL,NULL,NULL,NULL,127);
+INSERT INTO words VALUES(325,28,7,'will',6,NULL,NULL,NULL,NULL,154);
+INSERT INTO words VALUES(326,28,8,'help',12,NULL,NULL,NULL,NULL,155);
+INSERT INTO words VALUES(327,28,9,'you',0,NULL,NULL,NULL,NULL,156);
+INSERT INTO words VALUES(328,28,10,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(329,28,11,'''''',0,NULL,NULL,NULL,NULL,130);
+INSERT INTO words VALUES(330,29,0,'He',2,NULL,NULL,NULL,NULL,157);
+INSERT INTO words VALUES(331,29,1,'got',36,NULL,NULL,NULL,NULL,158);
+INSERT INTO words VALUES(332,29,2,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(333,29,3,'ball',13,NULL,NULL,NULL,NULL,123);
+INSERT INTO words VALUES(334,29,4,'out',17,NULL,NULL,NULL,NULL,159);
+INSERT INTO words VALUES(335,29,5,'of',0,NULL,NULL,NULL,NULL,39);
+INSERT INTO words VALUES(336,29,6,'the',0,NULL,NULL,NULL,NULL,19);
+INSERT INTO words VALUES(337,29,7,'water',10,NULL,NULL,NULL,NULL,160);
+INSERT INTO words VALUES(338,29,8,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(339,30,0,'Tom',3,NULL,NULL,NULL,NULL,116);
+INSERT INTO words VALUES(340,30,1,'said',12,NULL,NULL,NULL,NULL,110);
+INSERT INTO words VALUES(341,30,2,',',0,NULL,NULL,NULL,NULL,5);
+INSERT INTO words VALUES(342,30,3,'``',0,NULL,NULL,NULL,NULL,125);
+INSERT INTO words VALUES(343,30,4,'Thank',1,'thank.v.01',NULL,NULL,NULL,161);
+INSERT INTO words VALUES(344,30,5,'you',0,NULL,NULL,NULL,NULL,156);
+INSERT INTO words VALUES(345,30,6,'.',0,NULL,NULL,NULL,NULL,15);
+INSERT INTO words VALUES(346,30,7,'''''',0,NULL,NULL,NULL,NULL,130);
+CREATE TABLE word_types (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        word TEXT NOT NULL UNIQUE,
+        synset_count INTEGER NOT NULL
+    );
+INSERT INTO word_types VALUES(1,'Once',3);
+INSERT INTO word_types VALUES(2,'upon',0);
+INSERT INTO word_types VALUES(3,'a',7);
+INSERT INTO word_types VALUES(4,'time',15);
+INSERT INTO word_types VALUES(5,',',0);
+INSERT INTO word_types VALUES(6,'in',7);
+INSERT INTO word_types VALUES(7,'small',13);
+INSERT INTO word_types VALUES(8,'village',3);
+INSERT INTO word_types VALUES(9,'there',4);
+INSERT INTO word_types VALUES(10,'was',14);
+INSERT INTO word_types VALUES(11,'young',14);
+INSERT INTO word_types VALUES(12,'girl',5);
+INSERT INTO word_types VALUES(13,'named',9);
+INSERT INTO word_types VALUES(14,'Lily',1);
+INSERT INTO word_types VALUES(15,'.',0);
+INSERT INTO word_types VALUES(16,'She',0);
+INSERT INTO word_types VALUES(17,'loved',5);
+INSERT INTO word_types VALUES(18,'exploring',4);
+INSERT INTO word_types VALUES(19,'the',0);
+INSERT INTO word_types VALUES(20,'forest',3);
+INSERT INTO word_types VALUES(21,'near',9);
+INSERT INTO word_types VALUES(22,'her',0);
+INSERT INTO word_types VALUES(23,'home',17);
+INSERT INTO word_types VALUES(24,'Every',2);
+INSERT INTO word_types VALUES(25,'morning',4);
+INSERT INTO word_types VALUES(26,'would',0);
+INSERT INTO word_types VALUES(27,'pack',22);
+INSERT INTO word_types VALUES(28,'bag',14);
+INSERT INTO word_types VALUES(29,'with',0);
+INSERT INTO word_types VALUES(30,'snacks',2);
+INSERT INTO word_types VALUES(31,'and',0);
+INSERT INTO word_types VALUES(32,'book',15);
+INSERT INTO word_types VALUES(33,'set',45);
+INSERT INTO word_types VALUES(34,'off',9);
+INSERT INTO word_types VALUES(35,'on',5);
+INSERT INTO word_types VALUES(36,'adventure',3);
+INSERT INTO word_types VALUES(37,'The',0);
+INSERT INTO word_types VALUES(38,'full',13);
+INSERT INTO word_types VALUES(39,'of',0);
+INSERT INTO word_types VALUES(40,'tall',5);
+INSERT INTO word_types VALUES(41,'trees',7);
+INSERT INTO word_types VALUES(42,'chirping',2);
+INSERT INTO word_types VALUES(43,'birds',6);
+INSERT INTO word_types VALUES(44,'colorful',3);
+INSERT INTO word_types VALUES(45,'flowers',4);
+INSERT INTO word_types VALUES(46,'felt',17);
+INSERT INTO word_types VALUES(47,'happy',4);
+INSERT INTO word_types VALUES(48,'free',22);
+INSERT INTO word_types VALUES(49,'as',10);
+INSERT INTO word_types VALUES(50,'she',0);
+INSERT INTO word_types VALUES(51,'wandered',5);
+INSERT INTO word_types VALUES(52,'through',7);
+INSERT INTO word_types VALUES(53,'woods',9);
+INSERT INTO word_types VALUES(54,'One',9);
+INSERT INTO word_types VALUES(55,'day',10);
+INSERT INTO word_types VALUES(56,'found',21);
+INSERT INTO word_types VALUES(57,'mysterious',2);
+INSERT INTO word_types VALUES(58,'old',9);
+INSERT INTO word_types VALUES(59,'map',8);
+INSERT INTO word_types VALUES(60,'hidden',7);
+INSERT INTO word_types VALUES(61,'under',10);
+INSERT INTO word_types VALUES(62,'rock',9);
+INSERT INTO word_types VALUES(63,'Excited',12);
+INSERT INTO word_types VALUES(64,'decided',5);
+INSERT INTO word_types VALUES(65,'to',0);
+INSERT INTO word_types VALUES(66,'follow',24);
+INSERT INTO word_types VALUES(67,'discover',8);
+INSERT INTO word_types VALUES(68,'its',1);
+INSERT INTO word_types VALUES(69,'secrets',3);
+INSERT INTO word_types VALUES(70,'As',10);
+INSERT INTO word_types VALUES(71,'sun',7);
+INSERT INTO word_types VALUES(72,'returned',16);
+INSERT INTO word_types VALUES(73,'eager',2);
+INSERT INTO word_types VALUES(74,'continue',10);
+INSERT INTO word_types VALUES(75,'journey',3);
+INSERT INTO word_types VALUES(76,'next',4);
+INSERT INTO word_types VALUES(77,'little',10);
+INSERT INTO word_types VALUES(78,'Lucy',1);
+INSERT INTO word_types VALUES(79,'go',35);
+INSERT INTO word_types VALUES(80,'store',6);
+INSERT INTO word_types VALUES(81,'buy',6);
+INSERT INTO word_types VALUES(82,'sweets',5);
+INSERT INTO word_types VALUES(83,'mom',1);
+INSERT INTO word_types VALUES(84,'dad',1);
+INSERT INTO word_types VALUES(85,'On',5);
+INSERT INTO word_types VALUES(86,'this',0);
+INSERT INTO word_types VALUES(87,'special',10);
+INSERT INTO word_types VALUES(88,'entered',9);
+INSERT INTO word_types VALUES(89,'feeling',19);
+INSERT INTO word_types VALUES(90,'so',11);
+INSERT INTO word_types VALUES(91,'excited',12);
+INSERT INTO word_types VALUES(92,'they',0);
+INSERT INTO word_types VALUES(93,'were',13);
+INSERT INTO word_types VALUES(94,'looking',13);
+INSERT INTO word_types VALUES(95,'around',10);
+INSERT INTO word_types VALUES(96,'noticed',5);
+INSERT INTO word_types VALUES(97,'playing',38);
+INSERT INTO word_types VALUES(98,'toy',8);
+INSERT INTO word_types VALUES(99,'corner',14);
+INSERT INTO word_types VALUES(100,'gasped',1);
+INSERT INTO word_types VALUES(101,'excitement',4);
+INSERT INTO word_types VALUES(102,'ran',41);
+INSERT INTO word_types VALUES(103,'towards',0);
+INSERT INTO word_types VALUES(104,'asked',7);
+INSERT INTO word_types VALUES(105,'if',0);
+INSERT INTO word_types VALUES(106,'could',0);
+INSERT INTO word_types VALUES(107,'play',52);
+INSERT INTO word_types VALUES(108,'too',2);
+INSERT INTO word_types VALUES(109,'but',1);
+INSERT INTO word_types VALUES(110,'said',12);
+INSERT INTO word_types VALUES(111,'no',6);
+INSERT INTO word_types VALUES(112,'rather',4);
+INSERT INTO word_types VALUES(113,'grumpy',1);
+INSERT INTO word_types VALUES(114,'not',1);
+INSERT INTO word_types VALUES(115,'mood',3);
+INSERT INTO word_types VALUES(116,'Tom',3);
+INSERT INTO word_types VALUES(117,'his',0);
+INSERT INTO word_types VALUES(118,'went',30);
+INSERT INTO word_types VALUES(119,'park',8);
+INSERT INTO word_types VALUES(120,'saw',28);
+INSERT INTO word_types VALUES(121,'big',17);
+INSERT INTO word_types VALUES(122,'red',7);
+INSERT INTO word_types VALUES(123,'ball',13);
+INSERT INTO word_types VALUES(124,'tree',7);
+INSERT INTO word_types VALUES(125,'``',0);
+INSERT INTO word_types VALUES(126,'Can',8);
+INSERT INTO word_types VALUES(127,'I',4);
+INSERT INTO word_types VALUES(128,'it',1);
+INSERT INTO word_types VALUES(129,'?',0);
+INSERT INTO word_types VALUES(130,'''''',0);
+INSERT INTO word_types VALUES(131,'Mom',1);
+INSERT INTO word_types VALUES(132,'smiled',2);
+INSERT INTO word_types VALUES(133,'Yes',1);
+INSERT INTO word_types VALUES(134,'be',14);
+INSERT INTO word_types VALUES(135,'careful',5);
+INSERT INTO word_types VALUES(136,'kicked',8);
+INSERT INTO word_types VALUES(137,'high',18);
+INSERT INTO word_types VALUES(138,'Look',14);
+INSERT INTO word_types VALUES(139,'!',0);
+INSERT INTO word_types VALUES(140,'It',1);
+INSERT INTO word_types VALUES(141,'''s',0);
+INSERT INTO word_types VALUES(142,'flying',17);
+INSERT INTO word_types VALUES(143,'he',2);
+INSERT INTO word_types VALUES(144,'Then',5);
+INSERT INTO word_types VALUES(145,'landed',8);
+INSERT INTO word_types VALUES(146,'pond',1);
+INSERT INTO word_types VALUES(147,'sad',3);
+INSERT INTO word_types VALUES(148,'ca',2);
+INSERT INTO word_types VALUES(149,'n''t',0);
+INSERT INTO word_types VALUES(150,'get',37);
+INSERT INTO word_types VALUES(151,'A',7);
+INSERT INTO word_types VALUES(152,'kind',4);
+INSERT INTO word_types VALUES(153,'man',13);
+INSERT INTO word_types VALUES(154,'will',6);
+INSERT INTO word_types VALUES(155,'help',12);
+INSERT INTO word_types VALUES(156,'you',0);
+INSERT INTO word_types VALUES(157,'He',2);
+INSERT INTO word_types VALUES(158,'got',36);
+INSERT INTO word_types VALUES(159,'out',17);
+INSERT INTO word_types VALUES(160,'water',10);
+INSERT INTO word_types VALUES(161,'Thank',1);
+CREATE TABLE word_type_synsets (
+        word_type_id INTEGER NOT NULL,
         synset_id TEXT NOT NULL,
-        PRIMARY KEY(word_id, synset_id),
-        FOREIGN KEY(word_id) REFERENCES words(id)
+        PRIMARY KEY(word_type_id, synset_id),
+        FOREIGN KEY(word_type_id) REFERENCES word_types(id)
     );
-INSERT INTO word_synsets VALUES(1,'once.r.01');
-INSERT INTO word_synsets VALUES(1,'once.r.02');
-INSERT INTO word_synsets VALUES(1,'once.r.03');
-INSERT INTO word_synsets VALUES(3,'angstrom.n.01');
-INSERT INTO word_synsets VALUES(3,'vitamin_a.n.01');
-INSERT INTO word_synsets VALUES(3,'deoxyadenosine_monophosphate.n.01');
-INSERT INTO word_synsets VALUES(3,'adenine.n.01');
-INSERT INTO word_synsets VALUES(3,'ampere.n.02');
-INSERT INTO word_synsets VALUES(3,'a.n.06');
-INSERT INTO word_synsets VALUES(3,'a.n.07');
-INSERT INTO word_synsets VALUES(4,'time.n.01');
-INSERT INTO word_synsets VALUES(4,'time.n.02');
-INSERT INTO word_synsets VALUES(4,'time.n.03');
-INSERT INTO word_synsets VALUES(4,'time.n.04');
-INSERT INTO word_synsets VALUES(4,'time.n.05');
-INSERT INTO word_synsets VALUES(4,'time.n.06');
-INSERT INTO word_synsets VALUES(4,'clock_time.n.01');
-INSERT INTO word_synsets VALUES(4,'fourth_dimension.n.01');
-INSERT INTO word_synsets VALUES(4,'meter.n.04');
-INSERT INTO word_synsets VALUES(4,'prison_term.n.01');
-INSERT INTO word_synsets VALUES(4,'clock.v.01');
-INSERT INTO word_synsets VALUES(4,'time.v.02');
-INSERT INTO word_synsets VALUES(4,'time.v.03');
-INSERT INTO word_synsets VALUES(4,'time.v.04');
-INSERT INTO word_synsets VALUES(4,'time.v.05');
-INSERT INTO word_synsets VALUES(6,'inch.n.01');
-INSERT INTO word_synsets VALUES(6,'indium.n.01');
-INSERT INTO word_synsets VALUES(6,'indiana.n.01');
-INSERT INTO word_synsets VALUES(6,'in.s.01');
-INSERT INTO word_synsets VALUES(6,'in.s.02');
-INSERT INTO word_synsets VALUES(6,'in.s.03');
-INSERT INTO word_synsets VALUES(6,'in.r.01');
-INSERT INTO word_synsets VALUES(7,'angstrom.n.01');
-INSERT INTO word_synsets VALUES(7,'vitamin_a.n.01');
-INSERT INTO word_synsets VALUES(7,'deoxyadenosine_monophosphate.n.01');
-INSERT INTO word_synsets VALUES(7,'adenine.n.01');
-INSERT INTO word_synsets VALUES(7,'ampere.n.02');
-INSERT INTO word_synsets VALUES(7,'a.n.06');
-INSERT INTO word_synsets VALUES(7,'a.n.07');
-INSERT INTO word_synsets VALUES(8,'small.n.01');
-INSERT INTO word_synsets VALUES(8,'small.n.02');
-INSERT INTO word_synsets VALUES(8,'small.a.01');
-INSERT INTO word_synsets VALUES(8,'minor.s.10');
-INSERT INTO word_synsets VALUES(8,'little.s.03');
-INSERT INTO word_synsets VALUES(8,'small.s.04');
-INSERT INTO word_synsets VALUES(8,'humble.s.01');
-INSERT INTO word_synsets VALUES(8,'little.s.07');
-INSERT INTO word_synsets VALUES(8,'little.s.05');
-INSERT INTO word_synsets VALUES(8,'small.s.08');
-INSERT INTO word_synsets VALUES(8,'modest.s.02');
-INSERT INTO word_synsets VALUES(8,'belittled.s.01');
-INSERT INTO word_synsets VALUES(8,'small.r.01');
-INSERT INTO word_synsets VALUES(9,'village.n.01');
-INSERT INTO word_synsets VALUES(9,'village.n.02');
-INSERT INTO word_synsets VALUES(9,'greenwich_village.n.01');
-INSERT INTO word_synsets VALUES(11,'there.n.01');
-INSERT INTO word_synsets VALUES(11,'there.r.01');
-INSERT INTO word_synsets VALUES(11,'there.r.02');
-INSERT INTO word_synsets VALUES(11,'there.r.03');
-INSERT INTO word_synsets VALUES(12,'washington.n.02');
-INSERT INTO word_synsets VALUES(12,'be.v.01');
-INSERT INTO word_synsets VALUES(12,'be.v.02');
-INSERT INTO word_synsets VALUES(12,'be.v.03');
-INSERT INTO word_synsets VALUES(12,'exist.v.01');
-INSERT INTO word_synsets VALUES(12,'be.v.05');
-INSERT INTO word_synsets VALUES(12,'equal.v.01');
-INSERT INTO word_synsets VALUES(12,'constitute.v.01');
-INSERT INTO word_synsets VALUES(12,'be.v.08');
-INSERT INTO word_synsets VALUES(12,'embody.v.02');
-INSERT INTO word_synsets VALUES(12,'be.v.10');
-INSERT INTO word_synsets VALUES(12,'be.v.11');
-INSERT INTO word_synsets VALUES(12,'be.v.12');
-INSERT INTO word_synsets VALUES(12,'cost.v.01');
-INSERT INTO word_synsets VALUES(13,'angstrom.n.01');
-INSERT INTO word_synsets VALUES(13,'vitamin_a.n.01');
-INSERT INTO word_synsets VALUES(13,'deoxyadenosine_monophosphate.n.01');
-INSERT INTO word_synsets VALUES(13,'adenine.n.01');
-INSERT INTO word_synsets VALUES(13,'ampere.n.02');
-INSERT INTO word_synsets VALUES(13,'a.n.06');
-INSERT INTO word_synsets VALUES(13,'a.n.07');
-INSERT INTO word_synsets VALUES(14,'young.n.01');
-INSERT INTO word_synsets VALUES(14,'young.n.02');
-INSERT INTO word_synsets VALUES(14,'young.n.03');
-INSERT INTO word_synsets VALUES(14,'young.n.04');
-INSERT INTO word_synsets VALUES(14,'young.n.05');
-INSERT INTO word_synsets VALUES(14,'young.n.06');
-INSERT INTO word_synsets VALUES(14,'young.n.07');
-INSERT INTO word_synsets VALUES(14,'young.n.08');
-INSERT INTO word_synsets VALUES(14,'young.n.09');
-INSERT INTO word_synsets VALUES(14,'young.a.01');
-INSERT INTO word_synsets VALUES(14,'new.s.10');
-INSERT INTO word_synsets VALUES(14,'youthful.s.01');
-INSERT INTO word_synsets VALUES(14,'young.s.04');
-INSERT INTO word_synsets VALUES(14,'unseasoned.s.03');
-INSERT INTO word_synsets VALUES(15,'girl.n.01');
-INSERT INTO word_synsets VALUES(15,'female_child.n.01');
-INSERT INTO word_synsets VALUES(15,'daughter.n.01');
-INSERT INTO word_synsets VALUES(15,'girlfriend.n.02');
-INSERT INTO word_synsets VALUES(15,'girl.n.05');
-INSERT INTO word_synsets VALUES(16,'name.v.01');
-INSERT INTO word_synsets VALUES(16,'name.v.02');
-INSERT INTO word_synsets VALUES(16,'name.v.03');
-INSERT INTO word_synsets VALUES(16,'appoint.v.01');
-INSERT INTO word_synsets VALUES(16,'name.v.05');
-INSERT INTO word_synsets VALUES(16,'mention.v.01');
-INSERT INTO word_synsets VALUES(16,'identify.v.05');
-INSERT INTO word_synsets VALUES(16,'list.v.01');
-INSERT INTO word_synsets VALUES(16,'diagnose.v.01');
-INSERT INTO word_synsets VALUES(20,'love.v.01');
-INSERT INTO word_synsets VALUES(20,'love.v.02');
-INSERT INTO word_synsets VALUES(20,'love.v.03');
-INSERT INTO word_synsets VALUES(20,'sleep_together.v.01');
-INSERT INTO word_synsets VALUES(20,'loved.a.01');
-INSERT INTO word_synsets VALUES(21,'research.v.02');
-INSERT INTO word_synsets VALUES(21,'explore.v.02');
-INSERT INTO word_synsets VALUES(21,'explore.v.03');
-INSERT INTO word_synsets VALUES(21,'explore.v.04');
-INSERT INTO word_synsets VALUES(23,'forest.n.01');
-INSERT INTO word_synsets VALUES(23,'forest.n.02');
-INSERT INTO word_synsets VALUES(23,'afforest.v.01');
-INSERT INTO word_synsets VALUES(24,'approach.v.01');
-INSERT INTO word_synsets VALUES(24,'near.a.01');
-INSERT INTO word_synsets VALUES(24,'near.s.02');
-INSERT INTO word_synsets VALUES(24,'near.s.03');
-INSERT INTO word_synsets VALUES(24,'cheeseparing.s.01');
-INSERT INTO word_synsets VALUES(24,'dear.s.02');
-INSERT INTO word_synsets VALUES(24,'approximate.s.02');
-INSERT INTO word_synsets VALUES(24,'near.r.01');
-INSERT INTO word_synsets VALUES(24,'about.r.07');
-INSERT INTO word_synsets VALUES(26,'home.n.01');
-INSERT INTO word_synsets VALUES(26,'dwelling.n.01');
-INSERT INTO word_synsets VALUES(26,'home.n.03');
-INSERT INTO word_synsets VALUES(26,'home_plate.n.01');
-INSERT INTO word_synsets VALUES(26,'base.n.14');
-INSERT INTO word_synsets VALUES(26,'home.n.06');
-INSERT INTO word_synsets VALUES(26,'home.n.07');
-INSERT INTO word_synsets VALUES(26,'family.n.01');
-INSERT INTO word_synsets VALUES(26,'home.n.09');
-INSERT INTO word_synsets VALUES(26,'home.v.01');
-INSERT INTO word_synsets VALUES(26,'home.v.02');
-INSERT INTO word_synsets VALUES(26,'home.a.01');
-INSERT INTO word_synsets VALUES(26,'home.a.02');
-INSERT INTO word_synsets VALUES(26,'home.s.03');
-INSERT INTO word_synsets VALUES(26,'home.r.01');
-INSERT INTO word_synsets VALUES(26,'home.r.02');
-INSERT INTO word_synsets VALUES(26,'home.r.03');
-INSERT INTO word_synsets VALUES(28,'every.s.01');
-INSERT INTO word_synsets VALUES(28,'every.s.02');
-INSERT INTO word_synsets VALUES(29,'morning.n.01');
-INSERT INTO word_synsets VALUES(29,'good_morning.n.01');
-INSERT INTO word_synsets VALUES(29,'dawn.n.01');
-INSERT INTO word_synsets VALUES(29,'dawn.n.02');
-INSERT INTO word_synsets VALUES(33,'battalion.n.02');
-INSERT INTO word_synsets VALUES(33,'pack.n.02');
-INSERT INTO word_synsets VALUES(33,'pack.n.03');
-INSERT INTO word_synsets VALUES(33,'gang.n.01');
-INSERT INTO word_synsets VALUES(33,'clique.n.01');
-INSERT INTO word_synsets VALUES(33,'pack.n.06');
-INSERT INTO word_synsets VALUES(33,'pack.n.07');
-INSERT INTO word_synsets VALUES(33,'pack.n.08');
-INSERT INTO word_synsets VALUES(33,'pack.n.09');
-INSERT INTO word_synsets VALUES(33,'pack.v.01');
-INSERT INTO word_synsets VALUES(33,'pack.v.02');
-INSERT INTO word_synsets VALUES(33,'pack.v.03');
-INSERT INTO word_synsets VALUES(33,'pack.v.04');
-INSERT INTO word_synsets VALUES(33,'pack.v.05');
-INSERT INTO word_synsets VALUES(33,'carry.v.02');
-INSERT INTO word_synsets VALUES(33,'throng.v.01');
-INSERT INTO word_synsets VALUES(33,'backpack.v.01');
-INSERT INTO word_synsets VALUES(33,'tamp_down.v.01');
-INSERT INTO word_synsets VALUES(33,'pack.v.10');
-INSERT INTO word_synsets VALUES(33,'compact.v.01');
-INSERT INTO word_synsets VALUES(33,'pack.v.12');
-INSERT INTO word_synsets VALUES(33,'pack.v.13');
-INSERT INTO word_synsets VALUES(35,'bag.n.01');
-INSERT INTO word_synsets VALUES(35,'bag.n.02');
-INSERT INTO word_synsets VALUES(35,'base.n.03');
-INSERT INTO word_synsets VALUES(35,'bag.n.04');
-INSERT INTO word_synsets VALUES(35,'bag.n.05');
-INSERT INTO word_synsets VALUES(35,'bag.n.06');
-INSERT INTO word_synsets VALUES(35,'bag.n.07');
-INSERT INTO word_synsets VALUES(35,'udder.n.01');
-INSERT INTO word_synsets VALUES(35,'cup_of_tea.n.01');
-INSERT INTO word_synsets VALUES(35,'bag.v.01');
-INSERT INTO word_synsets VALUES(35,'bag.v.02');
-INSERT INTO word_synsets VALUES(35,'bulge.v.02');
-INSERT INTO word_synsets VALUES(35,'pocket.v.02');
-INSERT INTO word_synsets VALUES(35,'bag.v.05');
-INSERT INTO word_synsets VALUES(37,'bite.n.04');
-INSERT INTO word_synsets VALUES(37,'nosh.v.01');
-INSERT INTO word_synsets VALUES(39,'angstrom.n.01');
-INSERT INTO word_synsets VALUES(39,'vitamin_a.n.01');
-INSERT INTO word_synsets VALUES(39,'deoxyadenosine_monophosphate.n.01');
-INSERT INTO word_synsets VALUES(39,'adenine.n.01');
-INSERT INTO word_synsets VALUES(39,'ampere.n.02');
-INSERT INTO word_synsets VALUES(39,'a.n.06');
-INSERT INTO word_synsets VALUES(39,'a.n.07');
-INSERT INTO word_synsets VALUES(40,'book.n.01');
-INSERT INTO word_synsets VALUES(40,'book.n.02');
-INSERT INTO word_synsets VALUES(40,'record.n.05');
-INSERT INTO word_synsets VALUES(40,'script.n.01');
-INSERT INTO word_synsets VALUES(40,'ledger.n.01');
-INSERT INTO word_synsets VALUES(40,'book.n.06');
-INSERT INTO word_synsets VALUES(40,'book.n.07');
-INSERT INTO word_synsets VALUES(40,'koran.n.01');
-INSERT INTO word_synsets VALUES(40,'bible.n.01');
-INSERT INTO word_synsets VALUES(40,'book.n.10');
-INSERT INTO word_synsets VALUES(40,'book.n.11');
-INSERT INTO word_synsets VALUES(40,'book.v.01');
-INSERT INTO word_synsets VALUES(40,'reserve.v.04');
-INSERT INTO word_synsets VALUES(40,'book.v.03');
-INSERT INTO word_synsets VALUES(40,'book.v.04');
-INSERT INTO word_synsets VALUES(43,'set.n.01');
-INSERT INTO word_synsets VALUES(43,'set.n.02');
-INSERT INTO word_synsets VALUES(43,'set.n.03');
-INSERT INTO word_synsets VALUES(43,'stage_set.n.01');
-INSERT INTO word_synsets VALUES(43,'set.n.05');
-INSERT INTO word_synsets VALUES(43,'bent.n.01');
-INSERT INTO word_synsets VALUES(43,'set.n.07');
-INSERT INTO word_synsets VALUES(43,'set.n.08');
-INSERT INTO word_synsets VALUES(43,'hardening.n.02');
-INSERT INTO word_synsets VALUES(43,'set.n.10');
-INSERT INTO word_synsets VALUES(43,'set.n.11');
-INSERT INTO word_synsets VALUES(43,'set.n.12');
-INSERT INTO word_synsets VALUES(43,'set.n.13');
-INSERT INTO word_synsets VALUES(43,'put.v.01');
-INSERT INTO word_synsets VALUES(43,'determine.v.03');
-INSERT INTO word_synsets VALUES(43,'specify.v.02');
-INSERT INTO word_synsets VALUES(43,'set.v.04');
-INSERT INTO word_synsets VALUES(43,'set.v.05');
-INSERT INTO word_synsets VALUES(43,'set.v.06');
-INSERT INTO word_synsets VALUES(43,'fix.v.12');
-INSERT INTO word_synsets VALUES(43,'set.v.08');
-INSERT INTO word_synsets VALUES(43,'set.v.09');
-INSERT INTO word_synsets VALUES(43,'set.v.10');
-INSERT INTO word_synsets VALUES(43,'arrange.v.06');
-INSERT INTO word_synsets VALUES(43,'plant.v.01');
-INSERT INTO word_synsets VALUES(43,'set.v.13');
-INSERT INTO word_synsets VALUES(43,'jell.v.01');
-INSERT INTO word_synsets VALUES(43,'typeset.v.01');
-INSERT INTO word_synsets VALUES(43,'set.v.16');
-INSERT INTO word_synsets VALUES(43,'set.v.17');
-INSERT INTO word_synsets VALUES(43,'set.v.18');
-INSERT INTO word_synsets VALUES(43,'sic.v.01');
-INSERT INTO word_synsets VALUES(43,'place.v.11');
-INSERT INTO word_synsets VALUES(43,'rig.v.04');
-INSERT INTO word_synsets VALUES(43,'set_up.v.04');
-INSERT INTO word_synsets VALUES(43,'adjust.v.01');
-INSERT INTO word_synsets VALUES(43,'fructify.v.03');
-INSERT INTO word_synsets VALUES(43,'dress.v.16');
-INSERT INTO word_synsets VALUES(43,'fit.s.02');
-INSERT INTO word_synsets VALUES(43,'fixed.s.02');
-INSERT INTO word_synsets VALUES(43,'located.s.01');
-INSERT INTO word_synsets VALUES(43,'laid.s.01');
-INSERT INTO word_synsets VALUES(43,'set.s.05');
-INSERT INTO word_synsets VALUES(43,'determined.s.04');
-INSERT INTO word_synsets VALUES(43,'hardened.s.05');
-INSERT INTO word_synsets VALUES(44,'murder.v.01');
-INSERT INTO word_synsets VALUES(44,'off.a.01');
-INSERT INTO word_synsets VALUES(44,'off.s.02');
-INSERT INTO word_synsets VALUES(44,'off.a.03');
-INSERT INTO word_synsets VALUES(44,'off.s.04');
-INSERT INTO word_synsets VALUES(44,'off.s.05');
-INSERT INTO word_synsets VALUES(44,'away.r.01');
-INSERT INTO word_synsets VALUES(44,'off.r.02');
-INSERT INTO word_synsets VALUES(44,'off.r.03');
-INSERT INTO word_synsets VALUES(45,'on.a.01');
-INSERT INTO word_synsets VALUES(45,'on.a.02');
-INSERT INTO word_synsets VALUES(45,'along.r.01');
-INSERT INTO word_synsets VALUES(45,'on.r.02');
-INSERT INTO word_synsets VALUES(45,'on.r.03');
-INSERT INTO word_synsets VALUES(47,'adventure.n.01');
-INSERT INTO word_synsets VALUES(47,'gamble.v.01');
-INSERT INTO word_synsets VALUES(47,'venture.v.03');
-INSERT INTO word_synsets VALUES(50,'forest.n.01');
-INSERT INTO word_synsets VALUES(50,'forest.n.02');
-INSERT INTO word_synsets VALUES(50,'afforest.v.01');
-INSERT INTO word_synsets VALUES(51,'washington.n.02');
-INSERT INTO word_synsets VALUES(51,'be.v.01');
-INSERT INTO word_synsets VALUES(51,'be.v.02');
-INSERT INTO word_synsets VALUES(51,'be.v.03');
-INSERT INTO word_synsets VALUES(51,'exist.v.01');
-INSERT INTO word_synsets VALUES(51,'be.v.05');
-INSERT INTO word_synsets VALUES(51,'equal.v.01');
-INSERT INTO word_synsets VALUES(51,'constitute.v.01');
-INSERT INTO word_synsets VALUES(51,'be.v.08');
-INSERT INTO word_synsets VALUES(51,'embody.v.02');
-INSERT INTO word_synsets VALUES(51,'be.v.10');
-INSERT INTO word_synsets VALUES(51,'be.v.11');
-INSERT INTO word_synsets VALUES(51,'be.v.12');
-INSERT INTO word_synsets VALUES(51,'cost.v.01');
-INSERT INTO word_synsets VALUES(52,'full_moon.n.01');
-INSERT INTO word_synsets VALUES(52,'full.v.01');
-INSERT INTO word_synsets VALUES(52,'full.v.02');
-INSERT INTO word_synsets VALUES(52,'wax.v.03');
-INSERT INTO word_synsets VALUES(52,'full.a.01');
-INSERT INTO word_synsets VALUES(52,'entire.s.01');
-INSERT INTO word_synsets VALUES(52,'full.s.03');
-INSERT INTO word_synsets VALUES(52,'full.s.04');
-INSERT INTO word_synsets VALUES(52,'full.a.05');
-INSERT INTO word_synsets VALUES(52,'full.s.06');
-INSERT INTO word_synsets VALUES(52,'broad.s.05');
-INSERT INTO word_synsets VALUES(52,'wide.s.06');
-INSERT INTO word_synsets VALUES(52,'fully.r.01');
-INSERT INTO word_synsets VALUES(54,'tall.n.01');
-INSERT INTO word_synsets VALUES(54,'tall.a.01');
-INSERT INTO word_synsets VALUES(54,'grandiloquent.s.01');
-INSERT INTO word_synsets VALUES(54,'tall.s.03');
-INSERT INTO word_synsets VALUES(54,'improbable.s.03');
-INSERT INTO word_synsets VALUES(55,'tree.n.01');
-INSERT INTO word_synsets VALUES(55,'tree.n.02');
-INSERT INTO word_synsets VALUES(55,'tree.n.03');
-INSERT INTO word_synsets VALUES(55,'corner.v.02');
-INSERT INTO word_synsets VALUES(55,'tree.v.02');
-INSERT INTO word_synsets VALUES(55,'tree.v.03');
-INSERT INTO word_synsets VALUES(55,'tree.v.04');
-INSERT INTO word_synsets VALUES(57,'peep.v.03');
-INSERT INTO word_synsets VALUES(57,'tweedle.v.01');
-INSERT INTO word_synsets VALUES(58,'bird.n.01');
-INSERT INTO word_synsets VALUES(58,'bird.n.02');
-INSERT INTO word_synsets VALUES(58,'dame.n.01');
-INSERT INTO word_synsets VALUES(58,'boo.n.01');
-INSERT INTO word_synsets VALUES(58,'shuttlecock.n.01');
-INSERT INTO word_synsets VALUES(58,'bird.v.01');
-INSERT INTO word_synsets VALUES(61,'colorful.a.01');
-INSERT INTO word_synsets VALUES(61,'colorful.a.02');
-INSERT INTO word_synsets VALUES(61,'colored.a.01');
-INSERT INTO word_synsets VALUES(62,'flower.n.01');
-INSERT INTO word_synsets VALUES(62,'flower.n.02');
-INSERT INTO word_synsets VALUES(62,'flower.n.03');
-INSERT INTO word_synsets VALUES(62,'bloom.v.01');
-INSERT INTO word_synsets VALUES(65,'felt.n.01');
-INSERT INTO word_synsets VALUES(65,'felt.v.01');
-INSERT INTO word_synsets VALUES(65,'felt.v.02');
-INSERT INTO word_synsets VALUES(65,'felt.v.03');
-INSERT INTO word_synsets VALUES(65,'feel.v.01');
-INSERT INTO word_synsets VALUES(65,'find.v.05');
-INSERT INTO word_synsets VALUES(65,'feel.v.03');
-INSERT INTO word_synsets VALUES(65,'feel.v.04');
-INSERT INTO word_synsets VALUES(65,'feel.v.05');
-INSERT INTO word_synsets VALUES(65,'feel.v.06');
-INSERT INTO word_synsets VALUES(65,'feel.v.07');
-INSERT INTO word_synsets VALUES(65,'feel.v.08');
-INSERT INTO word_synsets VALUES(65,'feel.v.09');
-INSERT INTO word_synsets VALUES(65,'palpate.v.01');
-INSERT INTO word_synsets VALUES(65,'feel.v.11');
-INSERT INTO word_synsets VALUES(65,'feel.v.12');
-INSERT INTO word_synsets VALUES(65,'feel.v.13');
-INSERT INTO word_synsets VALUES(66,'happy.a.01');
-INSERT INTO word_synsets VALUES(66,'felicitous.s.02');
-INSERT INTO word_synsets VALUES(66,'glad.s.02');
-INSERT INTO word_synsets VALUES(66,'happy.s.04');
-INSERT INTO word_synsets VALUES(68,'free.n.01');
-INSERT INTO word_synsets VALUES(68,'free.v.01');
-INSERT INTO word_synsets VALUES(68,'rid.v.01');
-INSERT INTO word_synsets VALUES(68,'dislodge.v.01');
-INSERT INTO word_synsets VALUES(68,'exempt.v.01');
-INSERT INTO word_synsets VALUES(68,'free.v.05');
-INSERT INTO word_synsets VALUES(68,'free.v.06');
-INSERT INTO word_synsets VALUES(68,'free.v.07');
-INSERT INTO word_synsets VALUES(68,'absolve.v.02');
-INSERT INTO word_synsets VALUES(68,'release.v.08');
-INSERT INTO word_synsets VALUES(68,'release.v.09');
-INSERT INTO word_synsets VALUES(68,'unblock.v.03');
-INSERT INTO word_synsets VALUES(68,'free.a.01');
-INSERT INTO word_synsets VALUES(68,'free.a.02');
-INSERT INTO word_synsets VALUES(68,'complimentary.s.02');
-INSERT INTO word_synsets VALUES(68,'free.s.04');
-INSERT INTO word_synsets VALUES(68,'detached.s.06');
-INSERT INTO word_synsets VALUES(68,'free.a.06');
-INSERT INTO word_synsets VALUES(68,'spare.s.03');
-INSERT INTO word_synsets VALUES(68,'barren.s.03');
-INSERT INTO word_synsets VALUES(68,'free.s.09');
-INSERT INTO word_synsets VALUES(68,'loose.r.01');
-INSERT INTO word_synsets VALUES(69,'arsenic.n.02');
-INSERT INTO word_synsets VALUES(69,'american_samoa.n.01');
-INSERT INTO word_synsets VALUES(69,'angstrom.n.01');
-INSERT INTO word_synsets VALUES(69,'vitamin_a.n.01');
-INSERT INTO word_synsets VALUES(69,'deoxyadenosine_monophosphate.n.01');
-INSERT INTO word_synsets VALUES(69,'adenine.n.01');
-INSERT INTO word_synsets VALUES(69,'ampere.n.02');
-INSERT INTO word_synsets VALUES(69,'a.n.06');
-INSERT INTO word_synsets VALUES(69,'a.n.07');
-INSERT INTO word_synsets VALUES(69,'equally.r.01');
-INSERT INTO word_synsets VALUES(71,'roll.v.12');
-INSERT INTO word_synsets VALUES(71,'cheat_on.v.01');
-INSERT INTO word_synsets VALUES(71,'wander.v.03');
-INSERT INTO word_synsets VALUES(71,'weave.v.04');
-INSERT INTO word_synsets VALUES(71,'digress.v.01');
-INSERT INTO word_synsets VALUES(72,'done.s.01');
-INSERT INTO word_synsets VALUES(72,'through.s.02');
-INSERT INTO word_synsets VALUES(72,'through.r.01');
-INSERT INTO word_synsets VALUES(72,'through.r.02');
-INSERT INTO word_synsets VALUES(72,'through.r.03');
-INSERT INTO word_synsets VALUES(72,'through.r.04');
-INSERT INTO word_synsets VALUES(72,'through.r.05');
-INSERT INTO word_synsets VALUES(74,'forest.n.01');
-INSERT INTO word_synsets VALUES(74,'wood.n.01');
-INSERT INTO word_synsets VALUES(74,'wood.n.03');
-INSERT INTO word_synsets VALUES(74,'wood.n.04');
-INSERT INTO word_synsets VALUES(74,'wood.n.05');
-INSERT INTO word_synsets VALUES(74,'wood.n.06');
-INSERT INTO word_synsets VALUES(74,'woodwind.n.01');
-INSERT INTO word_synsets VALUES(74,'wood.n.08');
-INSERT INTO word_synsets VALUES(76,'one.n.01');
-INSERT INTO word_synsets VALUES(76,'one.n.02');
-INSERT INTO word_synsets VALUES(76,'one.s.01');
-INSERT INTO word_synsets VALUES(76,'one.s.02');
-INSERT INTO word_synsets VALUES(76,'one.s.03');
-INSERT INTO word_synsets VALUES(76,'one.s.04');
-INSERT INTO word_synsets VALUES(76,'one.s.05');
-INSERT INTO word_synsets VALUES(76,'one.s.06');
-INSERT INTO word_synsets VALUES(76,'matchless.s.01');
-INSERT INTO word_synsets VALUES(77,'day.n.01');
-INSERT INTO word_synsets VALUES(77,'day.n.02');
-INSERT INTO word_synsets VALUES(77,'day.n.03');
-INSERT INTO word_synsets VALUES(77,'day.n.04');
-INSERT INTO word_synsets VALUES(77,'day.n.05');
-INSERT INTO word_synsets VALUES(77,'day.n.06');
-INSERT INTO word_synsets VALUES(77,'day.n.07');
-INSERT INTO word_synsets VALUES(77,'sidereal_day.n.01');
-INSERT INTO word_synsets VALUES(77,'day.n.09');
-INSERT INTO word_synsets VALUES(77,'day.n.10');
-INSERT INTO word_synsets VALUES(80,'found.n.01');
-INSERT INTO word_synsets VALUES(80,'establish.v.01');
-INSERT INTO word_synsets VALUES(80,'establish.v.02');
-INSERT INTO word_synsets VALUES(80,'establish.v.08');
-INSERT INTO word_synsets VALUES(80,'find.v.01');
-INSERT INTO word_synsets VALUES(80,'detect.v.01');
-INSERT INTO word_synsets VALUES(80,'find.v.03');
-INSERT INTO word_synsets VALUES(80,'determine.v.01');
-INSERT INTO word_synsets VALUES(80,'find.v.05');
-INSERT INTO word_synsets VALUES(80,'witness.v.02');
-INSERT INTO word_synsets VALUES(80,'line_up.v.02');
-INSERT INTO word_synsets VALUES(80,'discover.v.03');
-INSERT INTO word_synsets VALUES(80,'discover.v.04');
-INSERT INTO word_synsets VALUES(80,'find.v.10');
-INSERT INTO word_synsets VALUES(80,'rule.v.04');
-INSERT INTO word_synsets VALUES(80,'receive.v.02');
-INSERT INTO word_synsets VALUES(80,'find.v.13');
-INSERT INTO word_synsets VALUES(80,'recover.v.01');
-INSERT INTO word_synsets VALUES(80,'find.v.15');
-INSERT INTO word_synsets VALUES(80,'find_oneself.v.01');
-INSERT INTO word_synsets VALUES(80,'found.a.01');
-INSERT INTO word_synsets VALUES(81,'angstrom.n.01');
-INSERT INTO word_synsets VALUES(81,'vitamin_a.n.01');
-INSERT INTO word_synsets VALUES(81,'deoxyadenosine_monophosphate.n.01');
-INSERT INTO word_synsets VALUES(81,'adenine.n.01');
-INSERT INTO word_synsets VALUES(81,'ampere.n.02');
-INSERT INTO word_synsets VALUES(81,'a.n.06');
-INSERT INTO word_synsets VALUES(81,'a.n.07');
-INSERT INTO word_synsets VALUES(82,'cryptic.s.01');
-INSERT INTO word_synsets VALUES(82,'mysterious.s.02');
-INSERT INTO word_synsets VALUES(83,'old.n.01');
-INSERT INTO word_synsets VALUES(83,'old.a.01');
-INSERT INTO word_synsets VALUES(83,'old.a.02');
-INSERT INTO word_synsets VALUES(83,'old.s.03');
-INSERT INTO word_synsets VALUES(83,'old.s.04');
-INSERT INTO word_synsets VALUES(83,'erstwhile.s.01');
-INSERT INTO word_synsets VALUES(83,'honest-to-god.s.01');
-INSERT INTO word_synsets VALUES(83,'old.s.07');
-INSERT INTO word_synsets VALUES(83,'previous.s.01');
-INSERT INTO word_synsets VALUES(84,'map.n.01');
-INSERT INTO word_synsets VALUES(84,'function.n.01');
-INSERT INTO word_synsets VALUES(84,'map.v.01');
-INSERT INTO word_synsets VALUES(84,'map.v.02');
-INSERT INTO word_synsets VALUES(84,'map.v.03');
-INSERT INTO word_synsets VALUES(84,'map.v.04');
-INSERT INTO word_synsets VALUES(84,'map.v.05');
-INSERT INTO word_synsets VALUES(84,'map.v.06');
-INSERT INTO word_synsets VALUES(85,'hide.v.01');
-INSERT INTO word_synsets VALUES(85,'hide.v.02');
-INSERT INTO word_synsets VALUES(85,'shroud.v.01');
-INSERT INTO word_synsets VALUES(85,'obscure.v.05');
-INSERT INTO word_synsets VALUES(85,'concealed.s.01');
-INSERT INTO word_synsets VALUES(85,'hidden.s.02');
-INSERT INTO word_synsets VALUES(85,'hidden.s.03');
-INSERT INTO word_synsets VALUES(86,'nether.s.03');
-INSERT INTO word_synsets VALUES(86,'under.s.02');
-INSERT INTO word_synsets VALUES(86,'under.r.01');
-INSERT INTO word_synsets VALUES(86,'under.r.02');
-INSERT INTO word_synsets VALUES(86,'under.r.03');
-INSERT INTO word_synsets VALUES(86,'under.r.04');
-INSERT INTO word_synsets VALUES(86,'under.r.05');
-INSERT INTO word_synsets VALUES(86,'under.r.06');
-INSERT INTO word_synsets VALUES(86,'under.r.07');
-INSERT INTO word_synsets VALUES(86,'under.r.08');
-INSERT INTO word_synsets VALUES(87,'angstrom.n.01');
-INSERT INTO word_synsets VALUES(87,'vitamin_a.n.01');
-INSERT INTO word_synsets VALUES(87,'deoxyadenosine_monophosphate.n.01');
-INSERT INTO word_synsets VALUES(87,'adenine.n.01');
-INSERT INTO word_synsets VALUES(87,'ampere.n.02');
-INSERT INTO word_synsets VALUES(87,'a.n.06');
-INSERT INTO word_synsets VALUES(87,'a.n.07');
-INSERT INTO word_synsets VALUES(88,'rock.n.01');
-INSERT INTO word_synsets VALUES(88,'rock.n.02');
-INSERT INTO word_synsets VALUES(88,'rock.n.03');
-INSERT INTO word_synsets VALUES(88,'rock.n.04');
-INSERT INTO word_synsets VALUES(88,'rock_candy.n.01');
-INSERT INTO word_synsets VALUES(88,'rock_''n''_roll.n.01');
-INSERT INTO word_synsets VALUES(88,'rock.n.07');
-INSERT INTO word_synsets VALUES(88,'rock.v.01');
-INSERT INTO word_synsets VALUES(88,'rock.v.02');
-INSERT INTO word_synsets VALUES(90,'excite.v.01');
-INSERT INTO word_synsets VALUES(90,'stimulate.v.01');
-INSERT INTO word_synsets VALUES(90,'stimulate.v.06');
-INSERT INTO word_synsets VALUES(90,'agitate.v.02');
-INSERT INTO word_synsets VALUES(90,'arouse.v.07');
-INSERT INTO word_synsets VALUES(90,'stimulate.v.03');
-INSERT INTO word_synsets VALUES(90,'excite.v.07');
-INSERT INTO word_synsets VALUES(90,'excite.v.08');
-INSERT INTO word_synsets VALUES(90,'aroused.s.06');
-INSERT INTO word_synsets VALUES(90,'excited.a.02');
-INSERT INTO word_synsets VALUES(90,'delirious.s.02');
-INSERT INTO word_synsets VALUES(90,'activated.s.02');
-INSERT INTO word_synsets VALUES(93,'decide.v.01');
-INSERT INTO word_synsets VALUES(93,'decide.v.02');
-INSERT INTO word_synsets VALUES(93,'decide.v.03');
-INSERT INTO word_synsets VALUES(93,'decide.v.04');
-INSERT INTO word_synsets VALUES(93,'distinct.s.04');
-INSERT INTO word_synsets VALUES(95,'follow.v.01');
-INSERT INTO word_synsets VALUES(95,'postdate.v.01');
-INSERT INTO word_synsets VALUES(95,'follow.v.03');
-INSERT INTO word_synsets VALUES(95,'follow.v.04');
-INSERT INTO word_synsets VALUES(95,'comply.v.01');
-INSERT INTO word_synsets VALUES(95,'follow.v.06');
-INSERT INTO word_synsets VALUES(95,'follow.v.07');
-INSERT INTO word_synsets VALUES(95,'follow.v.08');
-INSERT INTO word_synsets VALUES(95,'adopt.v.01');
-INSERT INTO word_synsets VALUES(95,'follow.v.10');
-INSERT INTO word_synsets VALUES(95,'take_after.v.02');
-INSERT INTO word_synsets VALUES(95,'trace.v.01');
-INSERT INTO word_synsets VALUES(95,'watch.v.02');
-INSERT INTO word_synsets VALUES(95,'succeed.v.02');
-INSERT INTO word_synsets VALUES(95,'play_along.v.02');
-INSERT INTO word_synsets VALUES(95,'keep_up.v.04');
-INSERT INTO word_synsets VALUES(95,'come.v.05');
-INSERT INTO word_synsets VALUES(95,'follow.v.18');
-INSERT INTO word_synsets VALUES(95,'follow.v.19');
-INSERT INTO word_synsets VALUES(95,'be.v.08');
-INSERT INTO word_synsets VALUES(95,'surveil.v.01');
-INSERT INTO word_synsets VALUES(95,'pursue.v.02');
-INSERT INTO word_synsets VALUES(95,'follow.v.23');
-INSERT INTO word_synsets VALUES(95,'stick_to.v.02');
-INSERT INTO word_synsets VALUES(97,'map.n.01');
-INSERT INTO word_synsets VALUES(97,'function.n.01');
-INSERT INTO word_synsets VALUES(97,'map.v.01');
-INSERT INTO word_synsets VALUES(97,'map.v.02');
-INSERT INTO word_synsets VALUES(97,'map.v.03');
-INSERT INTO word_synsets VALUES(97,'map.v.04');
-INSERT INTO word_synsets VALUES(97,'map.v.05');
-INSERT INTO word_synsets VALUES(97,'map.v.06');
-INSERT INTO word_synsets VALUES(99,'detect.v.01');
-INSERT INTO word_synsets VALUES(99,'learn.v.02');
-INSERT INTO word_synsets VALUES(99,'discover.v.03');
-INSERT INTO word_synsets VALUES(99,'discover.v.04');
-INSERT INTO word_synsets VALUES(99,'fall_upon.v.01');
-INSERT INTO word_synsets VALUES(99,'unwrap.v.02');
-INSERT INTO word_synsets VALUES(99,'discover.v.07');
-INSERT INTO word_synsets VALUES(99,'identify.v.05');
-INSERT INTO word_synsets VALUES(101,'secret.n.01');
-INSERT INTO word_synsets VALUES(101,'secret.n.02');
-INSERT INTO word_synsets VALUES(101,'mystery.n.01');
-INSERT INTO word_synsets VALUES(103,'arsenic.n.02');
-INSERT INTO word_synsets VALUES(103,'american_samoa.n.01');
-INSERT INTO word_synsets VALUES(103,'angstrom.n.01');
-INSERT INTO word_synsets VALUES(103,'vitamin_a.n.01');
-INSERT INTO word_synsets VALUES(103,'deoxyadenosine_monophosphate.n.01');
-INSERT INTO word_synsets VALUES(103,'adenine.n.01');
-INSERT INTO word_synsets VALUES(103,'ampere.n.02');
-INSERT INTO word_synsets VALUES(103,'a.n.06');
-INSERT INTO word_synsets VALUES(103,'a.n.07');
-INSERT INTO word_synsets VALUES(103,'equally.r.01');
-INSERT INTO word_synsets VALUES(105,'sun.n.01');
-INSERT INTO word_synsets VALUES(105,'sunlight.n.01');
-INSERT INTO word_synsets VALUES(105,'sun.n.03');
-INSERT INTO word_synsets VALUES(105,'sun.n.04');
-INSERT INTO word_synsets VALUES(105,'sunday.n.01');
-INSERT INTO word_synsets VALUES(105,'sun.v.01');
-INSERT INTO word_synsets VALUES(105,'sun.v.02');
-INSERT INTO word_synsets VALUES(106,'set.n.01');
-INSERT INTO word_synsets VALUES(106,'set.n.02');
-INSERT INTO word_synsets VALUES(106,'set.n.03');
-INSERT INTO word_synsets VALUES(106,'stage_set.n.01');
-INSERT INTO word_synsets VALUES(106,'set.n.05');
-INSERT INTO word_synsets VALUES(106,'bent.n.01');
-INSERT INTO word_synsets VALUES(106,'set.n.07');
-INSERT INTO word_synsets VALUES(106,'set.n.08');
-INSERT INTO word_synsets VALUES(106,'hardening.n.02');
-INSERT INTO word_synsets VALUES(106,'set.n.10');
-INSERT INTO word_synsets VALUES(106,'set.n.11');
-INSERT INTO word_synsets VALUES(106,'set.n.12');
-INSERT INTO word_synsets VALUES(106,'set.n.13');
-INSERT INTO word_synsets VALUES(106,'put.v.01');
-INSERT INTO word_synsets VALUES(106,'determine.v.03');
-INSERT INTO word_synsets VALUES(106,'specify.v.02');
-INSERT INTO word_synsets VALUES(106,'set.v.04');
-INSERT INTO word_synsets VALUES(106,'set.v.05');
-INSERT INTO word_synsets VALUES(106,'set.v.06');
-INSERT INTO word_synsets VALUES(106,'fix.v.12');
-INSERT INTO word_synsets VALUES(106,'set.v.08');
-INSERT INTO word_synsets VALUES(106,'set.v.09');
-INSERT INTO word_synsets VALUES(106,'set.v.10');
-INSERT INTO word_synsets VALUES(106,'arrange.v.06');
-INSERT INTO word_synsets VALUES(106,'plant.v.01');
-INSERT INTO word_synsets VALUES(106,'set.v.13');
-INSERT INTO word_synsets VALUES(106,'jell.v.01');
-INSERT INTO word_synsets VALUES(106,'typeset.v.01');
-INSERT INTO word_synsets VALUES(106,'set.v.16');
-INSERT INTO word_synsets VALUES(106,'set.v.17');
-INSERT INTO word_synsets VALUES(106,'set.v.18');
-INSERT INTO word_synsets VALUES(106,'sic.v.01');
-INSERT INTO word_synsets VALUES(106,'place.v.11');
-INSERT INTO word_synsets VALUES(106,'rig.v.04');
-INSERT INTO word_synsets VALUES(106,'set_up.v.04');
-INSERT INTO word_synsets VALUES(106,'adjust.v.01');
-INSERT INTO word_synsets VALUES(106,'fructify.v.03');
-INSERT INTO word_synsets VALUES(106,'dress.v.16');
-INSERT INTO word_synsets VALUES(106,'fit.s.02');
-INSERT INTO word_synsets VALUES(106,'fixed.s.02');
-INSERT INTO word_synsets VALUES(106,'located.s.01');
-INSERT INTO word_synsets VALUES(106,'laid.s.01');
-INSERT INTO word_synsets VALUES(106,'set.s.05');
-INSERT INTO word_synsets VALUES(106,'determined.s.04');
-INSERT INTO word_synsets VALUES(106,'hardened.s.05');
-INSERT INTO word_synsets VALUES(109,'return.v.01');
-INSERT INTO word_synsets VALUES(109,'render.v.07');
-INSERT INTO word_synsets VALUES(109,'revert.v.01');
-INSERT INTO word_synsets VALUES(109,'hark_back.v.01');
-INSERT INTO word_synsets VALUES(109,'return.v.05');
-INSERT INTO word_synsets VALUES(109,'return.v.06');
-INSERT INTO word_synsets VALUES(109,'return.v.07');
-INSERT INTO word_synsets VALUES(109,'retort.v.01');
-INSERT INTO word_synsets VALUES(109,'come_back.v.01');
-INSERT INTO word_synsets VALUES(109,'refund.v.01');
-INSERT INTO word_synsets VALUES(109,'render.v.05');
-INSERT INTO word_synsets VALUES(109,'reelect.v.01');
-INSERT INTO word_synsets VALUES(109,'fall.v.21');
-INSERT INTO word_synsets VALUES(109,'return.v.14');
-INSERT INTO word_synsets VALUES(109,'render.v.04');
-INSERT INTO word_synsets VALUES(109,'return.v.16');
-INSERT INTO word_synsets VALUES(110,'home.n.01');
-INSERT INTO word_synsets VALUES(110,'dwelling.n.01');
-INSERT INTO word_synsets VALUES(110,'home.n.03');
-INSERT INTO word_synsets VALUES(110,'home_plate.n.01');
-INSERT INTO word_synsets VALUES(110,'base.n.14');
-INSERT INTO word_synsets VALUES(110,'home.n.06');
-INSERT INTO word_synsets VALUES(110,'home.n.07');
-INSERT INTO word_synsets VALUES(110,'family.n.01');
-INSERT INTO word_synsets VALUES(110,'home.n.09');
-INSERT INTO word_synsets VALUES(110,'home.v.01');
-INSERT INTO word_synsets VALUES(110,'home.v.02');
-INSERT INTO word_synsets VALUES(110,'home.a.01');
-INSERT INTO word_synsets VALUES(110,'home.a.02');
-INSERT INTO word_synsets VALUES(110,'home.s.03');
-INSERT INTO word_synsets VALUES(110,'home.r.01');
-INSERT INTO word_synsets VALUES(110,'home.r.02');
-INSERT INTO word_synsets VALUES(110,'home.r.03');
-INSERT INTO word_synsets VALUES(112,'tidal_bore.n.01');
-INSERT INTO word_synsets VALUES(112,'eager.a.01');
-INSERT INTO word_synsets VALUES(114,'continue.v.01');
-INSERT INTO word_synsets VALUES(114,'continue.v.02');
-INSERT INTO word_synsets VALUES(114,'continue.v.03');
-INSERT INTO word_synsets VALUES(114,'proceed.v.02');
-INSERT INTO word_synsets VALUES(114,'retain.v.02');
-INSERT INTO word_synsets VALUES(114,'continue.v.06');
-INSERT INTO word_synsets VALUES(114,'continue.v.07');
-INSERT INTO word_synsets VALUES(114,'stay.v.04');
-INSERT INTO word_synsets VALUES(114,'cover.v.03');
-INSERT INTO word_synsets VALUES(114,'continue.v.10');
-INSERT INTO word_synsets VALUES(116,'journey.n.01');
-INSERT INTO word_synsets VALUES(116,'travel.v.02');
-INSERT INTO word_synsets VALUES(116,'travel.v.04');
-INSERT INTO word_synsets VALUES(118,'following.s.02');
-INSERT INTO word_synsets VALUES(118,'adjacent.s.01');
-INSERT INTO word_synsets VALUES(118,'future.s.03');
-INSERT INTO word_synsets VALUES(118,'next.r.01');
-INSERT INTO word_synsets VALUES(119,'day.n.01');
-INSERT INTO word_synsets VALUES(119,'day.n.02');
-INSERT INTO word_synsets VALUES(119,'day.n.03');
-INSERT INTO word_synsets VALUES(119,'day.n.04');
-INSERT INTO word_synsets VALUES(119,'day.n.05');
-INSERT INTO word_synsets VALUES(119,'day.n.06');
-INSERT INTO word_synsets VALUES(119,'day.n.07');
-INSERT INTO word_synsets VALUES(119,'sidereal_day.n.01');
-INSERT INTO word_synsets VALUES(119,'day.n.09');
-INSERT INTO word_synsets VALUES(119,'day.n.10');
-INSERT INTO word_synsets VALUES(121,'once.r.01');
-INSERT INTO word_synsets VALUES(121,'once.r.02');
-INSERT INTO word_synsets VALUES(121,'once.r.03');
-INSERT INTO word_synsets VALUES(123,'angstrom.n.01');
-INSERT INTO word_synsets VALUES(123,'vitamin_a.n.01');
-INSERT INTO word_synsets VALUES(123,'deoxyadenosine_monophosphate.n.01');
-INSERT INTO word_synsets VALUES(123,'adenine.n.01');
-INSERT INTO word_synsets VALUES(123,'ampere.n.02');
-INSERT INTO word_synsets VALUES(123,'a.n.06');
-INSERT INTO word_synsets VALUES(123,'a.n.07');
-INSERT INTO word_synsets VALUES(124,'time.n.01');
-INSERT INTO word_synsets VALUES(124,'time.n.02');
-INSERT INTO word_synsets VALUES(124,'time.n.03');
-INSERT INTO word_synsets VALUES(124,'time.n.04');
-INSERT INTO word_synsets VALUES(124,'time.n.05');
-INSERT INTO word_synsets VALUES(124,'time.n.06');
-INSERT INTO word_synsets VALUES(124,'clock_time.n.01');
-INSERT INTO word_synsets VALUES(124,'fourth_dimension.n.01');
-INSERT INTO word_synsets VALUES(124,'meter.n.04');
-INSERT INTO word_synsets VALUES(124,'prison_term.n.01');
-INSERT INTO word_synsets VALUES(124,'clock.v.01');
-INSERT INTO word_synsets VALUES(124,'time.v.02');
-INSERT INTO word_synsets VALUES(124,'time.v.03');
-INSERT INTO word_synsets VALUES(124,'time.v.04');
-INSERT INTO word_synsets VALUES(124,'time.v.05');
-INSERT INTO word_synsets VALUES(125,'there.n.01');
-INSERT INTO word_synsets VALUES(125,'there.r.01');
-INSERT INTO word_synsets VALUES(125,'there.r.02');
-INSERT INTO word_synsets VALUES(125,'there.r.03');
-INSERT INTO word_synsets VALUES(126,'washington.n.02');
-INSERT INTO word_synsets VALUES(126,'be.v.01');
-INSERT INTO word_synsets VALUES(126,'be.v.02');
-INSERT INTO word_synsets VALUES(126,'be.v.03');
-INSERT INTO word_synsets VALUES(126,'exist.v.01');
-INSERT INTO word_synsets VALUES(126,'be.v.05');
-INSERT INTO word_synsets VALUES(126,'equal.v.01');
-INSERT INTO word_synsets VALUES(126,'constitute.v.01');
-INSERT INTO word_synsets VALUES(126,'be.v.08');
-INSERT INTO word_synsets VALUES(126,'embody.v.02');
-INSERT INTO word_synsets VALUES(126,'be.v.10');
-INSERT INTO word_synsets VALUES(126,'be.v.11');
-INSERT INTO word_synsets VALUES(126,'be.v.12');
-INSERT INTO word_synsets VALUES(126,'cost.v.01');
-INSERT INTO word_synsets VALUES(127,'angstrom.n.01');
-INSERT INTO word_synsets VALUES(127,'vitamin_a.n.01');
-INSERT INTO word_synsets VALUES(127,'deoxyadenosine_monophosphate.n.01');
-INSERT INTO word_synsets VALUES(127,'adenine.n.01');
-INSERT INTO word_synsets VALUES(127,'ampere.n.02');
-INSERT INTO word_synsets VALUES(127,'a.n.06');
-INSERT INTO word_synsets VALUES(127,'a.n.07');
-INSERT INTO word_synsets VALUES(128,'little.n.01');
-INSERT INTO word_synsets VALUES(128,'small.a.01');
-INSERT INTO word_synsets VALUES(128,'little.a.02');
-INSERT INTO word_synsets VALUES(128,'little.s.03');
-INSERT INTO word_synsets VALUES(128,'fiddling.s.01');
-INSERT INTO word_synsets VALUES(128,'little.s.05');
-INSERT INTO word_synsets VALUES(128,'short.a.03');
-INSERT INTO word_synsets VALUES(128,'little.s.07');
-INSERT INTO word_synsets VALUES(128,'little.s.08');
-INSERT INTO word_synsets VALUES(128,'little.r.01');
-INSERT INTO word_synsets VALUES(129,'girl.n.01');
-INSERT INTO word_synsets VALUES(129,'female_child.n.01');
-INSERT INTO word_synsets VALUES(129,'daughter.n.01');
-INSERT INTO word_synsets VALUES(129,'girlfriend.n.02');
-INSERT INTO word_synsets VALUES(129,'girl.n.05');
-INSERT INTO word_synsets VALUES(130,'name.v.01');
-INSERT INTO word_synsets VALUES(130,'name.v.02');
-INSERT INTO word_synsets VALUES(130,'name.v.03');
-INSERT INTO word_synsets VALUES(130,'appoint.v.01');
-INSERT INTO word_synsets VALUES(130,'name.v.05');
-INSERT INTO word_synsets VALUES(130,'mention.v.01');
-INSERT INTO word_synsets VALUES(130,'identify.v.05');
-INSERT INTO word_synsets VALUES(130,'list.v.01');
-INSERT INTO word_synsets VALUES(130,'diagnose.v.01');
-INSERT INTO word_synsets VALUES(134,'love.v.01');
-INSERT INTO word_synsets VALUES(134,'love.v.02');
-INSERT INTO word_synsets VALUES(134,'love.v.03');
-INSERT INTO word_synsets VALUES(134,'sleep_together.v.01');
-INSERT INTO word_synsets VALUES(134,'loved.a.01');
-INSERT INTO word_synsets VALUES(136,'go.n.01');
-INSERT INTO word_synsets VALUES(136,'adam.n.03');
-INSERT INTO word_synsets VALUES(136,'crack.n.09');
-INSERT INTO word_synsets VALUES(136,'go.n.04');
-INSERT INTO word_synsets VALUES(136,'travel.v.01');
-INSERT INTO word_synsets VALUES(136,'go.v.02');
-INSERT INTO word_synsets VALUES(136,'go.v.03');
-INSERT INTO word_synsets VALUES(136,'become.v.01');
-INSERT INTO word_synsets VALUES(136,'go.v.05');
-INSERT INTO word_synsets VALUES(136,'run.v.05');
-INSERT INTO word_synsets VALUES(136,'run.v.03');
-INSERT INTO word_synsets VALUES(136,'proceed.v.04');
-INSERT INTO word_synsets VALUES(136,'go.v.09');
-INSERT INTO word_synsets VALUES(136,'go.v.10');
-INSERT INTO word_synsets VALUES(136,'sound.v.02');
-INSERT INTO word_synsets VALUES(136,'function.v.01');
-INSERT INTO word_synsets VALUES(136,'run_low.v.01');
-INSERT INTO word_synsets VALUES(136,'move.v.13');
-INSERT INTO word_synsets VALUES(136,'survive.v.01');
-INSERT INTO word_synsets VALUES(136,'go.v.16');
-INSERT INTO word_synsets VALUES(136,'die.v.01');
-INSERT INTO word_synsets VALUES(136,'belong.v.03');
-INSERT INTO word_synsets VALUES(136,'go.v.19');
-INSERT INTO word_synsets VALUES(136,'start.v.09');
-INSERT INTO word_synsets VALUES(136,'move.v.15');
-INSERT INTO word_synsets VALUES(136,'go.v.22');
-INSERT INTO word_synsets VALUES(136,'go.v.23');
-INSERT INTO word_synsets VALUES(136,'blend.v.02');
-INSERT INTO word_synsets VALUES(136,'go.v.25');
-INSERT INTO word_synsets VALUES(136,'fit.v.02');
-INSERT INTO word_synsets VALUES(136,'rifle.v.02');
-INSERT INTO word_synsets VALUES(136,'go.v.28');
-INSERT INTO word_synsets VALUES(136,'plump.v.04');
-INSERT INTO word_synsets VALUES(136,'fail.v.04');
-INSERT INTO word_synsets VALUES(136,'go.a.01');
-INSERT INTO word_synsets VALUES(139,'shop.n.01');
-INSERT INTO word_synsets VALUES(139,'store.n.02');
-INSERT INTO word_synsets VALUES(139,'memory.n.04');
-INSERT INTO word_synsets VALUES(139,'storehouse.n.01');
-INSERT INTO word_synsets VALUES(139,'store.v.01');
-INSERT INTO word_synsets VALUES(139,'store.v.02');
-INSERT INTO word_synsets VALUES(141,'bargain.n.02');
-INSERT INTO word_synsets VALUES(141,'buy.v.01');
-INSERT INTO word_synsets VALUES(141,'bribe.v.01');
-INSERT INTO word_synsets VALUES(141,'buy.v.03');
-INSERT INTO word_synsets VALUES(141,'buy.v.04');
-INSERT INTO word_synsets VALUES(141,'buy.v.05');
-INSERT INTO word_synsets VALUES(142,'sweet.n.01');
-INSERT INTO word_synsets VALUES(142,'dessert.n.01');
-INSERT INTO word_synsets VALUES(142,'sweet.n.03');
-INSERT INTO word_synsets VALUES(142,'sweet.n.04');
-INSERT INTO word_synsets VALUES(142,'sweetness.n.02');
-INSERT INTO word_synsets VALUES(149,'on.a.01');
-INSERT INTO word_synsets VALUES(149,'on.a.02');
-INSERT INTO word_synsets VALUES(149,'along.r.01');
-INSERT INTO word_synsets VALUES(149,'on.r.02');
-INSERT INTO word_synsets VALUES(149,'on.r.03');
-INSERT INTO word_synsets VALUES(151,'special.n.01');
-INSERT INTO word_synsets VALUES(151,'special.n.02');
-INSERT INTO word_synsets VALUES(151,'special.n.03');
-INSERT INTO word_synsets VALUES(151,'particular.s.01');
-INSERT INTO word_synsets VALUES(151,'special.s.02');
-INSERT INTO word_synsets VALUES(151,'especial.s.01');
-INSERT INTO word_synsets VALUES(151,'special.s.04');
-INSERT INTO word_synsets VALUES(151,'limited.s.06');
-INSERT INTO word_synsets VALUES(151,'particular.s.04');
-INSERT INTO word_synsets VALUES(151,'extra.s.02');
-INSERT INTO word_synsets VALUES(152,'day.n.01');
-INSERT INTO word_synsets VALUES(152,'day.n.02');
-INSERT INTO word_synsets VALUES(152,'day.n.03');
-INSERT INTO word_synsets VALUES(152,'day.n.04');
-INSERT INTO word_synsets VALUES(152,'day.n.05');
-INSERT INTO word_synsets VALUES(152,'day.n.06');
-INSERT INTO word_synsets VALUES(152,'day.n.07');
-INSERT INTO word_synsets VALUES(152,'sidereal_day.n.01');
-INSERT INTO word_synsets VALUES(152,'day.n.09');
-INSERT INTO word_synsets VALUES(152,'day.n.10');
-INSERT INTO word_synsets VALUES(155,'enter.v.01');
-INSERT INTO word_synsets VALUES(155,'enter.v.02');
-INSERT INTO word_synsets VALUES(155,'enroll.v.01');
-INSERT INTO word_synsets VALUES(155,'figure.v.02');
-INSERT INTO word_synsets VALUES(155,'record.v.01');
-INSERT INTO word_synsets VALUES(155,'enter.v.06');
-INSERT INTO word_synsets VALUES(155,'accede.v.02');
-INSERT INTO word_synsets VALUES(155,'insert.v.01');
-INSERT INTO word_synsets VALUES(155,'embark.v.02');
-INSERT INTO word_synsets VALUES(157,'shop.n.01');
-INSERT INTO word_synsets VALUES(157,'store.n.02');
-INSERT INTO word_synsets VALUES(157,'memory.n.04');
-INSERT INTO word_synsets VALUES(157,'storehouse.n.01');
-INSERT INTO word_synsets VALUES(157,'store.v.01');
-INSERT INTO word_synsets VALUES(157,'store.v.02');
-INSERT INTO word_synsets VALUES(164,'feeling.n.01');
-INSERT INTO word_synsets VALUES(164,'impression.n.01');
-INSERT INTO word_synsets VALUES(164,'spirit.n.02');
-INSERT INTO word_synsets VALUES(164,'feeling.n.04');
-INSERT INTO word_synsets VALUES(164,'touch.n.10');
-INSERT INTO word_synsets VALUES(164,'feeling.n.06');
-INSERT INTO word_synsets VALUES(164,'feel.v.01');
-INSERT INTO word_synsets VALUES(164,'find.v.05');
-INSERT INTO word_synsets VALUES(164,'feel.v.03');
-INSERT INTO word_synsets VALUES(164,'feel.v.04');
-INSERT INTO word_synsets VALUES(164,'feel.v.05');
-INSERT INTO word_synsets VALUES(164,'feel.v.06');
-INSERT INTO word_synsets VALUES(164,'feel.v.07');
-INSERT INTO word_synsets VALUES(164,'feel.v.08');
-INSERT INTO word_synsets VALUES(164,'feel.v.09');
-INSERT INTO word_synsets VALUES(164,'palpate.v.01');
-INSERT INTO word_synsets VALUES(164,'feel.v.11');
-INSERT INTO word_synsets VALUES(164,'feel.v.12');
-INSERT INTO word_synsets VALUES(164,'feel.v.13');
-INSERT INTO word_synsets VALUES(165,'sol.n.03');
-INSERT INTO word_synsets VALUES(165,'so.r.01');
-INSERT INTO word_synsets VALUES(165,'so.r.02');
-INSERT INTO word_synsets VALUES(165,'so.r.03');
-INSERT INTO word_synsets VALUES(165,'so.r.04');
-INSERT INTO word_synsets VALUES(165,'so.r.05');
-INSERT INTO word_synsets VALUES(165,'thus.r.02');
-INSERT INTO word_synsets VALUES(165,'so.r.07');
-INSERT INTO word_synsets VALUES(165,'then.r.01');
-INSERT INTO word_synsets VALUES(165,'therefore.r.01');
-INSERT INTO word_synsets VALUES(165,'indeed.r.01');
-INSERT INTO word_synsets VALUES(166,'excite.v.01');
-INSERT INTO word_synsets VALUES(166,'stimulate.v.01');
-INSERT INTO word_synsets VALUES(166,'stimulate.v.06');
-INSERT INTO word_synsets VALUES(166,'agitate.v.02');
-INSERT INTO word_synsets VALUES(166,'arouse.v.07');
-INSERT INTO word_synsets VALUES(166,'stimulate.v.03');
-INSERT INTO word_synsets VALUES(166,'excite.v.07');
-INSERT INTO word_synsets VALUES(166,'excite.v.08');
-INSERT INTO word_synsets VALUES(166,'aroused.s.06');
-INSERT INTO word_synsets VALUES(166,'excited.a.02');
-INSERT INTO word_synsets VALUES(166,'delirious.s.02');
-INSERT INTO word_synsets VALUES(166,'activated.s.02');
-INSERT INTO word_synsets VALUES(168,'arsenic.n.02');
-INSERT INTO word_synsets VALUES(168,'american_samoa.n.01');
-INSERT INTO word_synsets VALUES(168,'angstrom.n.01');
-INSERT INTO word_synsets VALUES(168,'vitamin_a.n.01');
-INSERT INTO word_synsets VALUES(168,'deoxyadenosine_monophosphate.n.01');
-INSERT INTO word_synsets VALUES(168,'adenine.n.01');
-INSERT INTO word_synsets VALUES(168,'ampere.n.02');
-INSERT INTO word_synsets VALUES(168,'a.n.06');
-INSERT INTO word_synsets VALUES(168,'a.n.07');
-INSERT INTO word_synsets VALUES(168,'equally.r.01');
-INSERT INTO word_synsets VALUES(170,'be.v.01');
-INSERT INTO word_synsets VALUES(170,'be.v.02');
-INSERT INTO word_synsets VALUES(170,'be.v.03');
-INSERT INTO word_synsets VALUES(170,'exist.v.01');
-INSERT INTO word_synsets VALUES(170,'be.v.05');
-INSERT INTO word_synsets VALUES(170,'equal.v.01');
-INSERT INTO word_synsets VALUES(170,'constitute.v.01');
-INSERT INTO word_synsets VALUES(170,'be.v.08');
-INSERT INTO word_synsets VALUES(170,'embody.v.02');
-INSERT INTO word_synsets VALUES(170,'be.v.10');
-INSERT INTO word_synsets VALUES(170,'be.v.11');
-INSERT INTO word_synsets VALUES(170,'be.v.12');
-INSERT INTO word_synsets VALUES(170,'cost.v.01');
-INSERT INTO word_synsets VALUES(171,'look.n.02');
-INSERT INTO word_synsets VALUES(171,'looking.n.02');
-INSERT INTO word_synsets VALUES(171,'look.v.01');
-INSERT INTO word_synsets VALUES(171,'look.v.02');
-INSERT INTO word_synsets VALUES(171,'look.v.03');
-INSERT INTO word_synsets VALUES(171,'search.v.02');
-INSERT INTO word_synsets VALUES(171,'front.v.01');
-INSERT INTO word_synsets VALUES(171,'attend.v.02');
-INSERT INTO word_synsets VALUES(171,'look.v.07');
-INSERT INTO word_synsets VALUES(171,'expect.v.03');
-INSERT INTO word_synsets VALUES(171,'look.v.09');
-INSERT INTO word_synsets VALUES(171,'count.v.08');
-INSERT INTO word_synsets VALUES(171,'looking.s.01');
-INSERT INTO word_synsets VALUES(172,'about.r.03');
-INSERT INTO word_synsets VALUES(172,'around.r.02');
-INSERT INTO word_synsets VALUES(172,'about.r.04');
-INSERT INTO word_synsets VALUES(172,'around.r.04');
-INSERT INTO word_synsets VALUES(172,'approximately.r.01');
-INSERT INTO word_synsets VALUES(172,'about.r.05');
-INSERT INTO word_synsets VALUES(172,'around.r.07');
-INSERT INTO word_synsets VALUES(172,'about.r.02');
-INSERT INTO word_synsets VALUES(172,'around.r.09');
-INSERT INTO word_synsets VALUES(172,'round.r.01');
-INSERT INTO word_synsets VALUES(175,'detect.v.01');
-INSERT INTO word_synsets VALUES(175,'notice.v.02');
-INSERT INTO word_synsets VALUES(175,'comment.v.01');
-INSERT INTO word_synsets VALUES(175,'notice.v.04');
-INSERT INTO word_synsets VALUES(175,'noticed.a.01');
-INSERT INTO word_synsets VALUES(176,'angstrom.n.01');
-INSERT INTO word_synsets VALUES(176,'vitamin_a.n.01');
-INSERT INTO word_synsets VALUES(176,'deoxyadenosine_monophosphate.n.01');
-INSERT INTO word_synsets VALUES(176,'adenine.n.01');
-INSERT INTO word_synsets VALUES(176,'ampere.n.02');
-INSERT INTO word_synsets VALUES(176,'a.n.06');
-INSERT INTO word_synsets VALUES(176,'a.n.07');
-INSERT INTO word_synsets VALUES(177,'little.n.01');
-INSERT INTO word_synsets VALUES(177,'small.a.01');
-INSERT INTO word_synsets VALUES(177,'little.a.02');
-INSERT INTO word_synsets VALUES(177,'little.s.03');
-INSERT INTO word_synsets VALUES(177,'fiddling.s.01');
-INSERT INTO word_synsets VALUES(177,'little.s.05');
-INSERT INTO word_synsets VALUES(177,'short.a.03');
-INSERT INTO word_synsets VALUES(177,'little.s.07');
-INSERT INTO word_synsets VALUES(177,'little.s.08');
-INSERT INTO word_synsets VALUES(177,'little.r.01');
-INSERT INTO word_synsets VALUES(178,'girl.n.01');
-INSERT INTO word_synsets VALUES(178,'female_child.n.01');
-INSERT INTO word_synsets VALUES(178,'daughter.n.01');
-INSERT INTO word_synsets VALUES(178,'girlfriend.n.02');
-INSERT INTO word_synsets VALUES(178,'girl.n.05');
-INSERT INTO word_synsets VALUES(179,'playing.n.01');
-INSERT INTO word_synsets VALUES(179,'playing.n.02');
-INSERT INTO word_synsets VALUES(179,'acting.n.01');
-INSERT INTO word_synsets VALUES(179,'play.v.01');
-INSERT INTO word_synsets VALUES(179,'play.v.02');
-INSERT INTO word_synsets VALUES(179,'play.v.03');
-INSERT INTO word_synsets VALUES(179,'act.v.03');
-INSERT INTO word_synsets VALUES(179,'play.v.05');
-INSERT INTO word_synsets VALUES(179,'play.v.06');
-INSERT INTO word_synsets VALUES(179,'play.v.07');
-INSERT INTO word_synsets VALUES(179,'act.v.05');
-INSERT INTO word_synsets VALUES(179,'play.v.09');
-INSERT INTO word_synsets VALUES(179,'play.v.10');
-INSERT INTO word_synsets VALUES(179,'play.v.11');
-INSERT INTO word_synsets VALUES(179,'play.v.12');
-INSERT INTO word_synsets VALUES(179,'play.v.13');
-INSERT INTO word_synsets VALUES(179,'play.v.14');
-INSERT INTO word_synsets VALUES(179,'play.v.15');
-INSERT INTO word_synsets VALUES(179,'play.v.16');
-INSERT INTO word_synsets VALUES(179,'play.v.17');
-INSERT INTO word_synsets VALUES(179,'play.v.18');
-INSERT INTO word_synsets VALUES(179,'toy.v.02');
-INSERT INTO word_synsets VALUES(179,'play.v.20');
-INSERT INTO word_synsets VALUES(179,'dally.v.04');
-INSERT INTO word_synsets VALUES(179,'play.v.22');
-INSERT INTO word_synsets VALUES(179,'dally.v.01');
-INSERT INTO word_synsets VALUES(179,'play.v.24');
-INSERT INTO word_synsets VALUES(179,'act.v.10');
-INSERT INTO word_synsets VALUES(179,'play.v.26');
-INSERT INTO word_synsets VALUES(179,'bring.v.03');
-INSERT INTO word_synsets VALUES(179,'play.v.28');
-INSERT INTO word_synsets VALUES(179,'play.v.29');
-INSERT INTO word_synsets VALUES(179,'bet.v.02');
-INSERT INTO word_synsets VALUES(179,'play.v.31');
-INSERT INTO word_synsets VALUES(179,'play.v.32');
-INSERT INTO word_synsets VALUES(179,'play.v.33');
-INSERT INTO word_synsets VALUES(179,'meet.v.10');
-INSERT INTO word_synsets VALUES(179,'play.v.35');
-INSERT INTO word_synsets VALUES(181,'angstrom.n.01');
-INSERT INTO word_synsets VALUES(181,'vitamin_a.n.01');
-INSERT INTO word_synsets VALUES(181,'deoxyadenosine_monophosphate.n.01');
-INSERT INTO word_synsets VALUES(181,'adenine.n.01');
-INSERT INTO word_synsets VALUES(181,'ampere.n.02');
-INSERT INTO word_synsets VALUES(181,'a.n.06');
-INSERT INTO word_synsets VALUES(181,'a.n.07');
-INSERT INTO word_synsets VALUES(182,'plaything.n.01');
-INSERT INTO word_synsets VALUES(182,'toy.n.02');
-INSERT INTO word_synsets VALUES(182,'toy.n.03');
-INSERT INTO word_synsets VALUES(182,'miniature.n.02');
-INSERT INTO word_synsets VALUES(182,'toy_dog.n.01');
-INSERT INTO word_synsets VALUES(182,'dally.v.01');
-INSERT INTO word_synsets VALUES(182,'toy.v.02');
-INSERT INTO word_synsets VALUES(182,'play.v.16');
-INSERT INTO word_synsets VALUES(183,'inch.n.01');
-INSERT INTO word_synsets VALUES(183,'indium.n.01');
-INSERT INTO word_synsets VALUES(183,'indiana.n.01');
-INSERT INTO word_synsets VALUES(183,'in.s.01');
-INSERT INTO word_synsets VALUES(183,'in.s.02');
-INSERT INTO word_synsets VALUES(183,'in.s.03');
-INSERT INTO word_synsets VALUES(183,'in.r.01');
-INSERT INTO word_synsets VALUES(185,'corner.n.01');
-INSERT INTO word_synsets VALUES(185,'corner.n.02');
-INSERT INTO word_synsets VALUES(185,'corner.n.03');
-INSERT INTO word_synsets VALUES(185,'corner.n.04');
-INSERT INTO word_synsets VALUES(185,'corner.n.05');
-INSERT INTO word_synsets VALUES(185,'recess.n.02');
-INSERT INTO word_synsets VALUES(185,'corner.n.07');
-INSERT INTO word_synsets VALUES(185,'corner.n.08');
-INSERT INTO word_synsets VALUES(185,'corner.n.09');
-INSERT INTO word_synsets VALUES(185,'corner.n.10');
-INSERT INTO word_synsets VALUES(185,'corner.n.11');
-INSERT INTO word_synsets VALUES(185,'corner.v.01');
-INSERT INTO word_synsets VALUES(185,'corner.v.02');
-INSERT INTO word_synsets VALUES(185,'corner.v.03');
-INSERT INTO word_synsets VALUES(188,'shop.n.01');
-INSERT INTO word_synsets VALUES(188,'store.n.02');
-INSERT INTO word_synsets VALUES(188,'memory.n.04');
-INSERT INTO word_synsets VALUES(188,'storehouse.n.01');
-INSERT INTO word_synsets VALUES(188,'store.v.01');
-INSERT INTO word_synsets VALUES(188,'store.v.02');
-INSERT INTO word_synsets VALUES(192,'inch.n.01');
-INSERT INTO word_synsets VALUES(192,'indium.n.01');
-INSERT INTO word_synsets VALUES(192,'indiana.n.01');
-INSERT INTO word_synsets VALUES(192,'in.s.01');
-INSERT INTO word_synsets VALUES(192,'in.s.02');
-INSERT INTO word_synsets VALUES(192,'in.s.03');
-INSERT INTO word_synsets VALUES(192,'in.r.01');
-INSERT INTO word_synsets VALUES(193,'exhilaration.n.01');
-INSERT INTO word_synsets VALUES(193,'excitement.n.02');
-INSERT INTO word_synsets VALUES(193,'excitation.n.03');
-INSERT INTO word_synsets VALUES(193,'agitation.n.04');
-INSERT INTO word_synsets VALUES(195,'run.v.01');
-INSERT INTO word_synsets VALUES(195,'scat.v.01');
-INSERT INTO word_synsets VALUES(195,'run.v.03');
-INSERT INTO word_synsets VALUES(195,'operate.v.01');
-INSERT INTO word_synsets VALUES(195,'run.v.05');
-INSERT INTO word_synsets VALUES(195,'run.v.06');
-INSERT INTO word_synsets VALUES(195,'function.v.01');
-INSERT INTO word_synsets VALUES(195,'range.v.01');
-INSERT INTO word_synsets VALUES(195,'campaign.v.01');
-INSERT INTO word_synsets VALUES(195,'play.v.18');
-INSERT INTO word_synsets VALUES(195,'run.v.11');
-INSERT INTO word_synsets VALUES(195,'tend.v.01');
-INSERT INTO word_synsets VALUES(195,'run.v.13');
-INSERT INTO word_synsets VALUES(195,'run.v.14');
-INSERT INTO word_synsets VALUES(195,'run.v.15');
-INSERT INTO word_synsets VALUES(195,'run.v.16');
-INSERT INTO word_synsets VALUES(195,'prevail.v.03');
-INSERT INTO word_synsets VALUES(195,'run.v.18');
-INSERT INTO word_synsets VALUES(195,'run.v.19');
-INSERT INTO word_synsets VALUES(195,'carry.v.15');
-INSERT INTO word_synsets VALUES(195,'run.v.21');
-INSERT INTO word_synsets VALUES(195,'guide.v.05');
-INSERT INTO word_synsets VALUES(195,'run.v.23');
-INSERT INTO word_synsets VALUES(195,'run.v.24');
-INSERT INTO word_synsets VALUES(195,'run.v.25');
-INSERT INTO word_synsets VALUES(195,'run.v.26');
-INSERT INTO word_synsets VALUES(195,'run.v.27');
-INSERT INTO word_synsets VALUES(195,'run.v.28');
-INSERT INTO word_synsets VALUES(195,'run.v.29');
-INSERT INTO word_synsets VALUES(195,'run.v.30');
-INSERT INTO word_synsets VALUES(195,'run.v.31');
-INSERT INTO word_synsets VALUES(195,'run.v.32');
-INSERT INTO word_synsets VALUES(195,'run.v.33');
-INSERT INTO word_synsets VALUES(195,'run.v.34');
-INSERT INTO word_synsets VALUES(195,'ply.v.03');
-INSERT INTO word_synsets VALUES(195,'hunt.v.01');
-INSERT INTO word_synsets VALUES(195,'race.v.02');
-INSERT INTO word_synsets VALUES(195,'move.v.13');
-INSERT INTO word_synsets VALUES(195,'melt.v.01');
-INSERT INTO word_synsets VALUES(195,'ladder.v.01');
-INSERT INTO word_synsets VALUES(195,'run.v.41');
-INSERT INTO word_synsets VALUES(200,'ask.v.01');
-INSERT INTO word_synsets VALUES(200,'ask.v.02');
-INSERT INTO word_synsets VALUES(200,'ask.v.03');
-INSERT INTO word_synsets VALUES(200,'ask.v.04');
-INSERT INTO word_synsets VALUES(200,'ask.v.05');
-INSERT INTO word_synsets VALUES(200,'necessitate.v.01');
-INSERT INTO word_synsets VALUES(200,'ask.v.07');
-INSERT INTO word_synsets VALUES(204,'play.n.01');
-INSERT INTO word_synsets VALUES(204,'play.n.02');
-INSERT INTO word_synsets VALUES(204,'play.n.03');
-INSERT INTO word_synsets VALUES(204,'maneuver.n.03');
-INSERT INTO word_synsets VALUES(204,'play.n.05');
-INSERT INTO word_synsets VALUES(204,'play.n.06');
-INSERT INTO word_synsets VALUES(204,'bid.n.02');
-INSERT INTO word_synsets VALUES(204,'play.n.08');
-INSERT INTO word_synsets VALUES(204,'playing_period.n.01');
-INSERT INTO word_synsets VALUES(204,'free_rein.n.01');
-INSERT INTO word_synsets VALUES(204,'shimmer.n.01');
-INSERT INTO word_synsets VALUES(204,'fun.n.02');
-INSERT INTO word_synsets VALUES(204,'looseness.n.05');
-INSERT INTO word_synsets VALUES(204,'play.n.14');
-INSERT INTO word_synsets VALUES(204,'turn.n.03');
-INSERT INTO word_synsets VALUES(204,'gambling.n.01');
-INSERT INTO word_synsets VALUES(204,'play.n.17');
-INSERT INTO word_synsets VALUES(204,'play.v.01');
-INSERT INTO word_synsets VALUES(204,'play.v.02');
-INSERT INTO word_synsets VALUES(204,'play.v.03');
-INSERT INTO word_synsets VALUES(204,'act.v.03');
-INSERT INTO word_synsets VALUES(204,'play.v.05');
-INSERT INTO word_synsets VALUES(204,'play.v.06');
-INSERT INTO word_synsets VALUES(204,'play.v.07');
-INSERT INTO word_synsets VALUES(204,'act.v.05');
-INSERT INTO word_synsets VALUES(204,'play.v.09');
-INSERT INTO word_synsets VALUES(204,'play.v.10');
-INSERT INTO word_synsets VALUES(204,'play.v.11');
-INSERT INTO word_synsets VALUES(204,'play.v.12');
-INSERT INTO word_synsets VALUES(204,'play.v.13');
-INSERT INTO word_synsets VALUES(204,'play.v.14');
-INSERT INTO word_synsets VALUES(204,'play.v.15');
-INSERT INTO word_synsets VALUES(204,'play.v.16');
-INSERT INTO word_synsets VALUES(204,'play.v.17');
-INSERT INTO word_synsets VALUES(204,'play.v.18');
-INSERT INTO word_synsets VALUES(204,'toy.v.02');
-INSERT INTO word_synsets VALUES(204,'play.v.20');
-INSERT INTO word_synsets VALUES(204,'dally.v.04');
-INSERT INTO word_synsets VALUES(204,'play.v.22');
-INSERT INTO word_synsets VALUES(204,'dally.v.01');
-INSERT INTO word_synsets VALUES(204,'play.v.24');
-INSERT INTO word_synsets VALUES(204,'act.v.10');
-INSERT INTO word_synsets VALUES(204,'play.v.26');
-INSERT INTO word_synsets VALUES(204,'bring.v.03');
-INSERT INTO word_synsets VALUES(204,'play.v.28');
-INSERT INTO word_synsets VALUES(204,'play.v.29');
-INSERT INTO word_synsets VALUES(204,'bet.v.02');
-INSERT INTO word_synsets VALUES(204,'play.v.31');
-INSERT INTO word_synsets VALUES(204,'play.v.32');
-INSERT INTO word_synsets VALUES(204,'play.v.33');
-INSERT INTO word_synsets VALUES(204,'meet.v.10');
-INSERT INTO word_synsets VALUES(204,'play.v.35');
-INSERT INTO word_synsets VALUES(205,'excessively.r.01');
-INSERT INTO word_synsets VALUES(205,'besides.r.02');
-INSERT INTO word_synsets VALUES(208,'little.n.01');
-INSERT INTO word_synsets VALUES(208,'small.a.01');
-INSERT INTO word_synsets VALUES(208,'little.a.02');
-INSERT INTO word_synsets VALUES(208,'little.s.03');
-INSERT INTO word_synsets VALUES(208,'fiddling.s.01');
-INSERT INTO word_synsets VALUES(208,'little.s.05');
-INSERT INTO word_synsets VALUES(208,'short.a.03');
-INSERT INTO word_synsets VALUES(208,'little.s.07');
-INSERT INTO word_synsets VALUES(208,'little.s.08');
-INSERT INTO word_synsets VALUES(208,'little.r.01');
-INSERT INTO word_synsets VALUES(209,'girl.n.01');
-INSERT INTO word_synsets VALUES(209,'female_child.n.01');
-INSERT INTO word_synsets VALUES(209,'daughter.n.01');
-INSERT INTO word_synsets VALUES(209,'girlfriend.n.02');
-INSERT INTO word_synsets VALUES(209,'girl.n.05');
-INSERT INTO word_synsets VALUES(210,'state.v.01');
-INSERT INTO word_synsets VALUES(210,'allege.v.01');
-INSERT INTO word_synsets VALUES(210,'suppose.v.01');
-INSERT INTO word_synsets VALUES(210,'read.v.02');
-INSERT INTO word_synsets VALUES(210,'order.v.01');
-INSERT INTO word_synsets VALUES(210,'pronounce.v.01');
-INSERT INTO word_synsets VALUES(210,'say.v.07');
-INSERT INTO word_synsets VALUES(210,'say.v.08');
-INSERT INTO word_synsets VALUES(210,'say.v.09');
-INSERT INTO word_synsets VALUES(210,'say.v.10');
-INSERT INTO word_synsets VALUES(210,'say.v.11');
-INSERT INTO word_synsets VALUES(210,'aforesaid.s.01');
-INSERT INTO word_synsets VALUES(211,'no.n.01');
-INSERT INTO word_synsets VALUES(211,'nobelium.n.01');
-INSERT INTO word_synsets VALUES(211,'no.a.01');
-INSERT INTO word_synsets VALUES(211,'no.r.01');
-INSERT INTO word_synsets VALUES(211,'no.r.02');
-INSERT INTO word_synsets VALUES(211,'no.r.03');
-INSERT INTO word_synsets VALUES(214,'washington.n.02');
-INSERT INTO word_synsets VALUES(214,'be.v.01');
-INSERT INTO word_synsets VALUES(214,'be.v.02');
-INSERT INTO word_synsets VALUES(214,'be.v.03');
-INSERT INTO word_synsets VALUES(214,'exist.v.01');
-INSERT INTO word_synsets VALUES(214,'be.v.05');
-INSERT INTO word_synsets VALUES(214,'equal.v.01');
-INSERT INTO word_synsets VALUES(214,'constitute.v.01');
-INSERT INTO word_synsets VALUES(214,'be.v.08');
-INSERT INTO word_synsets VALUES(214,'embody.v.02');
-INSERT INTO word_synsets VALUES(214,'be.v.10');
-INSERT INTO word_synsets VALUES(214,'be.v.11');
-INSERT INTO word_synsets VALUES(214,'be.v.12');
-INSERT INTO word_synsets VALUES(214,'cost.v.01');
-INSERT INTO word_synsets VALUES(215,'rather.r.01');
-INSERT INTO word_synsets VALUES(215,'rather.r.02');
-INSERT INTO word_synsets VALUES(215,'preferably.r.01');
-INSERT INTO word_synsets VALUES(215,'quite.r.01');
-INSERT INTO word_synsets VALUES(218,'washington.n.02');
-INSERT INTO word_synsets VALUES(218,'be.v.01');
-INSERT INTO word_synsets VALUES(218,'be.v.02');
-INSERT INTO word_synsets VALUES(218,'be.v.03');
-INSERT INTO word_synsets VALUES(218,'exist.v.01');
-INSERT INTO word_synsets VALUES(218,'be.v.05');
-INSERT INTO word_synsets VALUES(218,'equal.v.01');
-INSERT INTO word_synsets VALUES(218,'constitute.v.01');
-INSERT INTO word_synsets VALUES(218,'be.v.08');
-INSERT INTO word_synsets VALUES(218,'embody.v.02');
-INSERT INTO word_synsets VALUES(218,'be.v.10');
-INSERT INTO word_synsets VALUES(218,'be.v.11');
-INSERT INTO word_synsets VALUES(218,'be.v.12');
-INSERT INTO word_synsets VALUES(218,'cost.v.01');
-INSERT INTO word_synsets VALUES(220,'inch.n.01');
-INSERT INTO word_synsets VALUES(220,'indium.n.01');
-INSERT INTO word_synsets VALUES(220,'indiana.n.01');
-INSERT INTO word_synsets VALUES(220,'in.s.01');
-INSERT INTO word_synsets VALUES(220,'in.s.02');
-INSERT INTO word_synsets VALUES(220,'in.s.03');
-INSERT INTO word_synsets VALUES(220,'in.r.01');
-INSERT INTO word_synsets VALUES(222,'temper.n.02');
-INSERT INTO word_synsets VALUES(222,'climate.n.02');
-INSERT INTO word_synsets VALUES(222,'mood.n.03');
-INSERT INTO word_synsets VALUES(224,'play.n.01');
-INSERT INTO word_synsets VALUES(224,'play.n.02');
-INSERT INTO word_synsets VALUES(224,'play.n.03');
-INSERT INTO word_synsets VALUES(224,'maneuver.n.03');
-INSERT INTO word_synsets VALUES(224,'play.n.05');
-INSERT INTO word_synsets VALUES(224,'play.n.06');
-INSERT INTO word_synsets VALUES(224,'bid.n.02');
-INSERT INTO word_synsets VALUES(224,'play.n.08');
-INSERT INTO word_synsets VALUES(224,'playing_period.n.01');
-INSERT INTO word_synsets VALUES(224,'free_rein.n.01');
-INSERT INTO word_synsets VALUES(224,'shimmer.n.01');
-INSERT INTO word_synsets VALUES(224,'fun.n.02');
-INSERT INTO word_synsets VALUES(224,'looseness.n.05');
-INSERT INTO word_synsets VALUES(224,'play.n.14');
-INSERT INTO word_synsets VALUES(224,'turn.n.03');
-INSERT INTO word_synsets VALUES(224,'gambling.n.01');
-INSERT INTO word_synsets VALUES(224,'play.n.17');
-INSERT INTO word_synsets VALUES(224,'play.v.01');
-INSERT INTO word_synsets VALUES(224,'play.v.02');
-INSERT INTO word_synsets VALUES(224,'play.v.03');
-INSERT INTO word_synsets VALUES(224,'act.v.03');
-INSERT INTO word_synsets VALUES(224,'play.v.05');
-INSERT INTO word_synsets VALUES(224,'play.v.06');
-INSERT INTO word_synsets VALUES(224,'play.v.07');
-INSERT INTO word_synsets VALUES(224,'act.v.05');
-INSERT INTO word_synsets VALUES(224,'play.v.09');
-INSERT INTO word_synsets VALUES(224,'play.v.10');
-INSERT INTO word_synsets VALUES(224,'play.v.11');
-INSERT INTO word_synsets VALUES(224,'play.v.12');
-INSERT INTO word_synsets VALUES(224,'play.v.13');
-INSERT INTO word_synsets VALUES(224,'play.v.14');
-INSERT INTO word_synsets VALUES(224,'play.v.15');
-INSERT INTO word_synsets VALUES(224,'play.v.16');
-INSERT INTO word_synsets VALUES(224,'play.v.17');
-INSERT INTO word_synsets VALUES(224,'play.v.18');
-INSERT INTO word_synsets VALUES(224,'toy.v.02');
-INSERT INTO word_synsets VALUES(224,'play.v.20');
-INSERT INTO word_synsets VALUES(224,'dally.v.04');
-INSERT INTO word_synsets VALUES(224,'play.v.22');
-INSERT INTO word_synsets VALUES(224,'dally.v.01');
-INSERT INTO word_synsets VALUES(224,'play.v.24');
-INSERT INTO word_synsets VALUES(224,'act.v.10');
-INSERT INTO word_synsets VALUES(224,'play.v.26');
-INSERT INTO word_synsets VALUES(224,'bring.v.03');
-INSERT INTO word_synsets VALUES(224,'play.v.28');
-INSERT INTO word_synsets VALUES(224,'play.v.29');
-INSERT INTO word_synsets VALUES(224,'bet.v.02');
-INSERT INTO word_synsets VALUES(224,'play.v.31');
-INSERT INTO word_synsets VALUES(224,'play.v.32');
-INSERT INTO word_synsets VALUES(224,'play.v.33');
-INSERT INTO word_synsets VALUES(224,'meet.v.10');
-INSERT INTO word_synsets VALUES(224,'play.v.35');
+INSERT INTO word_type_synsets VALUES(1,'once.r.01');
+INSERT INTO word_type_synsets VALUES(1,'once.r.02');
+INSERT INTO word_type_synsets VALUES(1,'once.r.03');
+INSERT INTO word_type_synsets VALUES(3,'angstrom.n.01');
+INSERT INTO word_type_synsets VALUES(3,'vitamin_a.n.01');
+INSERT INTO word_type_synsets VALUES(3,'deoxyadenosine_monophosphate.n.01');
+INSERT INTO word_type_synsets VALUES(3,'adenine.n.01');
+INSERT INTO word_type_synsets VALUES(3,'ampere.n.02');
+INSERT INTO word_type_synsets VALUES(3,'a.n.06');
+INSERT INTO word_type_synsets VALUES(3,'a.n.07');
+INSERT INTO word_type_synsets VALUES(4,'time.n.01');
+INSERT INTO word_type_synsets VALUES(4,'time.n.02');
+INSERT INTO word_type_synsets VALUES(4,'time.n.03');
+INSERT INTO word_type_synsets VALUES(4,'time.n.04');
+INSERT INTO word_type_synsets VALUES(4,'time.n.05');
+INSERT INTO word_type_synsets VALUES(4,'time.n.06');
+INSERT INTO word_type_synsets VALUES(4,'clock_time.n.01');
+INSERT INTO word_type_synsets VALUES(4,'fourth_dimension.n.01');
+INSERT INTO word_type_synsets VALUES(4,'meter.n.04');
+INSERT INTO word_type_synsets VALUES(4,'prison_term.n.01');
+INSERT INTO word_type_synsets VALUES(4,'clock.v.01');
+INSERT INTO word_type_synsets VALUES(4,'time.v.02');
+INSERT INTO word_type_synsets VALUES(4,'time.v.03');
+INSERT INTO word_type_synsets VALUES(4,'time.v.04');
+INSERT INTO word_type_synsets VALUES(4,'time.v.05');
+INSERT INTO word_type_synsets VALUES(6,'inch.n.01');
+INSERT INTO word_type_synsets VALUES(6,'indium.n.01');
+INSERT INTO word_type_synsets VALUES(6,'indiana.n.01');
+INSERT INTO word_type_synsets VALUES(6,'in.s.01');
+INSERT INTO word_type_synsets VALUES(6,'in.s.02');
+INSERT INTO word_type_synsets VALUES(6,'in.s.03');
+INSERT INTO word_type_synsets VALUES(6,'in.r.01');
+INSERT INTO word_type_synsets VALUES(7,'small.n.01');
+INSERT INTO word_type_synsets VALUES(7,'small.n.02');
+INSERT INTO word_type_synsets VALUES(7,'small.a.01');
+INSERT INTO word_type_synsets VALUES(7,'minor.s.10');
+INSERT INTO word_type_synsets VALUES(7,'little.s.03');
+INSERT INTO word_type_synsets VALUES(7,'small.s.04');
+INSERT INTO word_type_synsets VALUES(7,'humble.s.01');
+INSERT INTO word_type_synsets VALUES(7,'little.s.07');
+INSERT INTO word_type_synsets VALUES(7,'little.s.05');
+INSERT INTO word_type_synsets VALUES(7,'small.s.08');
+INSERT INTO word_type_synsets VALUES(7,'modest.s.02');
+INSERT INTO word_type_synsets VALUES(7,'belittled.s.01');
+INSERT INTO word_type_synsets VALUES(7,'small.r.01');
+INSERT INTO word_type_synsets VALUES(8,'village.n.01');
+INSERT INTO word_type_synsets VALUES(8,'village.n.02');
+INSERT INTO word_type_synsets VALUES(8,'greenwich_village.n.01');
+INSERT INTO word_type_synsets VALUES(9,'there.n.01');
+INSERT INTO word_type_synsets VALUES(9,'there.r.01');
+INSERT INTO word_type_synsets VALUES(9,'there.r.02');
+INSERT INTO word_type_synsets VALUES(9,'there.r.03');
+INSERT INTO word_type_synsets VALUES(10,'washington.n.02');
+INSERT INTO word_type_synsets VALUES(10,'be.v.01');
+INSERT INTO word_type_synsets VALUES(10,'be.v.02');
+INSERT INTO word_type_synsets VALUES(10,'be.v.03');
+INSERT INTO word_type_synsets VALUES(10,'exist.v.01');
+INSERT INTO word_type_synsets VALUES(10,'be.v.05');
+INSERT INTO word_type_synsets VALUES(10,'equal.v.01');
+INSERT INTO word_type_synsets VALUES(10,'constitute.v.01');
+INSERT INTO word_type_synsets VALUES(10,'be.v.08');
+INSERT INTO word_type_synsets VALUES(10,'embody.v.02');
+INSERT INTO word_type_synsets VALUES(10,'be.v.10');
+INSERT INTO word_type_synsets VALUES(10,'be.v.11');
+INSERT INTO word_type_synsets VALUES(10,'be.v.12');
+INSERT INTO word_type_synsets VALUES(10,'cost.v.01');
+INSERT INTO word_type_synsets VALUES(11,'young.n.01');
+INSERT INTO word_type_synsets VALUES(11,'young.n.02');
+INSERT INTO word_type_synsets VALUES(11,'young.n.03');
+INSERT INTO word_type_synsets VALUES(11,'young.n.04');
+INSERT INTO word_type_synsets VALUES(11,'young.n.05');
+INSERT INTO word_type_synsets VALUES(11,'young.n.06');
+INSERT INTO word_type_synsets VALUES(11,'young.n.07');
+INSERT INTO word_type_synsets VALUES(11,'young.n.08');
+INSERT INTO word_type_synsets VALUES(11,'young.n.09');
+INSERT INTO word_type_synsets VALUES(11,'young.a.01');
+INSERT INTO word_type_synsets VALUES(11,'new.s.10');
+INSERT INTO word_type_synsets VALUES(11,'youthful.s.01');
+INSERT INTO word_type_synsets VALUES(11,'young.s.04');
+INSERT INTO word_type_synsets VALUES(11,'unseasoned.s.03');
+INSERT INTO word_type_synsets VALUES(12,'girl.n.01');
+INSERT INTO word_type_synsets VALUES(12,'female_child.n.01');
+INSERT INTO word_type_synsets VALUES(12,'daughter.n.01');
+INSERT INTO word_type_synsets VALUES(12,'girlfriend.n.02');
+INSERT INTO word_type_synsets VALUES(12,'girl.n.05');
+INSERT INTO word_type_synsets VALUES(13,'name.v.01');
+INSERT INTO word_type_synsets VALUES(13,'name.v.02');
+INSERT INTO word_type_synsets VALUES(13,'name.v.03');
+INSERT INTO word_type_synsets VALUES(13,'appoint.v.01');
+INSERT INTO word_type_synsets VALUES(13,'name.v.05');
+INSERT INTO word_type_synsets VALUES(13,'mention.v.01');
+INSERT INTO word_type_synsets VALUES(13,'identify.v.05');
+INSERT INTO word_type_synsets VALUES(13,'list.v.01');
+INSERT INTO word_type_synsets VALUES(13,'diagnose.v.01');
+INSERT INTO word_type_synsets VALUES(17,'love.v.01');
+INSERT INTO word_type_synsets VALUES(17,'love.v.02');
+INSERT INTO word_type_synsets VALUES(17,'love.v.03');
+INSERT INTO word_type_synsets VALUES(17,'sleep_together.v.01');
+INSERT INTO word_type_synsets VALUES(17,'loved.a.01');
+INSERT INTO word_type_synsets VALUES(18,'research.v.02');
+INSERT INTO word_type_synsets VALUES(18,'explore.v.02');
+INSERT INTO word_type_synsets VALUES(18,'explore.v.03');
+INSERT INTO word_type_synsets VALUES(18,'explore.v.04');
+INSERT INTO word_type_synsets VALUES(20,'forest.n.01');
+INSERT INTO word_type_synsets VALUES(20,'forest.n.02');
+INSERT INTO word_type_synsets VALUES(20,'afforest.v.01');
+INSERT INTO word_type_synsets VALUES(21,'approach.v.01');
+INSERT INTO word_type_synsets VALUES(21,'near.a.01');
+INSERT INTO word_type_synsets VALUES(21,'near.s.02');
+INSERT INTO word_type_synsets VALUES(21,'near.s.03');
+INSERT INTO word_type_synsets VALUES(21,'cheeseparing.s.01');
+INSERT INTO word_type_synsets VALUES(21,'dear.s.02');
+INSERT INTO word_type_synsets VALUES(21,'approximate.s.02');
+INSERT INTO word_type_synsets VALUES(21,'near.r.01');
+INSERT INTO word_type_synsets VALUES(21,'about.r.07');
+INSERT INTO word_type_synsets VALUES(23,'home.n.01');
+INSERT INTO word_type_synsets VALUES(23,'dwelling.n.01');
+INSERT INTO word_type_synsets VALUES(23,'home.n.03');
+INSERT INTO word_type_synsets VALUES(23,'home_plate.n.01');
+INSERT INTO word_type_synsets VALUES(23,'base.n.14');
+INSERT INTO word_type_synsets VALUES(23,'home.n.06');
+INSERT INTO word_type_synsets VALUES(23,'home.n.07');
+INSERT INTO word_type_synsets VALUES(23,'family.n.01');
+INSERT INTO word_type_synsets VALUES(23,'home.n.09');
+INSERT INTO word_type_synsets VALUES(23,'home.v.01');
+INSERT INTO word_type_synsets VALUES(23,'home.v.02');
+INSERT INTO word_type_synsets VALUES(23,'home.a.01');
+INSERT INTO word_type_synsets VALUES(23,'home.a.02');
+INSERT INTO word_type_synsets VALUES(23,'home.s.03');
+INSERT INTO word_type_synsets VALUES(23,'home.r.01');
+INSERT INTO word_type_synsets VALUES(23,'home.r.02');
+INSERT INTO word_type_synsets VALUES(23,'home.r.03');
+INSERT INTO word_type_synsets VALUES(24,'every.s.01');
+INSERT INTO word_type_synsets VALUES(24,'every.s.02');
+INSERT INTO word_type_synsets VALUES(25,'morning.n.01');
+INSERT INTO word_type_synsets VALUES(25,'good_morning.n.01');
+INSERT INTO word_type_synsets VALUES(25,'dawn.n.01');
+INSERT INTO word_type_synsets VALUES(25,'dawn.n.02');
+INSERT INTO word_type_synsets VALUES(27,'battalion.n.02');
+INSERT INTO word_type_synsets VALUES(27,'pack.n.02');
+INSERT INTO word_type_synsets VALUES(27,'pack.n.03');
+INSERT INTO word_type_synsets VALUES(27,'gang.n.01');
+INSERT INTO word_type_synsets VALUES(27,'clique.n.01');
+INSERT INTO word_type_synsets VALUES(27,'pack.n.06');
+INSERT INTO word_type_synsets VALUES(27,'pack.n.07');
+INSERT INTO word_type_synsets VALUES(27,'pack.n.08');
+INSERT INTO word_type_synsets VALUES(27,'pack.n.09');
+INSERT INTO word_type_synsets VALUES(27,'pack.v.01');
+INSERT INTO word_type_synsets VALUES(27,'pack.v.02');
+INSERT INTO word_type_synsets VALUES(27,'pack.v.03');
+INSERT INTO word_type_synsets VALUES(27,'pack.v.04');
+INSERT INTO word_type_synsets VALUES(27,'pack.v.05');
+INSERT INTO word_type_synsets VALUES(27,'carry.v.02');
+INSERT INTO word_type_synsets VALUES(27,'throng.v.01');
+INSERT INTO word_type_synsets VALUES(27,'backpack.v.01');
+INSERT INTO word_type_synsets VALUES(27,'tamp_down.v.01');
+INSERT INTO word_type_synsets VALUES(27,'pack.v.10');
+INSERT INTO word_type_synsets VALUES(27,'compact.v.01');
+INSERT INTO word_type_synsets VALUES(27,'pack.v.12');
+INSERT INTO word_type_synsets VALUES(27,'pack.v.13');
+INSERT INTO word_type_synsets VALUES(28,'bag.n.01');
+INSERT INTO word_type_synsets VALUES(28,'bag.n.02');
+INSERT INTO word_type_synsets VALUES(28,'base.n.03');
+INSERT INTO word_type_synsets VALUES(28,'bag.n.04');
+INSERT INTO word_type_synsets VALUES(28,'bag.n.05');
+INSERT INTO word_type_synsets VALUES(28,'bag.n.06');
+INSERT INTO word_type_synsets VALUES(28,'bag.n.07');
+INSERT INTO word_type_synsets VALUES(28,'udder.n.01');
+INSERT INTO word_type_synsets VALUES(28,'cup_of_tea.n.01');
+INSERT INTO word_type_synsets VALUES(28,'bag.v.01');
+INSERT INTO word_type_synsets VALUES(28,'bag.v.02');
+INSERT INTO word_type_synsets VALUES(28,'bulge.v.02');
+INSERT INTO word_type_synsets VALUES(28,'pocket.v.02');
+INSERT INTO word_type_synsets VALUES(28,'bag.v.05');
+INSERT INTO word_type_synsets VALUES(30,'bite.n.04');
+INSERT INTO word_type_synsets VALUES(30,'nosh.v.01');
+INSERT INTO word_type_synsets VALUES(32,'book.n.01');
+INSERT INTO word_type_synsets VALUES(32,'book.n.02');
+INSERT INTO word_type_synsets VALUES(32,'record.n.05');
+INSERT INTO word_type_synsets VALUES(32,'script.n.01');
+INSERT INTO word_type_synsets VALUES(32,'ledger.n.01');
+INSERT INTO word_type_synsets VALUES(32,'book.n.06');
+INSERT INTO word_type_synsets VALUES(32,'book.n.07');
+INSERT INTO word_type_synsets VALUES(32,'koran.n.01');
+INSERT INTO word_type_synsets VALUES(32,'bible.n.01');
+INSERT INTO word_type_synsets VALUES(32,'book.n.10');
+INSERT INTO word_type_synsets VALUES(32,'book.n.11');
+INSERT INTO word_type_synsets VALUES(32,'book.v.01');
+INSERT INTO word_type_synsets VALUES(32,'reserve.v.04');
+INSERT INTO word_type_synsets VALUES(32,'book.v.03');
+INSERT INTO word_type_synsets VALUES(32,'book.v.04');
+INSERT INTO word_type_synsets VALUES(33,'set.n.01');
+INSERT INTO word_type_synsets VALUES(33,'set.n.02');
+INSERT INTO word_type_synsets VALUES(33,'set.n.03');
+INSERT INTO word_type_synsets VALUES(33,'stage_set.n.01');
+INSERT INTO word_type_synsets VALUES(33,'set.n.05');
+INSERT INTO word_type_synsets VALUES(33,'bent.n.01');
+INSERT INTO word_type_synsets VALUES(33,'set.n.07');
+INSERT INTO word_type_synsets VALUES(33,'set.n.08');
+INSERT INTO word_type_synsets VALUES(33,'hardening.n.02');
+INSERT INTO word_type_synsets VALUES(33,'set.n.10');
+INSERT INTO word_type_synsets VALUES(33,'set.n.11');
+INSERT INTO word_type_synsets VALUES(33,'set.n.12');
+INSERT INTO word_type_synsets VALUES(33,'set.n.13');
+INSERT INTO word_type_synsets VALUES(33,'put.v.01');
+INSERT INTO word_type_synsets VALUES(33,'determine.v.03');
+INSERT INTO word_type_synsets VALUES(33,'specify.v.02');
+INSERT INTO word_type_synsets VALUES(33,'set.v.04');
+INSERT INTO word_type_synsets VALUES(33,'set.v.05');
+INSERT INTO word_type_synsets VALUES(33,'set.v.06');
+INSERT INTO word_type_synsets VALUES(33,'fix.v.12');
+INSERT INTO word_type_synsets VALUES(33,'set.v.08');
+INSERT INTO word_type_synsets VALUES(33,'set.v.09');
+INSERT INTO word_type_synsets VALUES(33,'set.v.10');
+INSERT INTO word_type_synsets VALUES(33,'arrange.v.06');
+INSERT INTO word_type_synsets VALUES(33,'plant.v.01');
+INSERT INTO word_type_synsets VALUES(33,'set.v.13');
+INSERT INTO word_type_synsets VALUES(33,'jell.v.01');
+INSERT INTO word_type_synsets VALUES(33,'typeset.v.01');
+INSERT INTO word_type_synsets VALUES(33,'set.v.16');
+INSERT INTO word_type_synsets VALUES(33,'set.v.17');
+INSERT INTO word_type_synsets VALUES(33,'set.v.18');
+INSERT INTO word_type_synsets VALUES(33,'sic.v.01');
+INSERT INTO word_type_synsets VALUES(33,'place.v.11');
+INSERT INTO word_type_synsets VALUES(33,'rig.v.04');
+INSERT INTO word_type_synsets VALUES(33,'set_up.v.04');
+INSERT INTO word_type_synsets VALUES(33,'adjust.v.01');
+INSERT INTO word_type_synsets VALUES(33,'fructify.v.03');
+INSERT INTO word_type_synsets VALUES(33,'dress.v.16');
+INSERT INTO word_type_synsets VALUES(33,'fit.s.02');
+INSERT INTO word_type_synsets VALUES(33,'fixed.s.02');
+INSERT INTO word_type_synsets VALUES(33,'located.s.01');
+INSERT INTO word_type_synsets VALUES(33,'laid.s.01');
+INSERT INTO word_type_synsets VALUES(33,'set.s.05');
+INSERT INTO word_type_synsets VALUES(33,'determined.s.04');
+INSERT INTO word_type_synsets VALUES(33,'hardened.s.05');
+INSERT INTO word_type_synsets VALUES(34,'murder.v.01');
+INSERT INTO word_type_synsets VALUES(34,'off.a.01');
+INSERT INTO word_type_synsets VALUES(34,'off.s.02');
+INSERT INTO word_type_synsets VALUES(34,'off.a.03');
+INSERT INTO word_type_synsets VALUES(34,'off.s.04');
+INSERT INTO word_type_synsets VALUES(34,'off.s.05');
+INSERT INTO word_type_synsets VALUES(34,'away.r.01');
+INSERT INTO word_type_synsets VALUES(34,'off.r.02');
+INSERT INTO word_type_synsets VALUES(34,'off.r.03');
+INSERT INTO word_type_synsets VALUES(35,'on.a.01');
+INSERT INTO word_type_synsets VALUES(35,'on.a.02');
+INSERT INTO word_type_synsets VALUES(35,'along.r.01');
+INSERT INTO word_type_synsets VALUES(35,'on.r.02');
+INSERT INTO word_type_synsets VALUES(35,'on.r.03');
+INSERT INTO word_type_synsets VALUES(36,'adventure.n.01');
+INSERT INTO word_type_synsets VALUES(36,'gamble.v.01');
+INSERT INTO word_type_synsets VALUES(36,'venture.v.03');
+INSERT INTO word_type_synsets VALUES(38,'full_moon.n.01');
+INSERT INTO word_type_synsets VALUES(38,'full.v.01');
+INSERT INTO word_type_synsets VALUES(38,'full.v.02');
+INSERT INTO word_type_synsets VALUES(38,'wax.v.03');
+INSERT INTO word_type_synsets VALUES(38,'full.a.01');
+INSERT INTO word_type_synsets VALUES(38,'entire.s.01');
+INSERT INTO word_type_synsets VALUES(38,'full.s.03');
+INSERT INTO word_type_synsets VALUES(38,'full.s.04');
+INSERT INTO word_type_synsets VALUES(38,'full.a.05');
+INSERT INTO word_type_synsets VALUES(38,'full.s.06');
+INSERT INTO word_type_synsets VALUES(38,'broad.s.05');
+INSERT INTO word_type_synsets VALUES(38,'wide.s.06');
+INSERT INTO word_type_synsets VALUES(38,'fully.r.01');
+INSERT INTO word_type_synsets VALUES(40,'tall.n.01');
+INSERT INTO word_type_synsets VALUES(40,'tall.a.01');
+INSERT INTO word_type_synsets VALUES(40,'grandiloquent.s.01');
+INSERT INTO word_type_synsets VALUES(40,'tall.s.03');
+INSERT INTO word_type_synsets VALUES(40,'improbable.s.03');
+INSERT INTO word_type_synsets VALUES(41,'tree.n.01');
+INSERT INTO word_type_synsets VALUES(41,'tree.n.02');
+INSERT INTO word_type_synsets VALUES(41,'tree.n.03');
+INSERT INTO word_type_synsets VALUES(41,'corner.v.02');
+INSERT INTO word_type_synsets VALUES(41,'tree.v.02');
+INSERT INTO word_type_synsets VALUES(41,'tree.v.03');
+INSERT INTO word_type_synsets VALUES(41,'tree.v.04');
+INSERT INTO word_type_synsets VALUES(42,'peep.v.03');
+INSERT INTO word_type_synsets VALUES(42,'tweedle.v.01');
+INSERT INTO word_type_synsets VALUES(43,'bird.n.01');
+INSERT INTO word_type_synsets VALUES(43,'bird.n.02');
+INSERT INTO word_type_synsets VALUES(43,'dame.n.01');
+INSERT INTO word_type_synsets VALUES(43,'boo.n.01');
+INSERT INTO word_type_synsets VALUES(43,'shuttlecock.n.01');
+INSERT INTO word_type_synsets VALUES(43,'bird.v.01');
+INSERT INTO word_type_synsets VALUES(44,'colorful.a.01');
+INSERT INTO word_type_synsets VALUES(44,'colorful.a.02');
+INSERT INTO word_type_synsets VALUES(44,'colored.a.01');
+INSERT INTO word_type_synsets VALUES(45,'flower.n.01');
+INSERT INTO word_type_synsets VALUES(45,'flower.n.02');
+INSERT INTO word_type_synsets VALUES(45,'flower.n.03');
+INSERT INTO word_type_synsets VALUES(45,'bloom.v.01');
+INSERT INTO word_type_synsets VALUES(46,'felt.n.01');
+INSERT INTO word_type_synsets VALUES(46,'felt.v.01');
+INSERT INTO word_type_synsets VALUES(46,'felt.v.02');
+INSERT INTO word_type_synsets VALUES(46,'felt.v.03');
+INSERT INTO word_type_synsets VALUES(46,'feel.v.01');
+INSERT INTO word_type_synsets VALUES(46,'find.v.05');
+INSERT INTO word_type_synsets VALUES(46,'feel.v.03');
+INSERT INTO word_type_synsets VALUES(46,'feel.v.04');
+INSERT INTO word_type_synsets VALUES(46,'feel.v.05');
+INSERT INTO word_type_synsets VALUES(46,'feel.v.06');
+INSERT INTO word_type_synsets VALUES(46,'feel.v.07');
+INSERT INTO word_type_synsets VALUES(46,'feel.v.08');
+INSERT INTO word_type_synsets VALUES(46,'feel.v.09');
+INSERT INTO word_type_synsets VALUES(46,'palpate.v.01');
+INSERT INTO word_type_synsets VALUES(46,'feel.v.11');
+INSERT INTO word_type_synsets VALUES(46,'feel.v.12');
+INSERT INTO word_type_synsets VALUES(46,'feel.v.13');
+INSERT INTO word_type_synsets VALUES(47,'happy.a.01');
+INSERT INTO word_type_synsets VALUES(47,'felicitous.s.02');
+INSERT INTO word_type_synsets VALUES(47,'glad.s.02');
+INSERT INTO word_type_synsets VALUES(47,'happy.s.04');
+INSERT INTO word_type_synsets VALUES(48,'free.n.01');
+INSERT INTO word_type_synsets VALUES(48,'free.v.01');
+INSERT INTO word_type_synsets VALUES(48,'rid.v.01');
+INSERT INTO word_type_synsets VALUES(48,'dislodge.v.01');
+INSERT INTO word_type_synsets VALUES(48,'exempt.v.01');
+INSERT INTO word_type_synsets VALUES(48,'free.v.05');
+INSERT INTO word_type_synsets VALUES(48,'free.v.06');
+INSERT INTO word_type_synsets VALUES(48,'free.v.07');
+INSERT INTO word_type_synsets VALUES(48,'absolve.v.02');
+INSERT INTO word_type_synsets VALUES(48,'release.v.08');
+INSERT INTO word_type_synsets VALUES(48,'release.v.09');
+INSERT INTO word_type_synsets VALUES(48,'unblock.v.03');
+INSERT INTO word_type_synsets VALUES(48,'free.a.01');
+INSERT INTO word_type_synsets VALUES(48,'free.a.02');
+INSERT INTO word_type_synsets VALUES(48,'complimentary.s.02');
+INSERT INTO word_type_synsets VALUES(48,'free.s.04');
+INSERT INTO word_type_synsets VALUES(48,'detached.s.06');
+INSERT INTO word_type_synsets VALUES(48,'free.a.06');
+INSERT INTO word_type_synsets VALUES(48,'spare.s.03');
+INSERT INTO word_type_synsets VALUES(48,'barren.s.03');
+INSERT INTO word_type_synsets VALUES(48,'free.s.09');
+INSERT INTO word_type_synsets VALUES(48,'loose.r.01');
+INSERT INTO word_type_synsets VALUES(49,'arsenic.n.02');
+INSERT INTO word_type_synsets VALUES(49,'american_samoa.n.01');
+INSERT INTO word_type_synsets VALUES(49,'angstrom.n.01');
+INSERT INTO word_type_synsets VALUES(49,'vitamin_a.n.01');
+INSERT INTO word_type_synsets VALUES(49,'deoxyadenosine_monophosphate.n.01');
+INSERT INTO word_type_synsets VALUES(49,'adenine.n.01');
+INSERT INTO word_type_synsets VALUES(49,'ampere.n.02');
+INSERT INTO word_type_synsets VALUES(49,'a.n.06');
+INSERT INTO word_type_synsets VALUES(49,'a.n.07');
+INSERT INTO word_type_synsets VALUES(49,'equally.r.01');
+INSERT INTO word_type_synsets VALUES(51,'roll.v.12');
+INSERT INTO word_type_synsets VALUES(51,'cheat_on.v.01');
+INSERT INTO word_type_synsets VALUES(51,'wander.v.03');
+INSERT INTO word_type_synsets VALUES(51,'weave.v.04');
+INSERT INTO word_type_synsets VALUES(51,'digress.v.01');
+INSERT INTO word_type_synsets VALUES(52,'done.s.01');
+INSERT INTO word_type_synsets VALUES(52,'through.s.02');
+INSERT INTO word_type_synsets VALUES(52,'through.r.01');
+INSERT INTO word_type_synsets VALUES(52,'through.r.02');
+INSERT INTO word_type_synsets VALUES(52,'through.r.03');
+INSERT INTO word_type_synsets VALUES(52,'through.r.04');
+INSERT INTO word_type_synsets VALUES(52,'through.r.05');
+INSERT INTO word_type_synsets VALUES(53,'forest.n.01');
+INSERT INTO word_type_synsets VALUES(53,'wood.n.01');
+INSERT INTO word_type_synsets VALUES(53,'wood.n.03');
+INSERT INTO word_type_synsets VALUES(53,'wood.n.04');
+INSERT INTO word_type_synsets VALUES(53,'wood.n.05');
+INSERT INTO word_type_synsets VALUES(53,'wood.n.06');
+INSERT INTO word_type_synsets VALUES(53,'woodwind.n.01');
+INSERT INTO word_type_synsets VALUES(53,'wood.n.08');
+INSERT INTO word_type_synsets VALUES(54,'one.n.01');
+INSERT INTO word_type_synsets VALUES(54,'one.n.02');
+INSERT INTO word_type_synsets VALUES(54,'one.s.01');
+INSERT INTO word_type_synsets VALUES(54,'one.s.02');
+INSERT INTO word_type_synsets VALUES(54,'one.s.03');
+INSERT INTO word_type_synsets VALUES(54,'one.s.04');
+INSERT INTO word_type_synsets VALUES(54,'one.s.05');
+INSERT INTO word_type_synsets VALUES(54,'one.s.06');
+INSERT INTO word_type_synsets VALUES(54,'matchless.s.01');
+INSERT INTO word_type_synsets VALUES(55,'day.n.01');
+INSERT INTO word_type_synsets VALUES(55,'day.n.02');
+INSERT INTO word_type_synsets VALUES(55,'day.n.03');
+INSERT INTO word_type_synsets VALUES(55,'day.n.04');
+INSERT INTO word_type_synsets VALUES(55,'day.n.05');
+INSERT INTO word_type_synsets VALUES(55,'day.n.06');
+INSERT INTO word_type_synsets VALUES(55,'day.n.07');
+INSERT INTO word_type_synsets VALUES(55,'sidereal_day.n.01');
+INSERT INTO word_type_synsets VALUES(55,'day.n.09');
+INSERT INTO word_type_synsets VALUES(55,'day.n.10');
+INSERT INTO word_type_synsets VALUES(56,'found.n.01');
+INSERT INTO word_type_synsets VALUES(56,'establish.v.01');
+INSERT INTO word_type_synsets VALUES(56,'establish.v.02');
+INSERT INTO word_type_synsets VALUES(56,'establish.v.08');
+INSERT INTO word_type_synsets VALUES(56,'find.v.01');
+INSERT INTO word_type_synsets VALUES(56,'detect.v.01');
+INSERT INTO word_type_synsets VALUES(56,'find.v.03');
+INSERT INTO word_type_synsets VALUES(56,'determine.v.01');
+INSERT INTO word_type_synsets VALUES(56,'find.v.05');
+INSERT INTO word_type_synsets VALUES(56,'witness.v.02');
+INSERT INTO word_type_synsets VALUES(56,'line_up.v.02');
+INSERT INTO word_type_synsets VALUES(56,'discover.v.03');
+INSERT INTO word_type_synsets VALUES(56,'discover.v.04');
+INSERT INTO word_type_synsets VALUES(56,'find.v.10');
+INSERT INTO word_type_synsets VALUES(56,'rule.v.04');
+INSERT INTO word_type_synsets VALUES(56,'receive.v.02');
+INSERT INTO word_type_synsets VALUES(56,'find.v.13');
+INSERT INTO word_type_synsets VALUES(56,'recover.v.01');
+INSERT INTO word_type_synsets VALUES(56,'find.v.15');
+INSERT INTO word_type_synsets VALUES(56,'find_oneself.v.01');
+INSERT INTO word_type_synsets VALUES(56,'found.a.01');
+INSERT INTO word_type_synsets VALUES(57,'cryptic.s.01');
+INSERT INTO word_type_synsets VALUES(57,'mysterious.s.02');
+INSERT INTO word_type_synsets VALUES(58,'old.n.01');
+INSERT INTO word_type_synsets VALUES(58,'old.a.01');
+INSERT INTO word_type_synsets VALUES(58,'old.a.02');
+INSERT INTO word_type_synsets VALUES(58,'old.s.03');
+INSERT INTO word_type_synsets VALUES(58,'old.s.04');
+INSERT INTO word_type_synsets VALUES(58,'erstwhile.s.01');
+INSERT INTO word_type_synsets VALUES(58,'honest-to-god.s.01');
+INSERT INTO word_type_synsets VALUES(58,'old.s.07');
+INSERT INTO word_type_synsets VALUES(58,'previous.s.01');
+INSERT INTO word_type_synsets VALUES(59,'map.n.01');
+INSERT INTO word_type_synsets VALUES(59,'function.n.01');
+INSERT INTO word_type_synsets VALUES(59,'map.v.01');
+INSERT INTO word_type_synsets VALUES(59,'map.v.02');
+INSERT INTO word_type_synsets VALUES(59,'map.v.03');
+INSERT INTO word_type_synsets VALUES(59,'map.v.04');
+INSERT INTO word_type_synsets VALUES(59,'map.v.05');
+INSERT INTO word_type_synsets VALUES(59,'map.v.06');
+INSERT INTO word_type_synsets VALUES(60,'hide.v.01');
+INSERT INTO word_type_synsets VALUES(60,'hide.v.02');
+INSERT INTO word_type_synsets VALUES(60,'shroud.v.01');
+INSERT INTO word_type_synsets VALUES(60,'obscure.v.05');
+INSERT INTO word_type_synsets VALUES(60,'concealed.s.01');
+INSERT INTO word_type_synsets VALUES(60,'hidden.s.02');
+INSERT INTO word_type_synsets VALUES(60,'hidden.s.03');
+INSERT INTO word_type_synsets VALUES(61,'nether.s.03');
+INSERT INTO word_type_synsets VALUES(61,'under.s.02');
+INSERT INTO word_type_synsets VALUES(61,'under.r.01');
+INSERT INTO word_type_synsets VALUES(61,'under.r.02');
+INSERT INTO word_type_synsets VALUES(61,'under.r.03');
+INSERT INTO word_type_synsets VALUES(61,'under.r.04');
+INSERT INTO word_type_synsets VALUES(61,'under.r.05');
+INSERT INTO word_type_synsets VALUES(61,'under.r.06');
+INSERT INTO word_type_synsets VALUES(61,'under.r.07');
+INSERT INTO word_type_synsets VALUES(61,'under.r.08');
+INSERT INTO word_type_synsets VALUES(62,'rock.n.01');
+INSERT INTO word_type_synsets VALUES(62,'rock.n.02');
+INSERT INTO word_type_synsets VALUES(62,'rock.n.03');
+INSERT INTO word_type_synsets VALUES(62,'rock.n.04');
+INSERT INTO word_type_synsets VALUES(62,'rock_candy.n.01');
+INSERT INTO word_type_synsets VALUES(62,'rock_''n''_roll.n.01');
+INSERT INTO word_type_synsets VALUES(62,'rock.n.07');
+INSERT INTO word_type_synsets VALUES(62,'rock.v.01');
+INSERT INTO word_type_synsets VALUES(62,'rock.v.02');
+INSERT INTO word_type_synsets VALUES(63,'excite.v.01');
+INSERT INTO word_type_synsets VALUES(63,'stimulate.v.01');
+INSERT INTO word_type_synsets VALUES(63,'stimulate.v.06');
+INSERT INTO word_type_synsets VALUES(63,'agitate.v.02');
+INSERT INTO word_type_synsets VALUES(63,'arouse.v.07');
+INSERT INTO word_type_synsets VALUES(63,'stimulate.v.03');
+INSERT INTO word_type_synsets VALUES(63,'excite.v.07');
+INSERT INTO word_type_synsets VALUES(63,'excite.v.08');
+INSERT INTO word_type_synsets VALUES(63,'aroused.s.06');
+INSERT INTO word_type_synsets VALUES(63,'excited.a.02');
+INSERT INTO word_type_synsets VALUES(63,'delirious.s.02');
+INSERT INTO word_type_synsets VALUES(63,'activated.s.02');
+INSERT INTO word_type_synsets VALUES(64,'decide.v.01');
+INSERT INTO word_type_synsets VALUES(64,'decide.v.02');
+INSERT INTO word_type_synsets VALUES(64,'decide.v.03');
+INSERT INTO word_type_synsets VALUES(64,'decide.v.04');
+INSERT INTO word_type_synsets VALUES(64,'distinct.s.04');
+INSERT INTO word_type_synsets VALUES(66,'follow.v.01');
+INSERT INTO word_type_synsets VALUES(66,'postdate.v.01');
+INSERT INTO word_type_synsets VALUES(66,'follow.v.03');
+INSERT INTO word_type_synsets VALUES(66,'follow.v.04');
+INSERT INTO word_type_synsets VALUES(66,'comply.v.01');
+INSERT INTO word_type_synsets VALUES(66,'follow.v.06');
+INSERT INTO word_type_synsets VALUES(66,'follow.v.07');
+INSERT INTO word_type_synsets VALUES(66,'follow.v.08');
+INSERT INTO word_type_synsets VALUES(66,'adopt.v.01');
+INSERT INTO word_type_synsets VALUES(66,'follow.v.10');
+INSERT INTO word_type_synsets VALUES(66,'take_after.v.02');
+INSERT INTO word_type_synsets VALUES(66,'trace.v.01');
+INSERT INTO word_type_synsets VALUES(66,'watch.v.02');
+INSERT INTO word_type_synsets VALUES(66,'succeed.v.02');
+INSERT INTO word_type_synsets VALUES(66,'play_along.v.02');
+INSERT INTO word_type_synsets VALUES(66,'keep_up.v.04');
+INSERT INTO word_type_synsets VALUES(66,'come.v.05');
+INSERT INTO word_type_synsets VALUES(66,'follow.v.18');
+INSERT INTO word_type_synsets VALUES(66,'follow.v.19');
+INSERT INTO word_type_synsets VALUES(66,'be.v.08');
+INSERT INTO word_type_synsets VALUES(66,'surveil.v.01');
+INSERT INTO word_type_synsets VALUES(66,'pursue.v.02');
+INSERT INTO word_type_synsets VALUES(66,'follow.v.23');
+INSERT INTO word_type_synsets VALUES(66,'stick_to.v.02');
+INSERT INTO word_type_synsets VALUES(67,'detect.v.01');
+INSERT INTO word_type_synsets VALUES(67,'learn.v.02');
+INSERT INTO word_type_synsets VALUES(67,'discover.v.03');
+INSERT INTO word_type_synsets VALUES(67,'discover.v.04');
+INSERT INTO word_type_synsets VALUES(67,'fall_upon.v.01');
+INSERT INTO word_type_synsets VALUES(67,'unwrap.v.02');
+INSERT INTO word_type_synsets VALUES(67,'discover.v.07');
+INSERT INTO word_type_synsets VALUES(67,'identify.v.05');
+INSERT INTO word_type_synsets VALUES(69,'secret.n.01');
+INSERT INTO word_type_synsets VALUES(69,'secret.n.02');
+INSERT INTO word_type_synsets VALUES(69,'mystery.n.01');
+INSERT INTO word_type_synsets VALUES(70,'arsenic.n.02');
+INSERT INTO word_type_synsets VALUES(70,'american_samoa.n.01');
+INSERT INTO word_type_synsets VALUES(70,'angstrom.n.01');
+INSERT INTO word_type_synsets VALUES(70,'vitamin_a.n.01');
+INSERT INTO word_type_synsets VALUES(70,'deoxyadenosine_monophosphate.n.01');
+INSERT INTO word_type_synsets VALUES(70,'adenine.n.01');
+INSERT INTO word_type_synsets VALUES(70,'ampere.n.02');
+INSERT INTO word_type_synsets VALUES(70,'a.n.06');
+INSERT INTO word_type_synsets VALUES(70,'a.n.07');
+INSERT INTO word_type_synsets VALUES(70,'equally.r.01');
+INSERT INTO word_type_synsets VALUES(71,'sun.n.01');
+INSERT INTO word_type_synsets VALUES(71,'sunlight.n.01');
+INSERT INTO word_type_synsets VALUES(71,'sun.n.03');
+INSERT INTO word_type_synsets VALUES(71,'sun.n.04');
+INSERT INTO word_type_synsets VALUES(71,'sunday.n.01');
+INSERT INTO word_type_synsets VALUES(71,'sun.v.01');
+INSERT INTO word_type_synsets VALUES(71,'sun.v.02');
+INSERT INTO word_type_synsets VALUES(72,'return.v.01');
+INSERT INTO word_type_synsets VALUES(72,'render.v.07');
+INSERT INTO word_type_synsets VALUES(72,'revert.v.01');
+INSERT INTO word_type_synsets VALUES(72,'hark_back.v.01');
+INSERT INTO word_type_synsets VALUES(72,'return.v.05');
+INSERT INTO word_type_synsets VALUES(72,'return.v.06');
+INSERT INTO word_type_synsets VALUES(72,'return.v.07');
+INSERT INTO word_type_synsets VALUES(72,'retort.v.01');
+INSERT INTO word_type_synsets VALUES(72,'come_back.v.01');
+INSERT INTO word_type_synsets VALUES(72,'refund.v.01');
+INSERT INTO word_type_synsets VALUES(72,'render.v.05');
+INSERT INTO word_type_synsets VALUES(72,'reelect.v.01');
+INSERT INTO word_type_synsets VALUES(72,'fall.v.21');
+INSERT INTO word_type_synsets VALUES(72,'return.v.14');
+INSERT INTO word_type_synsets VALUES(72,'render.v.04');
+INSERT INTO word_type_synsets VALUES(72,'return.v.16');
+INSERT INTO word_type_synsets VALUES(73,'tidal_bore.n.01');
+INSERT INTO word_type_synsets VALUES(73,'eager.a.01');
+INSERT INTO word_type_synsets VALUES(74,'continue.v.01');
+INSERT INTO word_type_synsets VALUES(74,'continue.v.02');
+INSERT INTO word_type_synsets VALUES(74,'continue.v.03');
+INSERT INTO word_type_synsets VALUES(74,'proceed.v.02');
+INSERT INTO word_type_synsets VALUES(74,'retain.v.02');
+INSERT INTO word_type_synsets VALUES(74,'continue.v.06');
+INSERT INTO word_type_synsets VALUES(74,'continue.v.07');
+INSERT INTO word_type_synsets VALUES(74,'stay.v.04');
+INSERT INTO word_type_synsets VALUES(74,'cover.v.03');
+INSERT INTO word_type_synsets VALUES(74,'continue.v.10');
+INSERT INTO word_type_synsets VALUES(75,'journey.n.01');
+INSERT INTO word_type_synsets VALUES(75,'travel.v.02');
+INSERT INTO word_type_synsets VALUES(75,'travel.v.04');
+INSERT INTO word_type_synsets VALUES(76,'following.s.02');
+INSERT INTO word_type_synsets VALUES(76,'adjacent.s.01');
+INSERT INTO word_type_synsets VALUES(76,'future.s.03');
+INSERT INTO word_type_synsets VALUES(76,'next.r.01');
+INSERT INTO word_type_synsets VALUES(77,'little.n.01');
+INSERT INTO word_type_synsets VALUES(77,'small.a.01');
+INSERT INTO word_type_synsets VALUES(77,'little.a.02');
+INSERT INTO word_type_synsets VALUES(77,'little.s.03');
+INSERT INTO word_type_synsets VALUES(77,'fiddling.s.01');
+INSERT INTO word_type_synsets VALUES(77,'little.s.05');
+INSERT INTO word_type_synsets VALUES(77,'short.a.03');
+INSERT INTO word_type_synsets VALUES(77,'little.s.07');
+INSERT INTO word_type_synsets VALUES(77,'little.s.08');
+INSERT INTO word_type_synsets VALUES(77,'little.r.01');
+INSERT INTO word_type_synsets VALUES(79,'go.n.01');
+INSERT INTO word_type_synsets VALUES(79,'adam.n.03');
+INSERT INTO word_type_synsets VALUES(79,'crack.n.09');
+INSERT INTO word_type_synsets VALUES(79,'go.n.04');
+INSERT INTO word_type_synsets VALUES(79,'travel.v.01');
+INSERT INTO word_type_synsets VALUES(79,'go.v.02');
+INSERT INTO word_type_synsets VALUES(79,'go.v.03');
+INSERT INTO word_type_synsets VALUES(79,'become.v.01');
+INSERT INTO word_type_synsets VALUES(79,'go.v.05');
+INSERT INTO word_type_synsets VALUES(79,'run.v.05');
+INSERT INTO word_type_synsets VALUES(79,'run.v.03');
+INSERT INTO word_type_synsets VALUES(79,'proceed.v.04');
+INSERT INTO word_type_synsets VALUES(79,'go.v.09');
+INSERT INTO word_type_synsets VALUES(79,'go.v.10');
+INSERT INTO word_type_synsets VALUES(79,'sound.v.02');
+INSERT INTO word_type_synsets VALUES(79,'function.v.01');
+INSERT INTO word_type_synsets VALUES(79,'run_low.v.01');
+INSERT INTO word_type_synsets VALUES(79,'move.v.13');
+INSERT INTO word_type_synsets VALUES(79,'survive.v.01');
+INSERT INTO word_type_synsets VALUES(79,'go.v.16');
+INSERT INTO word_type_synsets VALUES(79,'die.v.01');
+INSERT INTO word_type_synsets VALUES(79,'belong.v.03');
+INSERT INTO word_type_synsets VALUES(79,'go.v.19');
+INSERT INTO word_type_synsets VALUES(79,'start.v.09');
+INSERT INTO word_type_synsets VALUES(79,'move.v.15');
+INSERT INTO word_type_synsets VALUES(79,'go.v.22');
+INSERT INTO word_type_synsets VALUES(79,'go.v.23');
+INSERT INTO word_type_synsets VALUES(79,'blend.v.02');
+INSERT INTO word_type_synsets VALUES(79,'go.v.25');
+INSERT INTO word_type_synsets VALUES(79,'fit.v.02');
+INSERT INTO word_type_synsets VALUES(79,'rifle.v.02');
+INSERT INTO word_type_synsets VALUES(79,'go.v.28');
+INSERT INTO word_type_synsets VALUES(79,'plump.v.04');
+INSERT INTO word_type_synsets VALUES(79,'fail.v.04');
+INSERT INTO word_type_synsets VALUES(79,'go.a.01');
+INSERT INTO word_type_synsets VALUES(80,'shop.n.01');
+INSERT INTO word_type_synsets VALUES(80,'store.n.02');
+INSERT INTO word_type_synsets VALUES(80,'memory.n.04');
+INSERT INTO word_type_synsets VALUES(80,'storehouse.n.01');
+INSERT INTO word_type_synsets VALUES(80,'store.v.01');
+INSERT INTO word_type_synsets VALUES(80,'store.v.02');
+INSERT INTO word_type_synsets VALUES(81,'bargain.n.02');
+INSERT INTO word_type_synsets VALUES(81,'buy.v.01');
+INSERT INTO word_type_synsets VALUES(81,'bribe.v.01');
+INSERT INTO word_type_synsets VALUES(81,'buy.v.03');
+INSERT INTO word_type_synsets VALUES(81,'buy.v.04');
+INSERT INTO word_type_synsets VALUES(81,'buy.v.05');
+INSERT INTO word_type_synsets VALUES(82,'sweet.n.01');
+INSERT INTO word_type_synsets VALUES(82,'dessert.n.01');
+INSERT INTO word_type_synsets VALUES(82,'sweet.n.03');
+INSERT INTO word_type_synsets VALUES(82,'sweet.n.04');
+INSERT INTO word_type_synsets VALUES(82,'sweetness.n.02');
+INSERT INTO word_type_synsets VALUES(85,'on.a.01');
+INSERT INTO word_type_synsets VALUES(85,'on.a.02');
+INSERT INTO word_type_synsets VALUES(85,'along.r.01');
+INSERT INTO word_type_synsets VALUES(85,'on.r.02');
+INSERT INTO word_type_synsets VALUES(85,'on.r.03');
+INSERT INTO word_type_synsets VALUES(87,'special.n.01');
+INSERT INTO word_type_synsets VALUES(87,'special.n.02');
+INSERT INTO word_type_synsets VALUES(87,'special.n.03');
+INSERT INTO word_type_synsets VALUES(87,'particular.s.01');
+INSERT INTO word_type_synsets VALUES(87,'special.s.02');
+INSERT INTO word_type_synsets VALUES(87,'especial.s.01');
+INSERT INTO word_type_synsets VALUES(87,'special.s.04');
+INSERT INTO word_type_synsets VALUES(87,'limited.s.06');
+INSERT INTO word_type_synsets VALUES(87,'particular.s.04');
+INSERT INTO word_type_synsets VALUES(87,'extra.s.02');
+INSERT INTO word_type_synsets VALUES(88,'enter.v.01');
+INSERT INTO word_type_synsets VALUES(88,'enter.v.02');
+INSERT INTO word_type_synsets VALUES(88,'enroll.v.01');
+INSERT INTO word_type_synsets VALUES(88,'figure.v.02');
+INSERT INTO word_type_synsets VALUES(88,'record.v.01');
+INSERT INTO word_type_synsets VALUES(88,'enter.v.06');
+INSERT INTO word_type_synsets VALUES(88,'accede.v.02');
+INSERT INTO word_type_synsets VALUES(88,'insert.v.01');
+INSERT INTO word_type_synsets VALUES(88,'embark.v.02');
+INSERT INTO word_type_synsets VALUES(89,'feeling.n.01');
+INSERT INTO word_type_synsets VALUES(89,'impression.n.01');
+INSERT INTO word_type_synsets VALUES(89,'spirit.n.02');
+INSERT INTO word_type_synsets VALUES(89,'feeling.n.04');
+INSERT INTO word_type_synsets VALUES(89,'touch.n.10');
+INSERT INTO word_type_synsets VALUES(89,'feeling.n.06');
+INSERT INTO word_type_synsets VALUES(89,'feel.v.01');
+INSERT INTO word_type_synsets VALUES(89,'find.v.05');
+INSERT INTO word_type_synsets VALUES(89,'feel.v.03');
+INSERT INTO word_type_synsets VALUES(89,'feel.v.04');
+INSERT INTO word_type_synsets VALUES(89,'feel.v.05');
+INSERT INTO word_type_synsets VALUES(89,'feel.v.06');
+INSERT INTO word_type_synsets VALUES(89,'feel.v.07');
+INSERT INTO word_type_synsets VALUES(89,'feel.v.08');
+INSERT INTO word_type_synsets VALUES(89,'feel.v.09');
+INSERT INTO word_type_synsets VALUES(89,'palpate.v.01');
+INSERT INTO word_type_synsets VALUES(89,'feel.v.11');
+INSERT INTO word_type_synsets VALUES(89,'feel.v.12');
+INSERT INTO word_type_synsets VALUES(89,'feel.v.13');
+INSERT INTO word_type_synsets VALUES(90,'sol.n.03');
+INSERT INTO word_type_synsets VALUES(90,'so.r.01');
+INSERT INTO word_type_synsets VALUES(90,'so.r.02');
+INSERT INTO word_type_synsets VALUES(90,'so.r.03');
+INSERT INTO word_type_synsets VALUES(90,'so.r.04');
+INSERT INTO word_type_synsets VALUES(90,'so.r.05');
+INSERT INTO word_type_synsets VALUES(90,'thus.r.02');
+INSERT INTO word_type_synsets VALUES(90,'so.r.07');
+INSERT INTO word_type_synsets VALUES(90,'then.r.01');
+INSERT INTO word_type_synsets VALUES(90,'therefore.r.01');
+INSERT INTO word_type_synsets VALUES(90,'indeed.r.01');
+INSERT INTO word_type_synsets VALUES(91,'excite.v.01');
+INSERT INTO word_type_synsets VALUES(91,'stimulate.v.01');
+INSERT INTO word_type_synsets VALUES(91,'stimulate.v.06');
+INSERT INTO word_type_synsets VALUES(91,'agitate.v.02');
+INSERT INTO word_type_synsets VALUES(91,'arouse.v.07');
+INSERT INTO word_type_synsets VALUES(91,'stimulate.v.03');
+INSERT INTO word_type_synsets VALUES(91,'excite.v.07');
+INSERT INTO word_type_synsets VALUES(91,'excite.v.08');
+INSERT INTO word_type_synsets VALUES(91,'aroused.s.06');
+INSERT INTO word_type_synsets VALUES(91,'excited.a.02');
+INSERT INTO word_type_synsets VALUES(91,'delirious.s.02');
+INSERT INTO word_type_synsets VALUES(91,'activated.s.02');
+INSERT INTO word_type_synsets VALUES(93,'be.v.01');
+INSERT INTO word_type_synsets VALUES(93,'be.v.02');
+INSERT INTO word_type_synsets VALUES(93,'be.v.03');
+INSERT INTO word_type_synsets VALUES(93,'exist.v.01');
+INSERT INTO word_type_synsets VALUES(93,'be.v.05');
+INSERT INTO word_type_synsets VALUES(93,'equal.v.01');
+INSERT INTO word_type_synsets VALUES(93,'constitute.v.01');
+INSERT INTO word_type_synsets VALUES(93,'be.v.08');
+INSERT INTO word_type_synsets VALUES(93,'embody.v.02');
+INSERT INTO word_type_synsets VALUES(93,'be.v.10');
+INSERT INTO word_type_synsets VALUES(93,'be.v.11');
+INSERT INTO word_type_synsets VALUES(93,'be.v.12');
+INSERT INTO word_type_synsets VALUES(93,'cost.v.01');
+INSERT INTO word_type_synsets VALUES(94,'look.n.02');
+INSERT INTO word_type_synsets VALUES(94,'looking.n.02');
+INSERT INTO word_type_synsets VALUES(94,'look.v.01');
+INSERT INTO word_type_synsets VALUES(94,'look.v.02');
+INSERT INTO word_type_synsets VALUES(94,'look.v.03');
+INSERT INTO word_type_synsets VALUES(94,'search.v.02');
+INSERT INTO word_type_synsets VALUES(94,'front.v.01');
+INSERT INTO word_type_synsets VALUES(94,'attend.v.02');
+INSERT INTO word_type_synsets VALUES(94,'look.v.07');
+INSERT INTO word_type_synsets VALUES(94,'expect.v.03');
+INSERT INTO word_type_synsets VALUES(94,'look.v.09');
+INSERT INTO word_type_synsets VALUES(94,'count.v.08');
+INSERT INTO word_type_synsets VALUES(94,'looking.s.01');
+INSERT INTO word_type_synsets VALUES(95,'about.r.03');
+INSERT INTO word_type_synsets VALUES(95,'around.r.02');
+INSERT INTO word_type_synsets VALUES(95,'about.r.04');
+INSERT INTO word_type_synsets VALUES(95,'around.r.04');
+INSERT INTO word_type_synsets VALUES(95,'approximately.r.01');
+INSERT INTO word_type_synsets VALUES(95,'about.r.05');
+INSERT INTO word_type_synsets VALUES(95,'around.r.07');
+INSERT INTO word_type_synsets VALUES(95,'about.r.02');
+INSERT INTO word_type_synsets VALUES(95,'around.r.09');
+INSERT INTO word_type_synsets VALUES(95,'round.r.01');
+INSERT INTO word_type_synsets VALUES(96,'detect.v.01');
+INSERT INTO word_type_synsets VALUES(96,'notice.v.02');
+INSERT INTO word_type_synsets VALUES(96,'comment.v.01');
+INSERT INTO word_type_synsets VALUES(96,'notice.v.04');
+INSERT INTO word_type_synsets VALUES(96,'noticed.a.01');
+INSERT INTO word_type_synsets VALUES(97,'playing.n.01');
+INSERT INTO word_type_synsets VALUES(97,'playing.n.02');
+INSERT INTO word_type_synsets VALUES(97,'acting.n.01');
+INSERT INTO word_type_synsets VALUES(97,'play.v.01');
+INSERT INTO word_type_synsets VALUES(97,'play.v.02');
+INSERT INTO word_type_synsets VALUES(97,'play.v.03');
+INSERT INTO word_type_synsets VALUES(97,'act.v.03');
+INSERT INTO word_type_synsets VALUES(97,'play.v.05');
+INSERT INTO word_type_synsets VALUES(97,'play.v.06');
+INSERT INTO word_type_synsets VALUES(97,'play.v.07');
+INSERT INTO word_type_synsets VALUES(97,'act.v.05');
+INSERT INTO word_type_synsets VALUES(97,'play.v.09');
+INSERT INTO word_type_synsets VALUES(97,'play.v.10');
+INSERT INTO word_type_synsets VALUES(97,'play.v.11');
+INSERT INTO word_type_synsets VALUES(97,'play.v.12');
+INSERT INTO word_type_synsets VALUES(97,'play.v.13');
+INSERT INTO word_type_synsets VALUES(97,'play.v.14');
+INSERT INTO word_type_synsets VALUES(97,'play.v.15');
+INSERT INTO word_type_synsets VALUES(97,'play.v.16');
+INSERT INTO word_type_synsets VALUES(97,'play.v.17');
+INSERT INTO word_type_synsets VALUES(97,'play.v.18');
+INSERT INTO word_type_synsets VALUES(97,'toy.v.02');
+INSERT INTO word_type_synsets VALUES(97,'play.v.20');
+INSERT INTO word_type_synsets VALUES(97,'dally.v.04');
+INSERT INTO word_type_synsets VALUES(97,'play.v.22');
+INSERT INTO word_type_synsets VALUES(97,'dally.v.01');
+INSERT INTO word_type_synsets VALUES(97,'play.v.24');
+INSERT INTO word_type_synsets VALUES(97,'act.v.10');
+INSERT INTO word_type_synsets VALUES(97,'play.v.26');
+INSERT INTO word_type_synsets VALUES(97,'bring.v.03');
+INSERT INTO word_type_synsets VALUES(97,'play.v.28');
+INSERT INTO word_type_synsets VALUES(97,'play.v.29');
+INSERT INTO word_type_synsets VALUES(97,'bet.v.02');
+INSERT INTO word_type_synsets VALUES(97,'play.v.31');
+INSERT INTO word_type_synsets VALUES(97,'play.v.32');
+INSERT INTO word_type_synsets VALUES(97,'play.v.33');
+INSERT INTO word_type_synsets VALUES(97,'meet.v.10');
+INSERT INTO word_type_synsets VALUES(97,'play.v.35');
+INSERT INTO word_type_synsets VALUES(98,'plaything.n.01');
+INSERT INTO word_type_synsets VALUES(98,'toy.n.02');
+INSERT INTO word_type_synsets VALUES(98,'toy.n.03');
+INSERT INTO word_type_synsets VALUES(98,'miniature.n.02');
+INSERT INTO word_type_synsets VALUES(98,'toy_dog.n.01');
+INSERT INTO word_type_synsets VALUES(98,'dally.v.01');
+INSERT INTO word_type_synsets VALUES(98,'toy.v.02');
+INSERT INTO word_type_synsets VALUES(98,'play.v.16');
+INSERT INTO word_type_synsets VALUES(99,'corner.n.01');
+INSERT INTO word_type_synsets VALUES(99,'corner.n.02');
+INSERT INTO word_type_synsets VALUES(99,'corner.n.03');
+INSERT INTO word_type_synsets VALUES(99,'corner.n.04');
+INSERT INTO word_type_synsets VALUES(99,'corner.n.05');
+INSERT INTO word_type_synsets VALUES(99,'recess.n.02');
+INSERT INTO word_type_synsets VALUES(99,'corner.n.07');
+INSERT INTO word_type_synsets VALUES(99,'corner.n.08');
+INSERT INTO word_type_synsets VALUES(99,'corner.n.09');
+INSERT INTO word_type_synsets VALUES(99,'corner.n.10');
+INSERT INTO word_type_synsets VALUES(99,'corner.n.11');
+INSERT INTO word_type_synsets VALUES(99,'corner.v.01');
+INSERT INTO word_type_synsets VALUES(99,'corner.v.02');
+INSERT INTO word_type_synsets VALUES(99,'corner.v.03');
+INSERT INTO word_type_synsets VALUES(101,'exhilaration.n.01');
+INSERT INTO word_type_synsets VALUES(101,'excitement.n.02');
+INSERT INTO word_type_synsets VALUES(101,'excitation.n.03');
+INSERT INTO word_type_synsets VALUES(101,'agitation.n.04');
+INSERT INTO word_type_synsets VALUES(102,'run.v.01');
+INSERT INTO word_type_synsets VALUES(102,'scat.v.01');
+INSERT INTO word_type_synsets VALUES(102,'run.v.03');
+INSERT INTO word_type_synsets VALUES(102,'operate.v.01');
+INSERT INTO word_type_synsets VALUES(102,'run.v.05');
+INSERT INTO word_type_synsets VALUES(102,'run.v.06');
+INSERT INTO word_type_synsets VALUES(102,'function.v.01');
+INSERT INTO word_type_synsets VALUES(102,'range.v.01');
+INSERT INTO word_type_synsets VALUES(102,'campaign.v.01');
+INSERT INTO word_type_synsets VALUES(102,'play.v.18');
+INSERT INTO word_type_synsets VALUES(102,'run.v.11');
+INSERT INTO word_type_synsets VALUES(102,'tend.v.01');
+INSERT INTO word_type_synsets VALUES(102,'run.v.13');
+INSERT INTO word_type_synsets VALUES(102,'run.v.14');
+INSERT INTO word_type_synsets VALUES(102,'run.v.15');
+INSERT INTO word_type_synsets VALUES(102,'run.v.16');
+INSERT INTO word_type_synsets VALUES(102,'prevail.v.03');
+INSERT INTO word_type_synsets VALUES(102,'run.v.18');
+INSERT INTO word_type_synsets VALUES(102,'run.v.19');
+INSERT INTO word_type_synsets VALUES(102,'carry.v.15');
+INSERT INTO word_type_synsets VALUES(102,'run.v.21');
+INSERT INTO word_type_synsets VALUES(102,'guide.v.05');
+INSERT INTO word_type_synsets VALUES(102,'run.v.23');
+INSERT INTO word_type_synsets VALUES(102,'run.v.24');
+INSERT INTO word_type_synsets VALUES(102,'run.v.25');
+INSERT INTO word_type_synsets VALUES(102,'run.v.26');
+INSERT INTO word_type_synsets VALUES(102,'run.v.27');
+INSERT INTO word_type_synsets VALUES(102,'run.v.28');
+INSERT INTO word_type_synsets VALUES(102,'run.v.29');
+INSERT INTO word_type_synsets VALUES(102,'run.v.30');
+INSERT INTO word_type_synsets VALUES(102,'run.v.31');
+INSERT INTO word_type_synsets VALUES(102,'run.v.32');
+INSERT INTO word_type_synsets VALUES(102,'run.v.33');
+INSERT INTO word_type_synsets VALUES(102,'run.v.34');
+INSERT INTO word_type_synsets VALUES(102,'ply.v.03');
+INSERT INTO word_type_synsets VALUES(102,'hunt.v.01');
+INSERT INTO word_type_synsets VALUES(102,'race.v.02');
+INSERT INTO word_type_synsets VALUES(102,'move.v.13');
+INSERT INTO word_type_synsets VALUES(102,'melt.v.01');
+INSERT INTO word_type_synsets VALUES(102,'ladder.v.01');
+INSERT INTO word_type_synsets VALUES(102,'run.v.41');
+INSERT INTO word_type_synsets VALUES(104,'ask.v.01');
+INSERT INTO word_type_synsets VALUES(104,'ask.v.02');
+INSERT INTO word_type_synsets VALUES(104,'ask.v.03');
+INSERT INTO word_type_synsets VALUES(104,'ask.v.04');
+INSERT INTO word_type_synsets VALUES(104,'ask.v.05');
+INSERT INTO word_type_synsets VALUES(104,'necessitate.v.01');
+INSERT INTO word_type_synsets VALUES(104,'ask.v.07');
+INSERT INTO word_type_synsets VALUES(107,'play.n.01');
+INSERT INTO word_type_synsets VALUES(107,'play.n.02');
+INSERT INTO word_type_synsets VALUES(107,'play.n.03');
+INSERT INTO word_type_synsets VALUES(107,'maneuver.n.03');
+INSERT INTO word_type_synsets VALUES(107,'play.n.05');
+INSERT INTO word_type_synsets VALUES(107,'play.n.06');
+INSERT INTO word_type_synsets VALUES(107,'bid.n.02');
+INSERT INTO word_type_synsets VALUES(107,'play.n.08');
+INSERT INTO word_type_synsets VALUES(107,'playing_period.n.01');
+INSERT INTO word_type_synsets VALUES(107,'free_rein.n.01');
+INSERT INTO word_type_synsets VALUES(107,'shimmer.n.01');
+INSERT INTO word_type_synsets VALUES(107,'fun.n.02');
+INSERT INTO word_type_synsets VALUES(107,'looseness.n.05');
+INSERT INTO word_type_synsets VALUES(107,'play.n.14');
+INSERT INTO word_type_synsets VALUES(107,'turn.n.03');
+INSERT INTO word_type_synsets VALUES(107,'gambling.n.01');
+INSERT INTO word_type_synsets VALUES(107,'play.n.17');
+INSERT INTO word_type_synsets VALUES(107,'play.v.01');
+INSERT INTO word_type_synsets VALUES(107,'play.v.02');
+INSERT INTO word_type_synsets VALUES(107,'play.v.03');
+INSERT INTO word_type_synsets VALUES(107,'act.v.03');
+INSERT INTO word_type_synsets VALUES(107,'play.v.05');
+INSERT INTO word_type_synsets VALUES(107,'play.v.06');
+INSERT INTO word_type_synsets VALUES(107,'play.v.07');
+INSERT INTO word_type_synsets VALUES(107,'act.v.05');
+INSERT INTO word_type_synsets VALUES(107,'play.v.09');
+INSERT INTO word_type_synsets VALUES(107,'play.v.10');
+INSERT INTO word_type_synsets VALUES(107,'play.v.11');
+INSERT INTO word_type_synsets VALUES(107,'play.v.12');
+INSERT INTO word_type_synsets VALUES(107,'play.v.13');
+INSERT INTO word_type_synsets VALUES(107,'play.v.14');
+INSERT INTO word_type_synsets VALUES(107,'play.v.15');
+INSERT INTO word_type_synsets VALUES(107,'play.v.16');
+INSERT INTO word_type_synsets VALUES(107,'play.v.17');
+INSERT INTO word_type_synsets VALUES(107,'play.v.18');
+INSERT INTO word_type_synsets VALUES(107,'toy.v.02');
+INSERT INTO word_type_synsets VALUES(107,'play.v.20');
+INSERT INTO word_type_synsets VALUES(107,'dally.v.04');
+INSERT INTO word_type_synsets VALUES(107,'play.v.22');
+INSERT INTO word_type_synsets VALUES(107,'dally.v.01');
+INSERT INTO word_type_synsets VALUES(107,'play.v.24');
+INSERT INTO word_type_synsets VALUES(107,'act.v.10');
+INSERT INTO word_type_synsets VALUES(107,'play.v.26');
+INSERT INTO word_type_synsets VALUES(107,'bring.v.03');
+INSERT INTO word_type_synsets VALUES(107,'play.v.28');
+INSERT INTO word_type_synsets VALUES(107,'play.v.29');
+INSERT INTO word_type_synsets VALUES(107,'bet.v.02');
+INSERT INTO word_type_synsets VALUES(107,'play.v.31');
+INSERT INTO word_type_synsets VALUES(107,'play.v.32');
+INSERT INTO word_type_synsets VALUES(107,'play.v.33');
+INSERT INTO word_type_synsets VALUES(107,'meet.v.10');
+INSERT INTO word_type_synsets VALUES(107,'play.v.35');
+INSERT INTO word_type_synsets VALUES(108,'excessively.r.01');
+INSERT INTO word_type_synsets VALUES(108,'besides.r.02');
+INSERT INTO word_type_synsets VALUES(110,'state.v.01');
+INSERT INTO word_type_synsets VALUES(110,'allege.v.01');
+INSERT INTO word_type_synsets VALUES(110,'suppose.v.01');
+INSERT INTO word_type_synsets VALUES(110,'read.v.02');
+INSERT INTO word_type_synsets VALUES(110,'order.v.01');
+INSERT INTO word_type_synsets VALUES(110,'pronounce.v.01');
+INSERT INTO word_type_synsets VALUES(110,'say.v.07');
+INSERT INTO word_type_synsets VALUES(110,'say.v.08');
+INSERT INTO word_type_synsets VALUES(110,'say.v.09');
+INSERT INTO word_type_synsets VALUES(110,'say.v.10');
+INSERT INTO word_type_synsets VALUES(110,'say.v.11');
+INSERT INTO word_type_synsets VALUES(110,'aforesaid.s.01');
+INSERT INTO word_type_synsets VALUES(111,'no.n.01');
+INSERT INTO word_type_synsets VALUES(111,'nobelium.n.01');
+INSERT INTO word_type_synsets VALUES(111,'no.a.01');
+INSERT INTO word_type_synsets VALUES(111,'no.r.01');
+INSERT INTO word_type_synsets VALUES(111,'no.r.02');
+INSERT INTO word_type_synsets VALUES(111,'no.r.03');
+INSERT INTO word_type_synsets VALUES(112,'rather.r.01');
+INSERT INTO word_type_synsets VALUES(112,'rather.r.02');
+INSERT INTO word_type_synsets VALUES(112,'preferably.r.01');
+INSERT INTO word_type_synsets VALUES(112,'quite.r.01');
+INSERT INTO word_type_synsets VALUES(115,'temper.n.02');
+INSERT INTO word_type_synsets VALUES(115,'climate.n.02');
+INSERT INTO word_type_synsets VALUES(115,'mood.n.03');
+INSERT INTO word_type_synsets VALUES(116,'tom.n.01');
+INSERT INTO word_type_synsets VALUES(116,'tom.n.02');
+INSERT INTO word_type_synsets VALUES(116,'turkey_cock.n.01');
+INSERT INTO word_type_synsets VALUES(118,'travel.v.01');
+INSERT INTO word_type_synsets VALUES(118,'go.v.02');
+INSERT INTO word_type_synsets VALUES(118,'go.v.03');
+INSERT INTO word_type_synsets VALUES(118,'become.v.01');
+INSERT INTO word_type_synsets VALUES(118,'go.v.05');
+INSERT INTO word_type_synsets VALUES(118,'run.v.05');
+INSERT INTO word_type_synsets VALUES(118,'run.v.03');
+INSERT INTO word_type_synsets VALUES(118,'proceed.v.04');
+INSERT INTO word_type_synsets VALUES(118,'go.v.09');
+INSERT INTO word_type_synsets VALUES(118,'go.v.10');
+INSERT INTO word_type_synsets VALUES(118,'sound.v.02');
+INSERT INTO word_type_synsets VALUES(118,'function.v.01');
+INSERT INTO word_type_synsets VALUES(118,'run_low.v.01');
+INSERT INTO word_type_synsets VALUES(118,'move.v.13');
+INSERT INTO word_type_synsets VALUES(118,'survive.v.01');
+INSERT INTO word_type_synsets VALUES(118,'go.v.16');
+INSERT INTO word_type_synsets VALUES(118,'die.v.01');
+INSERT INTO word_type_synsets VALUES(118,'belong.v.03');
+INSERT INTO word_type_synsets VALUES(118,'go.v.19');
+INSERT INTO word_type_synsets VALUES(118,'start.v.09');
+INSERT INTO word_type_synsets VALUES(118,'move.v.15');
+INSERT INTO word_type_synsets VALUES(118,'go.v.22');
+INSERT INTO word_type_synsets VALUES(118,'go.v.23');
+INSERT INTO word_type_synsets VALUES(118,'blend.v.02');
+INSERT INTO word_type_synsets VALUES(118,'go.v.25');
+INSERT INTO word_type_synsets VALUES(118,'fit.v.02');
+INSERT INTO word_type_synsets VALUES(118,'rifle.v.02');
+INSERT INTO word_type_synsets VALUES(118,'go.v.28');
+INSERT INTO word_type_synsets VALUES(118,'plump.v.04');
+INSERT INTO word_type_synsets VALUES(118,'fail.v.04');
+INSERT INTO word_type_synsets VALUES(119,'park.n.01');
+INSERT INTO word_type_synsets VALUES(119,'park.n.02');
+INSERT INTO word_type_synsets VALUES(119,'ballpark.n.01');
+INSERT INTO word_type_synsets VALUES(119,'park.n.04');
+INSERT INTO word_type_synsets VALUES(119,'parking_lot.n.01');
+INSERT INTO word_type_synsets VALUES(119,'park.n.06');
+INSERT INTO word_type_synsets VALUES(119,'park.v.01');
+INSERT INTO word_type_synsets VALUES(119,'park.v.02');
+INSERT INTO word_type_synsets VALUES(120,'proverb.n.01');
+INSERT INTO word_type_synsets VALUES(120,'saw.n.02');
+INSERT INTO word_type_synsets VALUES(120,'power_saw.n.01');
+INSERT INTO word_type_synsets VALUES(120,'saw.v.01');
+INSERT INTO word_type_synsets VALUES(120,'see.v.01');
+INSERT INTO word_type_synsets VALUES(120,'understand.v.02');
+INSERT INTO word_type_synsets VALUES(120,'witness.v.02');
+INSERT INTO word_type_synsets VALUES(120,'visualize.v.01');
+INSERT INTO word_type_synsets VALUES(120,'see.v.05');
+INSERT INTO word_type_synsets VALUES(120,'learn.v.02');
+INSERT INTO word_type_synsets VALUES(120,'watch.v.03');
+INSERT INTO word_type_synsets VALUES(120,'meet.v.01');
+INSERT INTO word_type_synsets VALUES(120,'determine.v.08');
+INSERT INTO word_type_synsets VALUES(120,'see.v.10');
+INSERT INTO word_type_synsets VALUES(120,'see.v.11');
+INSERT INTO word_type_synsets VALUES(120,'see.v.12');
+INSERT INTO word_type_synsets VALUES(120,'visit.v.01');
+INSERT INTO word_type_synsets VALUES(120,'attend.v.02');
+INSERT INTO word_type_synsets VALUES(120,'see.v.15');
+INSERT INTO word_type_synsets VALUES(120,'go_steady.v.01');
+INSERT INTO word_type_synsets VALUES(120,'see.v.17');
+INSERT INTO word_type_synsets VALUES(120,'see.v.18');
+INSERT INTO word_type_synsets VALUES(120,'see.v.19');
+INSERT INTO word_type_synsets VALUES(120,'examine.v.02');
+INSERT INTO word_type_synsets VALUES(120,'experience.v.01');
+INSERT INTO word_type_synsets VALUES(120,'see.v.22');
+INSERT INTO word_type_synsets VALUES(120,'see.v.23');
+INSERT INTO word_type_synsets VALUES(120,'interpret.v.01');
+INSERT INTO word_type_synsets VALUES(121,'large.a.01');
+INSERT INTO word_type_synsets VALUES(121,'big.s.02');
+INSERT INTO word_type_synsets VALUES(121,'bad.s.02');
+INSERT INTO word_type_synsets VALUES(121,'big.s.04');
+INSERT INTO word_type_synsets VALUES(121,'big.s.05');
+INSERT INTO word_type_synsets VALUES(121,'big.s.06');
+INSERT INTO word_type_synsets VALUES(121,'boastful.s.01');
+INSERT INTO word_type_synsets VALUES(121,'big.s.08');
+INSERT INTO word_type_synsets VALUES(121,'adult.s.01');
+INSERT INTO word_type_synsets VALUES(121,'big.s.10');
+INSERT INTO word_type_synsets VALUES(121,'big.s.11');
+INSERT INTO word_type_synsets VALUES(121,'big.s.12');
+INSERT INTO word_type_synsets VALUES(121,'big.s.13');
+INSERT INTO word_type_synsets VALUES(121,'big.r.01');
+INSERT INTO word_type_synsets VALUES(121,'boastfully.r.01');
+INSERT INTO word_type_synsets VALUES(121,'big.r.03');
+INSERT INTO word_type_synsets VALUES(121,'big.r.04');
+INSERT INTO word_type_synsets VALUES(122,'red.n.01');
+INSERT INTO word_type_synsets VALUES(122,'red.n.02');
+INSERT INTO word_type_synsets VALUES(122,'bolshevik.n.01');
+INSERT INTO word_type_synsets VALUES(122,'loss.n.06');
+INSERT INTO word_type_synsets VALUES(122,'red.s.01');
+INSERT INTO word_type_synsets VALUES(122,'crimson.s.02');
+INSERT INTO word_type_synsets VALUES(122,'crimson.s.03');
+INSERT INTO word_type_synsets VALUES(123,'ball.n.01');
+INSERT INTO word_type_synsets VALUES(123,'musket_ball.n.01');
+INSERT INTO word_type_synsets VALUES(123,'ball.n.03');
+INSERT INTO word_type_synsets VALUES(123,'ball.n.04');
+INSERT INTO word_type_synsets VALUES(123,'testis.n.01');
+INSERT INTO word_type_synsets VALUES(123,'ball.n.06');
+INSERT INTO word_type_synsets VALUES(123,'ball.n.07');
+INSERT INTO word_type_synsets VALUES(123,'ball.n.08');
+INSERT INTO word_type_synsets VALUES(123,'ball.n.09');
+INSERT INTO word_type_synsets VALUES(123,'ball.n.10');
+INSERT INTO word_type_synsets VALUES(123,'ball.n.11');
+INSERT INTO word_type_synsets VALUES(123,'ball.n.12');
+INSERT INTO word_type_synsets VALUES(123,'ball.v.01');
+INSERT INTO word_type_synsets VALUES(124,'tree.n.01');
+INSERT INTO word_type_synsets VALUES(124,'tree.n.02');
+INSERT INTO word_type_synsets VALUES(124,'tree.n.03');
+INSERT INTO word_type_synsets VALUES(124,'corner.v.02');
+INSERT INTO word_type_synsets VALUES(124,'tree.v.02');
+INSERT INTO word_type_synsets VALUES(124,'tree.v.03');
+INSERT INTO word_type_synsets VALUES(124,'tree.v.04');
+INSERT INTO word_type_synsets VALUES(126,'can.n.01');
+INSERT INTO word_type_synsets VALUES(126,'can.n.02');
+INSERT INTO word_type_synsets VALUES(126,'can.n.03');
+INSERT INTO word_type_synsets VALUES(126,'buttocks.n.01');
+INSERT INTO word_type_synsets VALUES(126,'toilet.n.02');
+INSERT INTO word_type_synsets VALUES(126,'toilet.n.01');
+INSERT INTO word_type_synsets VALUES(126,'can.v.01');
+INSERT INTO word_type_synsets VALUES(126,'displace.v.03');
+INSERT INTO word_type_synsets VALUES(127,'iodine.n.01');
+INSERT INTO word_type_synsets VALUES(127,'one.n.01');
+INSERT INTO word_type_synsets VALUES(127,'i.n.03');
+INSERT INTO word_type_synsets VALUES(127,'one.s.01');
+INSERT INTO word_type_synsets VALUES(132,'smile.v.01');
+INSERT INTO word_type_synsets VALUES(132,'smile.v.02');
+INSERT INTO word_type_synsets VALUES(134,'beryllium.n.01');
+INSERT INTO word_type_synsets VALUES(134,'be.v.01');
+INSERT INTO word_type_synsets VALUES(134,'be.v.02');
+INSERT INTO word_type_synsets VALUES(134,'be.v.03');
+INSERT INTO word_type_synsets VALUES(134,'exist.v.01');
+INSERT INTO word_type_synsets VALUES(134,'be.v.05');
+INSERT INTO word_type_synsets VALUES(134,'equal.v.01');
+INSERT INTO word_type_synsets VALUES(134,'constitute.v.01');
+INSERT INTO word_type_synsets VALUES(134,'be.v.08');
+INSERT INTO word_type_synsets VALUES(134,'embody.v.02');
+INSERT INTO word_type_synsets VALUES(134,'be.v.10');
+INSERT INTO word_type_synsets VALUES(134,'be.v.11');
+INSERT INTO word_type_synsets VALUES(134,'be.v.12');
+INSERT INTO word_type_synsets VALUES(134,'cost.v.01');
+INSERT INTO word_type_synsets VALUES(135,'careful.a.01');
+INSERT INTO word_type_synsets VALUES(135,'careful.s.02');
+INSERT INTO word_type_synsets VALUES(135,'careful.s.03');
+INSERT INTO word_type_synsets VALUES(135,'careful.s.04');
+INSERT INTO word_type_synsets VALUES(135,'careful.s.05');
+INSERT INTO word_type_synsets VALUES(136,'kick.v.01');
+INSERT INTO word_type_synsets VALUES(136,'kick.v.02');
+INSERT INTO word_type_synsets VALUES(136,'kick.v.03');
+INSERT INTO word_type_synsets VALUES(136,'kick.v.04');
+INSERT INTO word_type_synsets VALUES(136,'kick_back.v.02');
+INSERT INTO word_type_synsets VALUES(136,'kick.v.06');
+INSERT INTO word_type_synsets VALUES(136,'kick.v.07');
+INSERT INTO word_type_synsets VALUES(136,'complain.v.01');
+INSERT INTO word_type_synsets VALUES(137,'high.n.01');
+INSERT INTO word_type_synsets VALUES(137,'high.n.02');
+INSERT INTO word_type_synsets VALUES(137,'high.n.03');
+INSERT INTO word_type_synsets VALUES(137,'high.n.04');
+INSERT INTO word_type_synsets VALUES(137,'high.n.05');
+INSERT INTO word_type_synsets VALUES(137,'senior_high_school.n.01');
+INSERT INTO word_type_synsets VALUES(137,'high_gear.n.01');
+INSERT INTO word_type_synsets VALUES(137,'high.a.01');
+INSERT INTO word_type_synsets VALUES(137,'high.a.02');
+INSERT INTO word_type_synsets VALUES(137,'eminent.s.01');
+INSERT INTO word_type_synsets VALUES(137,'high.a.04');
+INSERT INTO word_type_synsets VALUES(137,'high.s.05');
+INSERT INTO word_type_synsets VALUES(137,'gamey.s.02');
+INSERT INTO word_type_synsets VALUES(137,'high.s.07');
+INSERT INTO word_type_synsets VALUES(137,'high.r.01');
+INSERT INTO word_type_synsets VALUES(137,'high.r.02');
+INSERT INTO word_type_synsets VALUES(137,'high.r.03');
+INSERT INTO word_type_synsets VALUES(137,'high.r.04');
+INSERT INTO word_type_synsets VALUES(138,'expression.n.01');
+INSERT INTO word_type_synsets VALUES(138,'look.n.02');
+INSERT INTO word_type_synsets VALUES(138,'look.n.03');
+INSERT INTO word_type_synsets VALUES(138,'spirit.n.02');
+INSERT INTO word_type_synsets VALUES(138,'look.v.01');
+INSERT INTO word_type_synsets VALUES(138,'look.v.02');
+INSERT INTO word_type_synsets VALUES(138,'look.v.03');
+INSERT INTO word_type_synsets VALUES(138,'search.v.02');
+INSERT INTO word_type_synsets VALUES(138,'front.v.01');
+INSERT INTO word_type_synsets VALUES(138,'attend.v.02');
+INSERT INTO word_type_synsets VALUES(138,'look.v.07');
+INSERT INTO word_type_synsets VALUES(138,'expect.v.03');
+INSERT INTO word_type_synsets VALUES(138,'look.v.09');
+INSERT INTO word_type_synsets VALUES(138,'count.v.08');
+INSERT INTO word_type_synsets VALUES(142,'flight.n.02');
+INSERT INTO word_type_synsets VALUES(142,'fly.v.01');
+INSERT INTO word_type_synsets VALUES(142,'fly.v.02');
+INSERT INTO word_type_synsets VALUES(142,'fly.v.03');
+INSERT INTO word_type_synsets VALUES(142,'fly.v.04');
+INSERT INTO word_type_synsets VALUES(142,'fly.v.05');
+INSERT INTO word_type_synsets VALUES(142,'fly.v.06');
+INSERT INTO word_type_synsets VALUES(142,'fly.v.07');
+INSERT INTO word_type_synsets VALUES(142,'fly.v.08');
+INSERT INTO word_type_synsets VALUES(142,'fly.v.09');
+INSERT INTO word_type_synsets VALUES(142,'fly.v.10');
+INSERT INTO word_type_synsets VALUES(142,'flee.v.01');
+INSERT INTO word_type_synsets VALUES(142,'fly.v.12');
+INSERT INTO word_type_synsets VALUES(142,'fly.v.13');
+INSERT INTO word_type_synsets VALUES(142,'vanish.v.05');
+INSERT INTO word_type_synsets VALUES(142,'fast-flying.s.01');
+INSERT INTO word_type_synsets VALUES(142,'flying.s.02');
+INSERT INTO word_type_synsets VALUES(143,'helium.n.01');
+INSERT INTO word_type_synsets VALUES(143,'he.n.02');
+INSERT INTO word_type_synsets VALUES(144,'then.n.01');
+INSERT INTO word_type_synsets VALUES(144,'then.s.01');
+INSERT INTO word_type_synsets VALUES(144,'then.r.01');
+INSERT INTO word_type_synsets VALUES(144,'then.r.02');
+INSERT INTO word_type_synsets VALUES(144,'then.r.03');
+INSERT INTO word_type_synsets VALUES(145,'land.v.01');
+INSERT INTO word_type_synsets VALUES(145,'land.v.02');
+INSERT INTO word_type_synsets VALUES(145,'bring.v.05');
+INSERT INTO word_type_synsets VALUES(145,'land.v.04');
+INSERT INTO word_type_synsets VALUES(145,'land.v.05');
+INSERT INTO word_type_synsets VALUES(145,'land.v.06');
+INSERT INTO word_type_synsets VALUES(145,'down.v.04');
+INSERT INTO word_type_synsets VALUES(145,'landed.a.01');
+INSERT INTO word_type_synsets VALUES(147,'sad.a.01');
+INSERT INTO word_type_synsets VALUES(147,'sad.s.02');
+INSERT INTO word_type_synsets VALUES(147,'deplorable.s.01');
+INSERT INTO word_type_synsets VALUES(148,'calcium.n.01');
+INSERT INTO word_type_synsets VALUES(148,'california.n.01');
+INSERT INTO word_type_synsets VALUES(150,'get.n.01');
+INSERT INTO word_type_synsets VALUES(150,'get.v.01');
+INSERT INTO word_type_synsets VALUES(150,'become.v.01');
+INSERT INTO word_type_synsets VALUES(150,'get.v.03');
+INSERT INTO word_type_synsets VALUES(150,'receive.v.02');
+INSERT INTO word_type_synsets VALUES(150,'arrive.v.01');
+INSERT INTO word_type_synsets VALUES(150,'bring.v.04');
+INSERT INTO word_type_synsets VALUES(150,'experience.v.03');
+INSERT INTO word_type_synsets VALUES(150,'pay_back.v.02');
+INSERT INTO word_type_synsets VALUES(150,'have.v.17');
+INSERT INTO word_type_synsets VALUES(150,'induce.v.02');
+INSERT INTO word_type_synsets VALUES(150,'get.v.11');
+INSERT INTO word_type_synsets VALUES(150,'grow.v.08');
+INSERT INTO word_type_synsets VALUES(150,'contract.v.04');
+INSERT INTO word_type_synsets VALUES(150,'get.v.14');
+INSERT INTO word_type_synsets VALUES(150,'make.v.02');
+INSERT INTO word_type_synsets VALUES(150,'drive.v.11');
+INSERT INTO word_type_synsets VALUES(150,'catch.v.18');
+INSERT INTO word_type_synsets VALUES(150,'catch.v.07');
+INSERT INTO word_type_synsets VALUES(150,'get.v.19');
+INSERT INTO word_type_synsets VALUES(150,'get.v.20');
+INSERT INTO word_type_synsets VALUES(150,'get.v.21');
+INSERT INTO word_type_synsets VALUES(150,'get.v.22');
+INSERT INTO word_type_synsets VALUES(150,'catch.v.21');
+INSERT INTO word_type_synsets VALUES(150,'catch.v.22');
+INSERT INTO word_type_synsets VALUES(150,'get.v.25');
+INSERT INTO word_type_synsets VALUES(150,'scram.v.01');
+INSERT INTO word_type_synsets VALUES(150,'get.v.27');
+INSERT INTO word_type_synsets VALUES(150,'get.v.28');
+INSERT INTO word_type_synsets VALUES(150,'get.v.29');
+INSERT INTO word_type_synsets VALUES(150,'catch.v.24');
+INSERT INTO word_type_synsets VALUES(150,'draw.v.15');
+INSERT INTO word_type_synsets VALUES(150,'get.v.32');
+INSERT INTO word_type_synsets VALUES(150,'perplex.v.01');
+INSERT INTO word_type_synsets VALUES(150,'get_down.v.07');
+INSERT INTO word_type_synsets VALUES(150,'suffer.v.02');
+INSERT INTO word_type_synsets VALUES(150,'beget.v.01');
+INSERT INTO word_type_synsets VALUES(151,'angstrom.n.01');
+INSERT INTO word_type_synsets VALUES(151,'vitamin_a.n.01');
+INSERT INTO word_type_synsets VALUES(151,'deoxyadenosine_monophosphate.n.01');
+INSERT INTO word_type_synsets VALUES(151,'adenine.n.01');
+INSERT INTO word_type_synsets VALUES(151,'ampere.n.02');
+INSERT INTO word_type_synsets VALUES(151,'a.n.06');
+INSERT INTO word_type_synsets VALUES(151,'a.n.07');
+INSERT INTO word_type_synsets VALUES(152,'kind.n.01');
+INSERT INTO word_type_synsets VALUES(152,'kind.a.01');
+INSERT INTO word_type_synsets VALUES(152,'kind.s.02');
+INSERT INTO word_type_synsets VALUES(152,'kind.s.03');
+INSERT INTO word_type_synsets VALUES(153,'man.n.01');
+INSERT INTO word_type_synsets VALUES(153,'serviceman.n.01');
+INSERT INTO word_type_synsets VALUES(153,'man.n.03');
+INSERT INTO word_type_synsets VALUES(153,'homo.n.02');
+INSERT INTO word_type_synsets VALUES(153,'man.n.05');
+INSERT INTO word_type_synsets VALUES(153,'man.n.06');
+INSERT INTO word_type_synsets VALUES(153,'valet.n.01');
+INSERT INTO word_type_synsets VALUES(153,'man.n.08');
+INSERT INTO word_type_synsets VALUES(153,'man.n.09');
+INSERT INTO word_type_synsets VALUES(153,'man.n.10');
+INSERT INTO word_type_synsets VALUES(153,'world.n.08');
+INSERT INTO word_type_synsets VALUES(153,'man.v.01');
+INSERT INTO word_type_synsets VALUES(153,'man.v.02');
+INSERT INTO word_type_synsets VALUES(154,'volition.n.01');
+INSERT INTO word_type_synsets VALUES(154,'will.n.02');
+INSERT INTO word_type_synsets VALUES(154,'will.n.03');
+INSERT INTO word_type_synsets VALUES(154,'will.v.01');
+INSERT INTO word_type_synsets VALUES(154,'will.v.02');
+INSERT INTO word_type_synsets VALUES(154,'bequeath.v.01');
+INSERT INTO word_type_synsets VALUES(155,'aid.n.02');
+INSERT INTO word_type_synsets VALUES(155,'assistant.n.01');
+INSERT INTO word_type_synsets VALUES(155,'aid.n.01');
+INSERT INTO word_type_synsets VALUES(155,'avail.n.01');
+INSERT INTO word_type_synsets VALUES(155,'help.v.01');
+INSERT INTO word_type_synsets VALUES(155,'help.v.02');
+INSERT INTO word_type_synsets VALUES(155,'help.v.03');
+INSERT INTO word_type_synsets VALUES(155,'help_oneself.v.01');
+INSERT INTO word_type_synsets VALUES(155,'serve.v.05');
+INSERT INTO word_type_synsets VALUES(155,'help.v.06');
+INSERT INTO word_type_synsets VALUES(155,'avail.v.03');
+INSERT INTO word_type_synsets VALUES(155,'help.v.08');
+INSERT INTO word_type_synsets VALUES(157,'helium.n.01');
+INSERT INTO word_type_synsets VALUES(157,'he.n.02');
+INSERT INTO word_type_synsets VALUES(158,'get.v.01');
+INSERT INTO word_type_synsets VALUES(158,'become.v.01');
+INSERT INTO word_type_synsets VALUES(158,'get.v.03');
+INSERT INTO word_type_synsets VALUES(158,'receive.v.02');
+INSERT INTO word_type_synsets VALUES(158,'arrive.v.01');
+INSERT INTO word_type_synsets VALUES(158,'bring.v.04');
+INSERT INTO word_type_synsets VALUES(158,'experience.v.03');
+INSERT INTO word_type_synsets VALUES(158,'pay_back.v.02');
+INSERT INTO word_type_synsets VALUES(158,'have.v.17');
+INSERT INTO word_type_synsets VALUES(158,'induce.v.02');
+INSERT INTO word_type_synsets VALUES(158,'get.v.11');
+INSERT INTO word_type_synsets VALUES(158,'grow.v.08');
+INSERT INTO word_type_synsets VALUES(158,'contract.v.04');
+INSERT INTO word_type_synsets VALUES(158,'get.v.14');
+INSERT INTO word_type_synsets VALUES(158,'make.v.02');
+INSERT INTO word_type_synsets VALUES(158,'drive.v.11');
+INSERT INTO word_type_synsets VALUES(158,'catch.v.18');
+INSERT INTO word_type_synsets VALUES(158,'catch.v.07');
+INSERT INTO word_type_synsets VALUES(158,'get.v.19');
+INSERT INTO word_type_synsets VALUES(158,'get.v.20');
+INSERT INTO word_type_synsets VALUES(158,'get.v.21');
+INSERT INTO word_type_synsets VALUES(158,'get.v.22');
+INSERT INTO word_type_synsets VALUES(158,'catch.v.21');
+INSERT INTO word_type_synsets VALUES(158,'catch.v.22');
+INSERT INTO word_type_synsets VALUES(158,'get.v.25');
+INSERT INTO word_type_synsets VALUES(158,'scram.v.01');
+INSERT INTO word_type_synsets VALUES(158,'get.v.27');
+INSERT INTO word_type_synsets VALUES(158,'get.v.28');
+INSERT INTO word_type_synsets VALUES(158,'get.v.29');
+INSERT INTO word_type_synsets VALUES(158,'catch.v.24');
+INSERT INTO word_type_synsets VALUES(158,'draw.v.15');
+INSERT INTO word_type_synsets VALUES(158,'get.v.32');
+INSERT INTO word_type_synsets VALUES(158,'perplex.v.01');
+INSERT INTO word_type_synsets VALUES(158,'get_down.v.07');
+INSERT INTO word_type_synsets VALUES(158,'suffer.v.02');
+INSERT INTO word_type_synsets VALUES(158,'beget.v.01');
+INSERT INTO word_type_synsets VALUES(159,'out.n.01');
+INSERT INTO word_type_synsets VALUES(159,'come_out_of_the_closet.v.01');
+INSERT INTO word_type_synsets VALUES(159,'out.v.02');
+INSERT INTO word_type_synsets VALUES(159,'out.v.03');
+INSERT INTO word_type_synsets VALUES(159,'out.a.01');
+INSERT INTO word_type_synsets VALUES(159,'extinct.s.03');
+INSERT INTO word_type_synsets VALUES(159,'out.s.03');
+INSERT INTO word_type_synsets VALUES(159,'out.s.04');
+INSERT INTO word_type_synsets VALUES(159,'forbidden.s.01');
+INSERT INTO word_type_synsets VALUES(159,'out.s.06');
+INSERT INTO word_type_synsets VALUES(159,'out.s.07');
+INSERT INTO word_type_synsets VALUES(159,'out.s.08');
+INSERT INTO word_type_synsets VALUES(159,'out.s.09');
+INSERT INTO word_type_synsets VALUES(159,'knocked_out.s.01');
+INSERT INTO word_type_synsets VALUES(159,'out.r.01');
+INSERT INTO word_type_synsets VALUES(159,'out.r.02');
+INSERT INTO word_type_synsets VALUES(159,'away.r.02');
+INSERT INTO word_type_synsets VALUES(160,'water.n.01');
+INSERT INTO word_type_synsets VALUES(160,'body_of_water.n.01');
+INSERT INTO word_type_synsets VALUES(160,'water.n.03');
+INSERT INTO word_type_synsets VALUES(160,'water_system.n.02');
+INSERT INTO word_type_synsets VALUES(160,'urine.n.01');
+INSERT INTO word_type_synsets VALUES(160,'water.n.06');
+INSERT INTO word_type_synsets VALUES(160,'water.v.01');
+INSERT INTO word_type_synsets VALUES(160,'water.v.02');
+INSERT INTO word_type_synsets VALUES(160,'water.v.03');
+INSERT INTO word_type_synsets VALUES(160,'water.v.04');
 CREATE TABLE synsets (
         id TEXT PRIMARY KEY,
         description TEXT,
@@ -2376,11 +2670,268 @@ INSERT INTO synsets VALUES('quite.r.01','to a degree (not used with a negative)'
 INSERT INTO synsets VALUES('temper.n.02','a characteristic (habitual or relatively temporary) state of feeling','whether he praised or cursed me depended on his temper at the time; he was in a bad humor');
 INSERT INTO synsets VALUES('climate.n.02','the prevailing psychological state','the climate of opinion; the national mood had changed radically since the last election');
 INSERT INTO synsets VALUES('mood.n.03','verb inflections that express how the action or state is conceived by the speaker','');
+INSERT INTO synsets VALUES('tom.n.01','(ethnic slur) offensive and derogatory name for a Black man who is abjectly servile and deferential to Whites','');
+INSERT INTO synsets VALUES('tom.n.02','male cat','');
+INSERT INTO synsets VALUES('turkey_cock.n.01','male turkey','');
+INSERT INTO synsets VALUES('park.n.01','a large area of land preserved in its natural state as public property','there are laws that protect the wildlife in this park');
+INSERT INTO synsets VALUES('park.n.02','a piece of open land for recreational use in an urban area','they went for a walk in the park');
+INSERT INTO synsets VALUES('ballpark.n.01','a facility in which ball games are played (especially baseball games)','take me out to the ballpark');
+INSERT INTO synsets VALUES('park.n.04','Scottish explorer in Africa (1771-1806)','');
+INSERT INTO synsets VALUES('parking_lot.n.01','a lot where cars are parked','');
+INSERT INTO synsets VALUES('park.n.06','a gear position that acts as a parking brake','the put the car in park and got out');
+INSERT INTO synsets VALUES('park.v.01','place temporarily','park the car in the yard; park the children with the in-laws; park your bag in this locker');
+INSERT INTO synsets VALUES('park.v.02','maneuver a vehicle into a parking space','Park the car in front of the library; Can you park right here?');
+INSERT INTO synsets VALUES('proverb.n.01','a condensed but memorable saying embodying some important fact of experience that is taken as true by many people','');
+INSERT INTO synsets VALUES('saw.n.02','hand tool having a toothed blade for cutting','');
+INSERT INTO synsets VALUES('power_saw.n.01','a power tool for cutting wood','');
+INSERT INTO synsets VALUES('saw.v.01','cut with a saw','saw wood for the fireplace');
+INSERT INTO synsets VALUES('see.v.01','perceive by sight or have the power to perceive by sight','You have to be a good observer to see all the details; Can you see the bird in that tree?; He is blind--he cannot see');
+INSERT INTO synsets VALUES('understand.v.02','perceive (an idea or situation) mentally','Now I see!; I just can''t see your point; Does she realize how important this decision is?; I don''t understand the idea');
+INSERT INTO synsets VALUES('visualize.v.01','imagine; conceive of; see in one''s mind','I can''t see him on horseback!; I can see what will happen; I can see a risk in this strategy');
+INSERT INTO synsets VALUES('see.v.05','deem to be','She views this quite differently from me; I consider her to be shallow; I don''t see the situation quite as negatively as you do');
+INSERT INTO synsets VALUES('watch.v.03','see or watch','view a show on television; This program will be seen all over the world; view an exhibition; Catch a show on Broadway; see a movie');
+INSERT INTO synsets VALUES('meet.v.01','come together','I''ll probably see you at the meeting; How nice to see you again!');
+INSERT INTO synsets VALUES('determine.v.08','find out, learn, or determine with certainty, usually by making an inquiry or other effort','I want to see whether she speaks French; See whether it works; find out if he speaks Russian; Check whether the train leaves on time');
+INSERT INTO synsets VALUES('see.v.10','be careful or certain to do something; make certain of something','He verified that the valves were closed; See that the curtains are closed; control the quality of the product');
+INSERT INTO synsets VALUES('see.v.11','go to see for professional or business reasons','You should see a lawyer; We had to see a psychiatrist');
+INSERT INTO synsets VALUES('see.v.12','go to see for a social visit','I went to see my friend Mary the other day');
+INSERT INTO synsets VALUES('visit.v.01','go to see a place, as for entertainment','We went to see the Eiffel Tower in the morning');
+INSERT INTO synsets VALUES('see.v.15','receive as a specified guest','the doctor will see you now; The minister doesn''t see anybody before noon');
+INSERT INTO synsets VALUES('go_steady.v.01','date regularly; have a steady relationship with','Did you know that she is seeing an older man?; He is dating his former wife again!');
+INSERT INTO synsets VALUES('see.v.17','see and understand, have a good eye','The artist must first learn to see');
+INSERT INTO synsets VALUES('see.v.18','deliberate or decide','See whether you can come tomorrow; let''s see--which movie should we see tonight?');
+INSERT INTO synsets VALUES('see.v.19','observe as if with an eye','The camera saw the burglary and recorded it');
+INSERT INTO synsets VALUES('examine.v.02','observe, check out, and look over carefully or inspect','The customs agent examined the baggage; I must see your passport before you can enter the country');
+INSERT INTO synsets VALUES('experience.v.01','go or live through','We had many trials to go through; he saw action in Viet Nam');
+INSERT INTO synsets VALUES('see.v.22','accompany or escort','I''ll see you to the door');
+INSERT INTO synsets VALUES('see.v.23','match or meet','I saw the bet of one of my fellow players');
+INSERT INTO synsets VALUES('interpret.v.01','make sense of; assign a meaning to','What message do you see in this letter?; How do you interpret his behavior?');
+INSERT INTO synsets VALUES('large.a.01','above average in size or number or quantity or magnitude or extent','a large city; set out for the big city; a large sum; a big (or large) barn; a large family; big businesses; a big expenditure; a large number of newspapers; a big group of scientists; large areas of the world');
+INSERT INTO synsets VALUES('big.s.02','significant','graduation was a big day in his life');
+INSERT INTO synsets VALUES('bad.s.02','very intense','a bad headache; in a big rage; had a big (or bad) shock; a bad earthquake; a bad storm');
+INSERT INTO synsets VALUES('big.s.04','loud and firm','a big voice; big bold piano sounds');
+INSERT INTO synsets VALUES('big.s.05','conspicuous in position or importance','a big figure in the movement; big man on campus; he''s very large in financial circles; a prominent citizen');
+INSERT INTO synsets VALUES('big.s.06','prodigious','big spender; big eater; heavy investor');
+INSERT INTO synsets VALUES('boastful.s.01','exhibiting self-importance','big talk');
+INSERT INTO synsets VALUES('big.s.08','feeling self-importance','too big for his britches; had a swelled head; he was swelled with pride');
+INSERT INTO synsets VALUES('adult.s.01','(of animals) fully developed','an adult animal; a grown woman');
+INSERT INTO synsets VALUES('big.s.10','marked by intense physical force','a big wind');
+INSERT INTO synsets VALUES('big.s.11','generous and understanding and tolerant','a heart big enough to hold no grudges; that''s very big of you to be so forgiving; a large and generous spirit; a large heart; magnanimous toward his enemies');
+INSERT INTO synsets VALUES('big.s.12','given or giving freely','was a big tipper; the bounteous goodness of God; bountiful compliments; a freehanded host; a handsome allowance; Saturday''s child is loving and giving; a liberal backer of the arts; a munificent gift; her fond and openhanded grandfather');
+INSERT INTO synsets VALUES('big.s.13','in an advanced stage of pregnancy','was big with child; was great with child');
+INSERT INTO synsets VALUES('big.r.01','extremely well','his performance went over big');
+INSERT INTO synsets VALUES('boastfully.r.01','in a boastful manner','he talked big all evening');
+INSERT INTO synsets VALUES('big.r.03','on a grand scale','think big');
+INSERT INTO synsets VALUES('big.r.04','in a major way','the play failed big at the box office');
+INSERT INTO synsets VALUES('red.n.01','red color or pigment; the chromatic color resembling the hue of blood','');
+INSERT INTO synsets VALUES('red.n.02','a tributary of the Mississippi River that flows eastward from Texas along the southern boundary of Oklahoma and through Louisiana','');
+INSERT INTO synsets VALUES('bolshevik.n.01','emotionally charged terms used to refer to extreme radicals or revolutionaries','');
+INSERT INTO synsets VALUES('loss.n.06','the amount by which the cost of a business exceeds its revenue','the company operated at a loss last year; the company operated in the red last year');
+INSERT INTO synsets VALUES('red.s.01','of a color at the end of the color spectrum (next to orange); resembling the color of blood or cherries or tomatoes or rubies','');
+INSERT INTO synsets VALUES('crimson.s.02','characterized by violence or bloodshed; - Andrea Parke; - Thomas Gray; - Hudson Strode','writes of crimson deeds and barbaric days; fann''d by Conquest''s crimson wing; convulsed with red rage');
+INSERT INTO synsets VALUES('crimson.s.03','(especially of the face) reddened or suffused with or as if with blood from emotion or exertion','crimson with fury; turned red from exertion; with puffy reddened eyes; red-faced and violent; flushed (or crimson) with embarrassment');
+INSERT INTO synsets VALUES('ball.n.01','round object that is hit or thrown or kicked in games','the ball travelled 90 mph on his serve; the mayor threw out the first ball; the ball rolled into the corner pocket');
+INSERT INTO synsets VALUES('musket_ball.n.01','a solid projectile that is shot by a musket','they had to carry a ramrod as well as powder and ball');
+INSERT INTO synsets VALUES('ball.n.03','an object with a spherical shape','a ball of fire');
+INSERT INTO synsets VALUES('ball.n.04','the people assembled at a lavish formal dance','the ball was already emptying out before the fire alarm sounded');
+INSERT INTO synsets VALUES('testis.n.01','one of the two male reproductive glands that produce spermatozoa and secrete androgens','she kicked him in the balls and got away');
+INSERT INTO synsets VALUES('ball.n.06','a spherical object used as a plaything','he played with his rubber ball in the bathtub');
+INSERT INTO synsets VALUES('ball.n.07','United States comedienne best known as the star of a popular television program (1911-1989)','');
+INSERT INTO synsets VALUES('ball.n.08','a compact mass','a ball of mud caught him on the shoulder');
+INSERT INTO synsets VALUES('ball.n.09','a lavish dance requiring formal attire','');
+INSERT INTO synsets VALUES('ball.n.10','a more or less rounded anatomical body or mass','the ball at the base of the thumb; he stood on the balls of his feet');
+INSERT INTO synsets VALUES('ball.n.11','the game of baseball','');
+INSERT INTO synsets VALUES('ball.n.12','a pitch that is not in the strike zone','he threw nine straight balls before the manager yanked him');
+INSERT INTO synsets VALUES('ball.v.01','form into a ball by winding or rolling','ball wool');
+INSERT INTO synsets VALUES('can.n.01','airtight sealed metal container for food or drink or paint etc.','');
+INSERT INTO synsets VALUES('can.n.02','the quantity contained in a can','');
+INSERT INTO synsets VALUES('can.n.03','a buoy with a round bottom and conical top','');
+INSERT INTO synsets VALUES('buttocks.n.01','the fleshy part of the human body that you sit on','he deserves a good kick in the butt; are you going to sit on your fanny and do nothing?');
+INSERT INTO synsets VALUES('toilet.n.02','a plumbing fixture for defecation and urination','');
+INSERT INTO synsets VALUES('toilet.n.01','a room or building equipped with one or more toilets','');
+INSERT INTO synsets VALUES('can.v.01','preserve in a can or tin','tinned foods are not very tasty');
+INSERT INTO synsets VALUES('displace.v.03','terminate the employment of; discharge from an office or position','The boss fired his secretary today; The company terminated 25% of its workers');
+INSERT INTO synsets VALUES('iodine.n.01','a nonmetallic element belonging to the halogens; used especially in medicine and photography and in dyes; occurs naturally only in combination in small quantities (as in sea water or rocks)','');
+INSERT INTO synsets VALUES('i.n.03','the 9th letter of the Roman alphabet','');
+INSERT INTO synsets VALUES('smile.v.01','change one''s facial expression by spreading the lips, often to signal pleasure','');
+INSERT INTO synsets VALUES('smile.v.02','express with a smile','She smiled her thanks');
+INSERT INTO synsets VALUES('beryllium.n.01','a light strong brittle grey toxic bivalent metallic element','');
+INSERT INTO synsets VALUES('careful.a.01','exercising caution or showing care or attention','they were careful when crossing the busy street; be careful to keep her shoes clean; did very careful research; careful art restorers; careful of the rights of others; careful about one''s behavior');
+INSERT INTO synsets VALUES('careful.s.02','cautiously attentive','careful of her feelings; heedful of his father''s advice');
+INSERT INTO synsets VALUES('careful.s.03','unhurried and with care and dignity','walking at the same measured pace; with all deliberate speed');
+INSERT INTO synsets VALUES('careful.s.04','full of cares or anxiety; -Luke 10.41','Thou art careful and troubled about many things');
+INSERT INTO synsets VALUES('careful.s.05','mindful of the future in spending money','careful with money');
+INSERT INTO synsets VALUES('kick.v.01','drive or propel with the foot','');
+INSERT INTO synsets VALUES('kick.v.02','thrash about or strike out with the feet','');
+INSERT INTO synsets VALUES('kick.v.03','strike with the foot','The boy kicked the dog; Kick the door down');
+INSERT INTO synsets VALUES('kick.v.04','kick a leg up','');
+INSERT INTO synsets VALUES('kick_back.v.02','spring back, as from a forceful thrust','The gun kicked back into my shoulder');
+INSERT INTO synsets VALUES('kick.v.06','stop consuming','kick a habit; give up alcohol');
+INSERT INTO synsets VALUES('kick.v.07','make a goal','He kicked the extra point after touchdown');
+INSERT INTO synsets VALUES('complain.v.01','express complaints, discontent, displeasure, or unhappiness','My mother complains all day; She has a lot to kick about');
+INSERT INTO synsets VALUES('high.n.01','a lofty level or position or degree','summer temperatures reached an all-time high');
+INSERT INTO synsets VALUES('high.n.02','an air mass of higher than normal pressure','the east coast benefits from a Bermuda high');
+INSERT INTO synsets VALUES('high.n.03','a state of sustained elation','I''m on a permanent high these days');
+INSERT INTO synsets VALUES('high.n.04','a state of altered consciousness induced by alcohol or narcotics','they took drugs to get a high on');
+INSERT INTO synsets VALUES('high.n.05','a high place','they stood on high and observed the countryside; he doesn''t like heights');
+INSERT INTO synsets VALUES('senior_high_school.n.01','a public secondary school usually including grades 9 through 12','he goes to the neighborhood highschool');
+INSERT INTO synsets VALUES('high_gear.n.01','a forward gear with a gear ratio that gives the greatest vehicle velocity for a given engine speed','');
+INSERT INTO synsets VALUES('high.a.01','greater than normal in degree or intensity or amount','a high temperature; a high price; the high point of his career; high risks; has high hopes; the river is high; he has a high opinion of himself');
+INSERT INTO synsets VALUES('high.a.02','(literal meaning) being at or having a relatively great or specific elevation or upward extension (sometimes used in combinations like `knee-high'')','a high mountain; high ceilings; high buildings; a high forehead; a high incline; a foot high');
+INSERT INTO synsets VALUES('eminent.s.01','standing above others in quality or position','people in high places; the high priest; eminent members of the community');
+INSERT INTO synsets VALUES('high.a.04','used of sounds and voices; high in pitch or frequency','');
+INSERT INTO synsets VALUES('high.s.05','happy and excited and energetic','');
+INSERT INTO synsets VALUES('gamey.s.02','(used of the smell of meat) smelling spoiled or tainted','');
+INSERT INTO synsets VALUES('high.s.07','slightly and pleasantly intoxicated from alcohol or a drug (especially marijuana)','');
+INSERT INTO synsets VALUES('high.r.01','at a great altitude','he climbed high on the ladder');
+INSERT INTO synsets VALUES('high.r.02','in or to a high position, amount, or degree','prices have gone up far too high');
+INSERT INTO synsets VALUES('high.r.03','in a rich manner','he lives high');
+INSERT INTO synsets VALUES('high.r.04','far up toward the source','he lives high up the river');
+INSERT INTO synsets VALUES('expression.n.01','the feelings expressed on a person''s face','a sad expression; a look of triumph; an angry face');
+INSERT INTO synsets VALUES('look.n.03','physical appearance','I don''t like the looks of this place');
+INSERT INTO synsets VALUES('flight.n.02','an instance of traveling by air','flying was still an exciting adventure for him');
+INSERT INTO synsets VALUES('fly.v.01','travel through the air; be airborne','Man cannot fly');
+INSERT INTO synsets VALUES('fly.v.02','move quickly or suddenly','He flew about the place');
+INSERT INTO synsets VALUES('fly.v.03','operate an airplane','The pilot flew to Cuba');
+INSERT INTO synsets VALUES('fly.v.04','transport by aeroplane','We fly flowers from the Caribbean to North America');
+INSERT INTO synsets VALUES('fly.v.05','cause to fly or float','fly a kite');
+INSERT INTO synsets VALUES('fly.v.06','be dispersed or disseminated','Rumors and accusations are flying');
+INSERT INTO synsets VALUES('fly.v.07','change quickly from one emotional state to another','fly into a rage');
+INSERT INTO synsets VALUES('fly.v.08','pass away rapidly','Time flies like an arrow; Time fleeing beneath him');
+INSERT INTO synsets VALUES('fly.v.09','travel in an airplane','she is flying to Cincinnati tonight; Are we driving or flying?');
+INSERT INTO synsets VALUES('fly.v.10','display in the air or cause to float','fly a kite; All nations fly their flags in front of the U.N.');
+INSERT INTO synsets VALUES('flee.v.01','run away quickly','He threw down his gun and fled');
+INSERT INTO synsets VALUES('fly.v.12','travel over (an area of land or sea) in an aircraft','Lindbergh was the first to fly the Atlantic');
+INSERT INTO synsets VALUES('fly.v.13','hit a fly','');
+INSERT INTO synsets VALUES('vanish.v.05','decrease rapidly and disappear','the money vanished in las Vegas; all my stock assets have vaporized');
+INSERT INTO synsets VALUES('fast-flying.s.01','moving swiftly','fast-flying planes; played the difficult passage with flying fingers');
+INSERT INTO synsets VALUES('flying.s.02','hurried and brief','paid a flying visit; took a flying glance at the book; a quick inspection; a fast visit');
+INSERT INTO synsets VALUES('helium.n.01','a very light colorless element that is one of the six inert gasses; the most difficult gas to liquefy; occurs in economically extractable amounts in certain natural gases (as those found in Texas and Kansas)','');
+INSERT INTO synsets VALUES('he.n.02','the 5th letter of the Hebrew alphabet','');
+INSERT INTO synsets VALUES('then.n.01','that time; that moment','we will arrive before then; we were friends from then on');
+INSERT INTO synsets VALUES('then.s.01','at a specific prior time','the then president');
+INSERT INTO synsets VALUES('then.r.02','in that case or as a consequence','if he didn''t take it, then who did?; keep it then if you want to; the case, then, is closed; you''ve made up your mind then?; then you''ll be rich');
+INSERT INTO synsets VALUES('then.r.03','at that time','I was young then; prices were lower back then; science as it was then taught');
+INSERT INTO synsets VALUES('land.v.01','reach or come to rest','The bird landed on the highest branch; The plane landed in Istanbul');
+INSERT INTO synsets VALUES('land.v.02','cause to come to the ground','the pilot managed to land the airplane safely');
+INSERT INTO synsets VALUES('bring.v.05','bring into a different state','this may land you in jail');
+INSERT INTO synsets VALUES('land.v.04','bring ashore','The drug smugglers landed the heroin on the beach of the island');
+INSERT INTO synsets VALUES('land.v.05','deliver (a blow)','He landed several blows on his opponent''s head');
+INSERT INTO synsets VALUES('land.v.06','arrive on shore','The ship landed in Pearl Harbor');
+INSERT INTO synsets VALUES('down.v.04','shoot at and force to come down','the enemy landed several of our aircraft');
+INSERT INTO synsets VALUES('landed.a.01','owning or consisting of land or real estate','the landed gentry; landed property');
+INSERT INTO synsets VALUES('sad.a.01','experiencing or showing sorrow or unhappiness; ; - Christina Rossetti','feeling sad because his dog had died; Better by far that you should forget and smile / Than that you should remember and be sad');
+INSERT INTO synsets VALUES('sad.s.02','of things that make you feel sad; ; ; ; - Christina Rossetti','sad news; she doesn''t like sad movies; it was a very sad story; When I am dead, my dearest, / Sing no sad songs for me');
+INSERT INTO synsets VALUES('deplorable.s.01','bad; unfortunate','my finances were in a deplorable state; a lamentable decision; her clothes were in sad shape; a sorry state of affairs');
+INSERT INTO synsets VALUES('calcium.n.01','a white metallic element that burns with a brilliant light; the fifth most abundant element in the earth''s crust; an important component of most plants and animals','');
+INSERT INTO synsets VALUES('california.n.01','a state in the western United States on the Pacific; the 3rd largest state; known for earthquakes','');
+INSERT INTO synsets VALUES('get.n.01','a return on a shot that seemed impossible to reach and would normally have resulted in a point for the opponent','');
+INSERT INTO synsets VALUES('get.v.01','come into the possession of something concrete or abstract','She got a lot of paintings from her uncle; They acquired a new pet; Get your results the next day; Get permission to take a few days off from work');
+INSERT INTO synsets VALUES('get.v.03','cause to move; cause to be in a certain position or condition','He got his squad on the ball; This let me in for a big surprise; He got a girl into trouble');
+INSERT INTO synsets VALUES('arrive.v.01','reach a destination; arrive by movement or progress','She arrived home at 7 o''clock; She didn''t get to Chicago until after midnight');
+INSERT INTO synsets VALUES('bring.v.04','go or come after and bring or take back','Get me those books over there, please; Could you bring the wine?; The dog fetched the hat');
+INSERT INTO synsets VALUES('experience.v.03','go through (mental or physical states or experiences)','get an idea; experience vertigo; get nauseous; receive injuries; have a feeling');
+INSERT INTO synsets VALUES('pay_back.v.02','take vengeance on or get even','We''ll get them!; That''ll fix him good!; This time I got him');
+INSERT INTO synsets VALUES('have.v.17','achieve a point or goal','Nicklaus had a 70; The Brazilian team got 4 goals; She made 29 points that day');
+INSERT INTO synsets VALUES('induce.v.02','cause to do; cause to act in a specified manner','The ads induced me to buy a VCR; My children finally got me to buy a computer; My wife made me buy a new sofa');
+INSERT INTO synsets VALUES('get.v.11','succeed in catching or seizing, especially after a chase','We finally got the suspect; Did you catch the thief?');
+INSERT INTO synsets VALUES('grow.v.08','come to have or undergo a change of (physical features and attributes)','He grew a beard; The patient developed abdominal pains; I got funny spots all over my body; Well-developed breasts');
+INSERT INTO synsets VALUES('contract.v.04','be stricken by an illness, fall victim to an illness','He got AIDS; She came down with pneumonia; She took a chill');
+INSERT INTO synsets VALUES('get.v.14','communicate with a place or person; establish communication with, as if by telephone','Bill called this number and he got Mary; The operator couldn''t get Kobe because of the earthquake');
+INSERT INTO synsets VALUES('make.v.02','give certain properties to something','get someone mad; She made us look silly; He made a fool of himself at the meeting; Don''t make this into a big deal; This invention will make you a millionaire; Make yourself clear');
+INSERT INTO synsets VALUES('drive.v.11','move into a desired direction of discourse','What are you driving at?');
+INSERT INTO synsets VALUES('catch.v.18','grasp with the mind or develop an understanding of','did you catch that allusion?; We caught something of his theory in the lecture; don''t catch your meaning; did you get it?; She didn''t get the joke; I just don''t get him');
+INSERT INTO synsets VALUES('catch.v.07','attract and fix','His look caught her; She caught his eye; Catch the attention of the waiter');
+INSERT INTO synsets VALUES('get.v.19','reach with a blow or hit in a particular spot','the rock caught her in the back of the head; The blow got him in the back; The punch caught him in the stomach');
+INSERT INTO synsets VALUES('get.v.20','reach by calculation','What do you get when you add up these numbers?');
+INSERT INTO synsets VALUES('get.v.21','acquire as a result of some effort or action','You cannot get water out of a stone; Where did she get these news?');
+INSERT INTO synsets VALUES('get.v.22','purchase','What did you get at the toy store?');
+INSERT INTO synsets VALUES('catch.v.21','perceive by hearing','I didn''t catch your name; She didn''t get his name when they met the first time');
+INSERT INTO synsets VALUES('catch.v.22','suffer from the receipt of','She will catch hell for this behavior!');
+INSERT INTO synsets VALUES('get.v.25','receive as a retribution or punishment','He got 5 years in prison');
+INSERT INTO synsets VALUES('scram.v.01','leave immediately; used usually in the imperative form','Scram!');
+INSERT INTO synsets VALUES('get.v.27','reach and board','She got the bus just as it was leaving');
+INSERT INTO synsets VALUES('get.v.28','irritate','Her childish behavior really get to me; His lying really gets me');
+INSERT INTO synsets VALUES('get.v.29','evoke an emotional response','Brahms''s `Requiem'' gets me every time');
+INSERT INTO synsets VALUES('catch.v.24','apprehend and reproduce accurately','She really caught the spirit of the place in her drawings; She got the mood just right in her photographs');
+INSERT INTO synsets VALUES('draw.v.15','earn or achieve a base by being walked by the pitcher','He drew a base on balls');
+INSERT INTO synsets VALUES('get.v.32','overcome or destroy','The ice storm got my hibiscus; the cat got the goldfish');
+INSERT INTO synsets VALUES('perplex.v.01','be a mystery or bewildering to','This beats me!; Got me--I don''t know the answer!; a vexing problem; This question really stuck me');
+INSERT INTO synsets VALUES('get_down.v.07','take the first step or steps in carrying out an action','We began working at dawn; Who will start?; Get working as soon as the sun rises!; The first tourists began to arrive in Cambodia; He began early in the day; Let''s get down to work now');
+INSERT INTO synsets VALUES('suffer.v.02','undergo (as of injuries and illnesses)','She suffered a fracture in the accident; He had an insulin shock after eating three candy bars; She got a bruise on her leg; He got his arm broken in the scuffle');
+INSERT INTO synsets VALUES('beget.v.01','make children','Abraham begot Isaac; Men often father children but don''t recognize them');
+INSERT INTO synsets VALUES('kind.n.01','a category of things distinguished by some common characteristic or quality','sculpture is a form of art; what kinds of desserts are there?');
+INSERT INTO synsets VALUES('kind.a.01','having or showing a tender and considerate and helpful nature; used especially of persons and their behavior','kind to sick patients; a kind master; kind words showing understanding and sympathy; thanked her for her kind letter');
+INSERT INTO synsets VALUES('kind.s.02','agreeable, conducive to comfort','a dry climate kind to asthmatics; the genial sunshine; hot summer pavements are anything but kind to the feet');
+INSERT INTO synsets VALUES('kind.s.03','tolerant and forgiving under provocation','our neighbor was very kind about the window our son broke');
+INSERT INTO synsets VALUES('man.n.01','an adult person who is male (as opposed to a woman)','there were two women and six men on the bus');
+INSERT INTO synsets VALUES('serviceman.n.01','someone who serves in the armed forces; a member of a military force','two men stood sentry duty');
+INSERT INTO synsets VALUES('man.n.03','the generic use of the word to refer to any human being','it was every man for himself');
+INSERT INTO synsets VALUES('homo.n.02','any living or extinct member of the family Hominidae characterized by superior intelligence, articulate speech, and erect carriage','');
+INSERT INTO synsets VALUES('man.n.05','a male subordinate','the chief stationed two men outside the building; he awaited word from his man in Havana');
+INSERT INTO synsets VALUES('man.n.06','an adult male person who has a manly character (virile and courageous competent)','the army will make a man of you');
+INSERT INTO synsets VALUES('valet.n.01','a manservant who acts as a personal attendant to his employer','Jeeves was Bertie Wooster''s man');
+INSERT INTO synsets VALUES('man.n.08','a male person who plays a significant role (husband or lover or boyfriend) in the life of a particular woman','she takes good care of her man');
+INSERT INTO synsets VALUES('man.n.09','one of the British Isles in the Irish Sea','');
+INSERT INTO synsets VALUES('man.n.10','game equipment consisting of an object used in playing certain board games','he taught me to set up the men on the chess board; he sacrificed a piece to get a strategic advantage');
+INSERT INTO synsets VALUES('world.n.08','all of the living human inhabitants of the earth','all the world loves a lover; she always used `humankind'' because `mankind'' seemed to slight the women');
+INSERT INTO synsets VALUES('man.v.01','take charge of a certain job; occupy a certain work place','Mr. Smith manned the reception desk in the morning');
+INSERT INTO synsets VALUES('man.v.02','provide with workers','We cannot man all the desks; Students were manning the booths');
+INSERT INTO synsets VALUES('volition.n.01','the capability of conscious choice and decision and intention; - George Meredith','the exercise of their volition we construe as revolt');
+INSERT INTO synsets VALUES('will.n.02','a fixed and persistent intent or purpose','where there''s a will there''s a way');
+INSERT INTO synsets VALUES('will.n.03','a legal document declaring a person''s wishes regarding the disposal of their property when they die','');
+INSERT INTO synsets VALUES('will.v.01','decree or ordain','God wills our existence');
+INSERT INTO synsets VALUES('will.v.02','determine by choice','This action was willed and intended');
+INSERT INTO synsets VALUES('bequeath.v.01','leave or give by will after one''s death','My aunt bequeathed me all her jewelry; My grandfather left me his entire estate');
+INSERT INTO synsets VALUES('aid.n.02','the activity of contributing to the fulfillment of a need or furtherance of an effort or purpose','he gave me an assist with the housework; could not walk without assistance; rescue party went to their aid; offered his help in unloading');
+INSERT INTO synsets VALUES('assistant.n.01','a person who contributes to the fulfillment of a need or furtherance of an effort or purpose','my invaluable assistant; they hired additional help to finish the work');
+INSERT INTO synsets VALUES('aid.n.01','a resource','visual aids in teaching');
+INSERT INTO synsets VALUES('avail.n.01','a means of serving','of no avail; there''s no help for it');
+INSERT INTO synsets VALUES('help.v.01','give help or assistance; be of service','Everyone helped out during the earthquake; Can you help me carry this table?; She never helps around the house');
+INSERT INTO synsets VALUES('help.v.02','improve the condition of','These pills will help the patient');
+INSERT INTO synsets VALUES('help.v.03','be of use','This will help to prevent accidents');
+INSERT INTO synsets VALUES('help_oneself.v.01','abstain from doing; always used with a negative','I can''t help myself--I have to smoke; She could not help watching the sad spectacle');
+INSERT INTO synsets VALUES('serve.v.05','help to some food; help with food or drink','I served him three times, and after that he helped himself');
+INSERT INTO synsets VALUES('help.v.06','contribute to the furtherance of','This money will help the development of literacy in developing countries');
+INSERT INTO synsets VALUES('avail.v.03','take or use','She helped herself to some of the office supplies');
+INSERT INTO synsets VALUES('help.v.08','improve; change for the better','New slipcovers will help the old living room furniture');
+INSERT INTO synsets VALUES('out.n.01','(baseball) a failure by a batter or runner to reach a base safely in baseball','you only get 3 outs per inning');
+INSERT INTO synsets VALUES('come_out_of_the_closet.v.01','to state openly and publicly one''s homosexuality','This actor outed last year');
+INSERT INTO synsets VALUES('out.v.02','reveal (something) about somebody''s identity or lifestyle','The gay actor was outed last week; Someone outed a CIA agent');
+INSERT INTO synsets VALUES('out.v.03','be made known; be disclosed or revealed','The truth will out');
+INSERT INTO synsets VALUES('out.a.01','not allowed to continue to bat or run','he was tagged out at second on a close play; he fanned out');
+INSERT INTO synsets VALUES('extinct.s.03','being out or having grown cold','threw his extinct cigarette into the stream; the fire is out');
+INSERT INTO synsets VALUES('out.s.03','not worth considering as a possibility','a picnic is out because of the weather');
+INSERT INTO synsets VALUES('out.s.04','out of power; especially having been unsuccessful in an election','now the Democrats are out');
+INSERT INTO synsets VALUES('forbidden.s.01','excluded from use or mention','forbidden fruit; in our house dancing and playing cards were out; a taboo subject');
+INSERT INTO synsets VALUES('out.s.06','directed outward or serving to direct something outward','the out doorway; the out basket');
+INSERT INTO synsets VALUES('out.s.07','no longer fashionable','that style is out these days');
+INSERT INTO synsets VALUES('out.s.08','outside or external','the out surface of a ship''s hull');
+INSERT INTO synsets VALUES('out.s.09','outer or outlying','the out islands');
+INSERT INTO synsets VALUES('knocked_out.s.01','knocked unconscious by a heavy blow','');
+INSERT INTO synsets VALUES('out.r.01','away from home','they went out last night');
+INSERT INTO synsets VALUES('out.r.02','moving or appearing to move away from a place, especially one that is enclosed or hidden','the cat came out from under the bed');
+INSERT INTO synsets VALUES('away.r.02','from one''s possession','he gave out money to the poor; gave away the tickets');
+INSERT INTO synsets VALUES('water.n.01','binary compound that occurs at room temperature as a clear colorless odorless tasteless liquid; freezes into ice below 0 degrees centigrade and boils above 100 degrees centigrade; widely used as a solvent','');
+INSERT INTO synsets VALUES('body_of_water.n.01','the part of the earth''s surface covered with water (such as a river or lake or ocean)','they invaded our territorial waters; they were sitting by the water''s edge');
+INSERT INTO synsets VALUES('water.n.03','once thought to be one of four elements composing the universe (Empedocles)','');
+INSERT INTO synsets VALUES('water_system.n.02','a facility that provides a source of water','the town debated the purification of the water supply; first you have to cut off the water');
+INSERT INTO synsets VALUES('urine.n.01','liquid excretory product','there was blood in his urine; the child had to make water');
+INSERT INTO synsets VALUES('water.n.06','a liquid necessary for the life of most animals and plants','he asked for a drink of water');
+INSERT INTO synsets VALUES('water.v.01','supply with water, as with channels or ditches or streams','Water the fields');
+INSERT INTO synsets VALUES('water.v.02','provide with water','We watered the buffalo');
+INSERT INTO synsets VALUES('water.v.03','secrete or form water, as tears or saliva','My mouth watered at the prospect of a good dinner; His eyes watered');
+INSERT INTO synsets VALUES('water.v.04','fill with tears','His eyes were watering');
 DELETE FROM sqlite_sequence;
-INSERT INTO sqlite_sequence VALUES('stories',2);
-INSERT INTO sqlite_sequence VALUES('sentences',15);
-INSERT INTO sqlite_sequence VALUES('words',225);
+INSERT INTO sqlite_sequence VALUES('stories',3);
+INSERT INTO sqlite_sequence VALUES('sentences',30);
+INSERT INTO sqlite_sequence VALUES('word_types',161);
+INSERT INTO sqlite_sequence VALUES('words',346);
+CREATE VIEW word_synsets AS
+        SELECT words.id AS word_id, synset_id
+        FROM words JOIN word_type_synsets USING (word_type_id);
 CREATE INDEX idx_words_sentence_id ON words(sentence_id);
 CREATE INDEX idx_sentences_story_id_number ON sentences(story_id, sentence_number);
 CREATE INDEX idx_words_sentence_word_number ON words(sentence_id, word_number);
+CREATE INDEX idx_words_word_type_id ON words(word_type_id);
 COMMIT;
@@ -0,0 +1,199 @@
+#!/usr/bin/env python3
+
+# Sentence and word tokenizers for wordnetify.py.
+#
+# "nltk" is Punkt (nltk.sent_tokenize) plus NLTK's Treebank-style word tokenizer
+# (nltk.word_tokenize). It is what every database so far has been made with, and it
+# is the default.
+#
+# "regex" does the same job with a handful of precompiled regular expressions, and
+# is much faster. It copies what Punkt and the Treebank rules do on the kind of plain
+# prose in TinyStories (sentence-final punctuation, commas, quotes, contractions, a
+# few abbreviations like "Mr."), but it doesn't try to handle everything they do.
+# Run this file with --file to list every sentence where the two disagree.
+
+import argparse
+import functools
+import re
+import sys
+from typing import Dict, List, Tuple, Type
+
+
+class NltkTokenizer:
+    name = 'nltk'
+
+    # nltk is imported here rather than at the top, so that runs which don't use it
+    # don't pay for importing it
+    def sentences(self, text: str) -> List[str]:
+        import nltk
+        return nltk.sent_tokenize(text)
+
+    def words(self, sentence: str) -> List[str]:
+        import nltk
+        return nltk.word_tokenize(sentence)
+
+
+# Punctuation (plus any closing quotes or brackets), then whitespace, then the next token
+SENTENCE_END = re.compile(r"""([.?!]+)["'\)\]}”’»]*(?=\s+(\S))""")
+# The word before a full stop, to check for abbreviations and initials
+WORD_BEFORE = re.compile(r"(\S+)$")
+ABBREVIATIONS = {'mr', 'mrs', 'ms', 'dr', 'st', 'jr', 'sr', 'prof', 'mt', 'vs', 'e.g', 'i.e'}
+
+# The full stop at the end of a sentence (possibly inside closing quotes) is split
+# off; any other full stop stays attached to its word, as in the Treebank rules.
+FINAL_PERIOD = re.compile(r"""(?<=[^.])\.(["'\)\]}>»”’]*)\s*$""")
+# One pass over the rest of the sentence
+TOKEN = re.compile(r"""
+      ``|''                                  # quotes that are already in PTB form
+    | \.{2,}                                 # ellipsis
+    | --
+    | [,:](?!\d)                             # a comma or colon, unless it's inside a number
+    | [;@\#$%&?!*()\[\]{}<>"«»“”‘’„‒-―]
+    | (?:[^\s;@\#$%&?!*()\[\]{}<>"«»“”‘’„‒-―,:.-]|[,:](?=\d)|\.(?!\.)|-(?!-))+
+    """, re.VERBOSE)
+OPENING_QUOTE_CONTEXT = re.compile(r"""(?:^|[\s(\[{<])$""")
+# Clitics that Treebank splits off the end of a word, longest first
+CLITIC = re.compile(r"""^(.*[^'])(n't|N'T|'ll|'LL|'re|'RE|'ve|'VE|'[sSmMdD])$""")
+# MacIntyre's contractions, which Treebank splits into two words
+CONTRACTIONS = [re.compile(r"(?i)^(can)(not)$"), re.compile(r"(?i)^(d)('ye)$"),
+                re.compile(r"(?i)^(gim)(me)$"), re.compile(r"(?i)^(gon)(na)$"),
+                re.compile(r"(?i)^(got)(ta)$"), re.compile(r"(?i)^(lem)(me)$"),
+                re.compile(r"(?i)^(more)('n)$"), re.compile(r"(?i)^(wan)(na)$"),
+                re.compile(r"(?i)^('t)(is)$"), re.compile(r"(?i)^('t)(was)$")]
+NOT_A_CLITIC = re.compile(r"""(?i)^(?:re|ve|ll|m|t|s|d|n)\b""")
+
+
+@functools.lru_cache(maxsize=100000)
+def split_word(token: str) -> Tuple[str, ...]:
+    """Split a whitespace-delimited chunk into words the way the Treebank rules would.
+
+    TinyStories only has a few thousand distinct chunks, so this is cached."""
+    prefix: Tuple[str, ...] = ()
+    # An opening single quote, e.g. 'hello' -- but not a clitic like 's
+    if len(token) > 1 and token[0] == "'" and token[1] != "'" and not NOT_A_CLITIC.match(token[1:]):
+        prefix = ("'",)
+        token = token[1:]
+    suffix: Tuple[str, ...] = ()
+    # A closing single quote
+    if len(token) > 1 and token[-1] == "'" and token[-2] != "'":
+        suffix = ("'",)
+        token = token[:-1]
+    for contraction in CONTRACTIONS:
+        match = contraction.match(token)
+        if match:
+            return prefix + (match.group(1), match.group(2)) + suffix
+    match = CLITIC.match(token)
+    if match:
+        return prefix + (match.group(1), match.group(2)) + suffix
+    return prefix + (token,) + suffix
+
+
+class RegexTokenizer:
+    name = 'regex'
+
+    def sentences(self, text: str) -> List[str]:
+        answer = []
+        start = 0
+        for match in SENTENCE_END.finditer(text):
+            punctuation = match.group(1)
+            next_token = match.group(2)
+            if punctuation == '.':
+                before = WORD_BEFORE.search(text, 0, match.start())
+                word = before.group(1).lower() if before else ''
+                if word in ABBREVIATIONS or (len(word) == 1 and word.isalpha()):
+                    continue
+            elif punctuation.startswith('..') and not next_token[0].isupper():
+                # An ellipsis in the middle of a sentence
+                continue
+            sentence = text[start:match.end()].strip()
+            if sentence:
+                answer.append(sentence)
+            start = match.end()
+        sentence = text[start:].strip()
+        if sentence:
+            answer.append(sentence)
+        return answer
+
+    def words(self, sentence: str) -> List[str]:
+        final = []
+        match = FINAL_PERIOD.search(sentence)
+        if match:
+            # Quotes straight after the full stop close the sentence, so their context is
+            # the sentence itself (up to and including the full stop)
+            final = ['.'] + [self.quote(q, sentence[:match.start() + 1]) for q in match.group(1)]
+            sentence = sentence[:match.start()]
+        answer = []
+        for token in TOKEN.finditer(sentence):
+            text = token.group(0)
+            if text == '"':
+                answer.append(self.quote(text, sentence[:token.start()]))
+            elif len(text) > 1:
+                answer.extend(split_word(text))
+            else:
+                answer.append(text)
+        return answer + final
+
+    @staticmethod
+    def quote(text: str, before: str) -> str:
+        if text != '"':
+            return text
+        return '``' if OPENING_QUOTE_CONTEXT.search(before) else "''"
+
+
+TOKENIZERS: Dict[str, Type] = {
+    NltkTokenizer.name: NltkTokenizer,
+    RegexTokenizer.name: RegexTokenizer,
+}
+
+
+def get_tokenizer(name: str):
+    if name not in TOKENIZERS:
+        raise ValueError(f"Unknown tokenizer {name!r}: choose from {', '.join(TOKENIZERS)}")
+    return TOKENIZERS[name]()
+
+
+def compare_tokenizers(stories, reference, candidate, output=sys.stdout) -> Dict[str, int]:
+    """Run both tokenizers over every story and report each sentence they segment differently."""
+    counts = {'stories': 0, 'sentences': 0, 'sentence_differences': 0, 'word_differences': 0}
+    for story_number, story in stories:
+        counts['stories'] += 1
+        expected_sentences = reference.sentences(story)
+        actual_sentences = candidate.sentences(story)
+        counts['sentences'] += len(expected_sentences)
+        if expected_sentences != actual_sentences:
+            counts['sentence_differences'] += 1
+            output.write(f"## Story {story_number}: sentences differ\n")
+            output.write(f"   {reference.name}: {expected_sentences}\n")
+            output.write(f"   {candidate.name}: {actual_sentences}\n")
+            continue
+        for sentence in expected_sentences:
+            expected_words = reference.words(sentence)
+            actual_words = candidate.words(sentence)
+            if expected_words != actual_words:
+                counts['word_differences'] += 1
+                output.write(f"## Story {story_number}: words differ in {sentence!r}\n")
+                output.write(f"   {reference.name}: {expected_words}\n")
+                output.write(f"   {candidate.name}: {actual_words}\n")
+    return counts
+
+
+def main() -> None:
+    import wordnetify
+    parser = argparse.ArgumentParser(description="Compare two tokenizers on a TinyStories file, and show where they disagree.")
+    parser.add_argument("--file", required=True, help="The TinyStories file to tokenize")
+    parser.add_argument("--reference", default="nltk", choices=list(TOKENIZERS), help="The tokenizer that is assumed to be right")
+    parser.add_argument("--candidate", default="regex", choices=list(TOKENIZERS), help="The tokenizer being checked")
+    parser.add_argument("--stop-after", type=int, help="Number of stories to stop after")
+    args = parser.parse_args()
+
+    stories = enumerate(story for (pos, story) in wordnetify.read_file_in_chunks(args.file, max_chunks=args.stop_after))
+    counts = compare_tokenizers(stories, get_tokenizer(args.reference), get_tokenizer(args.candidate))
+    print(f"{counts['stories']} stories, {counts['sentences']} sentences: "
+          f"{counts['sentence_differences']} stories split into sentences differently, "
+          f"{counts['word_differences']} sentences split into words differently")
+    if counts['sentence_differences'] or counts['word_differences']:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,317 @@
+#!/usr/bin/env python3
+
+# A snapshot of the parts of WordNet that wordnetify.py and make_wordnet_database.py
+# use, in a single SQLite file: the lemma -> synset index, the morphy exception
+# lists, and each synset's name, part of speech, definition, examples, hypernyms
+# and hyponyms.
+#
+# NLTK's corpus reader parses the WordNet data files the first time it is used,
+# and the scripts used to call nltk.download() (which goes out to the network)
+# every time they started. Opening a snapshot is just opening a database (which
+# SQLite memory-maps), so short jobs can start straight away.
+#
+# Build it once (this is the only step that needs NLTK and its wordnet data):
+#
+#    ./wordnet_snapshot.py --output wordnet.snapshot --verify
+#
+# Snapshot.synsets() gives the same answers as nltk.corpus.wordnet.synsets(), in
+# the same order: it applies the same morphy rules to the same index. --verify
+# checks that against NLTK for every lemma, every exception and the inflections
+# that the rules undo.
+
+import argparse
+import json
+import os
+import sqlite3
+import sys
+from typing import Dict, Iterator, List, Optional
+
+FORMAT_VERSION = '1'
+
+# The same order as nltk.corpus.reader.wordnet.POS_LIST, which decides the order
+# that synsets() returns things in
+POS_LIST = ['n', 'v', 'a', 'r']
+
+# Copied from WordNetCorpusReader.MORPHOLOGICAL_SUBSTITUTIONS
+MORPHOLOGICAL_SUBSTITUTIONS = {
+    'n': [('s', ''), ('ses', 's'), ('ves', 'f'), ('xes', 'x'), ('zes', 'z'),
+          ('ches', 'ch'), ('shes', 'sh'), ('men', 'man'), ('ies', 'y')],
+    'v': [('s', ''), ('ies', 'y'), ('es', 'e'), ('es', ''), ('ed', 'e'), ('ed', ''),
+          ('ing', 'e'), ('ing', '')],
+    'a': [('er', ''), ('est', ''), ('er', 'e'), ('est', 'e')],
+    'r': [],
+}
+MORPHOLOGICAL_SUBSTITUTIONS['s'] = MORPHOLOGICAL_SUBSTITUTIONS['a']
+
+
+class SnapshotSynset:
+    """Enough of nltk's Synset for our scripts: compared and sorted by name, like the real thing."""
+
+    def __init__(self, snapshot: 'Snapshot', synset_id: int, name: str, pos: str,
+                 definition: str, examples: List[str]) -> None:
+        self.snapshot = snapshot
+        self.id = synset_id
+        self._name = name
+        self._pos = pos
+        self._definition = definition
+        self._examples = examples
+
+    def name(self) -> str:
+        return self._name
+
+    def pos(self) -> str:
+        return self._pos
+
+    def definition(self) -> str:
+        return self._definition
+
+    def examples(self) -> List[str]:
+        return self._examples
+
+    def hypernyms(self) -> List['SnapshotSynset']:
+        return self.snapshot.related(self.id, 'hypernym')
+
+    def hyponyms(self) -> List['SnapshotSynset']:
+        return self.snapshot.related(self.id, 'hyponym')
+
+    def __eq__(self, other: object) -> bool:
+        return isinstance(other, SnapshotSynset) and self._name == other._name
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    def __lt__(self, other: 'SnapshotSynset') -> bool:
+        return self._name < other._name
+
+    def __hash__(self) -> int:
+        return hash(self._name)
+
+    def __repr__(self) -> str:
+        return f"Synset('{self._name}')"
+
+
+class Snapshot:
+    """Looks things up in a snapshot file. Open one per process: it holds an SQLite connection."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        if not os.path.exists(path):
+            raise FileNotFoundError(f"There is no WordNet snapshot at {path}; make one with wordnet_snapshot.py")
+        self.conn = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+        cursor = self.conn.cursor()
+        cursor.execute("pragma mmap_size = 1073741824")
+        try:
+            cursor.execute("select value from meta where key = 'format_version'")
+            row = cursor.fetchone()
+        except sqlite3.DatabaseError:
+            row = None
+        if row is None or row[0] != FORMAT_VERSION:
+            raise ValueError(f"{path} isn't a WordNet snapshot that this version can read; rebuild it with wordnet_snapshot.py")
+        self.cache: Dict[int, SnapshotSynset] = {}
+
+    def ensure_loaded(self) -> None:
+        # There's nothing to load; this is here so a Snapshot can stand in for nltk's wordnet
+        pass
+
+    def get_version(self) -> str:
+        cursor = self.conn.cursor()
+        cursor.execute("select value from meta where key = 'wordnet_version'")
+        return cursor.fetchone()[0]
+
+    def make_synset(self, row) -> SnapshotSynset:
+        synset_id = row[0]
+        synset = self.cache.get(synset_id)
+        if synset is None:
+            synset = SnapshotSynset(self, synset_id, row[1], row[2], row[3], json.loads(row[4]))
+            self.cache[synset_id] = synset
+        return synset
+
+    def synset_by_id(self, synset_id: int) -> SnapshotSynset:
+        synset = self.cache.get(synset_id)
+        if synset is None:
+            cursor = self.conn.cursor()
+            cursor.execute("select id, name, pos, definition, examples from synsets where id = ?", [synset_id])
+            synset = self.make_synset(cursor.fetchone())
+        return synset
+
+    def synset(self, name: str) -> SnapshotSynset:
+        cursor = self.conn.cursor()
+        cursor.execute("select id, name, pos, definition, examples from synsets where name = ?", [name])
+        row = cursor.fetchone()
+        if row is None:
+            raise KeyError(f"No synset called {name!r}")
+        return self.make_synset(row)
+
+    def all_synsets(self) -> Iterator[SnapshotSynset]:
+        """Every synset, in the same order as nltk's wordnet.all_synsets()."""
+        cursor = self.conn.cursor()
+        cursor.execute("select id, name, pos, definition, examples from synsets order by id")
+        for row in cursor:
+            yield self.make_synset(row)
+
+    def related(self, synset_id: int, relation: str) -> List[SnapshotSynset]:
+        cursor = self.conn.cursor()
+        cursor.execute("select target_id from relations where synset_id = ? and relation = ? order by rank",
+                       [synset_id, relation])
+        return [self.synset_by_id(target_id) for (target_id,) in cursor.fetchall()]
+
+    def has_lemma(self, lemma: str, pos: str) -> bool:
+        cursor = self.conn.cursor()
+        cursor.execute("select 1 from lemma_index where lemma = ? and pos = ? limit 1", [lemma, pos])
+        return cursor.fetchone() is not None
+
+    def exceptions(self, form: str, pos: str) -> Optional[List[str]]:
+        cursor = self.conn.cursor()
+        cursor.execute("select base from exceptions where pos = ? and inflected = ? order by rank", [pos, form])
+        rows = cursor.fetchall()
+        if not rows:
+            return None
+        return [base for (base,) in rows]
+
+    def morphy(self, form: str, pos: str) -> List[str]:
+        """The lemmas that `form` could be an inflection of, the way WordNetCorpusReader._morphy() finds them."""
+        forms = self.exceptions(form, pos)
+        if forms is None:
+            forms = [form[:-len(old)] + new for (old, new) in MORPHOLOGICAL_SUBSTITUTIONS[pos] if form.endswith(old)]
+        answer = []
+        for candidate in [form] + forms:
+            if candidate not in answer and self.has_lemma(candidate, pos):
+                answer.append(candidate)
+        return answer
+
+    def synsets(self, word: str) -> List[SnapshotSynset]:
+        word = word.lower()
+        cursor = self.conn.cursor()
+        answer = []
+        for pos in POS_LIST:
+            for lemma in self.morphy(word, pos):
+                cursor.execute("""select synsets.id, name, synsets.pos, definition, examples
+                    from lemma_index join synsets on (synsets.id = synset_id)
+                    where lemma = ? and lemma_index.pos = ? order by rank""", [lemma, pos])
+                answer.extend(self.make_synset(row) for row in cursor.fetchall())
+        return answer
+
+
+def open_snapshot(path: str) -> Snapshot:
+    return Snapshot(path)
+
+
+def build_snapshot(output: str, progress: bool = False) -> None:
+    import nltk
+    nltk.download('wordnet', quiet=True)
+    from nltk.corpus import wordnet as wn
+
+    conn = sqlite3.connect(output + '.tmp')
+    cursor = conn.cursor()
+    for table in ['meta', 'synsets', 'relations', 'lemma_index', 'exceptions']:
+        cursor.execute(f"drop table if exists {table}")
+    cursor.execute("create table meta (key TEXT PRIMARY KEY, value TEXT)")
+    cursor.execute("""create table synsets (
+        id INTEGER PRIMARY KEY,
+        name TEXT NOT NULL UNIQUE,
+        pos TEXT NOT NULL,
+        definition TEXT,
+        examples TEXT)""")
+    cursor.execute("""create table relations (
+        synset_id INTEGER, relation TEXT, rank INTEGER, target_id INTEGER,
+        PRIMARY KEY (synset_id, relation, rank)) without rowid""")
+    cursor.execute("""create table lemma_index (
+        lemma TEXT, pos TEXT, rank INTEGER, synset_id INTEGER,
+        PRIMARY KEY (lemma, pos, rank)) without rowid""")
+    cursor.execute("""create table exceptions (
+        pos TEXT, inflected TEXT, rank INTEGER, base TEXT,
+        PRIMARY KEY (pos, inflected, rank)) without rowid""")
+
+    # Synsets are numbered in all_synsets() order, so that make_wordnet_database.py
+    # visits them in the same order either way.
+    iterator = wn.all_synsets()
+    if progress:
+        import tqdm
+        iterator = tqdm.tqdm(iterator, desc="synsets")
+    synset_ids: Dict[str, int] = {}
+    all_synsets = []
+    for synset in iterator:
+        synset_ids[synset.name()] = len(all_synsets) + 1
+        all_synsets.append(synset)
+    cursor.executemany("insert into synsets (id, name, pos, definition, examples) values (?, ?, ?, ?, ?)",
+                       ((synset_ids[s.name()], s.name(), s.pos(), s.definition(), json.dumps(s.examples()))
+                        for s in all_synsets))
+    relations = []
+    for synset in all_synsets:
+        for relation, targets in [('hypernym', synset.hypernyms()), ('hyponym', synset.hyponyms())]:
+            for rank, target in enumerate(targets):
+                relations.append((synset_ids[synset.name()], relation, rank, synset_ids[target.name()]))
+    cursor.executemany("insert into relations (synset_id, relation, rank, target_id) values (?, ?, ?, ?)", relations)
+
+    # These two are private to the corpus reader, but they are exactly what
+    # synsets() and _morphy() look things up in.
+    lemma_rows = []
+    for lemma, by_pos in wn._lemma_pos_offset_map.items():
+        for pos, offsets in by_pos.items():
+            for rank, offset in enumerate(offsets):
+                synset = wn.synset_from_pos_and_offset(pos, offset)
+                lemma_rows.append((lemma, pos, rank, synset_ids[synset.name()]))
+    cursor.executemany("insert into lemma_index (lemma, pos, rank, synset_id) values (?, ?, ?, ?)", lemma_rows)
+    exception_rows = []
+    for pos, exceptions in wn._exception_map.items():
+        for inflected, bases in exceptions.items():
+            for rank, base in enumerate(bases):
+                exception_rows.append((pos, inflected, rank, base))
+    cursor.executemany("insert into exceptions (pos, inflected, rank, base) values (?, ?, ?, ?)", exception_rows)
+
+    cursor.executemany("insert into meta (key, value) values (?, ?)",
+                       [('format_version', FORMAT_VERSION),
+                        ('wordnet_version', wn.get_version()),
+                        ('nltk_version', nltk.__version__)])
+    conn.commit()
+    cursor.execute("vacuum")
+    conn.close()
+    os.replace(output + '.tmp', output)
+
+
+def verify_snapshot(path: str, progress: bool = False) -> int:
+    """Compare synsets() with NLTK's for every lemma, exception and undoable inflection. Returns the number of differences."""
+    import nltk
+    nltk.download('wordnet', quiet=True)
+    from nltk.corpus import wordnet as wn
+    snapshot = open_snapshot(path)
+    words = set(wn._lemma_pos_offset_map)
+    for exceptions in wn._exception_map.values():
+        words.update(exceptions)
+    endings = {old for substitutions in MORPHOLOGICAL_SUBSTITUTIONS.values() for (old, new) in substitutions}
+    words.update(lemma + ending for lemma in wn._lemma_pos_offset_map for ending in endings)
+    iterator = sorted(words)
+    if progress:
+        import tqdm
+        iterator = tqdm.tqdm(iterator, desc="verifying")
+    differences = 0
+    for word in iterator:
+        expected = [(s.name(), s.definition(), s.examples()) for s in wn.synsets(word)]
+        actual = [(s.name(), s.definition(), s.examples()) for s in snapshot.synsets(word)]
+        if expected != actual:
+            differences += 1
+            if differences <= 20:
+                sys.stderr.write(f"{word!r}: nltk has {[e[0] for e in expected]}, the snapshot has {[a[0] for a in actual]}\n")
+    return differences
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Save the parts of WordNet that wordnetify.py uses into a snapshot file, so that it doesn't need NLTK's corpus reader.")
+    parser.add_argument("--output", required=True, help="The snapshot file to write")
+    parser.add_argument("--verify", action="store_true", help="Check that the snapshot gives the same synsets as NLTK (takes a few minutes)")
+    parser.add_argument("--verify-only", action="store_true", help="Check an existing snapshot without rebuilding it")
+    parser.add_argument("--progress", action="store_true", help="Show progress bars")
+    args = parser.parse_args()
+
+    if not args.verify_only:
+        build_snapshot(args.output, args.progress)
+        print(f"Wrote {args.output}")
+    if args.verify or args.verify_only:
+        differences = verify_snapshot(args.output, args.progress)
+        if differences:
+            sys.exit(f"{differences} words have different synsets in {args.output} and NLTK")
+        print("The snapshot matches NLTK")
+
+
+if __name__ == "__main__":
+    main()
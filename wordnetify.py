@@ -1,17 +1,30 @@
 #!/usr/bin/env python3
 
 import argparse
-import nltk
+import collections
+import functools
+import itertools
+import multiprocessing
+import os
+import profiling
 import sqlite3
-from nltk.corpus import wordnet
+import storyindex
+import sys
+import time
+import tokenization
+import wordnet_snapshot
+import wordpaths
 
-# Ensure necessary NLTK resources are downloaded
-nltk.download('punkt')
-nltk.download('wordnet')
-nltk.download('punkt_tab')
+from typing import Dict, Optional, Iterator, Iterable, List, Sequence, Set, Tuple
 
+# (name, definition, examples) -- plain tuples rather than nltk Synset objects,
+# so that the analysis of a story can be pickled back from a worker process.
+SynsetRow = Tuple[str, str, str]
+# A story is analysed into [(sentence, [(word, candidate synsets), ...]), ...]
+StoryAnalysis = List[Tuple[str, List[Tuple[str, Sequence[SynsetRow]]]]]
 
-from typing import Optional, Iterator, Tuple
+# TinyStories has a small vocabulary, so almost every token has been looked up before.
+DEFAULT_SYNSET_CACHE_SIZE = 100000
 
 def read_file_in_chunks(file_path: str, starting_position: Optional[int] = None, max_chunks: Optional[int] = None) -> Iterator[Tuple[int, str]]:
     """Read a file and yield chunks of text separated by a specific delimiter."""
@@ -40,6 +53,10 @@ def read_file_in_chunks(file_path: str, starting_position: Optional[int] = None,
 
 def create_schema(conn: sqlite3.Connection) -> None:
     """Create the database schema."""
+    create_tables(conn)
+    create_indexes(conn)
+
+def create_tables(conn: sqlite3.Connection) -> None:
     cursor = conn.cursor()
 
     cursor.execute("""
@@ -77,15 +94,26 @@ def create_schema(conn: sqlite3.Connection) -> None:
         resolving_model TEXT,
         resolved_timestamp datetime,
         resolution_compute_time FLOAT,
-        FOREIGN KEY(sentence_id) REFERENCES sentences(id)
+        word_type_id INTEGER,
+        FOREIGN KEY(sentence_id) REFERENCES sentences(id),
+        FOREIGN KEY(word_type_id) REFERENCES word_types(id)
     );""")
-    
+
+    # The candidate synsets only depend on the text of the word, so they are
+    # stored once per distinct word rather than once per occurrence.
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS word_types (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        word TEXT NOT NULL UNIQUE,
+        synset_count INTEGER NOT NULL
+    );""")
+
     cursor.execute("""
-    CREATE TABLE IF NOT EXISTS word_synsets (
-        word_id INTEGER NOT NULL,
+    CREATE TABLE IF NOT EXISTS word_type_synsets (
+        word_type_id INTEGER NOT NULL,
         synset_id TEXT NOT NULL,
-        PRIMARY KEY(word_id, synset_id),
-        FOREIGN KEY(word_id) REFERENCES words(id)
+        PRIMARY KEY(word_type_id, synset_id),
+        FOREIGN KEY(word_type_id) REFERENCES word_types(id)
     );""")
     
     cursor.execute("""
@@ -95,6 +123,57 @@ def create_schema(conn: sqlite3.Connection) -> None:
         examples TEXT
     );""")
 
+    # What used to be a table with a row for every (word occurrence, candidate synset)
+    cursor.execute("""
+    CREATE VIEW IF NOT EXISTS word_synsets AS
+        SELECT words.id AS word_id, synset_id
+        FROM words JOIN word_type_synsets USING (word_type_id);
+    """)
+
+    conn.commit()
+
+def has_legacy_word_synsets(conn: sqlite3.Connection) -> bool:
+    """True if this database has a word_synsets table from before word_types existed."""
+    cursor = conn.cursor()
+    cursor.execute("select type from sqlite_master where name = 'word_synsets'")
+    row = cursor.fetchone()
+    return row is not None and row[0] == 'table'
+
+def migrate_to_word_types(conn: sqlite3.Connection) -> None:
+    """Convert a database with a per-occurrence word_synsets table to word_types.
+
+    Word types are numbered in order of first appearance, the same as if the
+    database had been made with word_types in the first place."""
+    cursor = conn.cursor()
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS word_types (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        word TEXT NOT NULL UNIQUE,
+        synset_count INTEGER NOT NULL
+    );""")
+    cursor.execute("""
+    CREATE TABLE IF NOT EXISTS word_type_synsets (
+        word_type_id INTEGER NOT NULL,
+        synset_id TEXT NOT NULL,
+        PRIMARY KEY(word_type_id, synset_id),
+        FOREIGN KEY(word_type_id) REFERENCES word_types(id)
+    );""")
+    cursor.execute("select count(*) from pragma_table_info('words') where name = 'word_type_id'")
+    if cursor.fetchone()[0] == 0:
+        cursor.execute("alter table words add column word_type_id INTEGER REFERENCES word_types(id)")
+    cursor.execute("""insert or ignore into word_types (word, synset_count)
+        select word, max(synset_count) from words group by word order by min(id)""")
+    cursor.execute("update words set word_type_id = (select id from word_types where word_types.word = words.word)")
+    cursor.execute("""insert or ignore into word_type_synsets (word_type_id, synset_id)
+        select word_type_id, synset_id from word_synsets join words on (word_id = words.id)
+        order by words.id, word_synsets.rowid""")
+    cursor.execute("drop table word_synsets")
+    conn.commit()
+    create_schema(conn)
+
+def create_indexes(conn: sqlite3.Connection) -> None:
+    cursor = conn.cursor()
+
     cursor.execute("""
     CREATE INDEX if not exists idx_words_sentence_id ON words(sentence_id);
     """)
@@ -106,59 +185,371 @@ def create_schema(conn: sqlite3.Connection) -> None:
     cursor.execute("""
     CREATE INDEX if not exists idx_words_sentence_word_number ON words(sentence_id, word_number);
     """)
+
+    cursor.execute("""
+    CREATE INDEX if not exists idx_words_word_type_id ON words(word_type_id);
+    """)
     
     
     conn.commit()
 
-def insert_story(conn: sqlite3.Connection, filename: str, story_number: int) -> int:
+def check_bulk_load_complete(conn: sqlite3.Connection) -> None:
+    """Refuse to carry on with a database that was left behind by a crashed --bulk-load."""
     cursor = conn.cursor()
-    cursor.execute("""
-    INSERT INTO stories (filename, story_number) VALUES (?, ?)
-    """, (filename, story_number))
-    return cursor.lastrowid
+    cursor.execute("select name from sqlite_master where type = 'table' and name = 'bulk_load_incomplete'")
+    if cursor.fetchone() is None:
+        return
+    cursor.execute("select filename, started from bulk_load_incomplete")
+    for filename, started in cursor:
+        sys.exit(f"The --bulk-load of {filename} into this database (started {started}) never finished. "
+                 "Bulk loading doesn't sync anything to disk, so the database may be damaged. Delete it and start again.")
 
-def insert_sentence(conn: sqlite3.Connection, story_id: int, sentence_number: int, sentence: str) -> int:
-    cursor = conn.cursor()
-    cursor.execute("""
-    INSERT INTO sentences (story_id, sentence_number, sentence) VALUES (?, ?, ?)
-    """, (story_id, sentence_number, sentence))
-    return cursor.lastrowid
+def start_bulk_load(conn: sqlite3.Connection, filename: str) -> None:
+    """Prepare a fresh database for loading as fast as possible.
 
-def insert_word(conn: sqlite3.Connection, sentence_id: int, word_number: int, word: str, synset_count: int, resolved_synset: Optional[str]) -> int:
+    Only the tables are created; the indexes are left to finish_bulk_load(). Nothing
+    is synced to disk until then, so a marker is committed first and only removed at
+    the end."""
+    create_tables(conn)
     cursor = conn.cursor()
-    cursor.execute("""
-    INSERT INTO words (sentence_id, word_number, word, synset_count, resolved_synset) VALUES (?, ?, ?, ?, ?)
-    """, (sentence_id, word_number, word, synset_count, resolved_synset))
-    return cursor.lastrowid
+    cursor.execute("select count(*) from stories")
+    if cursor.fetchone()[0] > 0:
+        sys.exit("--bulk-load only works on a new database")
+    cursor.execute("create table bulk_load_incomplete (filename text, started datetime default current_timestamp)")
+    cursor.execute("insert into bulk_load_incomplete (filename) values (?)", [filename])
+    conn.commit()
+    cursor.execute("pragma synchronous = OFF")
+    cursor.execute("pragma journal_mode = MEMORY")
+    cursor.execute("pragma cache_size = -1048576")   # in KiB, so 1GiB
+    cursor.execute("pragma mmap_size = 17179869184")  # SQLite caps this at its compiled-in maximum
 
-def insert_word_synset(conn: sqlite3.Connection, word_id: int, synset_id: str) -> None:
+def finish_bulk_load(conn: sqlite3.Connection) -> None:
+    create_indexes(conn)
     cursor = conn.cursor()
-    # beats me how it's possible but I got multiple hits on old.s.04
-    cursor.execute("""
-    INSERT OR IGNORE INTO word_synsets (word_id, synset_id) VALUES (?, ?)
-    """, (word_id, synset_id))
+    cursor.execute("analyze")
+    cursor.execute("drop table bulk_load_incomplete")
+    conn.commit()
+    cursor.execute("pragma synchronous = FULL")
+    cursor.execute("pragma journal_mode = DELETE")
 
-def insert_synset(conn: sqlite3.Connection, synset: nltk.corpus.reader.wordnet.Synset) -> None:
+def next_row_id(conn: sqlite3.Connection, table: str) -> int:
+    """The id that AUTOINCREMENT would hand out for the next row of `table`."""
     cursor = conn.cursor()
-    cursor.execute("""
-    INSERT OR IGNORE INTO synsets (id, description, examples) VALUES (?, ?, ?)
-    """, (synset.name(), synset.definition(), "; ".join(synset.examples())))
+    cursor.execute("select seq from sqlite_sequence where name = ?", [table])
+    row = cursor.fetchone()
+    sequence = row[0] if row is not None else 0
+    cursor.execute(f"select max(id) from {table}")
+    row = cursor.fetchone()
+    highest = row[0] if row[0] is not None else 0
+    return max(sequence, highest) + 1
+
+class BulkWriter:
+    """Buffers the rows for several stories and writes them with executemany.
+
+    Row ids are allocated here (the same way AUTOINCREMENT would) rather than
+    being read back from lastrowid after every insert. The file position is
+    updated in the same transaction as the rows, so after a crash the
+    checkpoint still points just past the last story that was committed."""
+
+    def __init__(self, conn: sqlite3.Connection, filename: str, commit_interval: int = 100,
+                 profile: Optional[profiling.StageProfile] = None) -> None:
+        self.conn = conn
+        self.filename = filename
+        self.commit_interval = commit_interval
+        self.profile = profile
+        self.next_story_id = next_row_id(conn, 'stories')
+        self.next_sentence_id = next_row_id(conn, 'sentences')
+        self.next_word_id = next_row_id(conn, 'words')
+        self.next_word_type_id = next_row_id(conn, 'word_types')
+        self.position: Optional[int] = None
+        self.buffered_stories = 0
+        self.stories: List[Tuple[int, str, int]] = []
+        self.sentences: List[Tuple[int, int, int, str]] = []
+        self.words: List[Tuple[int, int, int, str, int, Optional[str], int]] = []
+        self.word_types: List[Tuple[int, str, int]] = []
+        self.word_type_synsets: List[Tuple[int, str]] = []
+        self.synsets: List[SynsetRow] = []
+        # Word types and synsets only need writing the first time they turn up
+        cursor = conn.cursor()
+        cursor.execute("select word, id from word_types")
+        self.known_word_types: Dict[str, int] = {word: word_type_id for (word, word_type_id) in cursor}
+        cursor.execute("select id from synsets")
+        self.known_synsets: Set[str] = {row[0] for row in cursor}
+        self.skipped_synset_writes = 0
+        # If make_wordnet_database.py has already made word_paths, the words we resolve
+        # here need their rows too
+        self.fill_word_paths = wordpaths.has_word_paths(conn)
+
+    def add_story(self, story_number: int, analysis: StoryAnalysis, position: int) -> None:
+        story_id = self.next_story_id
+        self.next_story_id += 1
+        self.stories.append((story_id, self.filename, story_number))
+        for sentence_number, (sentence, words) in enumerate(analysis):
+            sentence_id = self.next_sentence_id
+            self.next_sentence_id += 1
+            self.sentences.append((sentence_id, story_id, sentence_number, sentence))
+            for word_number, (word, synsets) in enumerate(words):
+                word_id = self.next_word_id
+                self.next_word_id += 1
+                synset_count = len(synsets)
+                # This was a bad idea. If a word has one synset, but happens to also be
+                # a preposition or a pronoun or something, then this gets the wrong answer.
+                # Also, I should have lemmatized it first.
+                # I think in the future we can get rid of the resolved_synset and synset_count
+                # TBH, now that I know that the fastest way to resolve synsets is to use chatgpt + batch
+                # it probably makes more sense to fire off a query for every word to get the lemmatized
+                # form and then come back to get the synsets.
+                resolved_synset = synsets[0][0] if synset_count == 1 else None
+                word_type_id = self.known_word_types.get(word)
+                if word_type_id is None:
+                    word_type_id = self.add_word_type(word, synsets)
+                self.words.append((word_id, sentence_id, word_number, word, synset_count, resolved_synset, word_type_id))
+        self.position = position
+        self.buffered_stories += 1
+        if self.buffered_stories >= self.commit_interval:
+            self.flush()
+
+    def add_word_type(self, word: str, synsets: Sequence[SynsetRow]) -> int:
+        word_type_id = self.next_word_type_id
+        self.next_word_type_id += 1
+        self.known_word_types[word] = word_type_id
+        self.word_types.append((word_type_id, word, len(synsets)))
+        if len(synsets) > 1:
+            for synset in synsets:
+                self.word_type_synsets.append((word_type_id, synset[0]))
+                if synset[0] in self.known_synsets:
+                    self.skipped_synset_writes += 1
+                    continue
+                self.known_synsets.add(synset[0])
+                self.synsets.append(synset)
+        return word_type_id
+
+    def flush(self) -> None:
+        if self.buffered_stories == 0:
+            return
+        start = time.perf_counter()
+        cursor = self.conn.cursor()
+        cursor.executemany("INSERT INTO stories (id, filename, story_number) VALUES (?, ?, ?)", self.stories)
+        cursor.executemany("INSERT INTO sentences (id, story_id, sentence_number, sentence) VALUES (?, ?, ?, ?)", self.sentences)
+        cursor.executemany("INSERT INTO word_types (id, word, synset_count) VALUES (?, ?, ?)", self.word_types)
+        cursor.executemany("INSERT INTO words (id, sentence_id, word_number, word, synset_count, resolved_synset, word_type_id) VALUES (?, ?, ?, ?, ?, ?, ?)", self.words)
+        # beats me how it's possible but I got multiple hits on old.s.04
+        cursor.executemany("INSERT OR IGNORE INTO word_type_synsets (word_type_id, synset_id) VALUES (?, ?)", self.word_type_synsets)
+        cursor.executemany("INSERT OR IGNORE INTO synsets (id, description, examples) VALUES (?, ?, ?)", self.synsets)
+        if self.fill_word_paths:
+            wordpaths.refresh_word_paths(self.conn, [word[0] for word in self.words if word[5] is not None])
+        cursor.execute("update filepositions set position = ? where filename = ?", [self.position, self.filename])
+        inserted = time.perf_counter()
+        self.conn.commit()
+        if self.profile is not None:
+            self.profile.add('insert', inserted - start)
+            self.profile.add('commit', time.perf_counter() - inserted)
+            self.profile.count('commits')
+            self.profile.count('rows_written', len(self.stories) + len(self.sentences) + len(self.word_types) + len(self.words)
+                               + len(self.word_type_synsets) + len(self.synsets))
+        self.stories.clear()
+        self.sentences.clear()
+        self.words.clear()
+        self.word_types.clear()
+        self.word_type_synsets.clear()
+        self.synsets.clear()
+        self.buffered_stories = 0
+
+def download_nltk_data(tokenizer_name: str, snapshot_path: Optional[str]) -> None:
+    """Ensure necessary NLTK resources are downloaded, skipping the ones this run won't use."""
+    if tokenizer_name != tokenization.NltkTokenizer.name and snapshot_path is not None:
+        return
+    import nltk
+    if tokenizer_name == tokenization.NltkTokenizer.name:
+        nltk.download('punkt')
+        nltk.download('punkt_tab')
+    if snapshot_path is None:
+        nltk.download('wordnet')
+
+# Where synsets come from: NLTK's corpus reader, or a file made by wordnet_snapshot.py
+wordnet = None
+
+def set_wordnet(snapshot_path: Optional[str] = None) -> None:
+    global wordnet
+    if snapshot_path is None:
+        from nltk.corpus import wordnet as nltk_wordnet
+        wordnet = nltk_wordnet
+    else:
+        wordnet = wordnet_snapshot.open_snapshot(snapshot_path)
+
+def lookup_synsets_uncached(word: str) -> Tuple[SynsetRow, ...]:
+    if wordnet is None:
+        set_wordnet()
+    return tuple((synset.name(), synset.definition(), "; ".join(synset.examples()))
+                 for synset in wordnet.synsets(word))
+
+# wordnet.synsets() lower-cases its argument, so the cache can too
+lookup_synsets = functools.lru_cache(maxsize=DEFAULT_SYNSET_CACHE_SIZE)(lookup_synsets_uncached)
+
+def set_synset_cache_size(size: int) -> None:
+    global lookup_synsets
+    lookup_synsets = functools.lru_cache(maxsize=size)(lookup_synsets_uncached)
+
+def synset_cache_stats() -> Tuple[int, int, int]:
+    """Return (pid, hits, misses) for the synset cache in this process."""
+    info = lookup_synsets.cache_info()
+    return (os.getpid(), info.hits, info.misses)
+
+tokenizer = tokenization.NltkTokenizer()
+
+def set_tokenizer(name: str) -> None:
+    global tokenizer
+    tokenizer = tokenization.get_tokenizer(name)
+
+def analyse_story(story: str, profile: Optional[profiling.StageProfile] = None) -> StoryAnalysis:
+    """Split a story into sentences and words, and look up the candidate synsets of each word.
+
+    This is the CPU-heavy part of ingestion, and it doesn't touch the database, so it
+    can be run in a worker process."""
+    if profile is not None:
+        return analyse_story_profiled(story, profile)
+    analysis = []
+    for sentence in tokenizer.sentences(story):
+        words = []
+        for word in tokenizer.words(sentence):
+            words.append((word, lookup_synsets(word.lower())))
+        analysis.append((sentence, words))
+    return analysis
+
+def analyse_story_profiled(story: str, profile: profiling.StageProfile) -> StoryAnalysis:
+    """analyse_story(), with the time taken by each stage added to `profile`."""
+    analysis = []
+    start = time.perf_counter()
+    sentences = tokenizer.sentences(story)
+    now = time.perf_counter()
+    profile.add('sentence_split', now - start)
+    for sentence in sentences:
+        start = now
+        words = tokenizer.words(sentence)
+        now = time.perf_counter()
+        profile.add('word_tokenize', now - start)
+        start = now
+        analysis.append((sentence, [(word, lookup_synsets(word.lower())) for word in words]))
+        now = time.perf_counter()
+        profile.add('synset_lookup', now - start)
+        profile.count('tokens', len(words))
+        profile.count('synset_lookups', len(words))
+    profile.count('stories')
+    profile.count('sentences', len(sentences))
+    return analysis
+
+def analyse_stories(stories: List[str], profile_stages: bool = False) -> Tuple[List[StoryAnalysis], Tuple[int, int, int], Optional[profiling.StageProfile]]:
+    profile = profiling.StageProfile() if profile_stages else None
+    return [analyse_story(story, profile) for story in stories], synset_cache_stats(), profile
+
+def warm_up_worker(synset_cache_size: int, tokenizer_name: str, snapshot_path: Optional[str]) -> None:
+    set_synset_cache_size(synset_cache_size)
+    set_tokenizer(tokenizer_name)
+    set_wordnet(snapshot_path)
+    # wordnet is a lazy corpus reader; load it once per worker instead of on its first story
+    wordnet.ensure_loaded()
+
+def analyse_in_parallel(chunks: Iterable[Tuple[int, str]], workers: int,
+                        synset_cache_size: int = DEFAULT_SYNSET_CACHE_SIZE,
+                        tokenizer_name: str = tokenization.NltkTokenizer.name,
+                        snapshot_path: Optional[str] = None,
+                        cache_stats: Optional[Dict[int, Tuple[int, int]]] = None,
+                        stories_per_task: int = 32,
+                        profile: Optional[profiling.StageProfile] = None) -> Iterator[Tuple[int, StoryAnalysis]]:
+    """Analyse stories in a pool of worker processes, yielding them in the same order as `chunks`.
+
+    Only a bounded number of tasks are in flight at once, so we don't read the whole
+    file into memory when the workers are slower than the reader. The latest synset
+    cache (hits, misses) of each worker is recorded in `cache_stats`, keyed by pid, and
+    the workers' stage timings are added to `profile`."""
+    max_pending = workers * 4
+    chunks = iter(chunks)
+    with multiprocessing.Pool(workers, initializer=warm_up_worker, initargs=(synset_cache_size, tokenizer_name, snapshot_path)) as pool:
+        pending = collections.deque()
+        while True:
+            batch = list(itertools.islice(chunks, stories_per_task))
+            if batch:
+                positions = [pos for (pos, story) in batch]
+                task = pool.apply_async(analyse_stories, ([story for (pos, story) in batch], profile is not None))
+                pending.append((positions, task))
+            if not pending:
+                break
+            if batch and len(pending) < max_pending:
+                continue
+            positions, task = pending.popleft()
+            start = time.perf_counter()
+            analyses, (pid, hits, misses), worker_profile = task.get()
+            if cache_stats is not None:
+                cache_stats[pid] = (hits, misses)
+            if profile is not None:
+                profile.add('waiting_for_workers', time.perf_counter() - start)
+                profile.merge(worker_profile)
+            yield from zip(positions, analyses)
+
 def main() -> None:
     parser = argparse.ArgumentParser(description="Read a file in chunks separated by a delimiter and store the data in an SQLite database.")
     parser.add_argument("--file", type=str, help="The path to the file to be read.")
-    parser.add_argument("--database", type=str, help="The SQLite database file.")
+    parser.add_argument("--database", type=str, help="The SQLite database file. With --shard, {shard} in the name is replaced by the shard number, so that each shard can write to its own file (see merge_shards.py).")
     parser.add_argument("--progress", action="store_true", help="Show a progress bar")
     parser.add_argument("--restart", action="store_true",
                         help="If we have read this file before, delete everything from the last run")
     parser.add_argument("--stop-after", type=int, help="Number of stories to stop after")
+    parser.add_argument("--workers", type=int, default=1,
+                        help="Number of processes to use for tokenizing and synset lookup. Inserts are always done by this process, in story order.")
+    parser.add_argument("--commit-every", type=int, default=100,
+                        help="Number of stories to buffer and write in each transaction")
+    parser.add_argument("--bulk-load", action="store_true",
+                        help="Load a new database as fast as possible: no syncing or rollback journal while loading, and the indexes are only built at the end. If this gets interrupted, the database is no good.")
+    parser.add_argument("--migrate-word-types", action="store_true",
+                        help="Convert a database that has a word_synsets table (one row per word occurrence) to word_types")
+    parser.add_argument("--story-range", metavar="A:B",
+                        help="Only read stories A (inclusive) to B (exclusive), counting from 0. Uses (and if necessary builds) the story index.")
+    parser.add_argument("--shard", metavar="i/n",
+                        help="Only read the i'th (counting from 0) of n equal slices of the file. Uses (and if necessary builds) the story index.")
+    parser.add_argument("--tokenizer", default=tokenization.NltkTokenizer.name, choices=list(tokenization.TOKENIZERS),
+                        help="How to split stories into sentences and words. 'regex' is faster; see tokenization.py for how it compares to 'nltk'.")
+    parser.add_argument("--wordnet-snapshot", metavar="FILE",
+                        help="Look synsets up in a file made by wordnet_snapshot.py instead of loading NLTK's WordNet reader")
+    parser.add_argument("--synset-cache-size", type=int, default=DEFAULT_SYNSET_CACHE_SIZE,
+                        help="Number of distinct tokens to remember the synsets of")
+    parser.add_argument("--profile", action="store_true",
+                        help="Time each stage (reading, tokenizing, synset lookup, inserts, commits) and count what was done. A summary is printed every --profile-interval seconds and a breakdown at the end, and both are saved in the ingest_metrics table.")
+    parser.add_argument("--profile-interval", type=float, default=60.0,
+                        help="Seconds between --profile summaries (0 for just the final breakdown)")
 
     args = parser.parse_args()
+    if args.story_range is not None and args.shard is not None:
+        sys.exit("Specify at most one of --story-range and --shard")
+    if args.shard is not None:
+        args.database = args.database.replace('{shard}', args.shard.split('/')[0])
+
+    if args.bulk_load and args.restart:
+        sys.exit("--bulk-load is only for new databases, so it doesn't make sense with --restart")
+    if args.wordnet_snapshot is not None:
+        try:
+            wordnet_snapshot.open_snapshot(args.wordnet_snapshot)
+        except (OSError, ValueError) as e:
+            sys.exit(str(e))
 
     conn = sqlite3.connect(args.database)
-    create_schema(conn)
+    check_bulk_load_complete(conn)
+    if has_legacy_word_synsets(conn):
+        if not args.migrate_word_types:
+            sys.exit(f"{args.database} has a word_synsets table from an older version of wordnetify. Run with --migrate-word-types to convert it.")
+        migrate_to_word_types(conn)
+    if args.file is None:
+        # Nothing else to do
+        conn.close()
+        return
+    download_nltk_data(args.tokenizer, args.wordnet_snapshot)
+    if args.bulk_load:
+        start_bulk_load(conn, args.file)
+    else:
+        create_schema(conn)
     cursor = conn.cursor()
     if args.restart:
-        cursor.execute("delete from word_synsets where word_id in (select words.id from words join sentences on (sentence_id = sentences.id) join stories on (story_id = stories.id) where filename = ?)", [args.file])
+        if wordpaths.has_word_paths(conn):
+            cursor.execute("delete from word_paths where word_id in (select words.id from words join sentences on (sentence_id = sentences.id) join stories on (story_id = stories.id) where filename = ?)", [args.file])
         cursor.execute("delete from words where sentence_id in (select sentence_id from sentences join stories on (story_id = stories.id) where filename = ?)", [args.file])
         cursor.execute("delete from sentences where story_id in (select story_id from stories where filename = ?)", [args.file])
         cursor.execute("delete from stories where filename = ?", [args.file])
@@ -172,46 +563,72 @@ def main() -> None:
     else:
         start_position = row[0]
 
-    cursor.execute("select max(id) from stories where filename = ?", [args.file])
-    row = cursor.fetchone()
-    if row is None or row[0] is None:
-        story_number = 0
+    max_chunks = args.stop_after
+    if args.story_range is not None or args.shard is not None:
+        offsets = storyindex.load_index(args.file)
+        try:
+            if args.story_range is not None:
+                (first_story, stop_story) = storyindex.parse_story_range(args.story_range, len(offsets))
+            else:
+                (first_story, stop_story) = storyindex.parse_shard(args.shard, len(offsets))
+        except ValueError as e:
+            sys.exit(str(e))
+        # The checkpoint only counts if it is inside our slice; otherwise start at the beginning of it
+        story_number = first_story
+        if storyindex.story_start(offsets, first_story) < start_position <= storyindex.story_start(offsets, stop_story):
+            story_number = storyindex.stories_before(offsets, start_position)
+        start_position = storyindex.story_start(offsets, story_number)
+        remaining = stop_story - story_number
+        max_chunks = remaining if max_chunks is None else min(max_chunks, remaining)
     else:
-        story_number = row[0] + 1
-    iterator = read_file_in_chunks(args.file, start_position, max_chunks=args.stop_after)
+        cursor.execute("select max(id) from stories where filename = ?", [args.file])
+        row = cursor.fetchone()
+        if row is None or row[0] is None:
+            story_number = 0
+        else:
+            story_number = row[0] + 1
+    chunks = read_file_in_chunks(args.file, start_position, max_chunks=max_chunks)
+    profile = None
+    if args.profile:
+        write = sys.stderr.write
+        if args.progress:
+            import tqdm
+            write = lambda text: tqdm.tqdm.write(text, file=sys.stderr, end='')
+        profile = profiling.RunProfile(conn, args.file, args.profile_interval, write)
+        chunks = profile.timed('read', chunks)
+    cache_stats: Dict[int, Tuple[int, int]] = {}
+    if args.workers > 1:
+        iterator = analyse_in_parallel(chunks, args.workers, args.synset_cache_size, args.tokenizer,
+                                       args.wordnet_snapshot, cache_stats, profile=profile)
+    else:
+        set_synset_cache_size(args.synset_cache_size)
+        set_tokenizer(args.tokenizer)
+        set_wordnet(args.wordnet_snapshot)
+        iterator = ((pos, analyse_story(story, profile)) for (pos, story) in chunks)
     if args.progress:
         import tqdm
-        iterator = tqdm.tqdm(iterator)
-    for (pos, story) in iterator:
-        # Every story is a transaction
-        story_id = insert_story(conn, args.file, story_number)
+        iterator = tqdm.tqdm(iterator, total=max_chunks)
+    writer = BulkWriter(conn, args.file, args.commit_every, profile)
+    for (pos, analysis) in iterator:
+        writer.add_story(story_number, analysis, pos)
         story_number += 1
-        sentence_number = 0
-        for sentence in nltk.sent_tokenize(story):
-            sentence_id = insert_sentence(conn, story_id, sentence_number, sentence)
-            sentence_number += 1
-            word_number = 0
-            for word in nltk.word_tokenize(sentence):
-                synsets = nltk.corpus.wordnet.synsets(word)
-                synset_count = len(synsets)
-                # This was a bad idea. If a word has one synset, but happens to also be
-                # a preposition or a pronoun or something, then this gets the wrong answer.
-                # Also, I should have lemmatized it first.
-                # I think in the future we can get rid of the resolved_synset and synset_count
-                # TBH, now that I know that the fastest way to resolve synsets is to use chatgpt + batch
-                # it probably makes more sense to fire off a query for every word to get the lemmatized
-                # form and then come back to get the synsets.
-                resolved_synset = synsets[0].name() if synset_count == 1 else None
-                word_id = insert_word(conn, sentence_id, word_number, word, synset_count, resolved_synset)
-                word_number += 1
-
-                if synset_count > 1:
-                    for synset in synsets:
-                        insert_word_synset(conn, word_id, synset.name())
-                        insert_synset(conn, synset)
-        cursor.execute("update filepositions set position = ? where filename = ?", [pos, args.file])
-        conn.commit()
+        if profile is not None:
+            profile.tick()
+    writer.flush()
+    if args.bulk_load:
+        finish_bulk_load(conn)
+    if profile is not None:
+        profile.finish()
     conn.close()
 
+    if args.workers <= 1:
+        _, hits, misses = synset_cache_stats()
+        cache_stats[os.getpid()] = (hits, misses)
+    hits = sum(h for (h, m) in cache_stats.values())
+    misses = sum(m for (h, m) in cache_stats.values())
+    if hits + misses > 0:
+        sys.stderr.write(f"Synset cache: {hits} hits, {misses} misses ({100.0 * hits / (hits + misses):.1f}% hit rate); "
+                         f"skipped {writer.skipped_synset_writes} redundant synset writes\n")
+
 if __name__ == "__main__":
     main()
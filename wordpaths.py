@@ -1,24 +1,97 @@
 import hashlib
+import sys
 
-def get_hypernym_path(synset):
-    if synset.name() == 'entity.n.01':
-        return [synset]
+class PathBuilder:
+    # Shared ancestors make up most of every path, so each synset's path (and the
+    # ordinal of each child among its parent's sorted hyponyms) is only worked out
+    # once and then reused by everything underneath it. One PathBuilder can produce
+    # the paths of all of WordNet in roughly linear time.
+    def __init__(self):
+        self.hypernym_paths = {}
+        self.path_components = {}
+        self.hyponym_ordinals = {}
+
+    def hypernym_path(self, synset):
+        name = synset.name()
+        path = self.hypernym_paths.get(name)
+        if path is not None:
+            return path
+        if name == 'entity.n.01':
+            path = (synset,)
+        else:
+            hypernyms = sorted(synset.hypernyms())
+            if not hypernyms:
+                path = (synset,)
+            else:
+                # The path goes through the last of the sorted hypernyms. (It was meant
+                # to be the shortest one, but every path string we've ever stored was
+                # made this way.)
+                path = self.hypernym_path(hypernyms[-1]) + (synset,)
+        self.hypernym_paths[name] = path
+        return path
+
+    def child_ordinal(self, parent, child):
+        ordinals = self.hyponym_ordinals.get(parent.name())
+        if ordinals is None:
+            hyponyms = sorted(parent.hyponyms(), key=lambda s: s.name())
+            ordinals = {hyponym.name(): i + 1 for (i, hyponym) in enumerate(hyponyms)}
+            self.hyponym_ordinals[parent.name()] = ordinals
+        index = ordinals.get(child.name())
+        if index is None:
+            # bug in wordnet: wn.synset('inhibit.v.04').hypernyms()[0].hyponyms() doesn't show inhibit.v.01
+            if child.name() == 'inhibit.v.04':
+                return 2
+            raise ValueError(f"{child.name()} is not among the hyponyms of {parent.name()}")
+        return index
+
+    def components(self, synset):
+        # The root's hash, then the ordinal of each step down the hypernym path
+        name = synset.name()
+        components = self.path_components.get(name)
+        if components is not None:
+            return components
+        path = self.hypernym_path(synset)
+        if len(path) == 1:
+            components = (hash_synset(synset),)
+        else:
+            parent = path[-2]
+            components = self.components(parent) + (str(self.child_ordinal(parent, synset)),)
+        self.path_components[name] = components
+        return components
+
+    # This takes a synset as an argument
+    def path_string(self, synset):
+        # 1 = noun
+        # 1.2 = pronoun
+        # 1.3 = proper noun
+        # 2 = adjective
+        # 3 = verb
+        # 4 = adverb
+        # 5 = punctuation
 
-    hypernyms = sorted(synset.hypernyms())
-    if not hypernyms:
-        return [synset]
+        # Adjectives, we're kind of weak on. We just hash them.
+        if synset.pos() in ['a', 's']:
+            return f'2.{hash_synset(synset)}'
 
-    shortest_path = None
-    for hypernym in hypernyms:
-        hypernym_path = get_hypernym_path(hypernym)
-        if not hypernym_path:
-            continue
-        if not shortest_path:
-            shortest_path = hypernym_path
-            continue
-        shortest_path = shortest_path if len(shortest_path) < len(hypernym_path) else hypernym_path
+        if synset.pos() in ['r']:
+            return f'4.{hash_synset(synset)}'
 
-    return hypernym_path + [synset]
+        if synset.pos() in ['n', 'v']:
+            path = self.hypernym_path(synset)
+            if not path:
+                sys.exit(f"No path for {synset}")
+
+            if synset.pos() == 'n':
+                path_indices = ['1']  # Start with '1' for the nouns
+            else:
+                path_indices = ['3']
+            path_indices.extend(self.components(synset))
+            return '.'.join(path_indices)
+
+default_path_builder = PathBuilder()
+
+def get_hypernym_path(synset):
+    return list(default_path_builder.hypernym_path(synset))
 
 def hash_synset(synset):
     return hash_thing(synset.name())
@@ -28,49 +101,134 @@ def hash_thing(thing):
 
 # This takes a synset as an argument
 def get_path_string(synset):
-    # 1 = noun
-    # 1.2 = pronoun
-    # 1.3 = proper noun
-    # 2 = adjective
-    # 3 = verb
-    # 4 = adverb
-    # 5 = punctuation
-
-    # Adjectives, we're kind of weak on. We just hash them.
-    if synset.pos() in ['a', 's']:
-        return f'2.{hash_synset(synset)}'
-
-    if synset.pos() in ['r']:
-        return f'4.{hash_synset(synset)}'
-
-    if synset.pos() in ['n', 'v']:
-        path = get_hypernym_path(synset)
-        if not path:
-            sys.exit(f"No path for {synset}")
-
-        if synset.pos() == 'n':
-            path_indices = ['1']  # Start with '1' for the nouns
-        else:
-            path_indices = ['3']
-        path_indices.append(hash_synset(path[0]))
-        for i in range(len(path) - 1):
-            parent = path[i]
-            child = path[i+1]
-            hyponyms = sorted(parent.hyponyms(), key=lambda s: s.name())
-            try:
-                index = hyponyms.index(child) + 1
-            except ValueError:
-                # bug in wordnet: wn.synset('inhibit.v.04').hypernyms()[0].hyponyms() doesn't show inhibit.v.01
-                if child.name() == 'inhibit.v.04':
-                    index = 2
-                else:
-                    raise
-            path_indices.append(str(index))
+    return default_path_builder.path_string(synset)
+
+# Path keys: a binary form of a path string that sorts the way the path does.
+# Each component is a length byte followed by the number in big-endian bytes (so
+# 0 is just b'\x00', 7 is b'\x01\x07', 300 is b'\x02\x01\x2c'). Comparing keys
+# byte by byte then compares components numerically, a path sorts before
+# everything underneath it, and the keys of a whole subtree are exactly the keys
+# between key and key + b'\xff' (no length byte is ever 0xff). That makes "every
+# synset under X" a single range scan on an index.
+def encode_path_key(path):
+    key = bytearray()
+    for component in path.split('.'):
+        if not component.isdigit():
+            raise ValueError(f"Path {path!r} has a component that isn't a number: {component!r}")
+        number = int(component)
+        length = (number.bit_length() + 7) // 8
+        key.append(length)
+        key.extend(number.to_bytes(length, 'big'))
+    return bytes(key)
+
+def decode_path_key(key):
+    components = []
+    i = 0
+    while i < len(key):
+        length = key[i]
+        components.append(str(int.from_bytes(key[i+1:i+1+length], 'big')))
+        i += 1 + length
+    return '.'.join(components)
 
-        return '.'.join(path_indices)
+def subtree_key_range(path):
+    key = encode_path_key(path)
+    return (key, key + b'\xff')
 
+def add_path_key_column(conn):
+    # For synset_paths tables made before path_key existed
+    cursor = conn.cursor()
+    cursor.execute("select count(*) from pragma_table_info('synset_paths') where name = 'path_key'")
+    if cursor.fetchone()[0] == 0:
+        cursor.execute("alter table synset_paths add column path_key BLOB")
+    cursor.execute("create index if not exists synset_paths_by_path_key on synset_paths(path_key)")
 
+def fill_path_keys(conn):
+    conn.create_function('encode_path_key', 1, encode_path_key, deterministic=True)
+    conn.execute("update synset_paths set path_key = encode_path_key(path) where path_key is not encode_path_key(path)")
 
+def subtree_synsets(conn, path):
+    """(path, synset_name, definition) for the synset at `path` and everything under it, in path order."""
+    cursor = conn.cursor()
+    cursor.execute("""select path, synset_name, definition from synset_paths
+        where path_key >= ? and path_key < ? order by path_key""", subtree_key_range(path))
+    return cursor.fetchall()
+
+def subtree_words(conn, path):
+    """(word_id, word, resolved_synset, path) for every word in the corpus whose path is in the subtree."""
+    cursor = conn.cursor()
+    cursor.execute("""select word_id, word, resolved_synset, word_paths.path from word_paths
+        join words on (words.id = word_id)
+        where word_paths.path_key >= ? and word_paths.path_key < ? order by word_paths.path_key, word_id""",
+                   subtree_key_range(path))
+    return cursor.fetchall()
+
+
+# The closed-class words that aren't in WordNet (or not usefully). make_wordnet_database.py
+# gives each of them a path of its own, and closed_class.py resolves them without
+# asking a language model.
+personal_pronouns = [ 'i', 'me', 'you', 'he', 'him', 'she', 'her',
+                      'it', 'we', 'us', 'they', 'them' ]
+possessive_pronouns = [ 'my', 'mine', 'your', 'yours', 'his',
+                        'her', 'hers', 'its', 'our', 'ours', 'their', 'theirs' ]
+reflexive_pronouns = [ 'myself', 'yourself', 'yourselves',
+                       'himself', 'herself', 'itself', 'ourselves', 'themselves',
+                       'themself' ]
+demonstrative_pronouns = [ 'this', 'that', 'these', 'those' ]
+interrogative_and_relative_pronouns = [ 'who', 'whom', 'whose',
+                                        'which', 'what',
+                                        # 'that'
+                                       ]
+other_pronouns = [ 'everything', 'everyone', 'noone', 'nothing']
+terminal_punctuation = ['.', '?', '!', '<end-of-text>', '<start-of-text>']
+pausing_and_separating_punctuation = [',', ';', ':', '-',  '--']
+quotation_and_parenthetical_punctuation = ['"', "'", '(', ')', '[', ']', '...', '``', "''",'']
+linking_punctuation = ['/']
+specialized_punctuation = ['...', '&', '*', '^', '•', "'s"]
+# I really don't know what to do about 's -- I should identify its role and then do something
+# cleverer about it.
+
+conjunctions = ['and', 'or', 'but', 'nor', 'for', 'yet', 'so', 'either', 'neither', 'whether', 'both', 'how', 'if', 'then', 'because', 'when']
+# I have no structure for prepositions.
+prepositions = ['in', 'on', 'at', 'by', 'with', 'about', 'against', 'between', 'into', 'through', 'during',
+                'before', 'after', 'above', 'below', 'to', 'from', 'up', 'down', 'behind',
+                'near', 'far', 'inside', 'outside', 'onto', 'off', 'across', 'along', 'toward', 'throughout',
+                'per', 'beyond', 'via',
+                'under', 'over', 'for', 'of', 'among', 'around', 'beside', 'besides', 'despite',
+                'except', 'like', 'unlike', 'since', 'until', 'till', 'within', 'without',
+                'underneath', 'beneath', 'versus', 'amid', 'amidst', 'amongst',
+                'as', 'but', 'concerning', 'considering', 'depending', 'excluding', 'following',
+                'including', 'notwithstanding', 'pending', 'regarding', 'save', 'touching', 'upon',
+                'whereas', 'vs']
+articles = ['the', 'a', 'an']
+
+# Which pseudo-synset each list is
+closed_classes = [
+    ('(pronoun.other)', personal_pronouns + possessive_pronouns + reflexive_pronouns
+                        + demonstrative_pronouns + interrogative_and_relative_pronouns + other_pronouns),
+    ('(punctuation.other)', terminal_punctuation + pausing_and_separating_punctuation
+                            + quotation_and_parenthetical_punctuation + linking_punctuation + specialized_punctuation),
+    ('(conjunction.other)', conjunctions),
+    ('(preposition.other)', prepositions),
+    ('(article.other)', articles),
+]
+
+# Words in those lists that are often something else ("that" as a conjunction,
+# "so" and "then" as adverbs, "like" as a verb, "up" and "off" as adverbs, "'" as
+# an apostrophe...), so they have to be looked at in context
+not_always_closed_class = {
+    'this', 'that', 'these', 'those', 'which', 'what', 'whose',
+    "'", "'s", '',
+    'yet', 'so', 'either', 'neither', 'both', 'how', 'then', 'when',
+    'on', 'by', 'about', 'through', 'before', 'after', 'above', 'below', 'to', 'up', 'down',
+    'behind', 'near', 'far', 'inside', 'outside', 'off', 'across', 'along', 'beyond',
+    'under', 'over', 'around', 'besides', 'like', 'unlike', 'since', 'till', 'within',
+    'as', 'concerning', 'considering', 'depending', 'excluding', 'following', 'including',
+    'pending', 'save', 'touching',
+}
+
+# A preposition with WordNet senses of its own is only treated as closed class if
+# it's one of these (e.g. "in" is also inch, Indiana and indium, but never in TinyStories)
+prepositions_despite_wordnet = {'in', 'of', 'at', 'with', 'from', 'into', 'onto'}
 
 def is_enumerated_pseudo_synset(pseudo_synset):
     return pseudo_synset in {
@@ -89,3 +247,69 @@ hashed_pseudo_synset_prefix = {
     '(adverb.other)': '4.',
     '(other.other)': '8.'
 }
+
+# word_paths has the final path of every word whose path we know, so that other
+# scripts can get it with a join. make_wordnet_database.py creates and fills it;
+# after that, anything that changes words.resolved_synset calls refresh_word_paths()
+# for the words it changed.
+def word_path(word, synset, synset_path, word_lookup_path):
+    # synset_path is synset_paths.path for the synset, word_lookup_path is the
+    # one for the word itself (that's where pronouns, punctuation etc. are)
+    if synset is None:
+        return None
+    if len(synset.split('.')) == 3:
+        return synset_path
+    if is_enumerated_pseudo_synset(synset):
+        return word_lookup_path
+    prefix = hashed_pseudo_synset_prefix.get(synset)
+    if prefix is None:
+        return None
+    return prefix + hash_thing(word)
+
+WORD_PATH_QUERY = """select words.id, words.word, words.resolved_synset, by_synset.path, by_word.path
+    from words
+      left join synset_paths as by_synset on (by_synset.synset_name = words.resolved_synset)
+      left join synset_paths as by_word on (by_word.synset_name = lower(words.word))"""
+
+def create_word_paths_table(conn):
+    conn.execute("""create table if not exists word_paths (
+        word_id INTEGER PRIMARY KEY REFERENCES words(id),
+        path TEXT NOT NULL,
+        path_key BLOB)""")
+    conn.execute("create index if not exists word_paths_by_path_key on word_paths(path_key)")
+
+def has_word_paths(conn):
+    cursor = conn.cursor()
+    cursor.execute("select count(*) from sqlite_master where type = 'table' and name = 'word_paths'")
+    return cursor.fetchone()[0] > 0
+
+def refresh_word_paths(conn, word_ids=None):
+    # Recompute word_paths for these words, or for every word if word_ids is None.
+    # Does nothing if there's no word_paths table. Doesn't commit.
+    if not has_word_paths(conn):
+        return
+    cursor = conn.cursor()
+    if word_ids is None:
+        cursor.execute("delete from word_paths")
+        insert_word_paths(conn, conn.execute(WORD_PATH_QUERY))
+        return
+    cursor.execute("create temp table if not exists word_path_ids (word_id INTEGER PRIMARY KEY)")
+    cursor.execute("delete from temp.word_path_ids")
+    cursor.executemany("insert or ignore into temp.word_path_ids (word_id) values (?)", [(word_id,) for word_id in word_ids])
+    refresh_word_paths_in_table(conn, "temp.word_path_ids")
+
+def refresh_word_paths_in_table(conn, table):
+    # The same, for the words whose ids are in table's word_id column: one delete
+    # and one query, however many words there are. Doesn't commit.
+    if not has_word_paths(conn):
+        return
+    conn.execute(f"delete from word_paths where word_id in (select word_id from {table})")
+    insert_word_paths(conn, conn.execute(WORD_PATH_QUERY + f" where words.id in (select word_id from {table})"))
+
+def insert_word_paths(conn, rows):
+    # rows are from WORD_PATH_QUERY
+    paths = ((word_id, path, encode_path_key(path))
+             for (word_id, word, synset, synset_path, word_lookup_path) in rows
+             for path in [word_path(word, synset, synset_path, word_lookup_path)]
+             if path is not None)
+    conn.executemany("insert into word_paths (word_id, path, path_key) values (?, ?, ?)", paths)